@@ -0,0 +1,38 @@
+
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.utils.coloring import compute_total_coloring
+
+
+def _sparsity(num_procs, size=300, ncomps=20):
+    p = om.Problem()
+    model = p.model
+    model.add_subsystem('indep', om.IndepVarComp('x', val=np.ones(size)))
+    src = 'indep.x'
+    for i in range(ncomps):
+        model.add_subsystem(f'comp{i}', om.ExecComp('y=2.0*x+x**2', x=np.ones(size),
+                                                    y=np.ones(size), has_diag_partials=True))
+        model.connect(src, f'comp{i}.x')
+        src = f'comp{i}.y'
+    model.add_design_var('indep.x')
+    model.add_constraint(src, lower=0.)
+    model.add_objective('comp0.y', index=0)
+    p.setup(mode='fwd')
+    p.run_model()
+    compute_total_coloring(p, num_procs=num_procs)
+
+
+class BM(unittest.TestCase):
+    """Computing the total sparsity of a model with many design variables"""
+
+    def benchmark_sparsity_serial(self):
+        _sparsity(1)
+
+    def benchmark_sparsity_2procs(self):
+        _sparsity(2)
+
+    def benchmark_sparsity_4procs(self):
+        _sparsity(4)
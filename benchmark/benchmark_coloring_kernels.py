@@ -0,0 +1,83 @@
+"""
+Benchmarks of the graph coloring kernels on synthetic sparsity patterns.
+
+Each pattern is colored by the vectorized kernels in openmdao.utils.coloring and by the loop
+based kernels in openmdao.utils.coloring_reference, and the number of colors must match.
+"""
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+from scipy.sparse import coo_matrix, block_diag, diags, random as sparse_random
+
+import openmdao.utils.coloring as coloring_mod
+from openmdao.utils import coloring_reference
+from openmdao.utils.coloring import _compute_coloring
+
+
+_KERNELS = ('_order_by_ID', '_2col_adj_rows_cols', '_Jc2col_matrix_direct',
+            '_get_full_disjoint_col_matrix_cols', '_color_partition', 'MNCO_bidir', '_col2rows')
+
+
+def _banded(n=6000, bandwidth=11):
+    half = bandwidth // 2
+    return diags([np.ones(n)] * bandwidth, range(-half, half + 1), shape=(n, n), format='coo')
+
+
+def _block(nblocks=60, size=40):
+    # block diagonal with a dense row and column, so it needs a bidirectional coloring
+    blocks = [np.ones((size, size))] * nblocks
+    J = block_diag(blocks, format='lil')
+    J[-1, :] = 1.
+    J[:, -1] = 1.
+    return J.tocoo()
+
+
+def _random(n=3000, density=.002):
+    return sparse_random(n, n, density=density, format='coo', random_state=11)
+
+
+def _color(J, mode, reference=False):
+    J = coo_matrix((np.ones(J.nnz, dtype=bool), (J.row, J.col)), shape=J.shape)
+    if reference:
+        with mock.patch.multiple(coloring_mod, **{name: getattr(coloring_reference, name)
+                                                  for name in _KERNELS}):
+            return _compute_coloring(J, mode)
+    return _compute_coloring(J, mode)
+
+
+class BM(unittest.TestCase):
+    """Coloring of large banded, block and random sparsity patterns"""
+
+    def _check(self, J, mode):
+        start = time.perf_counter()
+        coloring = _color(J, mode)
+        elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ref_coloring = _color(J, mode, reference=True)
+        ref_elapsed = time.perf_counter() - start
+
+        self.assertEqual(coloring.total_solves(), ref_coloring.total_solves())
+        print(f"{J.shape}, {J.nnz} nonzeros, {mode}: {coloring.total_solves()} solves, "
+              f"{elapsed:.3f} sec (reference {ref_elapsed:.3f} sec)")
+
+        return coloring
+
+    def benchmark_banded_fwd(self):
+        coloring = self._check(_banded(), 'fwd')
+        self.assertEqual(coloring.total_solves(), 11)
+
+    def benchmark_banded_auto(self):
+        self._check(_banded(), 'auto')
+
+    def benchmark_block_auto(self):
+        coloring = self._check(_block(), 'auto')
+        self.assertEqual(coloring.total_solves(), 42)
+
+    def benchmark_random_fwd(self):
+        self._check(_random(), 'fwd')
+
+    def benchmark_random_auto(self):
+        self._check(_random(), 'auto')
@@ -0,0 +1,105 @@
+"""
+Benchmarks of the algebraic preconditioners of ScipyKrylov on the beam and param cycle models.
+
+Each case prints the number of Krylov iterations (matrix-vector products) and the wall time
+needed to compute the total derivatives.
+"""
+import time
+import unittest
+from unittest import mock
+
+import openmdao.api as om
+from openmdao.solvers.linear.scipy_iter_solver import ScipyKrylov
+from openmdao.test_suite.parametric_suite import ParameterizedInstance
+from openmdao.test_suite.test_examples.beam_optimization.multipoint_beam_group import \
+    MultipointBeamGroup
+from openmdao.utils.assert_utils import assert_near_equal
+
+
+def _beam_prob(linear_solver_class, linear_solver_options, mode):
+    prob = om.Problem(model=MultipointBeamGroup(E=1., L=1., b=0.1, volume=0.01,
+                                                num_elements=50, num_cp=4, num_load_cases=4))
+    prob.model.linear_solver = linear_solver_class(**linear_solver_options)
+    prob.setup(mode=mode)
+    prob.set_solver_print(level=-1)
+    prob.run_model()
+    return prob
+
+
+def _cycle_prob(linear_solver_class, linear_solver_options, mode):
+    suite = ParameterizedInstance('cycle', assembled_jac=True, jacobian_type='sparse-csc',
+                                  connection_type='explicit', partial_type='array',
+                                  partial_method='exact', num_var=5, num_comp=50,
+                                  var_shape=(3,))
+    suite.solver_class = om.NewtonSolver
+    suite.solver_options = {'solve_subsystems': False, 'maxiter': 20}
+    suite.linear_solver_class = linear_solver_class
+    suite.linear_solver_options = linear_solver_options
+    suite.setup()
+
+    prob = suite.problem
+    prob.setup(mode=mode)
+    prob.set_solver_print(level=-1)
+    prob.run_model()
+    return prob
+
+
+def _compute_totals(prob):
+    with mock.patch.object(ScipyKrylov, '_mat_vec', autospec=True,
+                           side_effect=ScipyKrylov._mat_vec) as mat_vec:
+        start = time.perf_counter()
+        model = prob.model
+        J = prob.compute_totals(getattr(model, 'total_of', None),
+                                getattr(model, 'total_wrt', None), return_format='array')
+        elapsed = time.perf_counter() - start
+
+    return J, mat_vec.call_count, elapsed
+
+
+class BM(unittest.TestCase):
+    """Krylov iterations and timings with and without algebraic preconditioners"""
+
+    def _check(self, model_func, mode, precon, tol, **options):
+        expected, _, direct_elapsed = _compute_totals(model_func(om.DirectSolver, {}, mode))
+
+        options.update(assemble_jac=True, precon=precon)
+        J, iters, elapsed = _compute_totals(model_func(om.ScipyKrylov, options, mode))
+
+        print(f"{model_func.__name__[1:]} {mode} {precon}: {iters} iterations, {elapsed:.3f} sec "
+              f"(DirectSolver {direct_elapsed:.3f} sec)")
+
+        assert_near_equal(J, expected, tol)
+        return iters
+
+    def _check_beam(self, precon):
+        return self._check(_beam_prob, 'fwd', precon, 1e-5, maxiter=200, restart=50, atol=1e-8,
+                           rtol=1e-12)
+
+    def _check_cycle(self, precon):
+        return self._check(_cycle_prob, 'rev', precon, 1e-8, maxiter=100, restart=100,
+                           atol=1e-12, rtol=1e-12)
+
+    def benchmark_beam_ilu(self):
+        self._check_beam('ilu')
+
+    def benchmark_beam_block_jacobi(self):
+        self._check_beam('block_jacobi')
+
+    def benchmark_beam_schwarz(self):
+        self._check_beam('schwarz')
+
+    def benchmark_cycle_none(self):
+        self._check_cycle(None)
+
+    def benchmark_cycle_ilu(self):
+        self._check_cycle('ilu')
+
+    def benchmark_cycle_block_jacobi(self):
+        self._check_cycle('block_jacobi')
+
+    def benchmark_cycle_schwarz(self):
+        self._check_cycle('schwarz')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Benchmarks of subspace recycling in the 'gcrodr' solver of ScipyKrylov.
+
+The total derivatives of a 1D Poisson problem need one linear solve per node, with the same
+matrix. Each case prints the total number of Krylov iterations (matrix-vector products) and the
+wall time needed to compute them.
+"""
+import time
+import unittest
+from unittest import mock
+
+import openmdao.api as om
+from openmdao.solvers.linear.scipy_iter_solver import ScipyKrylov
+from openmdao.test_suite.components.poisson1d import Poisson1DComp
+from openmdao.utils.assert_utils import assert_near_equal
+
+
+def _poisson_prob(linear_solver, mode, num_nodes=100):
+    prob = om.Problem()
+    prob.model.add_subsystem('poisson', Poisson1DComp(num_nodes=num_nodes), promotes=['*'])
+    prob.model.linear_solver = linear_solver
+    prob.setup(mode=mode)
+    prob.set_solver_print(level=-1)
+    prob.run_model()
+    return prob
+
+
+def _compute_totals(prob):
+    with mock.patch.object(ScipyKrylov, '_mat_vec', autospec=True,
+                           side_effect=ScipyKrylov._mat_vec) as mat_vec:
+        start = time.perf_counter()
+        J = prob.compute_totals(['u'], ['f'], return_format='array')
+        elapsed = time.perf_counter() - start
+
+    return J, mat_vec.call_count, elapsed
+
+
+class BM(unittest.TestCase):
+    """Krylov iterations and timings with and without subspace recycling"""
+
+    def _check(self, mode, **options):
+        expected, _, direct_elapsed = _compute_totals(_poisson_prob(om.DirectSolver(), mode))
+
+        solver = om.ScipyKrylov(maxiter=5000, atol=1e-14, rtol=1e-12, **options)
+        J, iters, elapsed = _compute_totals(_poisson_prob(solver, mode))
+
+        print(f"poisson {mode} {options}: {iters} iterations, {elapsed:.3f} sec "
+              f"(DirectSolver {direct_elapsed:.3f} sec)")
+
+        assert_near_equal(J, expected, 1e-6)
+        return iters
+
+    def _check_recycle(self, mode):
+        iters = self._check(mode, solver='gcrodr', recycle=False)
+        recycled_iters = self._check(mode, solver='gcrodr')
+        self.assertLess(recycled_iters, iters)
+
+    def benchmark_poisson_gmres_fwd(self):
+        self._check('fwd', solver='gmres', restart=100)
+
+    def benchmark_poisson_gmres_rev(self):
+        self._check('rev', solver='gmres', restart=100)
+
+    def benchmark_poisson_recycle_fwd(self):
+        self._check_recycle('fwd')
+
+    def benchmark_poisson_recycle_rev(self):
+        self._check_recycle('rev')
+
+
+if __name__ == '__main__':
+    unittest.main()
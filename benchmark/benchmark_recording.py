@@ -0,0 +1,34 @@
+
+import unittest
+
+import openmdao.api as om
+from openmdao.test_suite.build4test import create_dyncomps
+
+
+def _record(recorder=None, **kwargs):
+    p = om.Problem()
+    create_dyncomps(p.model, 50, 10, 10, 5)
+    if recorder is None:
+        recorder = om.SqliteRecorder('bench.sql', record_viewer_data=False, **kwargs)
+    p.model.add_recorder(recorder)
+    p.setup()
+    p.final_setup()
+    for i in range(50):
+        p.run_model()
+    p.cleanup()
+
+
+class BM(unittest.TestCase):
+    """Recording of many iterations of a model with lots of outputs"""
+
+    def benchmark_sync(self):
+        _record()
+
+    def benchmark_background(self):
+        _record(background_writes=True)
+
+    def benchmark_background_binary(self):
+        _record(background_writes=True, binary_data=True)
+
+    def benchmark_array(self):
+        _record(om.ArrayRecorder('bench_arrays'))
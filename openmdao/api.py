@@ -93,6 +93,9 @@ from openmdao.utils.options_dictionary import OptionsDictionary
 # Recorders
 from openmdao.recorders.sqlite_recorder import SqliteRecorder
 from openmdao.recorders.case_reader import CaseReader
+from openmdao.recorders.array_recorder import ArrayRecorder
+from openmdao.recorders.ring_buffer_recorder import RingBufferRecorder
+from openmdao.recorders.array_reader import ArrayCaseReader
 
 # Visualizations
 from openmdao.visualization.n2_viewer.n2_viewer import n2
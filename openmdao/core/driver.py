@@ -1,5 +1,6 @@
 """Define a base class for all Drivers in OpenMDAO."""
 import functools
+from collections import OrderedDict
 from itertools import chain
 import pprint
 import sys
@@ -10,7 +11,7 @@ import weakref
 import numpy as np
 
 from openmdao.core.group import Group
-from openmdao.core.total_jac import _TotalJacInfo
+from openmdao.core.total_jac import _TotalJacInfo, _get_model_state_hash
 from openmdao.core.constants import INT_DTYPE, _SetupStatus
 from openmdao.recorders.recording_manager import RecordingManager
 from openmdao.recorders.recording_iteration_stack import Recording
@@ -51,6 +52,11 @@ class DriverResult():
         The number of times the total jacobian was computed.
     deriv_time : float
         The time spent computing the total jacobian.
+    deriv_cache_hits : int
+        The number of times the total jacobian was found in the driver's totals cache.
+    deriv_cache_misses : int
+        The number of times the total jacobian was computed because it wasn't in the driver's
+        totals cache.
     exit_status : str
         A string that may provide more detail about the results of the driver run.
     success : bool
@@ -68,6 +74,8 @@ class DriverResult():
         self.model_time = 0.0
         self.deriv_evals = 0
         self.deriv_time = 0.0
+        self.deriv_cache_hits = 0
+        self.deriv_cache_misses = 0
         self.exit_status = 'NOT_RUN'
         self.success = False
 
@@ -81,6 +89,8 @@ class DriverResult():
         self.model_time = 0.0
         self.deriv_evals = 0
         self.deriv_time = 0.0
+        self.deriv_cache_hits = 0
+        self.deriv_cache_misses = 0
         self.exit_status = 'NOT_RUN'
         self.success = False
 
@@ -122,8 +132,11 @@ class DriverResult():
              f'  model_evals : {self.model_evals}\n'
              f'  model_time  : {self.model_time:-10.4E} s\n'
              f'  deriv_evals : {self.deriv_evals}\n'
-             f'  deriv_time  : {self.deriv_time:-10.4E} s\n'
-             f'  exit_status : {self.exit_status}')
+             f'  deriv_time  : {self.deriv_time:-10.4E} s\n')
+        if self.deriv_cache_hits or self.deriv_cache_misses:
+            s += (f'  deriv_cache : {self.deriv_cache_hits} hits, '
+                  f'{self.deriv_cache_misses} misses\n')
+        s += f'  exit_status : {self.exit_status}'
         return s
 
     def __bool__(self):
@@ -253,6 +266,8 @@ class Driver(object, metaclass=DriverMetaclass):
         Cached total jacobian handling object.
     _total_jac_linear : _TotalJacInfo or None
         Cached linear total jacobian handling object.
+    _totals_cache : OrderedDict
+        Most recently used total jacobians, keyed on the model state they were computed at.
     result : DriverResult
         DriverResult object containing information for use in the optimization report.
     _has_scaling : bool
@@ -292,6 +307,13 @@ class Driver(object, metaclass=DriverMetaclass):
                                   'variable to one of the valid options.',
                              default=default_desvar_behavior)
 
+        self.options.declare('totals_cache_size', types=int, default=0, lower=0,
+                             desc='Number of total jacobians to keep in a least recently used '
+                                  'cache keyed on the state of the model. When totals are '
+                                  'requested again at a cached state, they are returned without '
+                                  'doing any linear solves. Derivatives are only recorded when '
+                                  'they are computed. 0 disables the cache.')
+
         # Case recording options
         self.recording_options = OptionsDictionary(parent_name=type(self).__name__)
 
@@ -349,6 +371,7 @@ class Driver(object, metaclass=DriverMetaclass):
         self._con_subjacs = {}
         self._total_jac = None
         self._total_jac_linear = None
+        self._totals_cache = OrderedDict()
 
         self._declare_options()
         self.options.update(kwargs)
@@ -439,6 +462,7 @@ class Driver(object, metaclass=DriverMetaclass):
         model = problem.model
 
         self._total_jac = None
+        self._totals_cache = OrderedDict()
 
         # Determine if any design variables are discrete.
         self._designvars_discrete = [name for name, meta in self._designvars.items()
@@ -1267,7 +1291,8 @@ class Driver(object, metaclass=DriverMetaclass):
         return self._problem().model.run_solve_nonlinear()
 
     @DriverResult.track_stats(kind='deriv')
-    def _compute_totals(self, of=None, wrt=None, return_format='flat_dict', driver_scaling=True):
+    def _compute_totals(self, of=None, wrt=None, return_format='flat_dict', driver_scaling=True,
+                        use_cache=True):
         """
         Compute derivatives of desired quantities with respect to desired inputs.
 
@@ -1284,10 +1309,17 @@ class Driver(object, metaclass=DriverMetaclass):
         return_format : str
             Format to return the derivatives. Default is a 'flat_dict', which
             returns them in a dictionary whose keys are tuples of form (of, wrt). For
-            the scipy optimizer, 'array' is also supported.
+            the scipy optimizer, 'array' is also supported. 'lazy' returns a mapping with the
+            same keys that only does the linear solves needed for a block when it's accessed.
+            Lazy totals are not kept in the totals cache, and all of their blocks are solved
+            when derivatives are recorded. 'coo', 'csc' and 'csr' return a
+            scipy sparse matrix without allocating the dense jacobian.
         driver_scaling : bool
             If True (default), scale derivative values by the quantities specified when the desvars
             and responses were added. If False, leave them unscaled.
+        use_cache : bool
+            If False, don't look up or store the totals in the totals cache, so the _TotalJacInfo
+            of the driver always holds the returned derivatives.
 
         Returns
         -------
@@ -1303,7 +1335,27 @@ class Driver(object, metaclass=DriverMetaclass):
             print(header)
             print(len(header) * '-' + '\n')
 
-        if self._total_jac is None:
+        # the passes that compute the total sparsity randomize the partials at the same model
+        # state, so they must neither read nor fill the cache
+        cache_size = self.options['totals_cache_size']
+        if use_cache and cache_size > 0 and return_format != 'lazy' and \
+                not problem._computing_coloring and problem._metadata['coloring_randgen'] is None:
+            key = self._get_totals_cache_key(of, wrt, return_format, driver_scaling)
+            if key is not None:
+                try:
+                    totals = self._totals_cache[key]
+                except KeyError:
+                    self.result.deriv_cache_misses += 1
+                else:
+                    self._totals_cache.move_to_end(key)
+                    self.result.deriv_cache_hits += 1
+                    return _copy_totals(totals)
+        else:
+            key = None
+
+        if self._total_jac is None or (return_format != self._total_jac.return_format and
+                                       not {return_format, self._total_jac.return_format} <=
+                                       {'flat_dict', 'dict', 'array'}):
             total_jac = _TotalJacInfo(problem, of, wrt, return_format,
                                       approx=problem.model._owns_approx_jac,
                                       debug_print=debug_print,
@@ -1318,11 +1370,53 @@ class Driver(object, metaclass=DriverMetaclass):
 
         totals = total_jac.compute_totals()
 
+        if key is not None:
+            self._totals_cache[key] = _copy_totals(totals)
+            if len(self._totals_cache) > cache_size:
+                self._totals_cache.popitem(last=False)
+
         if self.recording_options['record_derivatives']:
             self.record_derivatives()
 
         return totals
 
+    def _get_totals_cache_key(self, of, wrt, return_format, driver_scaling):
+        """
+        Return the key of the totals cache for the current state of the model.
+
+        The key combines a hash of the model inputs and outputs, which include the design
+        variables, with the arguments of the totals request.
+
+        Parameters
+        ----------
+        of : list of variable name str or None
+            Variables whose derivatives will be computed.
+        wrt : list of variable name str or None
+            Variables with respect to which the derivatives will be computed.
+        return_format : str
+            Format to return the derivatives.
+        driver_scaling : bool
+            If True, derivative values are scaled by the driver scaling.
+
+        Returns
+        -------
+        tuple or None
+            The cache key, or None if the model state can't be hashed.
+        """
+        model = self._problem().model
+
+        digest = _get_model_state_hash(model)
+        if digest is None:
+            # unpicklable discrete values, so we can't tell if the state has changed
+            return None
+
+        # every proc must agree on whether the totals are cached
+        if model.comm.size > 1:
+            digest = tuple(model.comm.allgather(digest))
+
+        return (digest, None if of is None else tuple(of), None if wrt is None else tuple(wrt),
+                return_format, driver_scaling)
+
     def record_derivatives(self):
         """
         Record the current total jacobian.
@@ -1378,7 +1472,8 @@ class Driver(object, metaclass=DriverMetaclass):
                          min_improve_pct=coloring_mod._DEF_COMP_SPARSITY_ARGS['min_improve_pct'],
                          show_summary=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_summary'],
                          show_sparsity=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_sparsity'],
-                         use_scaling=coloring_mod._DEF_COMP_SPARSITY_ARGS['use_scaling']):
+                         use_scaling=coloring_mod._DEF_COMP_SPARSITY_ARGS['use_scaling'],
+                         cache=False, num_procs=1):
         """
         Set options for total deriv coloring.
 
@@ -1401,6 +1496,14 @@ class Driver(object, metaclass=DriverMetaclass):
             If True, display sparsity with coloring info after generating coloring.
         use_scaling : bool
             If True, use driver scaling when generating the sparsity.
+        cache : bool
+            If True, save the computed coloring in the coloring directory of the problem, keyed
+            by a hash of the variable sizes, connections, declared partial sparsity, design
+            variables and responses, and load it instead of computing the sparsity in later runs
+            with the same structure.
+        num_procs : int
+            Number of forked processes that share the linear solves used to compute the total
+            sparsity. Ignored when running under MPI or where processes can't be forked.
         """
         self._coloring_info.coloring = None
         self._coloring_info.num_full_jacs = num_full_jacs
@@ -1415,6 +1518,8 @@ class Driver(object, metaclass=DriverMetaclass):
         self._coloring_info.show_summary = show_summary
         self._coloring_info.show_sparsity = show_sparsity
         self._coloring_info.use_scaling = use_scaling
+        self._coloring_info.cache = cache
+        self._coloring_info.num_procs = num_procs
 
     def use_fixed_coloring(self, coloring=coloring_mod._STD_COLORING_FNAME):
         """
@@ -1824,6 +1929,25 @@ def record_iteration(requester, prob, case_name):
     rec_mgr.record_iteration(requester, data, requester._get_recorder_metadata(case_name))
 
 
+def _copy_totals(totals):
+    """
+    Return a copy of totals that doesn't share any arrays with the original.
+
+    Parameters
+    ----------
+    totals : ndarray or dict
+        Derivatives in any of the driver return formats.
+
+    Returns
+    -------
+    ndarray or dict
+        The copy.
+    """
+    if isinstance(totals, dict):
+        return {key: _copy_totals(val) for key, val in totals.items()}
+    return totals.copy()
+
+
 def filter_by_meta(metadict_items, key, chk_none=False, exclude=False):
     """
     Filter metadata items based on their value.
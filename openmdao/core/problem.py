@@ -34,6 +34,7 @@ from openmdao.jacobians.dictionary_jacobian import _CheckingJacobian
 from openmdao.approximation_schemes.complex_step import ComplexStep
 from openmdao.approximation_schemes.finite_difference import FiniteDifference
 from openmdao.solvers.solver import SolverInfo
+from openmdao.solvers.linear.direct import DirectSolver
 from openmdao.vectors.default_vector import DefaultVector
 from openmdao.error_checking.check_config import _default_checks, _all_checks, \
     _all_non_redundant_checks
@@ -823,6 +824,306 @@ class Problem(object, metaclass=ProblemMetaclass):
             # may need to convert some lnames to auto_ivc names
             return {n: lvec[conns[n] if n in conns else n].copy() for n in lnames}
 
+    def compute_jacvec_product_batch(self, of, wrt, mode, seeds):
+        """
+        Compute the total jacobian vector products for a block of seeds.
+
+        The linear solution vectors and variable indices are set up once for the whole block.
+        If the model's linear solver is a DirectSolver, all of the seeds are handled with a
+        single multi-RHS solve using the existing LU factorization. As with
+        compute_jacvec_product, the model must already be linearized.
+
+        Parameters
+        ----------
+        of : list of str
+            Variables whose derivatives will be computed.
+        wrt : list of str
+            Derivatives will be computed with respect to these variables.
+        mode : str
+            Derivative direction ('fwd' or 'rev').
+        seeds : ndarray
+            2D array with one seed per column. The rows are the flattened dresidual (fwd) or
+            doutput (rev) values of the 'wrt' (fwd) or 'of' (rev) variables, in order.
+
+        Returns
+        -------
+        ndarray
+            2D array with one jacobian vector product per column. The rows are the flattened
+            values of the 'of' (fwd) or 'wrt' (rev) variables, in order.
+        """
+        if mode == 'fwd':
+            lnames, rnames = of, wrt
+            lkind, rkind = 'output', 'residual'
+        else:  # rev
+            lnames, rnames = wrt, of
+            lkind, rkind = 'residual', 'output'
+
+        model = self.model
+        rvec = model._vectors[rkind]['linear']
+        lvec = model._vectors[lkind]['linear']
+
+        rinds = self._get_jacvec_inds(rvec, rnames)
+        linds = self._get_jacvec_inds(lvec, lnames)
+
+        seeds = np.asarray(seeds)
+        if seeds.ndim == 1:
+            seeds = seeds.reshape((seeds.size, 1))
+
+        if seeds.ndim != 2 or seeds.shape[0] != rinds.size:
+            raise RuntimeError(f"{self.msginfo}: seeds must be a 2D array with {rinds.size} rows "
+                               f"in {mode} mode but have shape {seeds.shape}.")
+
+        nseeds = seeds.shape[1]
+        solver = model.linear_solver
+
+        # A model level DirectSolver can solve for all seeds at once. The problem level vectors
+        # are unscaled, and so is the LU factorization of an assembled jacobian, so in that case
+        # (or if there is no scaling at all) no conversion of the block is needed.
+        if (isinstance(solver, DirectSolver) and model.comm.size == 1 and
+                not model._owns_approx_jac and
+                (solver._assembled_jac is not None or
+                 not (model._has_output_scaling or model._has_resid_scaling))):
+            rhs = np.zeros((rvec.asarray().size, nseeds),
+                           dtype=np.result_type(seeds, rvec.asarray()))
+            # We apply a -1 here because the derivative of the output is minus the derivative of
+            # the residual in openmdao.
+            rhs[rinds] = -seeds
+            return solver._solve_factored(mode, rhs)[linds]
+
+        products = np.empty((linds.size, nseeds), dtype=np.result_type(seeds, lvec.asarray()))
+        rdata = rvec.asarray()
+        ldata = lvec.asarray()
+
+        for i in range(nseeds):
+            rvec.set_val(0.)
+            rdata[rinds] = -seeds[:, i]
+            model.run_solve_linear(mode)
+            products[:, i] = ldata[linds]
+
+        return products
+
+    def _get_jacvec_inds(self, vec, names):
+        """
+        Return the indices of the given variables in the local data array of a linear vector.
+
+        Parameters
+        ----------
+        vec : <Vector>
+            The linear vector.
+        names : list of str
+            Promoted or absolute output names, or input names that will be converted to the
+            names of their connected sources.
+
+        Returns
+        -------
+        ndarray
+            Index array into the vector's data.
+        """
+        conns = self.model._conn_global_abs_in2out
+        slices = vec.get_slice_dict()
+
+        inds = []
+        for name in names:
+            if name in conns:
+                name = conns[name]
+            elif name not in slices:
+                abs_name = vec._name2abs_name(name)
+                if abs_name is None:
+                    raise KeyError(f"{self.msginfo}: Variable name '{name}' not found.")
+                name = abs_name
+            slc = slices[name]
+            inds.append(np.arange(slc.start, slc.stop))
+
+        return np.concatenate(inds) if inds else np.zeros(0, dtype=int)
+
+    def compute_hessian_vector_product(self, of, wrt, v, step=1e-6, form='central',
+                                       driver_scaling=False):
+        """
+        Compute the product of the second derivatives of 'of' variables with a vector.
+
+        The result is the directional derivative of the total jacobian along v, computed by
+        finite differencing total jacobians that are computed at perturbed design points. For a
+        scalar 'of' variable its row is the product of its Hessian with v. The model is run at
+        each perturbed point, and its state and linearization are restored afterwards.
+
+        Parameters
+        ----------
+        of : list of str
+            Variables whose derivatives will be computed.
+        wrt : list of str
+            Derivatives will be computed with respect to these variables.
+        v : ndarray
+            Flat array of the same size as the combined 'wrt' variables (or desvar indices).
+        step : float
+            Size of the perturbation of the design point along the direction of v.
+        form : str
+            Finite difference form, one of 'forward', 'backward' or 'central'.
+        driver_scaling : bool
+            If True (default is False), v and the result use driver scaling.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (size of 'of', size of 'wrt').
+        """
+        v = np.asarray(v)
+        return self._compute_hessian_vector_products(of, wrt, v.reshape((v.size, 1)), step,
+                                                     form, driver_scaling)[0]
+
+    def compute_hessian(self, of, wrt, sparsity=None, step=1e-6, form='central',
+                        driver_scaling=False):
+        """
+        Compute the Hessian of a scalar variable using Hessian-vector products.
+
+        If the sparsity of the Hessian is known, the columns are grouped using a graph coloring
+        so that only one Hessian-vector product per color is needed.
+
+        Parameters
+        ----------
+        of : str
+            Name of a scalar variable, typically the objective.
+        wrt : list of str
+            Derivatives will be computed with respect to these variables.
+        sparsity : ndarray, coo_matrix or None
+            Sparsity pattern of the Hessian. If None, the Hessian is assumed to be dense.
+        step : float
+            Size of the perturbation of the design point along each product direction.
+        form : str
+            Finite difference form, one of 'forward', 'backward' or 'central'.
+        driver_scaling : bool
+            If True (default is False), the Hessian uses driver scaling.
+
+        Returns
+        -------
+        ndarray
+            The symmetric Hessian matrix.
+        """
+        if sparsity is None:
+            coloring = vecs = None
+        else:
+            coloring = coloring_mod._compute_coloring(sparsity, 'fwd')
+            vecs = np.zeros((sparsity.shape[1], coloring.total_solves()))
+            for i, cols in enumerate(coloring.color_iter('fwd')):
+                vecs[cols, i] = 1.
+
+        hvps = self._compute_hessian_vector_products([of], wrt, vecs, step, form, driver_scaling,
+                                                     scalar_of=True)
+
+        if coloring is None:
+            H = np.vstack(hvps)
+        else:
+            H = coloring.expand_jac(np.vstack(hvps).T, 'fwd')
+
+        return .5 * (H + H.T)
+
+    def _compute_hessian_vector_products(self, of, wrt, vecs, step, form, driver_scaling,
+                                         scalar_of=False):
+        """
+        Compute the directional derivatives of the total jacobian along some vectors.
+
+        Parameters
+        ----------
+        of : list of str
+            Variables whose derivatives will be computed.
+        wrt : list of str
+            Derivatives will be computed with respect to these variables.
+        vecs : ndarray or None
+            2D array with one direction per column. If None, the columns of the identity are
+            used.
+        step : float
+            Size of the perturbation of the design point along each direction.
+        form : str
+            Finite difference form, one of 'forward', 'backward' or 'central'.
+        driver_scaling : bool
+            If True, vecs and the results use driver scaling.
+        scalar_of : bool
+            If True, raise an error if the 'of' variables don't have a total size of one.
+
+        Returns
+        -------
+        list of ndarray
+            The directional derivative of the total jacobian for each direction.
+        """
+        if form not in ('forward', 'backward', 'central'):
+            raise ValueError(f"{self.msginfo}: '{form}' is not a valid finite difference form. "
+                             "Must be one of ['forward', 'backward', 'central'].")
+
+        if self._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP:
+            with multi_proc_exception_check(self.comm):
+                self.final_setup()
+
+        model = self.model
+        total_info = _TotalJacInfo(self, of, wrt, 'array', approx=model._owns_approx_jac,
+                                   driver_scaling=driver_scaling)
+        nwrt = total_info.J.shape[1]
+
+        if scalar_of and total_info.J.shape[0] != 1:
+            raise ValueError(f"{self.msginfo}: compute_hessian requires a scalar 'of' variable "
+                             f"but '{of[0]}' has size {total_info.J.shape[0]}.")
+
+        if vecs is None:
+            vecs = np.eye(nwrt)
+        elif vecs.shape[0] != nwrt:
+            raise RuntimeError(f"{self.msginfo}: Expected a vector of size {nwrt} but got one "
+                               f"of size {vecs.shape[0]}.")
+
+        # the parts of the design point that are perturbed, with the factor that converts a
+        # perturbation of a jacobian column into a perturbation of the model output.
+        outputs = model._outputs
+        perturbs = []
+        for name, meta in total_info.input_meta['fwd'].items():
+            source = meta['source']
+            if model._var_allprocs_abs2meta['output'][source]['distributed']:
+                raise RuntimeError(f"{self.msginfo}: Hessian vector products with respect to "
+                                   f"distributed variable '{name}' are not supported.")
+            if not outputs._contains_abs(source):
+                continue
+            indices = meta['indices'] if 'indices' in meta else None
+            scaler = meta['total_scaler'] if driver_scaling else None
+            perturbs.append((outputs._abs_get_val(source), meta['jac_slice'],
+                             slice(None) if indices is None else indices.flat(),
+                             1. if scaler is None else scaler))
+
+        state = [vec.asarray(copy=True) for vec in (outputs, model._inputs, model._residuals)]
+
+        def perturbed_totals(delta):
+            for val, jac_slice, idxs, scaler in perturbs:
+                val[idxs] += delta[jac_slice] / scaler
+            try:
+                model.run_solve_nonlinear()
+                return total_info.compute_totals().copy()
+            finally:
+                for vec, data in zip((outputs, model._inputs, model._residuals), state):
+                    vec.set_val(data)
+
+        base = None
+        if form != 'central':
+            base = total_info.compute_totals().copy()
+
+        hvps = []
+        try:
+            for i in range(vecs.shape[1]):
+                v = vecs[:, i]
+                vnorm = np.linalg.norm(v)
+                if vnorm == 0.:
+                    hvps.append(np.zeros(total_info.J.shape))
+                    continue
+
+                h = step / vnorm
+                if form == 'forward':
+                    hvps.append((perturbed_totals(h * v) - base) / h)
+                elif form == 'backward':
+                    hvps.append((base - perturbed_totals(-h * v)) / h)
+                else:
+                    hvps.append((perturbed_totals(h * v) - perturbed_totals(-h * v)) /
+                                (2. * h))
+        finally:
+            # the model was last linearized at a perturbed point
+            if np.any(vecs):
+                model.run_linearize()
+
+        return hvps
+
     def _setup_recording(self):
         """
         Set up case recording.
@@ -1015,6 +1316,8 @@ class Problem(object, metaclass=ProblemMetaclass):
                                 # current derivative solve.
             'coloring_randgen': None,  # If total coloring is being computed, will contain a random
                                        # number generator, else None.
+            'coloring_seed_split': None,  # If total sparsity is being computed by several
+                                          # processes, (number of processes, process index).
             'group_by_pre_opt_post': self.options['group_by_pre_opt_post'],  # see option
             'relevance_cache': {},  # cache of relevance objects
             'rel_array_cache': {},  # cache of relevance arrays
@@ -1968,9 +2271,14 @@ class Problem(object, metaclass=ProblemMetaclass):
             Variables with respect to which the derivatives will be computed.
             Default is None, which uses the driver's desvars.
         return_format : str
-            Format to return the derivatives. Can be 'dict', 'flat_dict', or 'array'.
-            Default is a 'flat_dict', which returns them in a dictionary whose keys are
-            tuples of form (of, wrt).
+            Format to return the derivatives. Can be 'dict', 'flat_dict', 'array', 'lazy',
+            'coo', 'csc' or 'csr'. Default is a 'flat_dict', which returns them in a dictionary
+            whose keys are tuples of form (of, wrt). 'lazy' returns a read only mapping with the
+            same keys that only does the linear solves needed for each (of, wrt) block when it's
+            accessed, keeping them until the model state changes. 'coo', 'csc' and 'csr' return
+            a scipy sparse matrix of the whole jacobian, whose sparsity comes from the total
+            coloring if there is one, and otherwise from which responses depend on which design
+            variables. The dense jacobian is never allocated.
         debug_print : bool
             Set to True to print out some debug information during linear solve.
         driver_scaling : bool
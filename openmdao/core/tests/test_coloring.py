@@ -16,13 +16,19 @@ try:
 except ImportError:
     load_npz = None
 
+from scipy.sparse import coo_matrix, diags, random as sparse_random
+
 import openmdao.api as om
+import openmdao.utils.coloring as coloring_mod
+from openmdao.utils import coloring_reference
 from openmdao.core.problem import _clear_problem_names
 from openmdao.utils.general_utils import set_pyoptsparse_opt
 from openmdao.utils.array_utils import array_viz
-from openmdao.utils.coloring import _compute_coloring, compute_total_coloring, Coloring
+from openmdao.utils.coloring import _compute_coloring, compute_total_coloring, Coloring, \
+    _sum_abs_totals, _sum_abs_totals_forked
 from openmdao.utils.mpi import MPI, multi_proc_exception_check
 from openmdao.utils.testing_utils import use_tempdirs, set_env_vars
+from openmdao.utils.assert_utils import assert_warning
 from openmdao.test_suite.tot_jac_builder import TotJacBuilder
 from openmdao.utils.general_utils import run_driver, printoptions
 
@@ -1199,6 +1205,55 @@ class BidirectionalTestCase(unittest.TestCase):
         self.assertEqual(tot_colors, expected_colors)
 
 
+class ColoringKernelsTestCase(unittest.TestCase):
+    # the vectorized coloring kernels must give the same colorings as the reference versions
+
+    def _check_same(self, J):
+        J = coo_matrix((np.ones(J.nnz, dtype=bool), (J.row, J.col)), shape=J.shape)
+        for func in ('_get_full_disjoint_cols', 'MNCO_bidir'):
+            ours = getattr(coloring_mod, func)(J)
+            ref = getattr(coloring_reference, func)(J)
+            if func == 'MNCO_bidir':
+                for ours_dir, ref_dir in ((ours._fwd, ref._fwd), (ours._rev, ref._rev)):
+                    if ref_dir is None:
+                        self.assertIsNone(ours_dir)
+                        continue
+                    self.assertEqual(ours_dir[0], ref_dir[0])
+                    for rows, ref_rows in zip(ours_dir[1], ref_dir[1]):
+                        if ref_rows is None:
+                            self.assertIsNone(rows)
+                        else:
+                            np.testing.assert_array_equal(rows, ref_rows)
+            else:
+                self.assertEqual(ours, ref)
+
+        self.assertEqual(coloring_mod._col2rows(J.row, J.col, J.shape[1]),
+                         coloring_reference._col2rows(J.row, J.col, J.shape[1]))
+
+    def test_random(self):
+        gen = np.random.default_rng(11)
+        for i in range(50):
+            nrows, ncols = gen.integers(1, 40, 2)
+            J = sparse_random(nrows, ncols, density=gen.uniform(.01, .5), format='coo',
+                              random_state=i)
+            if J.nnz > 0:
+                self._check_same(J)
+
+    def test_banded(self):
+        for n in (3, 7, 60):
+            self._check_same(diags([np.ones(n)] * 5, range(-2, 3), shape=(n, n), format='coo'))
+
+    def test_block(self):
+        builder = TotJacBuilder(45, 40)
+        builder.add_row(44, density=.5)
+        builder.add_col(39, density=.5)
+        builder.add_block_diag([(4, 3), (6, 7), (10, 10), (20, 15)], 0, 0)
+        self._check_same(coo_matrix(builder.J))
+
+    def test_eisenstat(self):
+        self._check_same(coo_matrix(TotJacBuilder.eisenstat(12).J))
+
+
 def _get_random_mat(rows, cols, comm, generator=None):
     gen = generator if generator is not None else np.random.default_rng()
 
@@ -1595,5 +1650,119 @@ class SimulColoringConfigCheckTestCase(unittest.TestCase):
 
         self.assertIsNotNone(p.driver._get_coloring())
 
+
+@use_tempdirs
+class TotalColoringCacheTestCase(unittest.TestCase):
+    def _build_model(self, sizes, partials_method='cs'):
+        p = om.Problem(name='total_coloring_cache')
+        model = p.model
+        p.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', disp=False)
+        p.driver.declare_coloring(cache=True)
+
+        ofnames = ['w', 'x', 'y'][:len(sizes)]
+        indeps = model.add_subsystem('indeps', om.IndepVarComp())
+        for name, sz in zip(ofnames, sizes):
+            indeps.add_output(name, val=np.ones(sz))
+            model.add_design_var('indeps.' + name)
+            model.add_constraint('comp.' + name, lower=0.0)
+            model.connect('indeps.' + name, 'comp.' + name + '_in')
+
+        inames = [n + '_in' for n in ofnames]
+        model.add_subsystem('comp', DumbComp(inames, ofnames, sizes, sizes))
+        model.add_objective('comp.obj')
+
+        p.setup()
+        return p
+
+    def _run(self, p):
+        _clear_problem_names()
+        stdout = sys.stdout
+        sys.stdout = strout = StringIO()
+        try:
+            p.run_driver()
+        finally:
+            sys.stdout = stdout
+        return p.driver._get_coloring(), strout.getvalue()
+
+    def test_cache(self):
+        p = self._build_model([3, 4, 5])
+        coloring, out = self._run(p)
+        self.assertNotIn('loading total coloring from cache file', out)
+        cache_dir = p.get_coloring_dir(mode='input')
+        fnames = list(cache_dir.glob('total_coloring_*.pkl'))
+        self.assertEqual(len(fnames), 1)
+
+        # same structure, so the sparsity isn't computed again
+        cached, out = self._run(self._build_model([3, 4, 5]))
+        self.assertIn(f'loading total coloring from cache file {fnames[0]}', out)
+        self.assertNotIn('Full total jacobian', out)
+        self.assertEqual(cached._fwd[0], coloring._fwd[0])
+        self.assertEqual(cached._meta['structure_hash'], coloring._meta['structure_hash'])
+
+        # a different size is a different entry
+        _, out = self._run(self._build_model([3, 4, 6]))
+        self.assertNotIn('loading total coloring from cache file', out)
+        self.assertEqual(len(list(cache_dir.glob('total_coloring_*.pkl'))), 2)
+
+    def test_invalid_entry(self):
+        p = self._build_model([3, 4, 5])
+        self._run(p)
+        fname, = p.get_coloring_dir(mode='input').glob('total_coloring_*.pkl')
+
+        # an entry that doesn't match is removed and replaced
+        coloring = Coloring.load(fname)
+        coloring._meta['structure_hash'] = 'foo'
+        coloring.save(fname)
+
+        with assert_warning(om.DerivativesWarning,
+                            f"ScipyOptimizeDriver: Removing invalid cached total coloring "
+                            f"'{fname}': structure hash doesn't match."):
+            _, out = self._run(self._build_model([3, 4, 5]))
+        self.assertNotIn('loading total coloring from cache file', out)
+        self.assertNotEqual(Coloring.load(fname)._meta['structure_hash'], 'foo')
+
+        _, out = self._run(self._build_model([3, 4, 5]))
+        self.assertIn('loading total coloring from cache file', out)
+
+
+
+@unittest.skipUnless(sys.platform.startswith('linux'), "requires forked processes")
+@use_tempdirs
+class TotalSparsityProcsTestCase(unittest.TestCase):
+    def test_forked_sparsity(self):
+        colorings = []
+        for mode in ('fwd', 'rev'):
+            for num_procs in (1, 3):
+                p = om.Problem()
+                model = p.model
+                sizes = [3, 4, 5]
+                onames = ['w', 'x', 'y']
+                inames = [n + '_in' for n in onames]
+                indeps = model.add_subsystem('indeps', om.IndepVarComp())
+                model.add_subsystem('comp', DumbComp(inames, onames, sizes, sizes))
+                for iname, oname, sz in zip(inames, onames, sizes):
+                    indeps.add_output(oname, val=np.ones(sz))
+                    model.add_design_var('indeps.' + oname)
+                    model.add_constraint('comp.' + oname, lower=0.0)
+                    model.connect('indeps.' + oname, 'comp.' + iname)
+                model.add_objective('comp.obj')
+                p.setup(mode=mode)
+                p.run_model()
+                colorings.append(compute_total_coloring(p, mode=mode, num_procs=num_procs))
+
+        for serial, forked in (colorings[:2], colorings[2:]):
+            self.assertEqual(forked._meta['sparsity_procs'], 3)
+            self.assertEqual(forked._meta['good_tol'], serial._meta['good_tol'])
+            np.testing.assert_array_equal(forked.get_dense_sparsity(),
+                                          serial.get_dense_sparsity())
+            self.assertEqual(forked.total_solves(), serial.total_solves())
+
+        # each process does a disjoint share of the solves
+        of = ['comp.w', 'comp.x', 'comp.y', 'comp.obj']
+        wrt = ['indeps.w', 'indeps.x', 'indeps.y']
+        np.testing.assert_array_equal(_sum_abs_totals_forked(p, False, of, wrt, 2, False, 3),
+                                      _sum_abs_totals(p, False, of, wrt, 2, False))
+
+
 if __name__ == '__main__':
     unittest.main()
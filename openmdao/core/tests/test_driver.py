@@ -5,15 +5,17 @@ from packaging.version import Version
 from io import StringIO
 import sys
 import unittest
+from unittest import mock
 
 import numpy as np
 
 import openmdao.api as om
 from openmdao.core.driver import Driver
+from openmdao.core.total_jac import _TotalJacInfo
 from openmdao.utils.units import convert_units
 from openmdao.utils.assert_utils import assert_near_equal, assert_warnings, assert_check_totals, assert_no_warning
 from openmdao.utils.general_utils import printoptions, set_pyoptsparse_opt
-from openmdao.utils.testing_utils import use_tempdirs
+from openmdao.utils.testing_utils import use_tempdirs, set_env_vars_context
 from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.test_suite.components.sellar import SellarDerivatives
 from openmdao.test_suite.components.simple_comps import DoubleArrayComp, NonSquareArrayComp
@@ -847,6 +849,137 @@ class TestDriver(unittest.TestCase):
         with assert_warnings(expected_warnings):
             prob.final_setup()
 
+    def test_totals_cache(self):
+        prob = om.Problem()
+        prob.model = model = SellarDerivatives()
+        model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12)
+
+        model.add_design_var('z', ref=2.0)
+        model.add_design_var('x')
+        model.add_objective('obj')
+        model.add_constraint('con1', upper=0.)
+        prob.set_solver_print(level=0)
+
+        prob.driver.options['totals_cache_size'] = 1
+        prob.setup()
+
+        calls = []
+        compute_totals = _TotalJacInfo.compute_totals
+
+        def counting_compute_totals(self, *args, **kwargs):
+            calls.append(1)
+            return compute_totals(self, *args, **kwargs)
+
+        with mock.patch.object(_TotalJacInfo, 'compute_totals', counting_compute_totals):
+            prob.run_model()
+            base = prob.driver._compute_totals(return_format='array')
+
+            # same state, so no linear solves
+            base[:] = 0.
+            totals = prob.driver._compute_totals(return_format='array')
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(prob.driver.result.deriv_cache_hits, 1)
+            self.assertEqual(prob.driver.result.deriv_cache_misses, 1)
+
+            # the cached totals aren't changed by modifying the returned ones
+            assert_near_equal(prob.driver._compute_totals(return_format='array'), totals, 1e-15)
+            self.assertEqual(len(calls), 1)
+
+            # a different request at the same state is computed
+            prob.driver._compute_totals(return_format='dict')
+            self.assertEqual(len(calls), 2)
+
+            # a new state is computed and evicts the least recently used entry
+            prob.set_val('x', 2.)
+            prob.run_model()
+            new_totals = prob.driver._compute_totals(return_format='array')
+            self.assertEqual(len(calls), 3)
+            self.assertFalse(np.allclose(new_totals, totals))
+
+            prob.set_val('x', 1.)
+            prob.run_model()
+            assert_near_equal(prob.driver._compute_totals(return_format='array'), totals, 1e-10)
+            self.assertEqual(len(calls), 4)
+
+        self.assertEqual(prob.driver.result.deriv_cache_hits, 2)
+        self.assertEqual(prob.driver.result.deriv_cache_misses, 4)
+
+    def test_totals_cache_optimization(self):
+        results = []
+        for size in (0, 10):
+            prob = om.Problem()
+            prob.model = model = SellarDerivatives()
+            model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12)
+            model.add_design_var('z', lower=np.array([-10.0, 0.0]), upper=np.array([10.0, 10.0]))
+            model.add_design_var('x', lower=0.0, upper=10.0)
+            model.add_objective('obj')
+            model.add_constraint('con1', upper=0.0)
+            model.add_constraint('con2', upper=0.0)
+            prob.set_solver_print(level=0)
+
+            prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False,
+                                                 totals_cache_size=size)
+            prob.setup()
+            prob.run_driver()
+            results.append(prob)
+
+        assert_near_equal(results[1].get_val('obj'), results[0].get_val('obj'), 1e-12)
+        assert_near_equal(results[1].get_val('z'), results[0].get_val('z'), 1e-12)
+        self.assertEqual(results[0].driver.result.deriv_cache_misses, 0)
+        self.assertEqual(results[1].driver.result.deriv_cache_misses,
+                         results[0].driver.result.deriv_evals)
+        self.assertIn('deriv_cache', repr(results[1].driver.result))
+        self.assertNotIn('deriv_cache', repr(results[0].driver.result))
+
+    def test_totals_cache_coloring(self):
+        # the randomized passes that compute the total sparsity must not use the cache
+        results = []
+        for size in (0, 10):
+            prob = om.Problem(reports=False)
+            prob.model = model = SellarDerivatives()
+            model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12)
+            model.add_design_var('z', lower=np.array([-10.0, 0.0]), upper=np.array([10.0, 10.0]))
+            model.add_design_var('x', lower=0.0, upper=10.0)
+            model.add_objective('obj')
+            model.add_constraint('con1', upper=0.0)
+            model.add_constraint('con2', upper=0.0)
+            prob.set_solver_print(level=0)
+
+            prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False,
+                                                 totals_cache_size=size)
+            prob.driver.declare_coloring(use_scaling=True)
+            prob.setup()
+            prob.run_driver()
+            results.append(prob)
+
+        assert_near_equal(results[1].get_val('obj'), results[0].get_val('obj'), 1e-12)
+        assert_near_equal(results[1].get_val('z'), results[0].get_val('z'), 1e-12)
+        self.assertEqual(results[1].driver.result.deriv_cache_hits, 0)
+        self.assertEqual(results[1].driver.result.deriv_evals,
+                         results[0].driver.result.deriv_evals)
+
+    def test_totals_cache_scaling_report(self):
+        prob = om.Problem()
+        prob.model = model = SellarDerivatives()
+        model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12)
+        model.add_design_var('z', lower=np.array([-10.0, 0.0]), upper=np.array([10.0, 10.0]))
+        model.add_design_var('x', lower=0.0, upper=10.0)
+        model.add_objective('obj')
+        model.add_constraint('con1', upper=0.0)
+        model.add_constraint('con2', upper=0.0)
+        prob.set_solver_print(level=0)
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False,
+                                             totals_cache_size=10)
+        prob.driver.declare_coloring(use_scaling=True)
+
+        with set_env_vars_context(OPENMDAO_REPORTS='1'):
+            prob.setup()
+            prob.run_driver()
+
+        self.assertTrue((prob.get_reports_dir() / 'driver_scaling_report.html').is_file())
+        assert_near_equal(prob.get_val('obj'), 3.18339395045, 1e-8)
+
     def test_record_residuals_includes_excludes(self):
         import openmdao.api as om
         from openmdao.test_suite.components.sellar import SellarProblem
@@ -0,0 +1,169 @@
+""" Tests for Hessian vector products computed from total derivatives. """
+
+import unittest
+from unittest import mock
+
+import numpy as np
+from scipy.sparse import diags
+
+import openmdao.api as om
+from openmdao.test_suite.components.paraboloid import Paraboloid
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+try:
+    from parameterized import parameterized
+except ImportError:
+    from openmdao.utils.assert_utils import SkipParameterized as parameterized
+
+
+def _paraboloid(mode='rev'):
+    prob = om.Problem()
+    prob.model.add_subsystem('p', Paraboloid(), promotes=['*'])
+    prob.model.add_design_var('x', lower=-50., upper=50.)
+    prob.model.add_design_var('y', lower=-50., upper=50.)
+    prob.model.add_objective('f_xy')
+    prob.setup(mode=mode)
+    prob.set_val('x', 1.)
+    prob.set_val('y', 2.)
+    prob.run_model()
+    return prob
+
+
+def _chain(size=6, mode='rev'):
+    # f = sum(x[i]**2 * x[i+1]) has a tridiagonal Hessian, and y = x**3 has a diagonal one
+    # for each entry.
+    prob = om.Problem()
+    model = prob.model
+    model.add_subsystem('c1', om.ExecComp('y = x**3', x=np.ones(size), y=np.ones(size),
+                                          has_diag_partials=True), promotes=['x'])
+    model.add_subsystem('c2', om.ExecComp('f = sum(x[:-1]**2 * x[1:])', x=np.ones(size)),
+                        promotes=['x'])
+    model.linear_solver = om.DirectSolver()
+    prob.setup(mode=mode)
+    prob.set_val('x', np.arange(1., size + 1.) / size)
+    prob.run_model()
+    return prob
+
+
+def _chain_hessian(x):
+    n = x.size
+    H = np.zeros((n, n))
+    for i in range(n - 1):
+        H[i, i] += 2. * x[i + 1]
+        H[i, i + 1] += 2. * x[i]
+        H[i + 1, i] += 2. * x[i]
+    return H
+
+
+@use_tempdirs
+class HessianVectorProductTestCase(unittest.TestCase):
+
+    @parameterized.expand([('fwd', 'central'), ('rev', 'central'), ('rev', 'forward'),
+                           ('rev', 'backward')])
+    def test_paraboloid(self, mode, form):
+        prob = _paraboloid(mode)
+        H = np.array([[2., 1.], [1., 2.]])
+        v = np.array([.3, -1.7])
+
+        hvp = prob.compute_hessian_vector_product(['f_xy'], ['x', 'y'], v, form=form)
+
+        assert_near_equal(hvp, H.dot(v).reshape((1, 2)), 1e-6)
+
+        assert_near_equal(prob.compute_hessian('f_xy', ['x', 'y'], form=form), H, 1e-6)
+
+    def test_vector_of(self):
+        prob = _chain()
+        x = prob.get_val('x')
+        v = np.linspace(-1., 1., x.size)
+
+        hvp = prob.compute_hessian_vector_product(['c1.y', 'c2.f'], ['x'], v)
+
+        assert_near_equal(hvp[:-1], np.diag(6. * x * v), 1e-6)
+        assert_near_equal(hvp[-1], _chain_hessian(x).dot(v), 1e-6)
+
+    def test_state_restored(self):
+        prob = _chain()
+        outputs = prob.model._outputs.asarray(copy=True)
+        inputs = prob.model._inputs.asarray(copy=True)
+        J = prob.compute_totals(['c2.f'], ['x'], return_format='array')
+
+        prob.compute_hessian_vector_product(['c2.f'], ['x'], np.ones(6))
+
+        assert_near_equal(prob.model._outputs.asarray(), outputs, 1e-15)
+        assert_near_equal(prob.model._inputs.asarray(), inputs, 1e-15)
+        assert_near_equal(prob.compute_totals(['c2.f'], ['x'], return_format='array'), J, 1e-15)
+
+    def test_linearization_restored(self):
+        prob = _chain()
+        x = prob.get_val('x')
+
+        prob.compute_hessian_vector_product(['c1.y'], ['x'], np.ones(6))
+
+        # the jacobian-vector products use the jacobian at the restored point
+        src = prob.model.get_source('x')
+        jvp = prob.compute_jacvec_product(['c1.y'], [src], 'fwd', {src: np.ones(6)})
+        assert_near_equal(jvp['c1.y'], 3. * x**2, 1e-12)
+
+    def test_colored_hessian(self):
+        size = 12
+        prob = _chain(size)
+        x = prob.get_val('x')
+        sparsity = diags([1, 1, 1], [-1, 0, 1], shape=(size, size)).tocoo()
+
+        start = prob.model._problem_meta['ncompute_totals']
+        H = prob.compute_hessian('c2.f', ['x'], sparsity=sparsity)
+
+        assert_near_equal(H, _chain_hessian(x), 1e-6)
+        # 3 colors for a tridiagonal matrix, 2 total jacobians each
+        self.assertEqual(prob.model._problem_meta['ncompute_totals'] - start, 6)
+
+        start = prob.model._problem_meta['ncompute_totals']
+        H = prob.compute_hessian('c2.f', ['x'])
+
+        assert_near_equal(H, _chain_hessian(x), 1e-6)
+        self.assertEqual(prob.model._problem_meta['ncompute_totals'] - start, 2 * size)
+
+    def test_driver_scaling(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('p', Paraboloid(), promotes=['*'])
+        prob.model.add_design_var('x', lower=-50., upper=50., ref=4.)
+        prob.model.add_design_var('y', lower=-50., upper=50., ref=.5)
+        prob.model.add_objective('f_xy', ref=10.)
+        prob.setup()
+        prob.run_model()
+
+        scaler = np.array([4., .5])
+        H = np.array([[2., 1.], [1., 2.]]) * np.outer(scaler, scaler) / 10.
+        v = np.array([1., 2.])
+
+        hvp = prob.compute_hessian_vector_product(['f_xy'], ['x', 'y'], v, driver_scaling=True)
+        assert_near_equal(hvp[0], H.dot(v), 1e-6)
+
+    def test_errors(self):
+        prob = _chain()
+
+        with self.assertRaises(ValueError) as cm:
+            prob.compute_hessian_vector_product(['c2.f'], ['x'], np.ones(6), form='sideways')
+        self.assertEqual(str(cm.exception),
+                         f"{prob.msginfo}: 'sideways' is not a valid finite difference form. "
+                         "Must be one of ['forward', 'backward', 'central'].")
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_hessian_vector_product(['c2.f'], ['x'], np.ones(5))
+        self.assertEqual(str(cm.exception),
+                         f"{prob.msginfo}: Expected a vector of size 6 but got one of size 5.")
+
+        with mock.patch.object(prob.model, 'run_solve_nonlinear') as run:
+            with self.assertRaises(ValueError) as cm:
+                prob.compute_hessian('c1.y', ['x'])
+        self.assertEqual(str(cm.exception),
+                         f"{prob.msginfo}: compute_hessian requires a scalar 'of' variable but "
+                         "'c1.y' has size 6.")
+
+        # the size is checked before the model is run at any perturbed point
+        self.assertEqual(run.call_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,201 @@
+""" Tests for the 'lazy' total jacobian return format. """
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.recorders.recording_manager import RecordingManager
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.test_suite.groups.parallel_groups import FanOutGrouped
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
+
+try:
+    from parameterized import parameterized
+except ImportError:
+    from openmdao.utils.assert_utils import SkipParameterized as parameterized
+
+if MPI:
+    try:
+        from openmdao.vectors.petsc_vector import PETScVector
+    except ImportError:
+        PETScVector = None
+
+
+def _sellar(mode):
+    prob = om.Problem(SellarDerivatives())
+    prob.model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12)
+    prob.model.linear_solver = om.DirectSolver()
+    prob.set_solver_print(level=0)
+    prob.setup(mode=mode)
+    prob.run_model()
+    return prob
+
+
+def _diag_model(size=10, responses=True):
+    prob = om.Problem()
+    model = prob.model
+    model.add_subsystem('indep', om.IndepVarComp('x', val=np.arange(1., size + 1)))
+    model.add_subsystem('comp1', om.ExecComp('y=2.0*x', x=np.ones(size), y=np.ones(size),
+                                             has_diag_partials=True))
+    model.add_subsystem('comp2', om.ExecComp('y=3.0*x**2', x=np.ones(size), y=np.ones(size),
+                                             has_diag_partials=True))
+    model.connect('indep.x', ['comp1.x', 'comp2.x'])
+    model.add_design_var('indep.x')
+    if responses:
+        model.add_constraint('comp1.y', lower=0., ref=4.)
+        model.add_objective('comp2.y', index=0)
+    return prob
+
+
+@use_tempdirs
+class LazyTotalsTestCase(unittest.TestCase):
+
+    @parameterized.expand(['fwd', 'rev'])
+    def test_blocks(self, mode):
+        prob = _sellar(mode)
+        of = ['obj', 'con1', 'con2']
+        wrt = ['x', 'z']
+
+        full = prob.compute_totals(of=of, wrt=wrt)
+        J = prob.compute_totals(of=of, wrt=wrt, return_format='lazy')
+
+        self.assertEqual(J.nsolves, 0)
+        self.assertEqual(list(J), list(full))
+        self.assertIn(('obj', 'z'), J)
+        self.assertEqual(J.nsolves, 0)
+
+        assert_near_equal(J['obj', 'z'], full['obj', 'z'], 1e-12)
+        # a column per z entry in fwd mode, the obj row in rev mode
+        self.assertEqual(J.nsolves, 2 if mode == 'fwd' else 1)
+
+        # solutions are reused
+        assert_near_equal(J['obj', 'z'], full['obj', 'z'], 1e-12)
+        self.assertEqual(J.nsolves, 2 if mode == 'fwd' else 1)
+
+        assert_near_equal(J['con1', 'z'], full['con1', 'z'], 1e-12)
+        self.assertEqual(J.nsolves, 2)
+
+        for key, val in full.items():
+            assert_near_equal(J[key], val, 1e-12)
+        self.assertEqual(J.nsolves, 3)
+
+        with self.assertRaises(KeyError) as cm:
+            J['obj', 'y1']
+        self.assertEqual(cm.exception.args[0],
+                         "('obj', 'y1') is not a block of this total jacobian.")
+
+    def test_state_change(self):
+        prob = _sellar('rev')
+        J = prob.compute_totals(of=['obj', 'con1'], wrt=['x', 'z'], return_format='lazy')
+        J['obj', 'x']
+        self.assertEqual(J.nsolves, 1)
+
+        prob.set_val('x', 3.)
+        prob.run_model()
+        full = prob.compute_totals(of=['obj', 'con1'], wrt=['x', 'z'])
+
+        # the model is linearized again at the new point
+        assert_near_equal(J['obj', 'x'], full['obj', 'x'], 1e-12)
+        assert_near_equal(J['con1', 'z'], full['con1', 'z'], 1e-12)
+        self.assertEqual(J.nsolves, 3)
+
+    def test_coloring_and_scaling(self):
+        prob = _diag_model()
+        prob.driver.declare_coloring()
+        prob.setup(mode='fwd')
+        prob.run_model()
+
+        full = prob.driver._compute_totals()
+        J = prob.driver._compute_totals(return_format='lazy')
+        self.assertEqual(J.nsolves, 0)
+
+        # the constraint block only needs the single color of the diagonal jacobian
+        assert_near_equal(J['comp1.y', 'indep.x'], np.eye(10) * 2. / 4., 1e-12)
+        self.assertEqual(J.nsolves, 1)
+
+        assert_near_equal(J['comp2.y', 'indep.x'], full['comp2.y', 'indep.x'], 1e-12)
+        self.assertEqual(J.nsolves, 1)
+
+    def test_get_J_array(self):
+        prob = _diag_model()
+        prob.driver.declare_coloring()
+        prob.setup(mode='fwd')
+        prob.run_model()
+
+        full = prob.driver._compute_totals(return_format='array')
+        J = prob.driver._compute_totals(return_format='lazy')
+        self.assertEqual(J.nsolves, 0)
+
+        # the remaining seeds are solved, and the driver scaling is applied
+        assert_near_equal(prob.driver._total_jac.get_J_array(), full, 1e-12)
+        self.assertEqual(J.nsolves, 1)
+        assert_near_equal(J['comp1.y', 'indep.x'], np.eye(10) * 2. / 4., 1e-12)
+        self.assertEqual(J.nsolves, 1)
+
+        # the scaling report also sees the complete jacobian
+        data = prob.driver.scaling_report(show_browser=False)
+        self.assertEqual(data['oflabels'], ['comp2.y', 'comp1.y'])
+
+    def test_record_derivatives(self):
+        prob = _diag_model()
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+        prob.driver.recording_options['record_derivatives'] = True
+        prob.setup(mode='rev')
+        prob.run_model()
+
+        full = prob.driver._compute_totals()
+
+        with mock.patch.object(RecordingManager, 'record_derivatives') as record:
+            prob.driver._compute_totals(return_format='lazy')
+
+        # the recorded derivatives are complete and scaled, although no block was accessed
+        totals = record.call_args[0][1]
+        for (of, wrt), val in full.items():
+            assert_near_equal(totals[f'{of}!{wrt}'], val, 1e-12)
+
+    def test_approx_error(self):
+        prob = _diag_model()
+        prob.model.approx_totals()
+        prob.setup()
+        prob.run_model()
+
+        with self.assertRaises(ValueError) as cm:
+            prob.compute_totals(return_format='lazy')
+        self.assertEqual(str(cm.exception),
+                         "The 'lazy' jacobian return format is only supported for total "
+                         "derivatives computed by linear solves with get_remote=True.")
+
+
+@unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+class LazyTotalsMPITestCase(unittest.TestCase):
+
+    N_PROCS = 2
+
+    def test_par_deriv_color(self):
+        prob = om.Problem()
+        prob.model = FanOutGrouped()
+        prob.model.linear_solver = om.LinearBlockGS()
+        prob.model.sub.linear_solver = om.LinearBlockGS()
+
+        prob.model.add_design_var('iv.x')
+        prob.model.add_constraint('c2.y', upper=0.0, parallel_deriv_color='par_resp')
+        prob.model.add_constraint('c3.y', upper=0.0, parallel_deriv_color='par_resp')
+
+        prob.setup(mode='rev')
+        prob.run_model()
+
+        J = prob.compute_totals(['c2.y', 'c3.y'], ['iv.x'], return_format='lazy')
+
+        # both rows are solved together
+        assert_near_equal(J['c2.y', 'iv.x'][0][0], -6.0, 1e-6)
+        self.assertEqual(J.nsolves, 1)
+        assert_near_equal(J['c3.y', 'iv.x'][0][0], 15.0, 1e-6)
+        self.assertEqual(J.nsolves, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
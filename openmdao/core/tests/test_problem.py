@@ -4,6 +4,7 @@ import pathlib
 import sys
 import unittest
 import itertools
+from unittest import mock
 
 from io import StringIO
 import numpy as np
@@ -474,6 +475,70 @@ class TestProblem(unittest.TestCase):
 
         np.testing.assert_allclose(checkvec, result)
 
+    @parameterized.expand(itertools.product(['fwd', 'rev'],
+                                            ['dense', 'csc', 'matfree', 'krylov'],
+                                            [False, True]))
+    def test_compute_jacvec_product_batch(self, mode, solver, scaled):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('px', om.IndepVarComp('x', np.array([1., 2., 3.])))
+        model.add_subsystem('pz', om.IndepVarComp('z', 2.))
+        ref = 10. if scaled else 1.
+        model.add_subsystem('c1', om.ExecComp('y = 2.*x**2 + z*x', x=np.ones(3),
+                                              y={'val': np.ones(3), 'ref': ref, 'res_ref': ref}))
+        model.add_subsystem('c2', om.ExecComp('y = sum(x)*z', x=np.ones(3),
+                                              y={'val': 1., 'ref': ref}))
+        model.connect('px.x', 'c1.x')
+        model.connect('pz.z', ['c1.z', 'c2.z'])
+        model.connect('c1.y', 'c2.x')
+
+        if solver == 'krylov':
+            model.linear_solver = om.ScipyKrylov(atol=1e-14, rtol=1e-14)
+        elif solver == 'matfree':
+            model.linear_solver = om.DirectSolver(assemble_jac=False)
+        else:
+            model.options['assembled_jac_type'] = solver
+            model.linear_solver = om.DirectSolver()
+
+        prob.setup(mode=mode)
+        prob.run_model()
+
+        of = ['c1.y', 'c2.y']
+        wrt = ['px.x', 'c1.z']
+        J = prob.compute_totals(of, wrt, return_format='array')
+
+        seeds = np.random.random((J.shape[1] if mode == 'fwd' else J.shape[0], 5))
+
+        with mock.patch.object(type(model.linear_solver), 'solve',
+                               autospec=True,
+                               side_effect=type(model.linear_solver).solve) as solve:
+            products = prob.compute_jacvec_product_batch(of, wrt, mode, seeds)
+
+        if mode == 'fwd':
+            expected = J.dot(seeds)
+        else:
+            expected = J.T.dot(seeds)
+
+        np.testing.assert_allclose(products, expected)
+
+        # a model level DirectSolver does a single multi-RHS solve unless it would need to
+        # convert the scaling of the block
+        multi = solver in ('dense', 'csc') or (solver == 'matfree' and not scaled)
+        self.assertEqual(solve.call_count, 0 if multi else seeds.shape[1])
+
+        # a single 1D seed gives the same result as the unbatched version
+        seed = seeds[:, 0]
+        product = prob.compute_jacvec_product_batch(of, wrt, mode, seed)
+        np.testing.assert_allclose(product[:, 0], expected[:, 0])
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_jacvec_product_batch(of, wrt, mode, seeds[1:])
+
+        self.assertEqual(str(cm.exception),
+                         f"Problem {prob._get_inst_id()}: seeds must be a 2D array with "
+                         f"{seeds.shape[0]} rows in {mode} mode but have shape "
+                         f"{seeds[1:].shape}.")
+
     def test_feature_set_indeps(self):
 
         prob = om.Problem()
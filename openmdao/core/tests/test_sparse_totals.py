@@ -0,0 +1,189 @@
+""" Tests for the sparse total jacobian return formats. """
+
+import unittest
+
+import numpy as np
+from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
+
+import openmdao.api as om
+from openmdao.core.total_jac import _TotalJacInfo, _SparseTotalJacStorage
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs, set_env_vars_context
+
+try:
+    from parameterized import parameterized
+except ImportError:
+    from openmdao.utils.assert_utils import SkipParameterized as parameterized
+
+
+_matrix_types = {'coo': coo_matrix, 'csc': csc_matrix, 'csr': csr_matrix}
+
+
+def _diag_model(size=10):
+    prob = om.Problem()
+    model = prob.model
+    model.add_subsystem('indep', om.IndepVarComp('x', val=np.arange(1., size + 1)))
+    model.add_subsystem('indep2', om.IndepVarComp('z', val=np.ones(3)))
+    model.add_subsystem('comp1', om.ExecComp('y=2.0*x', x=np.ones(size), y=np.ones(size),
+                                             has_diag_partials=True))
+    model.add_subsystem('comp2', om.ExecComp('y=3.0*x**2', x=np.ones(size), y=np.ones(size),
+                                             has_diag_partials=True))
+    model.add_subsystem('comp3', om.ExecComp('y=sum(z)', z=np.ones(3)))
+    model.connect('indep.x', ['comp1.x', 'comp2.x'])
+    model.connect('indep2.z', 'comp3.z')
+    model.add_design_var('indep.x', ref=2.)
+    model.add_design_var('indep2.z')
+    model.add_constraint('comp1.y', lower=0., ref=4.)
+    model.add_constraint('comp3.y', lower=0.)
+    model.add_objective('comp2.y', index=0)
+    return prob
+
+
+@use_tempdirs
+class SparseTotalsTestCase(unittest.TestCase):
+
+    @parameterized.expand([(mode, fmt) for mode in ('fwd', 'rev') for fmt in _matrix_types])
+    def test_sellar(self, mode, fmt):
+        prob = om.Problem(SellarDerivatives())
+        prob.model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12)
+        prob.model.linear_solver = om.DirectSolver()
+        prob.set_solver_print(level=0)
+        prob.setup(mode=mode)
+        prob.run_model()
+
+        of = ['obj', 'con1', 'con2']
+        wrt = ['x', 'z']
+        expected = prob.compute_totals(of, wrt, return_format='array')
+        J = prob.compute_totals(of, wrt, return_format=fmt)
+
+        self.assertIsInstance(J, _matrix_types[fmt])
+        assert_near_equal(J.toarray(), expected, 1e-12)
+
+    @parameterized.expand(['fwd', 'rev'])
+    def test_relevance_pattern(self, mode):
+        prob = _diag_model()
+        prob.setup(mode=mode)
+        prob.run_model()
+
+        expected = prob.compute_totals(return_format='array')
+        J = prob.compute_totals(return_format='coo')
+
+        assert_near_equal(J.toarray(), expected, 1e-12)
+
+        # only the blocks of responses that depend on each design var are stored
+        self.assertEqual(J.nnz, 10 * 10 + 10 + 3)
+
+    @parameterized.expand(['fwd', 'rev'])
+    def test_coloring_pattern(self, mode):
+        prob = _diag_model()
+        prob.driver.declare_coloring()
+        prob.setup(mode=mode)
+        prob.run_model()
+
+        expected = prob.driver._compute_totals(return_format='array')
+
+        total_jac = _TotalJacInfo(prob, None, None, 'csr')
+        self.assertIsInstance(total_jac.J, _SparseTotalJacStorage)
+        J = total_jac.compute_totals()
+
+        # the pattern comes from the total coloring, and includes driver scaling
+        assert_near_equal(J.toarray(), expected, 1e-12)
+        self.assertEqual(J.nnz, 10 + 1 + 3)
+
+        # the driver can switch between dense and sparse formats
+        J = prob.driver._compute_totals(return_format='csc')
+        self.assertIsInstance(J, csc_matrix)
+        assert_near_equal(J.toarray(), expected, 1e-12)
+        assert_near_equal(prob.driver._compute_totals(return_format='array'), expected, 1e-12)
+
+    def test_totals_cache(self):
+        prob = _diag_model()
+        prob.driver.options['totals_cache_size'] = 2
+        prob.setup()
+        prob.run_model()
+
+        J1 = prob.driver._compute_totals(return_format='csr')
+        J2 = prob.driver._compute_totals(return_format='csr')
+
+        self.assertEqual(prob.driver.result.deriv_cache_hits, 1)
+        self.assertIsNot(J1, J2)
+        J1.data[:] = 0.
+        assert_near_equal(J2.toarray(), prob.driver._compute_totals(return_format='array'),
+                          1e-12)
+
+    def test_scaling_report(self):
+        with set_env_vars_context(OPENMDAO_REPORTS='1'):
+            prob = _diag_model()
+            prob.driver = om.ScipyOptimizeDriver()
+            prob.setup()
+            prob.run_model()
+
+            # the scaling report runs after the first _compute_totals
+            J = prob.driver._compute_totals(return_format='csr')
+
+        self.assertIsInstance(J, csr_matrix)
+        assert_near_equal(prob.driver._total_jac.get_J_array(), J.toarray(), 1e-12)
+
+        data = prob.driver.scaling_report(show_browser=False)
+        self.assertEqual(data['oflabels'], ['comp2.y', 'comp1.y', 'comp3.y'])
+
+    def test_check_total_jac(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('comp', om.ExecComp('y=2.0*x[0]', x=np.ones(2)))
+        model.add_design_var('comp.x')
+        model.add_objective('comp.y')
+        prob.setup()
+        prob.run_model()
+
+        total_jac = _TotalJacInfo(prob, None, None, 'csc')
+        total_jac.compute_totals()
+
+        with self.assertRaises(RuntimeError) as cm:
+            total_jac.check_total_jac()
+
+        msg = str(cm.exception)
+        self.assertTrue(msg.startswith("Design variables [('comp.x', inds=["), msg)
+        self.assertTrue(msg.endswith(")])] have no impact on the constraints or objective."), msg)
+
+    def test_approx_error(self):
+        prob = _diag_model()
+        prob.model.approx_totals()
+        prob.setup()
+        prob.run_model()
+
+        with self.assertRaises(ValueError) as cm:
+            prob.compute_totals(return_format='csr')
+        self.assertEqual(str(cm.exception),
+                         "The 'csr' jacobian return format is only supported for total "
+                         "derivatives computed by linear solves in serial.")
+
+
+class SparseTotalJacStorageTestCase(unittest.TestCase):
+
+    def test_set_rows_cols(self):
+        rows = np.array([0, 2, 1, 2, 0])
+        cols = np.array([0, 0, 1, 2, 2])
+        J = _SparseTotalJacStorage(rows, cols, (3, 3))
+
+        # columns and rows of the dense jacobian, including values outside of the pattern
+        J[np.arange(3), 0] = [1., 5., 2.]
+        J[1, np.arange(3)] = [7., 3., 9.]
+        J[np.array([2, 0]), 2] = [4., 6.]
+
+        expected = np.array([[1., 0., 6.],
+                             [0., 3., 0.],
+                             [2., 0., 4.]])
+
+        for fmt, cls in _matrix_types.items():
+            mat = J.tomatrix(fmt)
+            self.assertIsInstance(mat, cls)
+            assert_near_equal(mat.toarray(), expected, 1e-15)
+
+        J[:] = 0.
+        self.assertEqual(np.count_nonzero(J.tomatrix('coo').toarray()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,15 +3,19 @@ Helper class for total jacobian computation.
 """
 import sys
 import time
+import hashlib
+import pickle
 import pprint
 from contextlib import contextmanager
 from collections import defaultdict
+from collections.abc import Mapping
 from itertools import repeat
 from copy import deepcopy
 
 import numpy as np
+from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
 
-from openmdao.core.constants import INT_DTYPE
+from openmdao.core.constants import INT_DTYPE, _UNDEFINED
 from openmdao.utils.mpi import MPI, check_mpi_env
 from openmdao.utils.om_warnings import issue_warning, DerivativesWarning
 import openmdao.utils.coloring as coloring_mod
@@ -31,6 +35,8 @@ elif use_mpi is False:
 
 _directional_rng = np.random.default_rng(99)
 
+_sparse_formats = ('coo', 'csc', 'csr')
+
 
 class _TotalJacInfo(object):
     """
@@ -50,10 +56,10 @@ class _TotalJacInfo(object):
         The dense array form of the total jacobian.
     J_dict : dict
         Nested or flat dict with views of the jacobian.
-    J_final : ndarray or dict
-        If return_format is 'array', Jfinal is J.  Otherwise it's either a nested dict (if
-        return_format is 'dict') or a flat dict (return_format 'flat_dict') with views into
-        the array jacobian.
+    J_final : ndarray, dict or _LazyTotalJac
+        If return_format is 'array', Jfinal is J.  If return_format is 'lazy', it's a
+        _LazyTotalJac.  Otherwise it's either a nested dict (if return_format is 'dict') or a
+        flat dict (return_format 'flat_dict') with views into the array jacobian.
     lin_sol_cache : dict
         Dict of indices keyed to solution vectors.
     mode : str
@@ -74,7 +80,7 @@ class _TotalJacInfo(object):
         This is used for debug printing.
     return_format : str
         Indicates the desired return format of the total jacobian. Can have value of
-        'array', 'dict', or 'flat_dict'.
+        'array', 'dict', 'flat_dict' or 'lazy'.
     simul_coloring : Coloring or None
         Contains all data necessary to simultaneously solve for groups of total derivatives.
     _dist_driver_vars : dict
@@ -87,6 +93,8 @@ class _TotalJacInfo(object):
         If True, perform a single directional derivative.
     relevance : dict
         Dict of relevance dictionaries for each var of interest.
+    _recorded_sparsity : dict or None
+        Cached sparsity of the sub-jacobians recorded by record_derivatives.
     """
 
     def __init__(self, problem, of, wrt, return_format, approx=False,
@@ -105,7 +113,7 @@ class _TotalJacInfo(object):
             Design variable names.
         return_format : str
             Indicates the desired return format of the total jacobian. Can have value of
-            'array', 'dict', or 'flat_dict'.
+            'array', 'dict', 'flat_dict', 'lazy', 'coo', 'csc' or 'csr'.
         approx : bool
             If True, the object will compute approx total jacobians.
         debug_print : bool
@@ -195,6 +203,7 @@ class _TotalJacInfo(object):
         self.dist_input_range_map = {}
 
         self.simul_coloring = None
+        self._recorded_sparsity = _UNDEFINED
 
         self.relevance = get_relevance(model, of_metadata, wrt_metadata)
 
@@ -245,9 +254,19 @@ class _TotalJacInfo(object):
         self.wrt_size, self.has_wrt_dist = \
             self._get_tuple_map(wrt_metadata, all_abs2meta_out)
 
-        # always allocate a 2D dense array and we can assign views to dict keys later if
-        # return format is 'dict' or 'flat_dict'.
-        self.J = J = np.zeros((self.of_size, self.wrt_size))
+        if return_format in _sparse_formats:
+            if approx or directional or self.comm.size > 1 or \
+                    model.options['derivs_method'] == 'jax':
+                raise ValueError(f"The '{return_format}' jacobian return format is only "
+                                 "supported for total derivatives computed by linear solves "
+                                 "in serial.")
+            # the values are scattered directly into sparse storage with a fixed pattern
+            self.J = J = _SparseTotalJacStorage(*self._get_total_sparsity_pattern(),
+                                                (self.of_size, self.wrt_size))
+        else:
+            # always allocate a 2D dense array and we can assign views to dict keys later if
+            # return format is 'dict' or 'flat_dict'.
+            self.J = J = np.zeros((self.of_size, self.wrt_size))
 
         # if we have distributed 'wrt' variables in fwd mode we have to broadcast the jac
         # columns from the owner of a given range of dist indices to everyone else.
@@ -362,6 +381,17 @@ class _TotalJacInfo(object):
         if return_format == 'array':
             self.J_final = J
             self.J_dict = self._get_dict_J(J, wrt_metadata, of_metadata, 'dict')
+        elif return_format == 'lazy':
+            if approx or directional or not get_remote or \
+                    model.options['derivs_method'] == 'jax':
+                raise ValueError("The 'lazy' jacobian return format is only supported for "
+                                 "total derivatives computed by linear solves with "
+                                 "get_remote=True.")
+            self.J_dict = self._get_dict_J(J, wrt_metadata, of_metadata, 'flat_dict')
+            self.J_final = _LazyTotalJac(self)
+        elif return_format in _sparse_formats:
+            self.J_dict = None
+            self.J_final = J.tomatrix(return_format)
         else:
             self.J_final = self.J_dict = self._get_dict_J(J, wrt_metadata, of_metadata,
                                                           return_format)
@@ -1378,97 +1408,39 @@ class _TotalJacInfo(object):
                 self.model._recording_iter.pop()
 
         try:
-            debug_print = self.debug_print
-            par_print = self.par_deriv_printnames
-
-            has_lin_cons = self.has_lin_cons
-
             model = self.model
             # Prepare model for calculation by cleaning out the derivatives vectors.
             model._dinputs.set_val(0.0)
             model._doutputs.set_val(0.0)
             model._dresiduals.set_val(0.0)
 
-            # Linearize Model
-            model._tot_jac = self
-
             with self._totjac_context():
-                relevance = self.relevance
-                with relevance.active(model.linear_solver.use_relevance()):
-                    with relevance.all_seeds_active():
-                        try:
-                            ln_solver = model._linear_solver
-                            with model._scaled_context_all():
-                                model._linearize(model._assembled_jac,
-                                                 sub_do_ln=ln_solver._linearize_children())
-                            if ln_solver._assembled_jac is not None and \
-                                    ln_solver._assembled_jac._under_complex_step:
-                                model.linear_solver._assembled_jac._update(model)
-                            ln_solver._linearize()
-                        finally:
-                            model._tot_jac = None
+                self._linearize()
 
                 self.J[:] = 0.0
 
+                if self.return_format == 'lazy':
+                    # seeds are solved when blocks of the jacobian are accessed
+                    self.J_final._reset()
+                    return self.J_final
+
+                # when sparsity is computed by several processes, each one only does its share
+                # of the solves and leaves the rest of the jacobian zero
+                seed_split = model._problem_meta['coloring_seed_split']
+                isolve = -1
+
                 # Main loop over columns (fwd) or rows (rev) of the jacobian
                 for mode in self.modes:
-                    fwd = mode == 'fwd'
                     for key, idx_info in self.idx_iter_dict[mode].items():
                         imeta, idx_iter = idx_info
                         for inds, input_setter, jac_setter, itermeta in idx_iter(imeta, mode):
-                            model._problem_meta['seed_vars'] = itermeta['seed_vars']
-                            _, cache_key = input_setter(inds, itermeta, mode)
-
-                            if debug_print:
-                                if par_print and key in par_print:
-                                    print('Solving color:', key,
-                                          '(' + ', '.join([name for name in par_print[key]]) + ')',
-                                          flush=True)
-                                else:
-                                    if key == '@simul_coloring':
-                                        print(f'In mode: {mode}, Solving variable(s) using simul '
-                                              'coloring:')
-                                        for local_ind in imeta['coloring']._local_indices(inds,
-                                                                                          mode):
-                                            print(f"   {local_ind}", flush=True)
-                                    elif self.directional:
-                                        print(f"In mode: {mode}.\n, Solving for directional "
-                                              f"derivative wrt '{key}'",)
-                                    else:
-                                        print(f"In mode: {mode}.\n('{key}', [{inds}])", flush=True)
-
-                                t0 = time.perf_counter()
-
-                            if fwd:
-                                fwd_seeds = itermeta['seed_vars']
-                                rev_seeds = None
-                            else:
-                                fwd_seeds = None
-                                rev_seeds = itermeta['seed_vars']
-
-                            with relevance.seeds_active(fwd_seeds=fwd_seeds, rev_seeds=rev_seeds):
-                                # restore old linear solution if cache_linear_solution was set by
-                                # the user for any input variables involved in this linear solution.
-                                with model._scaled_context_all():
-                                    if (cache_key is not None and not has_lin_cons and
-                                            self.mode == mode):
-                                        self._restore_linear_solution(cache_key, mode)
-                                        model._solve_linear(mode)
-                                        self._save_linear_solution(cache_key, mode)
-                                    else:
-                                        model._solve_linear(mode)
-
-                            self.nsolves += 1
-
-                            if debug_print:
-                                print(f'Elapsed Time: {time.perf_counter() - t0} secs\n',
-                                      flush=True)
-
-                            jac_setter(inds, mode, imeta)
-
-                            # reset any Problem level data for the current iteration
-                            self.model._problem_meta['parallel_deriv_color'] = None
-                            self.model._problem_meta['seed_vars'] = None
+                            if seed_split is not None:
+                                isolve += 1
+                                if isolve % seed_split[0] != seed_split[1]:
+                                    continue
+
+                            self._solve_seed(mode, key, imeta, inds, input_setter, jac_setter,
+                                             itermeta)
 
                 # Driver scaling.
                 if self.has_scaling:
@@ -1476,13 +1448,13 @@ class _TotalJacInfo(object):
 
                 # if some of the wrt vars are distributed in fwd mode, we bcast from the rank
                 # where each part of the distrib var exists
-                if self.get_remote and mode == 'fwd' and self.has_wrt_dist:
-                    for start, stop, rank in self.dist_input_range_map[mode]:
-                        contig = self.J[:, start:stop].copy()
-                        model.comm.Bcast(contig, root=rank)
-                        self.J[:, start:stop] = contig
+                if mode == 'fwd':
+                    self._bcast_dist_wrt()
+
+                if self.return_format in _sparse_formats:
+                    self.J_final = self.J.tomatrix(self.return_format)
 
-                if debug_print:
+                if self.debug_print:
                     # Debug outputs scaled derivatives.
                     self._print_derivatives()
         finally:
@@ -1490,6 +1462,185 @@ class _TotalJacInfo(object):
 
         return self.J_final
 
+    def _linearize(self):
+        """
+        Linearize the model and its linear solvers for the total derivative solves.
+        """
+        model = self.model
+        relevance = self.relevance
+
+        model._tot_jac = self
+        with relevance.active(model.linear_solver.use_relevance()):
+            with relevance.all_seeds_active():
+                try:
+                    ln_solver = model._linear_solver
+                    with model._scaled_context_all():
+                        model._linearize(model._assembled_jac,
+                                         sub_do_ln=ln_solver._linearize_children())
+                    if ln_solver._assembled_jac is not None and \
+                            ln_solver._assembled_jac._under_complex_step:
+                        model.linear_solver._assembled_jac._update(model)
+                    ln_solver._linearize()
+                finally:
+                    model._tot_jac = None
+
+    def _solve_seed(self, mode, key, imeta, inds, input_setter, jac_setter, itermeta):
+        """
+        Do the linear solve for a single seed and set its part of the total jacobian.
+
+        Parameters
+        ----------
+        mode : str
+            Direction of derivative solution.
+        key : str
+            Name of the variable, parallel derivative color or '@simul_coloring' being solved.
+        imeta : dict
+            Dictionary of iteration metadata.
+        inds : int or list of int
+            Total jacobian row or column indices.
+        input_setter : method
+            Input setter method.
+        jac_setter : method
+            Jac setter method.
+        itermeta : dict
+            Metadata for the current seed.
+        """
+        model = self.model
+        debug_print = self.debug_print
+        par_print = self.par_deriv_printnames
+
+        model._problem_meta['seed_vars'] = itermeta['seed_vars']
+        _, cache_key = input_setter(inds, itermeta, mode)
+
+        if debug_print:
+            if par_print and key in par_print:
+                print('Solving color:', key,
+                      '(' + ', '.join([name for name in par_print[key]]) + ')', flush=True)
+            else:
+                if key == '@simul_coloring':
+                    print(f'In mode: {mode}, Solving variable(s) using simul coloring:')
+                    for local_ind in imeta['coloring']._local_indices(inds, mode):
+                        print(f"   {local_ind}", flush=True)
+                elif self.directional:
+                    print(f"In mode: {mode}.\n, Solving for directional derivative wrt '{key}'",)
+                else:
+                    print(f"In mode: {mode}.\n('{key}', [{inds}])", flush=True)
+
+            t0 = time.perf_counter()
+
+        if mode == 'fwd':
+            fwd_seeds = itermeta['seed_vars']
+            rev_seeds = None
+        else:
+            fwd_seeds = None
+            rev_seeds = itermeta['seed_vars']
+
+        with self.relevance.seeds_active(fwd_seeds=fwd_seeds, rev_seeds=rev_seeds):
+            # restore old linear solution if cache_linear_solution was set by the user for
+            # any input variables involved in this linear solution.
+            with model._scaled_context_all():
+                if cache_key is not None and not self.has_lin_cons and self.mode == mode:
+                    self._restore_linear_solution(cache_key, mode)
+                    model._solve_linear(mode)
+                    self._save_linear_solution(cache_key, mode)
+                else:
+                    model._solve_linear(mode)
+
+        self.nsolves += 1
+
+        if debug_print:
+            print(f'Elapsed Time: {time.perf_counter() - t0} secs\n', flush=True)
+
+        jac_setter(inds, mode, imeta)
+
+        # reset any Problem level data for the current iteration
+        model._problem_meta['parallel_deriv_color'] = None
+        model._problem_meta['seed_vars'] = None
+
+    def _bcast_dist_wrt(self):
+        """
+        Bcast the fwd mode columns of distributed wrt vars from the procs that own them.
+        """
+        if self.get_remote and self.has_wrt_dist:
+            for start, stop, rank in self.dist_input_range_map['fwd']:
+                contig = self.J[:, start:stop].copy()
+                self.model.comm.Bcast(contig, root=rank)
+                self.J[:, start:stop] = contig
+
+    def _get_seed_items(self, mode):
+        """
+        Return the seeds of the given mode and the seed that sets each jacobian row or column.
+
+        Parameters
+        ----------
+        mode : str
+            Direction of derivative solution.
+
+        Returns
+        -------
+        list
+            The (key, imeta, inds, input_setter, jac_setter, itermeta) of each seed.
+        ndarray
+            Index into the list of seeds for each jacobian column (fwd) or row (rev), or -1 for
+            those that aren't set by any seed.
+        """
+        items = []
+        size = self.J.shape[1] if mode == 'fwd' else self.J.shape[0]
+        seed_of_idx = np.full(size, -1, dtype=INT_DTYPE)
+
+        for key, (imeta, idx_iter) in self.idx_iter_dict[mode].items():
+            for inds, input_setter, jac_setter, itermeta in idx_iter(imeta, mode):
+                idxs = np.atleast_1d(np.asarray(inds, dtype=INT_DTYPE))
+                # parallel deriv colors repeat indices to make their index lists the same length
+                idxs = idxs[seed_of_idx[idxs] == -1]
+                seed_of_idx[idxs] = len(items)
+                items.append((key, imeta, inds, input_setter, jac_setter, itermeta))
+
+        return items, seed_of_idx
+
+    def _solve_lazy_block(self, of, wrt):
+        """
+        Do the linear solves needed for a block of the jacobian that haven't been done yet.
+
+        Parameters
+        ----------
+        of : str
+            Name of the response.
+        wrt : str
+            Name of the design variable.
+
+        Returns
+        -------
+        int
+            The number of linear solves done.
+        """
+        lazy = self.J_final
+        slices = {'fwd': self.input_meta['fwd'][wrt]['jac_slice'],
+                  'rev': self.output_meta['fwd'][of]['jac_slice']}
+
+        todo = []
+        for mode in self.modes:
+            items, seed_of_idx = lazy._seeds[mode]
+            seeds = seed_of_idx[slices[mode]]
+            seeds = np.unique(seeds[seeds >= 0])
+            seeds = seeds[~lazy._solved[mode][seeds]]
+            lazy._solved[mode][seeds] = True
+            todo.extend((mode, items[i]) for i in seeds)
+
+        if todo:
+            self.model._recording_iter.push(('_compute_totals', 0))
+            try:
+                with self._totjac_context():
+                    for mode, (key, imeta, inds, input_setter, jac_setter, itermeta) in todo:
+                        self._solve_seed(mode, key, imeta, inds, input_setter, jac_setter,
+                                         itermeta)
+                    if self.modes[-1] == 'fwd':
+                        self._bcast_dist_wrt()
+            finally:
+                self.model._recording_iter.pop()
+
+        return len(todo)
+
     def _compute_totals_approx(self, progress_out_stream=None):
         """
         Compute derivatives of desired quantities with respect to desired inputs.
@@ -1689,7 +1840,11 @@ class _TotalJacInfo(object):
         raise_error : bool
             If True, raise an exception if a zero row or column is found.
         """
-        nzrows, nzcols = np.nonzero(np.abs(self.J) > tol)
+        if isinstance(self.J, _SparseTotalJacStorage):
+            mask = np.abs(self.J.data) > tol
+            nzrows, nzcols = self.J.rows[mask], self.J.cols[mask]
+        else:
+            nzrows, nzcols = np.nonzero(np.abs(self.J) > tol)
 
         # Check for zero rows, which correspond to constraints unaffected by any design vars.
         col = np.ones(self.J.shape[0], dtype=bool)
@@ -1799,6 +1954,19 @@ class _TotalJacInfo(object):
                     if iscaler is not None:
                         val *= 1.0 / iscaler
 
+        elif self.return_format in _sparse_formats:
+            row_scaler = np.ones(self.J.shape[0])
+            for meta in responses.values():
+                if meta['total_scaler'] is not None:
+                    row_scaler[meta['jac_slice']] = meta['total_scaler']
+
+            col_scaler = np.ones(self.J.shape[1])
+            for meta in desvars.values():
+                if meta['total_scaler'] is not None:
+                    col_scaler[meta['jac_slice']] = 1.0 / meta['total_scaler']
+
+            self.J.data *= row_scaler[self.J.rows] * col_scaler[self.J.cols]
+
         elif self.return_format == 'flat_dict':
             for tup, val in J.items():
                 prom_out, prom_in = tup
@@ -1814,7 +1982,8 @@ class _TotalJacInfo(object):
                     val *= 1.0 / iscaler
         else:
             raise RuntimeError("Derivative scaling by the driver only supports 'dict', "
-                               "'array' and 'flat_array' formats at present.")
+                               "'array', 'flat_array', 'coo', 'csc' and 'csr' formats at "
+                               "present.")
 
     def _print_derivatives(self):
         """
@@ -1827,6 +1996,8 @@ class _TotalJacInfo(object):
                     pprint.pprint({(of, wrt): J_sub})
         else:
             J = self.J
+            if isinstance(J, _SparseTotalJacStorage):
+                J = J.tomatrix('csr')
             for of, ofmeta in self.output_meta['fwd'].items():
                 if not self.get_remote and ofmeta['remote']:
                     continue
@@ -1834,11 +2005,51 @@ class _TotalJacInfo(object):
                 for wrt, wrtmeta in self.input_meta['fwd'].items():
                     if self.get_remote or not wrtmeta['remote']:
                         deriv = J[out_slice, wrtmeta['jac_slice']]
+                        if not isinstance(deriv, np.ndarray):
+                            deriv = deriv.toarray()
                         pprint.pprint({(of, wrt): deriv})
 
         print('')
         sys.stdout.flush()
 
+    def get_J_array(self):
+        """
+        Return the total jacobian as a dense array, whatever the return format.
+
+        For the 'lazy' format, the seeds that haven't been solved yet are solved first, and the
+        driver scaling is applied to the returned copy.
+
+        Returns
+        -------
+        ndarray
+            The total jacobian.
+        """
+        if isinstance(self.J, _SparseTotalJacStorage):
+            return self.J.tomatrix('csr').toarray()
+
+        if self.return_format != 'lazy':
+            return self.J
+
+        lazy = self.J_final
+        if lazy._state != lazy._get_state():
+            self.compute_totals()
+        for of, wrt in self.J_dict:
+            self._solve_lazy_block(of, wrt)
+
+        J = self.J.copy()
+        if self.has_scaling:
+            J_dict = self._get_dict_J(J, self.input_meta['fwd'], self.output_meta['fwd'],
+                                      'flat_dict')
+            for (of, wrt), val in J_dict.items():
+                oscaler = self.output_meta['fwd'][of]['total_scaler']
+                iscaler = self.input_meta['fwd'][wrt]['total_scaler']
+                if oscaler is not None:
+                    val[:] = (oscaler * val.T).T
+                if iscaler is not None:
+                    val *= 1.0 / iscaler
+
+        return J
+
     def record_derivatives(self, requester, metadata):
         """
         Record derivatives to the recorder.
@@ -1853,13 +2064,120 @@ class _TotalJacInfo(object):
         self.model._recording_iter.push((requester._get_name(), requester.iter_count))
 
         try:
-            totals = self._get_dict_J(self.J, self.input_meta['fwd'], self.output_meta['fwd'],
+            J = self.J
+            if isinstance(J, _SparseTotalJacStorage):
+                J = J.tomatrix('csr')
+            elif self.return_format == 'lazy':
+                # the jacobian is only complete and scaled once all of its seeds are solved
+                J = self.get_J_array()
+            totals = self._get_dict_J(J, self.input_meta['fwd'], self.output_meta['fwd'],
                                       'flat_dict_structured_key')
+            if isinstance(self.J, _SparseTotalJacStorage):
+                totals = {key: subjac.toarray() for key, subjac in totals.items()}
             requester._rec_mgr.record_derivatives(requester, totals, metadata)
 
         finally:
             self.model._recording_iter.pop()
 
+    def get_recorded_sparsity(self):
+        """
+        Get the sparsity of the sub-jacobians recorded by record_derivatives.
+
+        The sparsity is taken from the total coloring, so it is only known when the total
+        coloring was computed for the same 'of' and 'wrt' variables as this jacobian.
+
+        Returns
+        -------
+        dict or None
+            Dictionary mapping the 'of!wrt' key of each recorded sub-jacobian to the rows and
+            columns of its nonzero entries, or None if the sparsity is not known.
+        """
+        if self._recorded_sparsity is not _UNDEFINED:
+            return self._recorded_sparsity
+
+        self._recorded_sparsity = None
+
+        of_metadata = self.output_meta['fwd']
+        wrt_metadata = self.input_meta['fwd']
+
+        nonzeros = self._get_coloring_nonzeros()
+        if nonzeros is None:
+            return None
+
+        nzrows, nzcols = nonzeros
+        get_remote = self.get_remote
+        sparsity = {}
+
+        # same sub-jacobians, in the same order, as the 'flat_dict_structured_key' format
+        for out, ofmeta in of_metadata.items():
+            if not get_remote and ofmeta['remote']:
+                continue
+            out_slice = ofmeta['jac_slice']
+            mask = (nzrows >= out_slice.start) & (nzrows < out_slice.stop)
+            rows = nzrows[mask] - out_slice.start
+            cols = nzcols[mask]
+            for inp, wrtmeta in wrt_metadata.items():
+                if get_remote or not wrtmeta['remote']:
+                    wrt_slice = wrtmeta['jac_slice']
+                    mask = (cols >= wrt_slice.start) & (cols < wrt_slice.stop)
+                    sparsity[f"{out}!{inp}"] = (rows[mask], cols[mask] - wrt_slice.start)
+
+        self._recorded_sparsity = sparsity
+        return sparsity
+
+    def _get_coloring_nonzeros(self):
+        """
+        Get the nonzero rows and columns of this jacobian from the total coloring.
+
+        Returns
+        -------
+        tuple of ndarray or None
+            Row and column indices of the nonzero entries, or None if there is no total
+            coloring for the same 'of' and 'wrt' variables as this jacobian.
+        """
+        coloring = self.simul_coloring
+
+        if coloring is None or coloring._shape != (self.of_size, self.wrt_size) or \
+                coloring._row_vars != list(self.output_meta['fwd']) or \
+                coloring._col_vars != list(self.input_meta['fwd']):
+            return None
+
+        return coloring._nzrows, coloring._nzcols
+
+    def _get_total_sparsity_pattern(self):
+        """
+        Get the rows and columns of the entries of this jacobian that may be nonzero.
+
+        The pattern comes from the total coloring if there is one for the same variables.
+        Otherwise it contains every sub-jacobian whose response depends on its design variable.
+
+        Returns
+        -------
+        tuple of ndarray
+            Row and column indices of the entries.
+        """
+        nonzeros = self._get_coloring_nonzeros()
+        if nonzeros is not None:
+            return nonzeros
+
+        rows = [np.zeros(0, dtype=INT_DTYPE)]
+        cols = [np.zeros(0, dtype=INT_DTYPE)]
+        for wrtmeta in self.input_meta['fwd'].values():
+            try:
+                relevant = self.relevance.relevant_vars(wrtmeta['source'], 'fwd', inputs=False)
+            except KeyError:
+                relevant = None
+            wrt_slice = wrtmeta['jac_slice']
+            for ofmeta in self.output_meta['fwd'].values():
+                if relevant is None or ofmeta['source'] in relevant:
+                    out_slice = ofmeta['jac_slice']
+                    r, c = np.meshgrid(np.arange(out_slice.start, out_slice.stop),
+                                       np.arange(wrt_slice.start, wrt_slice.stop), indexing='ij')
+                    rows.append(r.ravel())
+                    cols.append(c.ravel())
+
+        return np.concatenate(rows), np.concatenate(cols)
+
     def set_col(self, system, icol, column):
         """
         Set the given column of the total jacobian.
@@ -1989,6 +2307,306 @@ class _TotalJacInfo(object):
             self.model._problem_meta['mode'] = old_mode
 
 
+class _SparseTotalJacStorage(object):
+    """
+    Values of a total jacobian with a fixed sparsity pattern.
+
+    Rows and columns are set using the same indexing as the dense jacobian array, i.e.,
+    J[rows, icol] = vals and J[irow, cols] = vals, so the jacobian setters can scatter solutions
+    directly into it.  Values that fall outside of the pattern are dropped.
+
+    Parameters
+    ----------
+    rows : ndarray
+        Row indices of the entries in the pattern.
+    cols : ndarray
+        Column indices of the entries in the pattern.
+    shape : tuple
+        Shape of the total jacobian.
+
+    Attributes
+    ----------
+    shape : tuple
+        Shape of the total jacobian.
+    dtype : dtype
+        Data type of the values.
+    data : ndarray
+        Values of the entries, in column major order.
+    rows : ndarray
+        Row index of each entry in data.
+    cols : ndarray
+        Column index of each entry in data.
+    _indptr : ndarray
+        Offset into data of the start of each column.
+    _csr_perm : ndarray
+        Indices into data of the entries in row major order.
+    _csr_cols : ndarray
+        Column index of each entry in row major order.
+    _csr_indptr : ndarray
+        Offset into _csr_perm of the start of each row.
+    """
+
+    def __init__(self, rows, cols, shape):
+        """
+        Initialize attributes.
+        """
+        nrows, ncols = shape
+        self.shape = shape
+        self.dtype = np.dtype(float)
+
+        # remove duplicates and sort in column major order
+        flat = np.unique(np.asarray(cols, dtype=np.int64) * nrows + np.asarray(rows))
+        self.cols = (flat // nrows).astype(INT_DTYPE)
+        self.rows = (flat % nrows).astype(INT_DTYPE)
+        self.data = np.zeros(flat.size)
+
+        self._indptr = np.zeros(ncols + 1, dtype=INT_DTYPE)
+        np.cumsum(np.bincount(self.cols, minlength=ncols), out=self._indptr[1:])
+
+        self._csr_perm = np.lexsort((self.cols, self.rows))
+        self._csr_cols = self.cols[self._csr_perm]
+        self._csr_indptr = np.zeros(nrows + 1, dtype=INT_DTYPE)
+        np.cumsum(np.bincount(self.rows, minlength=nrows), out=self._csr_indptr[1:])
+
+    def __setitem__(self, key, val):
+        """
+        Set all values, a column, or a row of the jacobian.
+
+        Parameters
+        ----------
+        key : slice or tuple
+            Either a slice over all values, (row indices, column index) or
+            (row index, column indices).
+        val : float or ndarray
+            Value(s) to set.
+        """
+        if isinstance(key, slice):
+            self.data[key] = val
+            return
+
+        irow, icol = key
+        if isinstance(icol, (int, np.integer)):
+            start, end = self._indptr[icol], self._indptr[icol + 1]
+            pattern = self.rows[start:end]
+            idxs = irow
+            perm = None
+        else:
+            start, end = self._csr_indptr[irow], self._csr_indptr[irow + 1]
+            pattern = self._csr_cols[start:end]
+            idxs = icol
+            perm = self._csr_perm
+
+        if isinstance(idxs, slice):
+            idxs = np.arange(self.shape[0] if perm is None else self.shape[1])[idxs]
+
+        if start == end:
+            return
+
+        pos = np.minimum(np.searchsorted(pattern, idxs), end - start - 1)
+        mask = pattern[pos] == idxs
+        locs = pos[mask] + start
+        if perm is not None:
+            locs = perm[locs]
+
+        val = np.asarray(val)
+        self.data[locs] = val[mask] if val.ndim > 0 else val
+
+    def tomatrix(self, fmt):
+        """
+        Return the jacobian as a new scipy sparse matrix.
+
+        Parameters
+        ----------
+        fmt : str
+            Sparse format, one of 'coo', 'csc' or 'csr'.
+
+        Returns
+        -------
+        coo_matrix, csc_matrix or csr_matrix
+            The sparse jacobian.
+        """
+        if fmt == 'csr':
+            return csr_matrix((self.data[self._csr_perm], self._csr_cols.copy(),
+                               self._csr_indptr.copy()), shape=self.shape)
+        if fmt == 'csc':
+            return csc_matrix((self.data.copy(), self.rows.copy(), self._indptr.copy()),
+                              shape=self.shape)
+        return coo_matrix((self.data.copy(), (self.rows.copy(), self.cols.copy())),
+                          shape=self.shape)
+
+
+class _LazyTotalJac(Mapping):
+    """
+    Total jacobian that only does the linear solves needed for the blocks that are accessed.
+
+    Blocks are accessed as J[of, wrt].  The first access to a block does the forward solves
+    for its columns and the reverse solves for its rows (whole colors when the total jacobian
+    is colored), and the solutions are kept for other blocks that need the same solves.  If
+    the model state has changed since the model was linearized, the next access linearizes it
+    again and discards the kept solutions.  Returned blocks are copies.
+
+    Under MPI, all procs must access the same blocks in the same order.
+
+    Parameters
+    ----------
+    totjac : _TotalJacInfo
+        The object managing the total jacobian computation.
+
+    Attributes
+    ----------
+    _totjac : _TotalJacInfo
+        The object managing the total jacobian computation.
+    _seeds : dict
+        The seeds for each mode and the seed that sets each jacobian row or column.
+    _solved : dict
+        Boolean array for each mode that's True for the seeds that have been solved.
+    _state : tuple or None
+        Model state hash and compute_totals count at the last linearization.
+    """
+
+    def __init__(self, totjac):
+        """
+        Initialize the lazy jacobian.
+        """
+        self._totjac = totjac
+        self._seeds = {mode: totjac._get_seed_items(mode) for mode in totjac.modes}
+        self._solved = {mode: np.zeros(len(items), dtype=bool)
+                        for mode, (items, _) in self._seeds.items()}
+        self._state = None
+
+    def _get_state(self):
+        """
+        Return the current model state hash and compute_totals count.
+
+        Returns
+        -------
+        tuple
+            The model state hash and compute_totals count.
+        """
+        model = self._totjac.model
+        return _get_model_state_hash(model), model._problem_meta['ncompute_totals']
+
+    def _reset(self):
+        """
+        Discard all solutions after the model has been linearized.
+        """
+        for solved in self._solved.values():
+            solved[:] = False
+        self._state = self._get_state()
+
+    @property
+    def nsolves(self):
+        """
+        Return the number of linear solves done so far.
+
+        Returns
+        -------
+        int
+            The number of linear solves.
+        """
+        return self._totjac.nsolves
+
+    def __getitem__(self, key):
+        """
+        Return the (of, wrt) block of the total jacobian, doing any linear solves it needs.
+
+        Parameters
+        ----------
+        key : tuple of str
+            The (of, wrt) names of the block.
+
+        Returns
+        -------
+        ndarray
+            A copy of the block.
+        """
+        totjac = self._totjac
+        if key not in totjac.J_dict:
+            raise KeyError(f"{key} is not a block of this total jacobian.")
+
+        if self._state != self._get_state():
+            totjac.compute_totals()
+
+        of, wrt = key
+        totjac._solve_lazy_block(of, wrt)
+
+        val = totjac.J_dict[key].copy()
+
+        if totjac.has_scaling:
+            oscaler = totjac.output_meta['fwd'][of]['total_scaler']
+            iscaler = totjac.input_meta['fwd'][wrt]['total_scaler']
+            if oscaler is not None:
+                val[:] = (oscaler * val.T).T
+            if iscaler is not None:
+                val *= 1.0 / iscaler
+
+        return val
+
+    def __contains__(self, key):
+        """
+        Return True if the given (of, wrt) names are a block of the total jacobian.
+
+        Parameters
+        ----------
+        key : tuple of str
+            The (of, wrt) names of the block.
+
+        Returns
+        -------
+        bool
+            True if key is a block of the total jacobian.
+        """
+        return key in self._totjac.J_dict
+
+    def __iter__(self):
+        """
+        Iterate over the (of, wrt) keys of the blocks.
+
+        Returns
+        -------
+        iterator
+            Iterator over the keys.
+        """
+        return iter(self._totjac.J_dict)
+
+    def __len__(self):
+        """
+        Return the number of blocks.
+
+        Returns
+        -------
+        int
+            The number of blocks.
+        """
+        return len(self._totjac.J_dict)
+
+
+def _get_model_state_hash(model):
+    """
+    Return a hash of the inputs and outputs of the model on this proc.
+
+    Parameters
+    ----------
+    model : <Group>
+        The top level System of the System tree.
+
+    Returns
+    -------
+    bytes or None
+        The hash, or None if the model has discrete variables that can't be hashed.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(model._outputs.asarray().tobytes())
+    hasher.update(model._inputs.asarray().tobytes())
+    if model._discrete_outputs or model._discrete_inputs:
+        try:
+            hasher.update(pickle.dumps((sorted(model._discrete_outputs.items()),
+                                        sorted(model._discrete_inputs.items()))))
+        except Exception:
+            return None
+    return hasher.digest()
+
+
 def _fix_pdc_lengths(idx_iter_dict):
     """
     Take any parallel_deriv_color entries and make sure their index arrays are the same length.
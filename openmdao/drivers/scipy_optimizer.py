@@ -26,6 +26,7 @@ if Version(scipy_version) >= Version("1.1"):  # Only available in newer versions
 _gradient_optimizers = {'CG', 'BFGS', 'Newton-CG', 'L-BFGS-B', 'TNC', 'SLSQP', 'dogleg',
                         'trust-ncg', 'trust-constr', 'basinhopping', 'shgo'}
 _hessian_optimizers = {'trust-constr', 'trust-ncg'}
+_hessp_optimizers = {'Newton-CG', 'trust-constr'}
 _bounds_optimizers = {'L-BFGS-B', 'TNC', 'SLSQP', 'trust-constr', 'dual_annealing', 'shgo',
                       'differential_evolution', 'basinhopping', 'Nelder-Mead'}
 if Version(scipy_version) >= Version("1.11"):
@@ -189,6 +190,11 @@ class ScipyOptimizeDriver(Driver):
                              "ignore - don't perform check.")
         self.options.declare('singular_jac_tol', default=1e-16,
                              desc='Tolerance for zero row/column check.')
+        self.options.declare('hessp', default=False, types=bool,
+                             desc='If True, give the optimizer products of the objective Hessian '
+                             'with a vector, computed by finite differencing the total '
+                             'derivatives. Only used by optimizers in '
+                             f'{sorted(_hessp_optimizers)}.')
 
     def _get_name(self):
         """
@@ -460,6 +466,13 @@ class ScipyOptimizeDriver(Driver):
         else:
             hess = None
 
+        # Hessian-vector products of the objective replace the Hessian approximation
+        if self.options['hessp'] and opt in _hessp_optimizers:
+            hessp = self._hesspfunc
+            hess = None
+        else:
+            hessp = None
+
         # compute dynamic simul deriv coloring if option is set
         prob.get_total_coloring(self._coloring_info, run_model=False)
 
@@ -474,7 +487,7 @@ class ScipyOptimizeDriver(Driver):
                                   method=opt,
                                   jac=jac,
                                   hess=hess,
-                                  # hessp=None,
+                                  hessp=hessp,
                                   bounds=bounds,
                                   constraints=constraints,
                                   tol=self.options['tol'],
@@ -776,6 +789,40 @@ class ScipyOptimizeDriver(Driver):
 
         return grad[0, :]
 
+    def _hesspfunc(self, x_new, p):
+        """
+        Evaluate and return the product of the objective Hessian with a vector.
+
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing input values at new design point.
+        p : ndarray
+            Array that the Hessian is multiplied with.
+
+        Returns
+        -------
+        ndarray
+            Product of the Hessian of the objective with p.
+        """
+        prob = self._problem()
+
+        try:
+            # scipy normally asks for the product at the point it last evaluated
+            if self._desvar_array_cache is None or not np.array_equal(x_new,
+                                                                      self._desvar_array_cache):
+                self._objfunc(x_new)
+
+            hvp = prob.compute_hessian_vector_product(self._obj_and_nlcons[:1], self._dvlist, p,
+                                                      driver_scaling=True)
+
+        except Exception:
+            if self._exc_info is None:  # only record the first one
+                self._exc_info = sys.exc_info()
+            return np.zeros(p.shape)
+
+        return hvp[0, :]
+
     def _congradfunc(self, x_new, name, dbl, idx):
         """
         Return the cached gradient of the constraint function.
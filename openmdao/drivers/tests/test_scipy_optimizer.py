@@ -2,6 +2,7 @@
 
 import unittest
 import sys
+from unittest import mock
 from io import StringIO
 
 from packaging.version import Version
@@ -413,6 +414,39 @@ class TestScipyOptimizeDriver(unittest.TestCase):
         assert_near_equal(prob['x'], 6.66666667, 1e-6)
         assert_near_equal(prob['y'], -7.3333333, 1e-6)
 
+    def test_simple_paraboloid_unconstrained_hessp(self):
+        for optimizer in ('Newton-CG', 'trust-constr'):
+            with self.subTest(optimizer=optimizer):
+                prob = om.Problem()
+                model = prob.model
+
+                model.set_input_defaults('x', val=50.)
+                model.set_input_defaults('y', val=50.)
+
+                model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+
+                prob.driver = om.ScipyOptimizeDriver(optimizer=optimizer, tol=1e-9, disp=False,
+                                                     hessp=True)
+
+                model.add_design_var('x', ref=10.)
+                model.add_design_var('y')
+                model.add_objective('f_xy')
+
+                prob.setup()
+
+                with mock.patch.object(om.Problem, 'compute_hessian_vector_product',
+                                       autospec=True,
+                                       side_effect=om.Problem.compute_hessian_vector_product) \
+                        as hessp:
+                    failed = not prob.run_driver().success
+
+                self.assertFalse(failed, "Optimization failed, result =\n" +
+                                         str(prob.driver._scipy_optimize_result))
+                self.assertGreater(hessp.call_count, 0)
+
+                assert_near_equal(prob['x'], 6.66666667, 1e-6)
+                assert_near_equal(prob['y'], -7.3333333, 1e-6)
+
     def test_simple_paraboloid_unconstrained_COBYLA(self):
         prob = om.Problem()
         model = prob.model
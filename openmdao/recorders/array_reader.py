@@ -0,0 +1,193 @@
+"""
+Definition of the ArrayCaseReader, for files recorded by ArrayRecorder.
+"""
+import os
+import glob
+import json
+
+import numpy as np
+
+from openmdao.utils.units import unit_conversion, simplify_unit
+
+
+class ArrayCaseReader(object):
+    """
+    A reader for the memory-mapped .npy files written by ArrayRecorder.
+
+    Recorded data is returned as read-only views of the memory-mapped files, so nothing is
+    copied or decoded. Files that are still being written can be read, in which case only the
+    rows recorded so far are returned.
+
+    Parameters
+    ----------
+    dirpath : str or Path
+        Path to the directory containing the recording files.
+
+    Attributes
+    ----------
+    _dirpath : str or Path
+        Path to the directory containing the recording files.
+    """
+
+    def __init__(self, dirpath):
+        """
+        Initialize.
+        """
+        if not os.path.isdir(dirpath):
+            raise IOError(f'Directory does not exist({dirpath})')
+
+        self._dirpath = dirpath
+
+    def _get_sidecar(self, source):
+        """
+        Load the JSON sidecar describing the layout of the rows of a source.
+
+        Parameters
+        ----------
+        source : str
+            The name of the recording source.
+
+        Returns
+        -------
+        dict
+            Contents of the sidecar.
+        """
+        try:
+            with open(os.path.join(self._dirpath, f'{source}.json')) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise RuntimeError('Source not found: %s' % source)
+
+    def list_sources(self):
+        """
+        List of all the different recording sources for which there is recorded data.
+
+        Returns
+        -------
+        list
+            The driver and the pathnames of recorded systems and solvers.
+        """
+        return sorted(os.path.splitext(os.path.basename(path))[0]
+                      for path in glob.glob(os.path.join(self._dirpath, '*.json')))
+
+    def list_source_vars(self, source):
+        """
+        List of all inputs, outputs and residuals recorded by the specified source.
+
+        Parameters
+        ----------
+        source : str
+            The name of the recording source.
+
+        Returns
+        -------
+        dict
+            {'inputs': [list of keys], 'outputs': [list of keys], 'residuals': [list of keys]}.
+        """
+        fields = self._get_sidecar(source)['fields']
+        return {f'{kind}s': [f['prom'] for f in fields if f['kind'] == kind]
+                for kind in ('input', 'output', 'residual')}
+
+    def get_source_data(self, source='driver'):
+        """
+        Get the recorded rows of a source.
+
+        Fields are named 'counter', 'timestamp' and 'success' (plus 'abs_err' and 'rel_err'
+        for solvers), followed by '<kind>:<absolute name>' for each recorded variable,
+        where kind is 'output', 'input' or 'residual'.
+
+        Parameters
+        ----------
+        source : str
+            The name of the recording source.
+
+        Returns
+        -------
+        numpy.memmap
+            Read-only structured array with one row per recorded case.
+        """
+        sidecar = self._get_sidecar(source)
+        data = np.load(os.path.join(self._dirpath, f'{source}.npy'), mmap_mode='r')
+
+        if not sidecar['complete']:
+            # still being written, rows are complete once their counter is set
+            zero = np.flatnonzero(np.asarray(data['counter']) == 0.)
+            data = data[:zero[0] if zero.size else len(data)]
+
+        return data
+
+    def _get_field(self, fields, name):
+        """
+        Find the field of the variable with the given name.
+
+        Parameters
+        ----------
+        fields : list of dict
+            Name, kind, promoted name, shape and units of each recorded variable.
+        name : str
+            Promoted or absolute name of the variable.
+
+        Returns
+        -------
+        dict
+            The field, preferring outputs over inputs over residuals.
+        """
+        for kind in ('output', 'input', 'residual'):
+            for field in fields:
+                if field['kind'] == kind and (field['name'] == name or field['prom'] == name):
+                    return field
+
+        raise KeyError('Variable name "%s" not found.' % name)
+
+    def get_val_history(self, names, source='driver', units=None):
+        """
+        Get the recorded values of the specified variables across all cases from a source.
+
+        Parameters
+        ----------
+        names : str or iter of str
+            Promoted or absolute names of the variables.
+        source : str
+            The name of the recording source.
+        units : str or dict or None
+            Units to convert the values to, either for all variables or as a dictionary
+            keyed by variable name. Converted values are copies rather than views.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping each variable name to a 2D array with one flattened row of
+            values per case, in recorded order.
+        """
+        if isinstance(names, str):
+            names = [names]
+
+        fields = self._get_sidecar(source)['fields']
+        data = self.get_source_data(source)
+
+        history = {}
+        for name in names:
+            field = self._get_field(fields, name)
+            val = data[f"{field['kind']}:{field['name']}"].view(np.ndarray)
+            val = val.reshape((len(data), -1))
+
+            unit = units.get(name) if isinstance(units, dict) else units
+            if unit is not None:
+                base_units = field['units']
+                simp_units = simplify_unit(unit)
+
+                if base_units is None:
+                    msg = "Can't express variable '{}' with units of 'None' in units of '{}'."
+                    raise TypeError(msg.format(name, simp_units))
+
+                try:
+                    scale, offset = unit_conversion(base_units, simp_units)
+                except TypeError:
+                    msg = "Can't express variable '{}' with units of '{}' in units of '{}'."
+                    raise TypeError(msg.format(name, base_units, simp_units))
+
+                val = (val + offset) * scale
+
+            history[name] = val
+
+        return history
@@ -0,0 +1,562 @@
+"""
+Class definition for ArrayRecorder, which records cases to memory-mapped .npy files.
+"""
+import os
+import json
+import struct
+
+import numpy as np
+
+from openmdao.recorders.case_recorder import CaseRecorder
+from openmdao.core.system import System
+from openmdao.core.driver import Driver
+from openmdao.core.problem import Problem
+from openmdao.solvers.solver import Solver
+from openmdao.utils.mpi import MPI
+
+
+# version of the sidecar layout written by ArrayRecorder
+format_version = 1
+
+# fields at the start of every row, ahead of the recorded variables
+_ROW_FIELDS = ('counter', 'timestamp', 'success')
+_SOLVER_ROW_FIELDS = _ROW_FIELDS + ('abs_err', 'rel_err')
+
+# the kinds of recorded data, in the order they are laid out in a row
+_KINDS = ('output', 'input', 'residual')
+
+
+def _npy_header_dict(dtype, nrows):
+    """
+    Return the dictionary literal describing the array in a .npy header.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        The dtype of each row.
+    nrows : int
+        The number of rows.
+
+    Returns
+    -------
+    str
+        The dictionary literal.
+    """
+    return "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % \
+        (np.lib.format.dtype_to_descr(dtype), nrows)
+
+
+def _npy_header(dtype, nrows, header_size):
+    """
+    Return a .npy (version 2.0) header padded to a fixed size.
+
+    A fixed size allows the header to be rewritten in place as the number of rows changes.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        The dtype of each row.
+    nrows : int
+        The number of rows.
+    header_size : int
+        The total size of the header in bytes, including magic string and length.
+
+    Returns
+    -------
+    bytes
+        The header.
+    """
+    d = _npy_header_dict(dtype, nrows)
+    hlen = header_size - len(np.lib.format.MAGIC_PREFIX) - 6
+    return np.lib.format.MAGIC_PREFIX + bytes([2, 0]) + struct.pack('<I', hlen) + \
+        d.ljust(hlen - 1).encode('latin1') + b'\n'
+
+
+def _npy_header_size(dtype):
+    """
+    Return the size of a header that can hold any number of rows of the given dtype.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        The dtype of each row.
+
+    Returns
+    -------
+    int
+        The header size in bytes, a multiple of 64 so the data is aligned.
+    """
+    # magic string, version and length, then the dictionary with a 20 digit number of rows
+    size = len(np.lib.format.MAGIC_PREFIX) + 6 + len(_npy_header_dict(dtype, 10**19)) + 1
+    return size + (-size % 64)
+
+
+class _ArrayFile(object):
+    """
+    A growable memory-mapped .npy file of fixed-width rows for a single recording source.
+
+    Parameters
+    ----------
+    path : str
+        Path of the .npy file. The JSON sidecar has the same name with a .json extension.
+    fields : list of dict
+        Name, kind, promoted name, shape and units of each recorded variable.
+    row_fields : tuple of str
+        Names of the scalar fields at the start of every row.
+    initial_rows : int
+        Number of rows to allocate initially. The file doubles in size whenever it is full.
+
+    Attributes
+    ----------
+    path : str
+        Path of the .npy file.
+    keys : list of (str, str)
+        The kind and name of each recorded variable, in row order.
+    nrows : int
+        Number of rows recorded.
+    _dtype : numpy.dtype
+        Structured dtype of each row.
+    _rowlen : int
+        Number of float64 values in each row.
+    _header_size : int
+        Size in bytes of the .npy header.
+    _capacity : int
+        Number of rows allocated in the file.
+    _mm : numpy.memmap
+        2D float64 view of the allocated rows.
+    _sidecar : dict
+        Contents of the JSON sidecar.
+    """
+
+    def __init__(self, path, fields, row_fields, initial_rows):
+        """
+        Initialize.
+        """
+        self.path = path
+        self.keys = [(f['kind'], f['name']) for f in fields]
+        self.nrows = 0
+
+        self._dtype = np.dtype([(name, np.float64) for name in row_fields] +
+                               [(f"{f['kind']}:{f['name']}", np.float64, tuple(f['shape']))
+                                for f in fields])
+        self._rowlen = self._dtype.itemsize // 8
+        self._header_size = _npy_header_size(self._dtype)
+        self._capacity = 0
+        self._mm = None
+
+        self._sidecar = {
+            'format_version': format_version,
+            'header_size': self._header_size,
+            'row_fields': list(row_fields),
+            'fields': fields,
+            'complete': False,
+        }
+        self._write_sidecar()
+
+        with open(path, 'wb') as f:
+            f.write(_npy_header(self._dtype, 0, self._header_size))
+
+        self._resize(initial_rows)
+
+    def _write_sidecar(self):
+        """
+        Write the JSON sidecar describing the layout of the rows.
+        """
+        with open(os.path.splitext(self.path)[0] + '.json', 'w') as f:
+            json.dump(self._sidecar, f, indent=1)
+
+    def _resize(self, nrows):
+        """
+        Resize the file to hold the given number of rows and map it into memory.
+
+        Parameters
+        ----------
+        nrows : int
+            The new number of rows.
+        """
+        if self._mm is not None:
+            self._mm.flush()
+            self._mm = None
+
+        # extend the file before updating the header so that readers never see a header
+        # describing more rows than the file contains
+        os.truncate(self.path, self._header_size + nrows * self._dtype.itemsize)
+        with open(self.path, 'r+b') as f:
+            f.write(_npy_header(self._dtype, nrows, self._header_size))
+
+        self._capacity = nrows
+        if nrows > 0:
+            self._mm = np.memmap(self.path, dtype=np.float64, mode='r+',
+                                 offset=self._header_size, shape=(nrows, self._rowlen))
+
+    def append(self, row_vals, values):
+        """
+        Append a row.
+
+        Parameters
+        ----------
+        row_vals : tuple of float
+            Values of the scalar fields at the start of the row, starting with the counter.
+        values : list of ndarray
+            Values of the recorded variables, in row order.
+        """
+        if self.nrows == self._capacity:
+            self._resize(max(2 * self._capacity, 1))
+
+        row = self._mm[self.nrows]
+        nfields = len(row_vals)
+        if values:
+            row[nfields:] = np.concatenate(values)
+        row[1:nfields] = row_vals[1:]
+        # the counter goes in last, a nonzero counter marks the row as complete for readers
+        row[0] = row_vals[0]
+
+        self.nrows += 1
+
+    def close(self):
+        """
+        Truncate the file to the recorded rows and mark it as complete.
+        """
+        self._resize(self.nrows)
+        self._mm = None
+        self._sidecar['complete'] = True
+        self._write_sidecar()
+
+
+class ArrayRecorder(CaseRecorder):
+    """
+    Recorder that saves cases as rows of memory-mapped .npy files.
+
+    There is one file per recording source (the driver, and each recorded system and solver,
+    with pathnames starting with 'root'), named '<source>.npy', with a JSON sidecar
+    '<source>.json' describing the layout of its rows. The layout is fixed by the first case
+    recorded from a source and every row holds the counter, timestamp and success flag of the
+    case (plus abs_err and rel_err for solvers) followed by the flattened values of the recorded
+    outputs, inputs and residuals. Only numeric variables can be recorded. Use ArrayCaseReader
+    to read the files, even while they are still being written.
+
+    Parameters
+    ----------
+    dirpath : str or Path
+        Path to the directory for the recording files.
+    initial_rows : int, optional
+        Number of rows to allocate initially for each source. Files double in size when full.
+    record_viewer_data : bool, optional
+        Not supported by this recorder, data needed for visualization is not recorded.
+
+    Attributes
+    ----------
+    _dirpath : str or Path
+        Path to the directory for the recording files.
+    _use_outputs_dir : bool
+        Flag indicating if the files are being saved in the problem outputs dir.
+    _initial_rows : int
+        Number of rows to allocate initially for each source.
+    _files : dict
+        Dictionary mapping source name to its _ArrayFile.
+    _abs2prom : dict
+        Dictionary mapping absolute names to promoted names, for all variables.
+    _units : dict
+        Dictionary mapping absolute names to units, for all variables.
+    _suffix : str
+        Suffix added to file names when recording on multiple processors.
+    _started : set
+        Set of recording requesters for which this recorder has been started.
+    """
+
+    def __init__(self, dirpath, initial_rows=1024, record_viewer_data=False):
+        """
+        Initialize the ArrayRecorder.
+        """
+        self._dirpath = dirpath
+        self._use_outputs_dir = not (os.path.sep in str(dirpath) or '/' in str(dirpath))
+        self._initial_rows = initial_rows
+        self._files = {}
+        self._abs2prom = {}
+        self._units = {}
+        self._suffix = ''
+        self._started = set()
+
+        super().__init__(record_viewer_data)
+
+    def startup(self, recording_requester, comm=None):
+        """
+        Prepare for a new run.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Object to which this recorder is attached.
+        comm : MPI.Comm or <FakeComm> or None
+            The MPI communicator for the recorder (should be the comm for the Problem).
+        """
+        # we only want to set up recording once for each recording_requester
+        if recording_requester in self._started:
+            return
+
+        if isinstance(recording_requester, Problem):
+            raise ValueError("ArrayRecorder can't record Problem cases. Attach it to a Driver, "
+                             "System or Solver instead.")
+        if isinstance(recording_requester, Driver) and \
+                recording_requester.recording_options['record_derivatives']:
+            raise ValueError("ArrayRecorder can't record derivatives. Set the "
+                             "'record_derivatives' recording option of the Driver to False.")
+
+        super().startup(recording_requester, comm)
+
+        if isinstance(recording_requester, Driver):
+            system = recording_requester._problem().model
+        elif isinstance(recording_requester, System):
+            system = recording_requester
+        elif isinstance(recording_requester, Solver):
+            system = recording_requester._system()
+        else:
+            raise ValueError('Driver encountered a recording_requester it cannot handle'
+                             ': {0}'.format(recording_requester))
+
+        if MPI and comm and comm.size > 1:
+            if self._parallel:
+                self._suffix = f'_{comm.rank}'
+        else:
+            self._record_on_proc = True
+
+        if not self._started:
+            if self._use_outputs_dir:
+                self._dirpath = system.get_outputs_dir() / self._dirpath
+            if self._record_on_proc:
+                os.makedirs(self._dirpath, exist_ok=True)
+
+        model = system._problem_meta['model_ref']()
+        for io in ('input', 'output'):
+            self._abs2prom.update(model._var_allprocs_abs2prom[io])
+            for name, meta in model._var_allprocs_abs2meta[io].items():
+                self._units[name] = meta['units']
+
+        # auto_ivc outputs are known by the promoted name of the input they are connected to
+        for tgt, src in model._conn_global_abs_in2out.items():
+            if src.startswith('_auto_ivc.'):
+                self._abs2prom[src] = self._abs2prom[tgt]
+
+        self._started.add(recording_requester)
+
+    def _get_file(self, source, data, row_fields):
+        """
+        Return the file for a source, creating it from the layout of the data if necessary.
+
+        Parameters
+        ----------
+        source : str
+            The name of the recording source.
+        data : dict
+            Dictionary containing the recorded inputs, outputs, and residuals.
+        row_fields : tuple of str
+            Names of the scalar fields at the start of every row.
+
+        Returns
+        -------
+        _ArrayFile
+            The file for the source.
+        """
+        try:
+            return self._files[source]
+        except KeyError:
+            pass
+
+        fields = []
+        for kind in _KINDS:
+            vals = data.get(kind)
+            if not vals:
+                continue
+            for name, val in vals.items():
+                try:
+                    shape = np.shape(np.asarray(val, dtype=float))
+                except (TypeError, ValueError):
+                    raise TypeError(f"ArrayRecorder can only record numeric variables, but "
+                                    f"{kind} '{name}' from '{source}' has value {val!r}.")
+                fields.append({'name': name, 'kind': kind,
+                               'prom': self._abs2prom.get(name, name),
+                               'shape': list(shape),
+                               'units': self._units.get(name)})
+
+        path = os.path.join(self._dirpath, f'{source}{self._suffix}.npy')
+        self._files[source] = afile = _ArrayFile(path, fields, row_fields, self._initial_rows)
+        return afile
+
+    def _record(self, source, data, row_vals, row_fields=_ROW_FIELDS):
+        """
+        Record a case as a row in the file for its source.
+
+        Parameters
+        ----------
+        source : str
+            The name of the recording source.
+        data : dict
+            Dictionary containing the recorded inputs, outputs, and residuals.
+        row_vals : tuple of float
+            Values of the scalar fields at the start of the row.
+        row_fields : tuple of str
+            Names of the scalar fields at the start of every row.
+        """
+        if not self._record_on_proc:
+            return
+
+        afile = self._get_file(source, data, row_fields)
+
+        try:
+            values = [np.ravel(data[kind][name]) for kind, name in afile.keys]
+            if sum(len(data[kind]) if data.get(kind) else 0 for kind in _KINDS) != \
+                    len(values):
+                raise KeyError()
+        except KeyError:
+            raise RuntimeError(f"The variables recorded from '{source}' have changed since its "
+                               "first case. ArrayRecorder requires a fixed set of variables "
+                               "for each source.")
+
+        afile.append(row_vals, values)
+
+    def record_iteration_driver(self, driver, data, metadata):
+        """
+        Record data and metadata from a Driver.
+
+        Parameters
+        ----------
+        driver : Driver
+            Driver in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and System vars.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._record('driver', data,
+                     (self._counter, metadata['timestamp'], metadata['success']))
+
+    def record_iteration_system(self, system, data, metadata):
+        """
+        Record data and metadata from a System.
+
+        Parameters
+        ----------
+        system : System
+            System in need of recording.
+        data : dict
+            Dictionary containing inputs, outputs, and residuals.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        source = f'root.{system.pathname}' if system.pathname else 'root'
+        self._record(source, data, (self._counter, metadata['timestamp'], metadata['success']))
+
+    def record_iteration_solver(self, solver, data, metadata):
+        """
+        Record data and metadata from a Solver.
+
+        Parameters
+        ----------
+        solver : Solver
+            Solver in need of recording.
+        data : dict
+            Dictionary containing outputs, residuals, and errors.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        pathname = solver._system().pathname
+        source_system = f'root.{pathname}' if pathname else 'root'
+
+        solver_type = solver.SOLVER[0:2]
+        if solver_type == 'NL':
+            source = source_system + '.nonlinear_solver'
+        elif solver_type == 'LS':
+            source = source_system + '.nonlinear_solver.linesearch'
+        else:
+            raise RuntimeError("Solver type '%s' not recognized during recording. "
+                               "Expecting NL or LS" % solver.SOLVER)
+
+        self._record(source, data,
+                     (self._counter, metadata['timestamp'], metadata['success'],
+                      data['abs'], data['rel']),
+                     _SOLVER_ROW_FIELDS)
+
+    def record_iteration_problem(self, problem, data, metadata):
+        """
+        Record data and metadata from a Problem.
+
+        Parameters
+        ----------
+        problem : Problem
+            Problem in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, and constraints.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        # never called, since startup rejects Problem requesters
+        pass
+
+    def record_derivatives_driver(self, recording_requester, data, metadata):
+        """
+        Record derivatives data from a Driver.
+
+        Parameters
+        ----------
+        recording_requester : Driver
+            Driver in need of recording.
+        data : dict
+            Dictionary containing derivatives keyed by 'of,wrt' to be recorded.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        # never called, since startup rejects drivers that record derivatives
+        pass
+
+    def record_metadata_system(self, system, run_number=None):
+        """
+        Record system metadata.
+
+        System options are not recorded by this recorder.
+
+        Parameters
+        ----------
+        system : System
+            The System for which to record metadata.
+        run_number : int or None
+            Number indicating which run the metadata is associated with.
+            None for the first run, 1 for the second, etc.
+        """
+        pass
+
+    def record_metadata_solver(self, solver, run_number=None):
+        """
+        Record solver metadata.
+
+        Solver options are not recorded by this recorder.
+
+        Parameters
+        ----------
+        solver : Solver
+            The Solver for which to record metadata.
+        run_number : int or None
+            Number indicating which run the metadata is associated with.
+            None for the first run, 1 for the second, etc.
+        """
+        pass
+
+    def record_viewer_data(self, model_viewer_data):
+        """
+        Record model viewer data.
+
+        Viewer data is not recorded by this recorder.
+
+        Parameters
+        ----------
+        model_viewer_data : dict
+            Data required to visualize the model.
+        """
+        pass
+
+    def shutdown(self):
+        """
+        Shut down the recorder, truncating each file to the number of recorded rows.
+        """
+        for afile in self._files.values():
+            afile.close()
+        self._files = {}
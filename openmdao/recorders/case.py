@@ -14,19 +14,25 @@ import numpy as np
 from openmdao.core.constants import _DEFAULT_OUT_STREAM
 from openmdao.core.system import allowed_meta_names
 from openmdao.recorders.sqlite_recorder import blob_to_array
-from openmdao.utils.record_util import deserialize, get_source_system
+from openmdao.utils.record_util import deserialize, get_source_system, is_sparse_derivatives, \
+    deserialize_sparse_derivatives
 from openmdao.utils.variable_table import write_var_table, NA
 from openmdao.utils.general_utils import match_prom_or_abs
 from openmdao.utils.units import unit_conversion, simplify_unit
 from openmdao.recorders.sqlite_recorder import format_version as current_version
 
 _AMBIGOUS_PROM_NAME = object()
+_NOT_DECODED = object()
 
 
 class Case(object):
     """
     Case wraps the data from a single iteration of a recording to make it more easily accessible.
 
+    The recorded inputs, outputs, residuals and derivatives are kept as they were read from
+    the recording and are only decoded when first accessed. Looking up a single variable by
+    absolute or unique promoted output name does not build the maps of all of the variables.
+
     Parameters
     ----------
     source : str
@@ -49,6 +55,8 @@ class Case(object):
         Dictionary with information about variables (scaling, indices, execution order).
     data_format : int
         A version number specifying the format of array data, if not numpy arrays.
+    layouts : dict or None
+        Dictionary mapping layout id to the structured dtype of binary iteration data.
 
     Attributes
     ----------
@@ -95,27 +103,52 @@ class Case(object):
         Dictionary with information about variables (scaling, indices, execution order).
     _format_version : int
         A version number specifying the format of array data, if not numpy arrays.
+    _layouts : dict or None
+        Dictionary mapping layout id to the structured dtype of binary iteration data.
+    _payloads : dict
+        Dictionary mapping 'inputs', 'outputs', 'residuals' and 'jacobian' to the recorded
+        data that has not been decoded yet.
+    _decoded : dict
+        Dictionary mapping 'inputs', 'outputs', 'residuals' and 'jacobian' to the decoded
+        structured array or dict of values, or None if not recorded.
+    _inputs : PromAbsDict or None
+        Map of inputs to values recorded, once built.
+    _outputs : PromAbsDict or None
+        Map of outputs to values recorded, once built.
+    _residuals : PromAbsDict or None
+        Map of outputs to residuals recorded, once built.
+    _derivatives : PromAbsDict or None
+        Map of (output, input) to derivatives recorded, once built.
     """
 
+    # there may be a very large number of cases in memory at once
+    __slots__ = ['source', 'name', 'parent', 'counter', 'timestamp', 'success', 'msg',
+                 'abs_err', 'rel_err', '_prom2abs', '_abs2prom', '_abs2meta', '_conns',
+                 '_auto_ivc_map', '_var_info', '_format_version', '_layouts', '_payloads',
+                 '_decoded', '_inputs', '_outputs', '_residuals', '_derivatives']
+
     def __init__(self, source, data, prom2abs, abs2prom, abs2meta, conns, auto_ivc_map, var_info,
-                 data_format=-1):
+                 data_format=-1, layouts=None):
         """
         Initialize.
         """
         self.source = source
         self._format_version = data_format
+        self._layouts = layouts
 
         # save VOI dict reference for use by self._scale()
         self._var_info = var_info
 
-        if 'iteration_coordinate' in data.keys():
+        keys = data.keys()
+
+        if 'iteration_coordinate' in keys:
             self.name = data['iteration_coordinate']
             parts = self.name.split('|')
             if len(parts) > 2:
                 self.parent = '|'.join(parts[:-2])
             else:
                 self.parent = None
-        elif 'case_name' in data.keys():
+        elif 'case_name' in keys:
             self.name = data['case_name']  # problem cases
             self.parent = None
         else:
@@ -128,75 +161,28 @@ class Case(object):
         self.msg = data['msg']
 
         # for a solver or problem case
-        self.abs_err = data['abs_err'] if 'abs_err' in data.keys() else None
-        self.rel_err = data['rel_err'] if 'rel_err' in data.keys() else None
-
-        # rename solver keys
-        if 'solver_inputs' in data.keys():
-            if not isinstance(data, dict):
-                data = dict(zip(data.keys(), data))
-            data['inputs'] = data.pop('solver_inputs')
-            data['outputs'] = data.pop('solver_output')
-            data['residuals'] = data.pop('solver_residuals')
-
-        # default properties to None
-        self.inputs = None
-        self.outputs = None
-        self.residuals = None
-        self.derivatives = None
-
-        if 'inputs' in data.keys():
-            if data_format >= 3:
-                inputs = deserialize(data['inputs'], abs2meta, prom2abs, conns)
-            elif data_format in (1, 2):
-                inputs = blob_to_array(data['inputs'])
-                if type(inputs) is np.ndarray and not inputs.shape:
-                    inputs = None
-            else:
-                inputs = data['inputs']
-            if inputs is not None:
-                self.inputs = PromAbsDict(inputs, prom2abs['input'], abs2prom['input'])
-
-        if 'outputs' in data.keys():
-            if data_format >= 3:
-                outputs = deserialize(data['outputs'], abs2meta, prom2abs, conns)
-            elif self._format_version in (1, 2):
-                outputs = blob_to_array(data['outputs'])
-                if type(outputs) is np.ndarray and not outputs.shape:
-                    outputs = None
-            else:
-                outputs = data['outputs']
-            if outputs is not None:
-                self.outputs = PromAbsDict(outputs, prom2abs['output'], abs2prom['output'],
-                                           in_prom2abs=prom2abs['input'],
-                                           auto_ivc_map=auto_ivc_map)
-
-        if 'residuals' in data.keys():
-            if data_format >= 3:
-                residuals = deserialize(data['residuals'], abs2meta, prom2abs, conns)
-            elif data_format in (1, 2):
-                residuals = blob_to_array(data['residuals'])
-                if type(residuals) is np.ndarray and not residuals.shape:
-                    residuals = None
-            else:
-                residuals = data['residuals']
-            if residuals is not None:
-                self.residuals = PromAbsDict(residuals, prom2abs['output'], abs2prom['output'],
-                                             in_prom2abs=prom2abs['input'],
-                                             auto_ivc_map=auto_ivc_map)
-
-        if 'jacobian' in data.keys():
-            if data_format >= 2:
-                jacobian = blob_to_array(data['jacobian'])
-                if type(jacobian) is np.ndarray and not jacobian.shape:
-                    jacobian = None
-            else:
-                jacobian = data['jacobian']
-            if jacobian is not None:
-                self.derivatives = PromAbsDict(jacobian, prom2abs['output'], abs2prom['output'],
-                                               in_prom2abs=prom2abs['input'],
-                                               auto_ivc_map=auto_ivc_map,
-                                               var_info=var_info)
+        self.abs_err = data['abs_err'] if 'abs_err' in keys else None
+        self.rel_err = data['rel_err'] if 'rel_err' in keys else None
+
+        # keep only the recorded data, undecoded, rather than the whole row
+        self._payloads = payloads = {}
+        if 'solver_inputs' in keys:
+            # rename solver keys
+            payloads['inputs'] = data['solver_inputs']
+            payloads['outputs'] = data['solver_output']
+            payloads['residuals'] = data['solver_residuals']
+        else:
+            for key in ('inputs', 'outputs', 'residuals'):
+                if key in keys:
+                    payloads[key] = data[key]
+        if 'jacobian' in keys:
+            payloads['jacobian'] = data['jacobian']
+
+        self._decoded = {}
+        self._inputs = _NOT_DECODED
+        self._outputs = _NOT_DECODED
+        self._residuals = _NOT_DECODED
+        self._derivatives = _NOT_DECODED
 
         # save var name & meta dict references for use by self._get_variables_of_type()
         self._prom2abs = prom2abs
@@ -205,6 +191,195 @@ class Case(object):
         self._conns = conns
         self._auto_ivc_map = auto_ivc_map
 
+    def _get_decoded(self, key):
+        """
+        Get the decoded data recorded under the given key, decoding it on first access.
+
+        Parameters
+        ----------
+        key : str
+            One of 'inputs', 'outputs', 'residuals' or 'jacobian'.
+
+        Returns
+        -------
+        array or dict or tuple or None
+            Numpy structured array or dictionary of values, the nonzero values and sparsity of
+            sparsely recorded derivatives, or None if not recorded.
+        """
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+
+        data_format = self._format_version
+
+        try:
+            data = self._payloads.pop(key)
+        except KeyError:
+            vals = None
+        else:
+            if key == 'jacobian':
+                if data_format >= 17 and is_sparse_derivatives(data):
+                    # tuple of the nonzero values and their sparsity
+                    vals = deserialize_sparse_derivatives(data, self._layouts)
+                elif data_format >= 2:
+                    vals = blob_to_array(data)
+                    if type(vals) is np.ndarray and not vals.shape:
+                        vals = None
+                else:
+                    vals = data
+            elif data_format >= 3:
+                vals = deserialize(data, self._abs2meta, self._prom2abs, self._conns,
+                                   self._layouts)
+            elif data_format in (1, 2):
+                vals = blob_to_array(data)
+                if type(vals) is np.ndarray and not vals.shape:
+                    vals = None
+            else:
+                vals = data
+
+        self._decoded[key] = vals
+        return vals
+
+    def _get_output_val(self, name):
+        """
+        Get the value of an output by absolute or unique promoted name, if recorded.
+
+        This avoids building the map of all of the outputs.
+
+        Parameters
+        ----------
+        name : str
+            Absolute or promoted output name.
+
+        Returns
+        -------
+        float or ndarray or any python object
+            The recorded value, or _NOT_DECODED if it can't be found this way.
+        """
+        vals = self._get_decoded('outputs')
+        if vals is None:
+            return _NOT_DECODED
+
+        is_array = isinstance(vals, np.ndarray)
+        keys = vals.dtype.fields if is_array else vals
+
+        if name not in keys:
+            abs2prom = self._abs2prom['output']
+            in_prom2abs = self._prom2abs['input']
+            if name in abs2prom:
+                # absolute name, recorded by promoted name
+                name = abs2prom[name]
+            elif name in in_prom2abs:
+                # promoted input name of an auto_ivc output
+                src = self._conns.get(in_prom2abs[name][0])
+                if src is None or self._auto_ivc_map.get(src) != name:
+                    return _NOT_DECODED
+                name = src
+            else:
+                abs_names = self._prom2abs['output'].get(name)
+                if abs_names is None or len(abs_names) != 1 or \
+                        abs_names[0] in self._auto_ivc_map:
+                    return _NOT_DECODED
+                name = abs_names[0]
+            if name not in keys:
+                return _NOT_DECODED
+
+        return vals[0][name] if is_array else vals[name]
+
+    @property
+    def inputs(self):
+        """
+        Get the map of inputs to values recorded.
+
+        Returns
+        -------
+        PromAbsDict or None
+            Map of inputs to values recorded, None if not recorded.
+        """
+        if self._inputs is _NOT_DECODED:
+            vals = self._get_decoded('inputs')
+            if vals is None:
+                self._inputs = None
+            else:
+                self._inputs = PromAbsDict(vals, self._prom2abs['input'], self._abs2prom['input'])
+
+        return self._inputs
+
+    @property
+    def outputs(self):
+        """
+        Get the map of outputs to values recorded.
+
+        Returns
+        -------
+        PromAbsDict or None
+            Map of outputs to values recorded, None if not recorded.
+        """
+        if self._outputs is _NOT_DECODED:
+            self._outputs = self._get_output_dict('outputs')
+
+        return self._outputs
+
+    @property
+    def residuals(self):
+        """
+        Get the map of outputs to residuals recorded.
+
+        Returns
+        -------
+        PromAbsDict or None
+            Map of outputs to residuals recorded, None if not recorded.
+        """
+        if self._residuals is _NOT_DECODED:
+            self._residuals = self._get_output_dict('residuals')
+
+        return self._residuals
+
+    @property
+    def derivatives(self):
+        """
+        Get the map of (output, input) to derivatives recorded.
+
+        Returns
+        -------
+        PromAbsDict or None
+            Map of (output, input) to derivatives recorded, None if not recorded.
+        """
+        if self._derivatives is _NOT_DECODED:
+            self._derivatives = self._get_output_dict('jacobian', self._var_info)
+
+        return self._derivatives
+
+    def _get_output_dict(self, key, var_info=None):
+        """
+        Build the map of outputs to the values recorded under the given key.
+
+        Parameters
+        ----------
+        key : str
+            One of 'outputs', 'residuals' or 'jacobian'.
+        var_info : dict or None
+            Dictionary of variable metadata, needed for derivatives of constraint aliases.
+
+        Returns
+        -------
+        PromAbsDict or None
+            Map of outputs to values recorded, None if not recorded.
+        """
+        vals = self._get_decoded(key)
+        if vals is None:
+            return None
+
+        if isinstance(vals, tuple):
+            return DerivativesDict(*vals, self._prom2abs['output'], self._abs2prom['output'],
+                                   in_prom2abs=self._prom2abs['input'],
+                                   auto_ivc_map=self._auto_ivc_map, var_info=var_info)
+
+        return PromAbsDict(vals, self._prom2abs['output'], self._abs2prom['output'],
+                           in_prom2abs=self._prom2abs['input'],
+                           auto_ivc_map=self._auto_ivc_map, var_info=var_info)
+
     def __str__(self):
         """
         Get string representation of the case.
@@ -230,6 +405,11 @@ class Case(object):
         float or ndarray or any python object
             the requested output/input variable.
         """
+        if self._outputs is _NOT_DECODED:
+            val = self._get_output_val(name)
+            if val is not _NOT_DECODED:
+                return val
+
         if self.outputs is not None:
             try:
                 return self.outputs[name]
@@ -1490,3 +1670,155 @@ class PromAbsDict(dict):
                 yield (of, wrt)
             else:
                 yield key
+
+
+class DerivativesDict(PromAbsDict):
+    """
+    A PromAbsDict of derivatives that were recorded sparsely.
+
+    Only the nonzero values of the derivatives are kept, and each sub-jacobian is rebuilt as
+    a dense array when it is first accessed.
+
+    Parameters
+    ----------
+    nzvals : ndarray
+        The nonzero values of all of the sub-jacobians.
+    sparsity : dict
+        Dictionary mapping 'of!wrt' key to the (rows, cols, shape, start, stop) of each
+        sub-jacobian, where start and stop locate its nonzero values in nzvals.
+    prom2abs : dict
+        Dictionary mapping promoted names to absolute names.
+    abs2prom : dict
+        Dictionary mapping absolute names in the output vector to promoted names.
+    data_format : int
+        A version number specifying the OpenMDAO SQL case database version.
+    in_prom2abs : dict
+        Dictionary mapping promoted names in the input vector to absolute names.
+    auto_ivc_map : dict
+        Dictionary that maps all auto_ivc sources to either an absolute input name for single
+        connections or a promoted input name for multiple connections. This is for output
+        display.
+    var_info : dict
+        Dictionary of variable metadata. Needed when there are constraint aliases.
+
+    Attributes
+    ----------
+    _nzvals : ndarray
+        The nonzero values of all of the sub-jacobians.
+    _sparsity : dict
+        Dictionary mapping 'of!wrt' key to the (rows, cols, shape, start, stop) of each
+        sub-jacobian.
+    _sparse_keys : dict
+        Dictionary mapping absolute and promoted keys to the 'of!wrt' key in _sparsity.
+    """
+
+    def __init__(self, nzvals, sparsity, prom2abs, abs2prom, data_format=current_version,
+                 in_prom2abs=None, auto_ivc_map=None, var_info=None):
+        """
+        Initialize.
+        """
+        self._nzvals = nzvals
+        self._sparsity = sparsity
+
+        super().__init__(dict.fromkeys(sparsity, _NOT_DECODED), prom2abs, abs2prom,
+                         data_format, in_prom2abs, auto_ivc_map, var_info)
+
+        self._sparse_keys = {}
+        for key in sparsity:
+            abs_keys, prom_key = self._deriv_keys(key)
+            for abs_key in abs_keys:
+                self._sparse_keys[abs_key] = key
+            self._sparse_keys[prom_key] = key
+
+    def _rebuild(self, key):
+        """
+        Rebuild the dense sub-jacobian for the given key from its nonzero values.
+
+        Parameters
+        ----------
+        key : str or tuple
+            Absolute or promoted derivative key, as either (of, wrt) or 'of!wrt'.
+
+        Returns
+        -------
+        ndarray
+            The sub-jacobian.
+        """
+        if key in self._sparse_keys:
+            key = self._sparse_keys[key]
+        else:
+            key = self._sparse_keys[self._deriv_keys(key)[1]]
+
+        rows, cols, shape, start, stop = self._sparsity[key]
+        val = np.zeros(shape)
+        val[rows, cols] = self._nzvals[start:stop]
+
+        abs_keys, prom_key = self._deriv_keys(key)
+        for abs_key in abs_keys:
+            self._values[abs_key] = val
+        dict.__setitem__(self, prom_key, val)
+
+        return val
+
+    def _rebuild_all(self):
+        """
+        Rebuild all of the sub-jacobians that have not been accessed yet.
+        """
+        for key in self._sparsity:
+            if dict.__getitem__(self, self._deriv_keys(key)[1]) is _NOT_DECODED:
+                self._rebuild(key)
+
+    def __getitem__(self, key):
+        """
+        Use the derivative key to get the corresponding sub-jacobian.
+
+        Parameters
+        ----------
+        key : str or tuple
+            Absolute or promoted derivative key, as either (of, wrt) or 'of!wrt'.
+
+        Returns
+        -------
+        ndarray
+            The sub-jacobian.
+        """
+        val = super().__getitem__(key)
+        if val is _NOT_DECODED:
+            val = self._rebuild(key)
+        return val
+
+    def items(self):
+        """
+        Get the promoted derivative keys and sub-jacobians.
+
+        Returns
+        -------
+        dict_items
+            The promoted (of, wrt) keys and sub-jacobians.
+        """
+        self._rebuild_all()
+        return super().items()
+
+    def values(self):
+        """
+        Get the sub-jacobians.
+
+        Returns
+        -------
+        dict_values
+            The sub-jacobians.
+        """
+        self._rebuild_all()
+        return super().values()
+
+    def __repr__(self):
+        """
+        Get string representation of the derivatives.
+
+        Returns
+        -------
+        str
+            String representation of the derivatives.
+        """
+        self._rebuild_all()
+        return super().__repr__()
@@ -2,6 +2,8 @@
 CaseReader factory function.
 """
 from openmdao.recorders.sqlite_reader import SqliteCaseReader
+from openmdao.recorders.sqlite_multi_reader import SqliteMultiCaseReader
+from openmdao.utils.record_util import get_recording_files
 
 
 def CaseReader(filename, pre_load=True, metadata_filename=None):
@@ -10,9 +12,11 @@ def CaseReader(filename, pre_load=True, metadata_filename=None):
 
     Parameters
     ----------
-    filename : str or Path
+    filename : str or Path or list
         A path to the recorded file.
         Currently only sqlite database files recorded via SqliteRecorder are supported.
+        A glob pattern or a list of paths, such as the per-rank files written when recording
+        on multiple processors, may also be given. The files will be read as one.
     pre_load : bool
         If True, load all the data into memory during initialization.
     metadata_filename : str
@@ -23,4 +27,10 @@ def CaseReader(filename, pre_load=True, metadata_filename=None):
     BaseCaseReader
         An instance of a CaseReader.
     """
-    return SqliteCaseReader(filename, pre_load, metadata_filename)
+    filenames = get_recording_files(filename)
+
+    if len(filenames) <= 1:
+        return SqliteCaseReader(filenames[0] if filenames else filename, pre_load,
+                                metadata_filename)
+
+    return SqliteMultiCaseReader(filenames, pre_load, metadata_filename)
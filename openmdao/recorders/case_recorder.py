@@ -45,6 +45,12 @@ class CaseRecorder(object):
         Flag indicating if this recorder will record on the current process (None if unspecified).
     _recording_ranks : list
         List of ranks on which this recorder will record if running under MPI.
+    _payload_encoding : hashable or None
+        Description of how this recorder serializes case data. Recorders with the same
+        encoding share the data serialized for each case, None opts out of sharing.
+    _payload : CasePayload or None
+        The data for the case being recorded, shared with the other recorders of the
+        recording requester, if this recorder shares serialized data.
     """
 
     def __init__(self, record_viewer_data=True):
@@ -88,6 +94,10 @@ class CaseRecorder(object):
         # Only used when running under MPI with communicator size greater than one.
         self._recording_ranks = None
 
+        # recorders that can share serialized case data with other recorders must override
+        self._payload_encoding = None
+        self._payload = None
+
     @property
     def record_on_process(self):
         """
@@ -223,7 +233,8 @@ class CaseRecorder(object):
         metadata : dict, optional
             Dictionary containing execution metadata.
         **kwargs : keyword args
-            Some implementations of record_iteration need additional args.
+            Some implementations of record_iteration need additional args. The RecordingManager
+            passes the shared CasePayload as 'payload' to recorders with a payload encoding.
         """
         if not self._parallel or self._record_on_proc is True:
             self._counter += 1
@@ -231,16 +242,21 @@ class CaseRecorder(object):
             self._iteration_coordinate = \
                 recording_requester._recording_iter.get_formatted_iteration_coordinate()
 
-            if isinstance(recording_requester, Driver):
-                self.record_iteration_driver(recording_requester, data, metadata)
-            elif isinstance(recording_requester, System):
-                self.record_iteration_system(recording_requester, data, metadata)
-            elif isinstance(recording_requester, Solver):
-                self.record_iteration_solver(recording_requester, data, metadata)
-            elif isinstance(recording_requester, Problem):
-                self.record_iteration_problem(recording_requester, data, metadata)
-            else:
-                raise ValueError("Recorders must be attached to Drivers, Systems, or Solvers.")
+            self._payload = kwargs.get('payload')
+            try:
+                if isinstance(recording_requester, Driver):
+                    self.record_iteration_driver(recording_requester, data, metadata)
+                elif isinstance(recording_requester, System):
+                    self.record_iteration_system(recording_requester, data, metadata)
+                elif isinstance(recording_requester, Solver):
+                    self.record_iteration_solver(recording_requester, data, metadata)
+                elif isinstance(recording_requester, Problem):
+                    self.record_iteration_problem(recording_requester, data, metadata)
+                else:
+                    raise ValueError("Recorders must be attached to Drivers, Systems, or "
+                                     "Solvers.")
+            finally:
+                self._payload = None
 
     def record_iteration_driver(self, recording_requester, data, metadata):
         """
@@ -302,6 +318,19 @@ class CaseRecorder(object):
         """
         raise NotImplementedError("record_iteration_problem has not been overridden")
 
+    def record_failure(self, recording_requester, msg):
+        """
+        Handle a failure reported by a recording requester.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The object that reported the failure.
+        msg : str
+            Message describing the failure.
+        """
+        pass
+
     def record_derivatives(self, recording_requester, data, metadata, **kwargs):
         """
         Route the record_derivatives call to the proper method.
@@ -1,6 +1,9 @@
 """Management of iteration stack for recording."""
+import threading
 import weakref
 
+from openmdao.core.analysis_error import AnalysisError
+
 _norec_funcs = frozenset(['_run_apply', '_compute_totals'])
 
 
@@ -11,6 +14,9 @@ class _RecIteration(object):
     Some tests needed to reset the stack and this avoids issues
     with data left over from other tests.
 
+    The stack is local to each thread, so subsystems that are run concurrently each keep their
+    own iteration coordinates.
+
     Attributes
     ----------
     stack : list
@@ -19,6 +25,8 @@ class _RecIteration(object):
         Prefix to prepend to iteration coordinates.
     rank : int
         The MPI rank to use when constructing iteration coordinates.
+    _local : threading.local
+        Stack, prefix, rank and norec refcount of each thread that has used them.
     """
 
     def __init__(self, rank=0):
@@ -30,10 +38,116 @@ class _RecIteration(object):
         rank : int
             The rank to use when constructing iteration coordinates.
         """
-        self.stack = []
-        self.prefix = None
-        self.rank = 0
-        self._norec_refcount = 0
+        self._local = threading.local()
+
+    def __getstate__(self):
+        """
+        Return the state of this object for pickling.
+
+        Thread local values can't be pickled, so only those of the calling thread are kept.
+
+        Returns
+        -------
+        tuple
+            Cache of the stack, prefix and rank of the calling thread.
+        """
+        return self.save_cache()
+
+    def __setstate__(self, state):
+        """
+        Restore the state of this object after unpickling.
+
+        Parameters
+        ----------
+        state : tuple
+            Cache of the stack, prefix and rank of the thread that pickled this object.
+        """
+        self._local = threading.local()
+        self.restore_cache(state)
+
+    @property
+    def stack(self):
+        """
+        Return the iteration stack of the calling thread.
+
+        Returns
+        -------
+        list
+            A list that holds the stack of iteration coordinates.
+        """
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = stack = []
+            return stack
+
+    @stack.setter
+    def stack(self, stack):
+        """
+        Set the iteration stack of the calling thread.
+
+        Parameters
+        ----------
+        stack : list
+            A list that holds the stack of iteration coordinates.
+        """
+        self._local.stack = stack
+
+    @property
+    def prefix(self):
+        """
+        Return the prefix of the iteration coordinates of the calling thread.
+
+        Returns
+        -------
+        str or None
+            Prefix to prepend to iteration coordinates.
+        """
+        return getattr(self._local, 'prefix', None)
+
+    @prefix.setter
+    def prefix(self, prefix):
+        """
+        Set the prefix of the iteration coordinates of the calling thread.
+
+        Parameters
+        ----------
+        prefix : str or None
+            Prefix to prepend to iteration coordinates.
+        """
+        self._local.prefix = prefix
+
+    @property
+    def rank(self):
+        """
+        Return the rank used in the iteration coordinates of the calling thread.
+
+        Returns
+        -------
+        int
+            The MPI rank to use when constructing iteration coordinates.
+        """
+        return getattr(self._local, 'rank', 0)
+
+    @rank.setter
+    def rank(self, rank):
+        """
+        Set the rank used in the iteration coordinates of the calling thread.
+
+        Parameters
+        ----------
+        rank : int
+            The MPI rank to use when constructing iteration coordinates.
+        """
+        self._local.rank = rank
+
+    @property
+    def _norec_refcount(self):
+        return getattr(self._local, 'norec_refcount', 0)
+
+    @_norec_refcount.setter
+    def _norec_refcount(self, count):
+        self._local.norec_refcount = count
 
     def print_recording_iteration_stack(self):
         """
@@ -74,6 +188,29 @@ class _RecIteration(object):
 
         return prefix + separator.join(coord_list)
 
+    def save_cache(self):
+        """
+        Save the state of the stack so that it can be restored later, possibly in another thread.
+
+        Returns
+        -------
+        tuple
+            Cache of the current stack, prefix and rank.
+        """
+        return (list(self.stack), self.prefix, self.rank, self._norec_refcount)
+
+    def restore_cache(self, cache):
+        """
+        Restore a previously saved state of the stack.
+
+        Parameters
+        ----------
+        cache : tuple
+            Cache of the stack, prefix and rank.
+        """
+        stack, self.prefix, self.rank, self._norec_refcount = cache
+        self.stack = list(stack)
+
     def push(self, iter_coord):
         """
         Push the current iteration coordinate onto the stack.
@@ -166,7 +303,7 @@ class Recording(object):
         Parameters
         ----------
         *args : array
-            Solver recording requires extra args.
+            The type, value and traceback of the exception raised in the block, if any.
         """
         requester = self.recording_requester()
         if requester._recording_iter._norec_refcount == 0:
@@ -175,6 +312,10 @@ class Recording(object):
             else:
                 requester.record_iteration()
 
+            # let recorders that keep recent iterations in memory write them out
+            if args and isinstance(args[1], AnalysisError) and requester._rec_mgr._recorders:
+                requester._rec_mgr.record_failure(requester, str(args[1]))
+
         # Enable the following line for stack debugging.
         # print_recording_iteration_stack()
 
@@ -1,11 +1,73 @@
 """
 RecordingManager class definition.
 """
+import sys
 import time
 
+from openmdao.core.constants import _DEFAULT_OUT_STREAM
 from openmdao.utils.om_warnings import issue_warning
 
 
+class CasePayload(object):
+    """
+    The data for a single case, shared by all of the recorders of a recording requester.
+
+    Each serialized form of the data is computed by the first recorder that needs it and
+    reused by the other recorders with the same encoding.
+
+    Parameters
+    ----------
+    data : dict
+        Dictionary containing the data for the case.
+
+    Attributes
+    ----------
+    data : dict
+        Dictionary containing the data for the case.
+    hits : int
+        The number of times serialized data was reused.
+    _serialized : dict
+        Dictionary mapping (encoding, key) to the serialized data.
+    """
+
+    __slots__ = ['data', 'hits', '_serialized']
+
+    def __init__(self, data):
+        """
+        Initialize.
+        """
+        self.data = data
+        self.hits = 0
+        self._serialized = {}
+
+    def get_serialized(self, encoding, key, serialize):
+        """
+        Get an entry of the data serialized with the given encoding, serializing it if needed.
+
+        Parameters
+        ----------
+        encoding : hashable
+            Description of the encoding.
+        key : hashable
+            The serialized entry of the data, e.g. 'input', 'output' or 'residual'.
+        serialize : function
+            Function of no arguments that serializes the entry with the given encoding. The
+            result must not be modified by any recorder.
+
+        Returns
+        -------
+        object
+            The serialized data.
+        """
+        try:
+            val = self._serialized[encoding, key]
+        except KeyError:
+            val = self._serialized[encoding, key] = serialize()
+        else:
+            self.hits += 1
+        return val
+
+
 class RecordingManager(object):
     """
     Object that routes function calls to all attached recorders.
@@ -14,6 +76,11 @@ class RecordingManager(object):
     ----------
     _recorders : list of CaseRecorder
         All of the recorders attached to the current object.
+    _times : dict
+        Dictionary mapping each recorder to the number of cases it has recorded and the total
+        time it has taken to record them.
+    _shared : int
+        The number of times data serialized by one recorder was reused by another.
     """
 
     def __init__(self):
@@ -21,6 +88,8 @@ class RecordingManager(object):
         init.
         """
         self._recorders = []
+        self._times = {}
+        self._shared = 0
 
     def __getitem__(self, index):
         """
@@ -101,8 +170,21 @@ class RecordingManager(object):
         if metadata is not None:
             metadata['timestamp'] = time.perf_counter()
 
+        # only worth sharing serialized data between several recorders
+        payload = CasePayload(data) if len(self._recorders) > 1 else None
+
         for recorder in self._recorders:
-            recorder.record_iteration(recording_requester, data, metadata)
+            start = time.perf_counter()
+
+            if payload is not None and recorder._payload_encoding is not None:
+                recorder.record_iteration(recording_requester, data, metadata, payload=payload)
+            else:
+                recorder.record_iteration(recording_requester, data, metadata)
+
+            self._add_time(recorder, time.perf_counter() - start)
+
+        if payload is not None:
+            self._shared += payload.hits
 
     def record_derivatives(self, recording_requester, data, metadata):
         """
@@ -124,7 +206,73 @@ class RecordingManager(object):
             metadata['timestamp'] = time.perf_counter()
 
         for recorder in self._recorders:
+            start = time.perf_counter()
             recorder.record_derivatives(recording_requester, data, metadata)
+            self._add_time(recorder, time.perf_counter() - start)
+
+    def record_failure(self, recording_requester, msg):
+        """
+        Call record_failure on all recorders.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The object that reported the failure.
+        msg : str
+            Message describing the failure.
+        """
+        for recorder in self._recorders:
+            recorder.record_failure(recording_requester, msg)
+
+    def _add_time(self, recorder, elapsed):
+        """
+        Add to the count of cases recorded by a recorder and the time taken to record them.
+
+        Parameters
+        ----------
+        recorder : CaseRecorder
+            The recorder.
+        elapsed : float
+            The time taken to record the case.
+        """
+        try:
+            times = self._times[recorder]
+        except KeyError:
+            times = self._times[recorder] = [0, 0.]
+        times[0] += 1
+        times[1] += elapsed
+
+    def report_times(self, out_stream=_DEFAULT_OUT_STREAM):
+        """
+        Report the number of cases recorded by each recorder and the time taken.
+
+        Parameters
+        ----------
+        out_stream : file-like object
+            Where to send human readable output. Default is sys.stdout.
+            Set to None to suppress.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping each recorder to the number of cases it has recorded and the
+            total time in seconds it has taken to record them.
+        """
+        times = {recorder: tuple(times) for recorder, times in self._times.items()}
+
+        if out_stream is _DEFAULT_OUT_STREAM:
+            out_stream = sys.stdout
+
+        if out_stream is not None:
+            for recorder, (count, elapsed) in times.items():
+                name = getattr(recorder, '_filepath', type(recorder).__name__)
+                per_case = elapsed / count * 1e6 if count else 0.
+                out_stream.write(f"{name}: {count} cases in {elapsed:.4f} s "
+                                 f"({per_case:.1f} us per case)\n")
+            if self._shared:
+                out_stream.write(f"Serialized data reused {self._shared} times.\n")
+
+        return times
 
     def has_recorders(self):
         """
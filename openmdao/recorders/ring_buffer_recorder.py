@@ -0,0 +1,395 @@
+"""
+Class definition for RingBufferRecorder, which keeps recent iterations in memory.
+"""
+import numpy as np
+
+from openmdao.recorders.sqlite_recorder import SqliteRecorder
+from openmdao.solvers.solver import Solver
+
+
+# the kinds of recorded data, in the order they are laid out in a row
+_KINDS = ('output', 'input', 'residual')
+
+
+class _RingBuffer(object):
+    """
+    Preallocated storage for the most recent iterations of a single recording requester.
+
+    Parameters
+    ----------
+    requester : System or Solver
+        The object whose iterations are stored.
+    data : dict
+        Dictionary containing the inputs, outputs, and residuals of the first iteration, which
+        fixes the layout of every stored iteration.
+    capacity : int
+        The maximum number of iterations stored. Older iterations are overwritten.
+
+    Attributes
+    ----------
+    requester : System or Solver
+        The object whose iterations are stored.
+    capacity : int
+        The maximum number of iterations stored.
+    count : int
+        The number of iterations stored.
+    keys : list of tuple
+        The kind, name, shape and slice of the row of each stored variable.
+    _next : int
+        Index of the row for the next iteration.
+    _values : ndarray
+        The flattened values of the variables, one row per iteration.
+    _counters : ndarray
+        The recording counter of each iteration.
+    _timestamps : ndarray
+        The timestamp of each iteration.
+    _success : ndarray
+        The success flag of each iteration.
+    _abs : ndarray
+        The absolute error of each iteration, NaN if not recorded.
+    _rel : ndarray
+        The relative error of each iteration, NaN if not recorded.
+    _coords : list of str
+        The iteration coordinate of each iteration.
+    _msgs : list of str
+        The message of each iteration.
+    """
+
+    def __init__(self, requester, data, capacity):
+        """
+        Initialize.
+        """
+        self.requester = requester
+        self.capacity = capacity
+        self.count = 0
+        self.keys = []
+        self._next = 0
+
+        start = 0
+        for kind in _KINDS:
+            vals = data.get(kind)
+            if not vals:
+                continue
+            for name, val in vals.items():
+                try:
+                    shape = np.shape(np.asarray(val, dtype=float))
+                except (TypeError, ValueError):
+                    raise TypeError(f"RingBufferRecorder can only record numeric variables, but "
+                                    f"{kind} '{name}' of {requester.msginfo} has value {val!r}.")
+                stop = start + int(np.prod(shape))
+                self.keys.append((kind, name, shape, slice(start, stop)))
+                start = stop
+
+        self._values = np.empty((capacity, start))
+        self._counters = np.zeros(capacity, dtype=np.int64)
+        self._timestamps = np.zeros(capacity)
+        self._success = np.zeros(capacity, dtype=np.int8)
+        self._abs = np.full(capacity, np.nan)
+        self._rel = np.full(capacity, np.nan)
+        self._coords = [None] * capacity
+        self._msgs = [''] * capacity
+
+    def append(self, counter, coord, data, metadata):
+        """
+        Store an iteration, overwriting the oldest one if the buffer is full.
+
+        Parameters
+        ----------
+        counter : int
+            The recording counter of the iteration.
+        coord : str
+            The iteration coordinate of the iteration.
+        data : dict
+            Dictionary containing the inputs, outputs, and residuals of the iteration.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        i = self._next
+        keys = self.keys
+
+        try:
+            if sum(len(data[kind]) if data.get(kind) else 0 for kind in _KINDS) != len(keys):
+                raise KeyError()
+            if keys:
+                np.concatenate([np.ravel(data[kind][name]) for kind, name, _, _ in keys],
+                               out=self._values[i])
+        except (KeyError, ValueError):
+            raise RuntimeError(f"The variables recorded from {self.requester.msginfo} have "
+                               "changed since its first iteration. RingBufferRecorder requires "
+                               "a fixed set of variables for each recording requester.")
+
+        self._counters[i] = counter
+        self._timestamps[i] = metadata['timestamp']
+        self._success[i] = metadata['success']
+        abs_err = data.get('abs')
+        self._abs[i] = np.nan if abs_err is None else abs_err
+        rel_err = data.get('rel')
+        self._rel[i] = np.nan if rel_err is None else rel_err
+        self._coords[i] = coord
+        self._msgs[i] = metadata['msg']
+
+        self._next = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def mark_failure(self, msg):
+        """
+        Mark the most recent iteration as a failure.
+
+        Parameters
+        ----------
+        msg : str
+            Message describing the failure.
+        """
+        if self.count:
+            i = (self._next - 1) % self.capacity
+            self._success[i] = 0
+            self._msgs[i] = msg
+
+    def indices(self):
+        """
+        Return the rows of the stored iterations, from oldest to newest.
+
+        Returns
+        -------
+        list of int
+            The row indices.
+        """
+        return [(self._next - self.count + j) % self.capacity for j in range(self.count)]
+
+    def counter(self, i):
+        """
+        Return the recording counter of a stored iteration.
+
+        Parameters
+        ----------
+        i : int
+            The row of the iteration.
+
+        Returns
+        -------
+        int
+            The recording counter.
+        """
+        return int(self._counters[i])
+
+    def get_case(self, i):
+        """
+        Return the data and metadata of a stored iteration, as given to the recorder.
+
+        Parameters
+        ----------
+        i : int
+            The row of the iteration.
+
+        Returns
+        -------
+        str
+            The iteration coordinate.
+        dict
+            Dictionary containing the inputs, outputs, residuals and errors of the iteration.
+        dict
+            Dictionary containing execution metadata.
+        """
+        row = self._values[i]
+        data = {kind: {} for kind in _KINDS}
+        for kind, name, shape, slc in self.keys:
+            data[kind][name] = row[slc].reshape(shape)
+
+        abs_err = self._abs[i]
+        data['abs'] = None if np.isnan(abs_err) else float(abs_err)
+        rel_err = self._rel[i]
+        data['rel'] = None if np.isnan(rel_err) else float(rel_err)
+
+        metadata = {
+            'timestamp': float(self._timestamps[i]),
+            'success': int(self._success[i]),
+            'msg': self._msgs[i],
+        }
+
+        return self._coords[i], data, metadata
+
+    def clear(self):
+        """
+        Discard all stored iterations.
+        """
+        self.count = 0
+        self._next = 0
+
+
+class RingBufferRecorder(SqliteRecorder):
+    """
+    Recorder that keeps the most recent system and solver iterations in memory.
+
+    The last `capacity` iterations of each recorded system and solver are kept in preallocated
+    arrays, and are only written to the sqlite database when a failure is reported or when
+    flush is called, so recording has very little overhead until something goes wrong. Failures
+    are reported by any solver of the recorded system, of its subsystems or of its parents, and
+    by any recorded system or solver that an AnalysisError is raised from. After a failure, the
+    iterations kept at shutdown are also written, e.g. the end of the iterations of the parents
+    of a failed solver.
+    The database is the same as one written by SqliteRecorder and can be read by CaseReader.
+    Driver and Problem cases are written to the database as they are recorded.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the recorder file.
+    capacity : int, optional
+        The number of most recent iterations kept for each recorded system and solver.
+    flush_on_failure : bool, optional
+        If True, write out the kept iterations as soon as a failure is reported. Otherwise they
+        are written by flush, or at shutdown.
+    **kwargs : dict
+        Keyword arguments for SqliteRecorder.
+
+    Attributes
+    ----------
+    _capacity : int
+        The number of most recent iterations kept for each recorded system and solver.
+    _flush_on_failure : bool
+        If True, write out the kept iterations as soon as a failure is reported.
+    _buffers : dict
+        Dictionary mapping each recorded system and solver to its _RingBuffer.
+    _failed : bool
+        True if a failure has been reported.
+    """
+
+    def __init__(self, filepath, capacity=100, flush_on_failure=True, **kwargs):
+        """
+        Initialize the RingBufferRecorder.
+        """
+        if capacity < 1:
+            raise ValueError(f"RingBufferRecorder: capacity must be at least 1, but {capacity} "
+                             "was given.")
+
+        self._capacity = capacity
+        self._flush_on_failure = flush_on_failure
+        self._buffers = {}
+        self._failed = False
+
+        super().__init__(filepath, **kwargs)
+
+        # kept iterations are serialized when flushed, so there is nothing to share
+        self._payload_encoding = None
+
+    def _keep(self, recording_requester, data, metadata):
+        """
+        Keep an iteration in the ring buffer of its recording requester.
+
+        Parameters
+        ----------
+        recording_requester : System or Solver
+            The object whose iteration is kept.
+        data : dict
+            Dictionary containing inputs, outputs, residuals and errors.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if not self._database_initialized:
+            raise RuntimeError(f"{recording_requester.msginfo} attempted to record iteration to "
+                               f"'{self._filepath}', but database is not initialized;"
+                               " `run_model()`, `run_driver()`, or `final_setup()` "
+                               "must be called after adding a recorder.")
+
+        if self.connection:
+            try:
+                buf = self._buffers[recording_requester]
+            except KeyError:
+                buf = self._buffers[recording_requester] = \
+                    _RingBuffer(recording_requester, data, self._capacity)
+
+            buf.append(self._counter, self._iteration_coordinate, data, metadata)
+
+    def record_iteration_system(self, system, data, metadata):
+        """
+        Keep data and metadata from a System.
+
+        Parameters
+        ----------
+        system : System
+            System in need of recording.
+        data : dict
+            Dictionary containing inputs, outputs, and residuals.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._keep(system, data, metadata)
+
+    def record_iteration_solver(self, solver, data, metadata):
+        """
+        Keep data and metadata from a Solver.
+
+        Parameters
+        ----------
+        solver : Solver
+            Solver in need of recording.
+        data : dict
+            Dictionary containing outputs, residuals, and errors.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._keep(solver, data, metadata)
+
+    def record_failure(self, recording_requester, msg):
+        """
+        Mark the last iteration of the failed requester, and write out the kept iterations.
+
+        Parameters
+        ----------
+        recording_requester : object
+            The object that reported the failure.
+        msg : str
+            Message describing the failure.
+        """
+        buf = self._buffers.get(recording_requester)
+        if buf is not None:
+            buf.mark_failure(msg)
+
+        self._failed = True
+        if self._flush_on_failure:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the kept iterations of all systems and solvers to the database, oldest first.
+
+        The kept iterations are discarded once written.
+
+        Returns
+        -------
+        int
+            The number of iterations written.
+        """
+        cases = sorted(((buf.counter(i), buf, i)
+                        for buf in self._buffers.values() for i in buf.indices()),
+                       key=lambda case: case[0])
+        if not cases:
+            return 0
+
+        counter, coord = self._counter, self._iteration_coordinate
+        try:
+            for self._counter, buf, i in cases:
+                self._iteration_coordinate, data, metadata = buf.get_case(i)
+                if isinstance(buf.requester, Solver):
+                    super().record_iteration_solver(buf.requester, data, metadata)
+                else:
+                    super().record_iteration_system(buf.requester, data, metadata)
+        finally:
+            self._counter, self._iteration_coordinate = counter, coord
+
+        for buf in self._buffers.values():
+            buf.clear()
+
+        return len(cases)
+
+    def shutdown(self):
+        """
+        Shut down the recorder, writing out the kept iterations if a failure was reported.
+
+        Otherwise, the kept iterations are discarded.
+        """
+        if self._failed and self.connection:
+            self.flush()
+        self._buffers = {}
+        super().shutdown()
@@ -0,0 +1,286 @@
+"""
+Merge case recording files created with SqliteRecorder into a single file.
+"""
+import os
+import re
+import sqlite3
+
+import numpy as np
+
+from openmdao.utils.record_util import check_valid_sqlite3_db, get_recording_files, \
+    compress_data, decompress_data
+from openmdao.utils.om_warnings import issue_warning
+
+
+# tables holding the metadata common to all of the files
+_META_TABLES = ('metadata', 'driver_metadata', 'system_metadata', 'solver_metadata')
+
+# map of record type in the global_iterations table to case table
+_CASE_TABLES = {
+    'driver': 'driver_iterations',
+    'system': 'system_iterations',
+    'solver': 'solver_iterations',
+    'problem': 'problem_cases',
+}
+
+# columns that may contain binary iteration data or sparse derivatives
+_DATA_COLUMNS = ('inputs', 'outputs', 'residuals',
+                 'solver_inputs', 'solver_output', 'solver_residuals', 'derivatives')
+
+
+def _get_tables(cur, schema='main'):
+    """
+    Get the names and creation SQL of the tables and indices in a database.
+
+    Parameters
+    ----------
+    cur : sqlite3.Cursor
+        Cursor for the database.
+    schema : str
+        The name of the database schema.
+
+    Returns
+    -------
+    list of (str, str, str, str)
+        The type, name, table name and creation SQL of each table and index.
+    """
+    cur.execute(f"SELECT type, name, tbl_name, sql FROM {schema}.sqlite_master "  # nosec: trusted
+                "WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' ORDER BY type DESC")
+    return cur.fetchall()
+
+
+def _get_metadata_filename(filename, cur):
+    """
+    Get the name of the file containing the metadata for a case recording file.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the case recording file.
+    cur : sqlite3.Cursor
+        Cursor for the case recording file.
+
+    Returns
+    -------
+    str
+        The path to the file containing the metadata.
+    """
+    cur.execute("SELECT count(name) FROM sqlite_master WHERE type='table' AND name='metadata'")
+    if cur.fetchone()[0] > 0:
+        return filename
+
+    # same naming convention assumed by SqliteCaseReader for separate metadata
+    metadata_filename = re.sub(r'^(.*)_(\d+)', r'\1_meta', filename)
+    check_valid_sqlite3_db(metadata_filename)
+    return metadata_filename
+
+
+def sqlite_merge(filenames, out_filename, metadata_filename=None):
+    """
+    Merge case recording files created with SqliteRecorder into a single file.
+
+    This is intended for the per-rank files written when recording on multiple processors.
+    Cases are ordered by counter, with ties broken by the order of the files, and the
+    metadata is copied once. Case data is copied in bulk by SQLite and is not decoded,
+    except to renumber the layouts of binary iteration data if they differ between files.
+
+    Parameters
+    ----------
+    filenames : str or pathlib.Path or list
+        Filename(s) or glob pattern(s) of the recording files.
+    out_filename : str or pathlib.Path
+        The path to the merged file.
+    metadata_filename : str or None
+        The path to the file containing the recorded metadata, if separate.
+
+    Returns
+    -------
+    int
+        The number of cases in the merged file.
+    """
+    filenames = get_recording_files(filenames)
+    out_filename = str(out_filename)
+
+    for filename in filenames:
+        check_valid_sqlite3_db(filename)
+
+    if out_filename in filenames:
+        raise ValueError(f"The merged file, {out_filename}, is also one of the files to merge.")
+
+    # build the merged index of the cases in all of the files
+    global_iters = []
+    deriv_entries = []
+    table_entries = {table: [] for table in _CASE_TABLES.values()}
+    layout_maps = []
+    layouts = {}
+
+    for i, filename in enumerate(filenames):
+        with sqlite3.connect(filename) as con:
+            cur = con.cursor()
+            tables = {name for _, name, _, _ in _get_tables(cur)}
+
+            if i == 0:
+                schema = [entry for entry in _get_tables(cur) if entry[2] not in _META_TABLES]
+                if metadata_filename is None:
+                    metadata_filename = _get_metadata_filename(filename, cur)
+
+            counters = {}
+            for record_type, table in _CASE_TABLES.items():
+                if table in tables:
+                    cur.execute(f"SELECT id, counter FROM {table}")  # nosec: trusted input
+                    counters[record_type] = dict(cur.fetchall())
+                    table_entries[table].extend((counter, i, row_id)
+                                                for row_id, counter in
+                                                counters[record_type].items())
+
+            cur.execute("SELECT record_type, rowid, source FROM global_iterations ORDER BY id")
+            for j, (record_type, row_id, source) in enumerate(cur.fetchall()):
+                global_iters.append((counters[record_type][row_id], i, j,
+                                     record_type, row_id, source))
+
+            if 'driver_derivatives' in tables:
+                cur.execute("SELECT id, counter FROM driver_derivatives")
+                deriv_entries.extend((counter, i, row_id) for row_id, counter in cur.fetchall())
+
+            layout_map = {}
+            if 'layouts' in tables:
+                cur.execute("SELECT id, layout FROM layouts")
+                for layout_id, layout in cur.fetchall():
+                    layout_map[layout_id] = layouts.setdefault(layout, len(layouts) + 1)
+            layout_maps.append(layout_map)
+
+        con.close()
+
+    # new row ids for the cases in each table, in (counter, file) order
+    id_maps = {}
+    table_entries['driver_derivatives'] = deriv_entries
+    for table, entries in table_entries.items():
+        entries.sort(key=lambda entry: entry[:2])
+        for new_id, (_, i, row_id) in enumerate(entries, 1):
+            id_maps.setdefault((i, table), []).append((row_id, new_id))
+
+    global_iters.sort(key=lambda entry: entry[:3])
+    new_row_ids = {key: dict(id_map) for key, id_map in id_maps.items()}
+
+    if os.path.exists(out_filename):
+        os.remove(out_filename)
+        issue_warning(f'The existing case recorder file, {out_filename}, is being overwritten.',
+                      category=UserWarning)
+
+    con = sqlite3.connect(out_filename)
+    cur = con.cursor()
+
+    # bulk load, the file is of no use if this fails part way through anyway
+    cur.execute("PRAGMA journal_mode=OFF")
+    cur.execute("PRAGMA synchronous=OFF")
+
+    # create the tables, then copy the metadata
+    for entry_type, _, _, sql in schema:
+        if entry_type == 'table':
+            cur.execute(sql)
+
+    cur.execute("ATTACH DATABASE ? AS src", (metadata_filename,))
+    for entry_type, name, _, sql in _get_tables(cur, 'src'):
+        if name in _META_TABLES and entry_type == 'table':
+            cur.execute(sql)
+            cur.execute(f"INSERT INTO main.{name} SELECT * FROM src.{name}")  # nosec: trusted
+    con.commit()
+    cur.execute("DETACH DATABASE src")
+
+    # copy the cases
+    cur.execute("CREATE TEMP TABLE id_map(old INTEGER PRIMARY KEY, new INTEGER)")
+
+    for i, filename in enumerate(filenames):
+        layout_map = layout_maps[i]
+
+        def relayout(data, layout_map=layout_map):
+            # renumber the layout in the header of binary data
+            if isinstance(data, bytes) and not data.startswith(b'\x93NUMPY'):
+                # binary data, but not dense derivatives in the .npy format
+                blob, compression = decompress_data(data)
+                if not isinstance(blob, bytes):
+                    # compressed JSON
+                    return data
+                layout_id = layout_map[int(np.frombuffer(blob, dtype=np.int64, count=1)[0])]
+                blob = np.int64(layout_id).tobytes() + blob[8:]
+                return blob if compression is None else compress_data(blob, compression)
+            return data
+
+        con.create_function('relayout', 1, relayout, deterministic=True)
+        renumber = any(old != new for old, new in layout_map.items())
+
+        cur.execute("ATTACH DATABASE ? AS src", (filename,))
+        src_tables = {name for _, name, _, _ in _get_tables(cur, 'src')}
+
+        for table in table_entries:
+            if table not in src_tables:
+                continue
+
+            cur.execute(f"PRAGMA src.table_info({table})")  # nosec: trusted input
+            columns = [row[1] for row in cur.fetchall() if row[1] != 'id']
+            select = [f'relayout(t.{col})' if renumber and col in _DATA_COLUMNS else f't.{col}'
+                      for col in columns]
+
+            cur.execute("DELETE FROM temp.id_map")
+            cur.executemany("INSERT INTO temp.id_map VALUES(?, ?)", id_maps.get((i, table), []))
+            cur.execute(f"INSERT INTO main.{table}(id, {', '.join(columns)}) "  # nosec: trusted
+                        f"SELECT m.new, {', '.join(select)} FROM src.{table} AS t "
+                        "JOIN temp.id_map AS m ON t.id = m.old")
+
+        con.commit()
+        cur.execute("DETACH DATABASE src")
+
+    cur.executemany("INSERT INTO global_iterations(id, record_type, rowid, source) "
+                    "VALUES(?, ?, ?, ?)",
+                    [(new_id, record_type,
+                      new_row_ids[i, _CASE_TABLES[record_type]][row_id], source)
+                     for new_id, (_, i, _, record_type, row_id, source)
+                     in enumerate(global_iters, 1)])
+
+    if 'layouts' in {name for _, name, _, _ in schema}:
+        cur.executemany("INSERT INTO layouts(id, layout) VALUES(?, ?)",
+                        [(layout_id, layout) for layout, layout_id in layouts.items()])
+
+    # create the indices after the data is loaded
+    for entry_type, _, _, sql in schema:
+        if entry_type == 'index':
+            cur.execute(sql)
+
+    con.commit()
+    con.close()
+
+    return len(global_iters)
+
+
+def _sqlite_merge_setup_parser(parser):
+    """
+    Set up the openmdao subparser for the 'openmdao sqlite_merge' command.
+
+    Parameters
+    ----------
+    parser : argparse subparser
+        The parser we're adding options to.
+    """
+    parser.add_argument('files', nargs='+',
+                        help='Case recording files, or glob patterns, to be merged. Surround a '
+                        'glob pattern with quotation marks to prevent the OS from interpreting it.')
+    parser.add_argument('-o', '--outfile', action='store', dest='outfile', required=True,
+                        help='Name of the merged file.')
+    parser.add_argument('-m', '--metadata', action='store', dest='metadata', default=None,
+                        help='Name of the file containing the recorded metadata, if separate.')
+
+
+def _sqlite_merge_cmd(options, user_args):
+    """
+    Merge case recording files for 'openmdao sqlite_merge'.
+
+    Parameters
+    ----------
+    options : argparse Namespace
+        Command line options.
+    user_args : list of str
+        Args to be passed to the user script.
+    """
+    filenames = get_recording_files(options.files)
+    count = sqlite_merge(filenames, options.outfile, options.metadata)
+    print(f"Merged {count} cases from {len(filenames)} files into {options.outfile}.")
@@ -0,0 +1,398 @@
+"""
+Definition of the SqliteMultiCaseReader.
+"""
+import sys
+from collections import OrderedDict
+from io import TextIOBase
+
+import numpy as np
+
+from openmdao.recorders.base_case_reader import BaseCaseReader
+from openmdao.recorders.sqlite_reader import SqliteCaseReader
+from openmdao.core.constants import _DEFAULT_OUT_STREAM
+from openmdao.utils.variable_table import write_source_table
+
+
+class SqliteMultiCaseReader(BaseCaseReader):
+    """
+    A CaseReader that presents several files created with SqliteRecorder as one.
+
+    This is intended for the per-rank files written when recording on multiple processors.
+    No data is copied, a merged index of the cases in all of the files is built when the
+    reader is created and each request is passed on to the reader for the file containing
+    the case. Cases are ordered by counter, with ties broken by the order of the files.
+
+    Parameters
+    ----------
+    filenames : list of str or pathlib.Path
+        The paths to the files containing the recorded data.
+    pre_load : bool
+        If True, load all the data into memory during initialization.
+    metadata_filename : str
+        The path to the filename containing the recorded metadata, if separate.
+
+    Attributes
+    ----------
+    _filenames : list of str or pathlib.Path
+        The paths to the files containing the recorded data.
+    _readers : list of SqliteCaseReader
+        A reader for each of the files.
+    _global_cases : list of (int, str)
+        The file index and case ID of every case, in merged order.
+    _positions : dict
+        Dictionary mapping (file index, case ID) to position in the merged order.
+    _case_files : dict
+        Dictionary mapping case ID to the index of the first file containing it.
+    _case_tables : dict
+        Dictionary mapping (file index, case ID) to the type of the case
+        ('driver', 'system', 'solver' or 'problem').
+    """
+
+    def __init__(self, filenames, pre_load=False, metadata_filename=None):
+        """
+        Initialize.
+        """
+        super().__init__(filenames, pre_load)
+
+        self._filenames = filenames
+        self._readers = [SqliteCaseReader(filename, pre_load, metadata_filename)
+                         for filename in filenames]
+
+        # metadata is common to all of the files
+        reader = self._readers[0]
+        self._format_version = reader._format_version
+        self._openmdao_version = reader._openmdao_version
+        self.problem_metadata = reader.problem_metadata
+        self.solver_metadata = reader.solver_metadata
+        self._system_options = reader._system_options
+
+        # build the merged index
+        entries = []
+        self._case_tables = {}
+        for i, reader in enumerate(self._readers):
+            tables = {
+                'driver': reader._driver_cases,
+                'system': reader._system_cases,
+                'solver': reader._solver_cases,
+            }
+            if reader._format_version >= 2:
+                tables['problem'] = reader._problem_cases
+
+            for table_type, table in tables.items():
+                for counter, case_id in table._list_counters():
+                    entries.append((counter, i, case_id))
+                    self._case_tables[i, case_id] = table_type
+
+        entries.sort(key=lambda entry: entry[:2])
+
+        self._global_cases = [(i, case_id) for _, i, case_id in entries]
+        self._positions = {key: pos for pos, key in enumerate(self._global_cases)}
+        self._case_files = {}
+        for i, case_id in self._global_cases:
+            self._case_files.setdefault(case_id, i)
+
+    def _list_case_keys(self, source, recurse):
+        """
+        Get the (file index, case ID) of the cases from a source, in merged order.
+
+        Parameters
+        ----------
+        source : str or None
+            Identifies which cases to return.
+        recurse : bool
+            If True, will enable iterating over all successors in case hierarchy.
+
+        Returns
+        -------
+        list of (int, str)
+            The file index and case ID of each case.
+        """
+        keys = []
+        found = False
+
+        for i, reader in enumerate(self._readers):
+            try:
+                case_ids = reader.list_cases(source, recurse, True, out_stream=None)
+            except RuntimeError:
+                # source is not in this file
+                continue
+            found = True
+            keys.extend((i, case_id) for case_id in case_ids)
+
+        if not found:
+            raise RuntimeError('Source not found: %s' % source)
+
+        return sorted(keys, key=self._positions.__getitem__)
+
+    def _merge_nested(self, getter, name):
+        """
+        Merge the nested dictionaries of cases returned by the reader for each file.
+
+        Parameters
+        ----------
+        getter : function
+            Function returning the nested dictionary for a reader.
+        name : function
+            Function returning the case ID of a key in the nested dictionary.
+
+        Returns
+        -------
+        dict
+            The merged dictionary, with top level cases in merged order.
+        """
+        items = []
+
+        for i, reader in enumerate(self._readers):
+            try:
+                nested = getter(reader)
+            except RuntimeError:
+                continue
+            items.extend((self._positions[i, name(key)], key, val) for key, val in nested.items())
+
+        items.sort(key=lambda item: item[0])
+
+        return OrderedDict((key, val) for _, key, val in items)
+
+    def list_sources(self, out_stream=_DEFAULT_OUT_STREAM):
+        """
+        List of all the different recording sources for which there is recorded data.
+
+        Parameters
+        ----------
+        out_stream : file-like object
+            Where to send human readable output. Default is sys.stdout.
+            Set to None to suppress.
+
+        Returns
+        -------
+        list
+            One or more of: `problem`, `driver`, `<system hierarchy location>`,
+                            `<solver hierarchy location>`
+        """
+        sources = []
+
+        for reader in self._readers:
+            for source in reader.list_sources(out_stream=None):
+                if source not in sources:
+                    sources.append(source)
+
+        if out_stream:
+            if out_stream is _DEFAULT_OUT_STREAM:
+                out_stream = sys.stdout
+            elif not isinstance(out_stream, TextIOBase):
+                raise TypeError("Invalid output stream specified for 'out_stream'.")
+            for source in sources:
+                out_stream.write('{}\n'.format(source))
+
+        return sources
+
+    def list_source_vars(self, source, out_stream=_DEFAULT_OUT_STREAM):
+        """
+        List of all inputs and outputs recorded by the specified source.
+
+        Parameters
+        ----------
+        source : {'problem', 'driver', <system hierarchy location>, <solver hierarchy location>}
+            Identifies the source for which to return information.
+        out_stream : file-like object
+            Where to send human readable output. Default is sys.stdout.
+            Set to None to suppress.
+
+        Returns
+        -------
+        dict
+            {'inputs':[list of keys], 'outputs':[list of keys]}. Does not recurse.
+        """
+        for reader in self._readers:
+            if source in reader.list_sources(out_stream=None):
+                return reader.list_source_vars(source, out_stream)
+
+        return self._readers[0].list_source_vars(source, out_stream)
+
+    def list_model_options(self, run_number=0, system=None, out_stream=_DEFAULT_OUT_STREAM):
+        """
+        List model options for the specified run.
+
+        Parameters
+        ----------
+        run_number : int
+            Run_driver or run_model iteration to inspect.
+        system : str or None
+            Pathname of the system (None for all systems).
+        out_stream : file-like object
+            Where to send human readable output. Default is sys.stdout.
+            Set to None to suppress.
+
+        Returns
+        -------
+        dict
+            {system: {key: val}}.
+        """
+        return self._readers[0].list_model_options(run_number, system, out_stream)
+
+    def list_solver_options(self, run_number=0, solver=None, out_stream=_DEFAULT_OUT_STREAM):
+        """
+        List solver options for the specified run.
+
+        Parameters
+        ----------
+        run_number : int
+            Run_driver or run_model iteration to inspect.
+        solver : str or None
+            Pathname of the solver (None for all solvers).
+        out_stream : file-like object
+            Where to send human readable output. Default is sys.stdout.
+            Set to None to suppress.
+
+        Returns
+        -------
+        dict
+            {solver: {key: val}}.
+        """
+        return self._readers[0].list_solver_options(run_number, solver, out_stream)
+
+    def list_cases(self, source=None, recurse=True, flat=True, out_stream=_DEFAULT_OUT_STREAM):
+        """
+        Iterate over Driver, Solver and System cases in merged order.
+
+        Parameters
+        ----------
+        source : 'problem', 'driver', component pathname, solver pathname, case_name
+            If not None, only cases originating from the specified source or case are returned.
+        recurse : bool, optional
+            If True, will enable iterating over all successors in case hierarchy.
+        flat : bool, optional
+            If False and there are child cases, then a nested ordered dictionary
+            is returned rather than an iterator.
+        out_stream : file-like object
+            Where to send human readable output. Default is sys.stdout.
+            Set to None to suppress.
+
+        Returns
+        -------
+        iterator or dict
+            An iterator or a nested dictionary of identified cases.
+        """
+        if not flat:
+            return self._merge_nested(lambda r: r.list_cases(source, recurse, flat,
+                                                             out_stream=None),
+                                      lambda case_id: case_id)
+
+        keys = self._list_case_keys(source, recurse)
+
+        if out_stream:
+            # group consecutive cases of the same type, like SqliteCaseReader
+            source_cases = []
+            for key in keys:
+                table = self._case_tables[key]
+                if source_cases and table in source_cases[-1]:
+                    source_cases[-1][table].append(key[1])
+                else:
+                    source_cases.append({table: [key[1]]})
+            write_source_table(source_cases, out_stream)
+
+        return [case_id for _, case_id in keys]
+
+    def get_cases(self, source=None, recurse=True, flat=True):
+        """
+        Iterate over the cases.
+
+        Parameters
+        ----------
+        source : 'problem', 'driver', component pathname, solver pathname, case_name
+            Identifies which cases to return.
+        recurse : bool, optional
+            If True, will enable iterating over all successors in case hierarchy.
+        flat : bool, optional
+            If False and there are child cases, then a nested ordered dictionary
+            is returned rather than an iterator.
+
+        Returns
+        -------
+        list or dict
+            The cases identified by source.
+        """
+        if not flat:
+            return self._merge_nested(lambda r: r.get_cases(source, recurse, flat),
+                                      lambda case: case.name)
+
+        return [self._readers[i].get_case(case_id)
+                for i, case_id in self._list_case_keys(source, recurse)]
+
+    def get_case(self, case_id, recurse=False):
+        """
+        Get case identified by case_id.
+
+        Parameters
+        ----------
+        case_id : str or int
+            The unique identifier of the case to return or an index into all cases.
+        recurse : bool, optional
+            If True, will return all successors to the case as well.
+
+        Returns
+        -------
+        dict
+            The case identified by case_id.
+        """
+        if isinstance(case_id, int):
+            if case_id > len(self._global_cases) - 1:
+                raise IndexError("Invalid index into available cases:", case_id)
+            i, case_id = self._global_cases[case_id]
+        else:
+            try:
+                i = self._case_files[case_id]
+            except KeyError:
+                raise RuntimeError('Case not found:', case_id)
+
+        return self._readers[i].get_case(case_id, recurse)
+
+    def get_val_history(self, names, source='driver', units=None, chunk_size=1000):
+        """
+        Get the recorded values of the specified variables across all cases from a source.
+
+        Parameters
+        ----------
+        names : str or iter of str
+            Promoted or absolute names of the variables.
+        source : str
+            The source of the cases: 'driver', 'problem', or a system or solver pathname.
+        units : str or dict or None
+            Units to convert the values to, either for all variables or as a dictionary
+            keyed by variable name.
+        chunk_size : int
+            The number of rows to read from the database at a time.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping each variable name to a 2D array with one flattened row of
+            values per case, in merged order.
+        """
+        if isinstance(names, str):
+            names = [names]
+
+        positions = []
+        histories = []
+
+        for i, reader in enumerate(self._readers):
+            try:
+                history = reader.get_val_history(names, source, units, chunk_size)
+            except RuntimeError:
+                # source is not in this file
+                continue
+            case_ids = reader.list_cases(source, recurse=False, out_stream=None)
+            positions.extend(self._positions[i, case_id] for case_id in case_ids)
+            histories.append(history)
+
+        if not histories:
+            raise RuntimeError('Source not found: %s' % source)
+
+        order = np.argsort(positions, kind='stable')
+
+        merged = {}
+        for name in names:
+            vals = [history[name] for history in histories if history[name].size > 0]
+            merged[name] = np.vstack(vals)[order] if vals else np.zeros((0, 0))
+
+        return merged
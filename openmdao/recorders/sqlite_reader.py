@@ -13,8 +13,10 @@ from openmdao.recorders.base_case_reader import BaseCaseReader
 from openmdao.recorders.case import Case
 from openmdao.core.constants import _DEFAULT_OUT_STREAM
 from openmdao.utils.variable_table import write_source_table
-from openmdao.utils.record_util import check_valid_sqlite3_db, get_source_system
+from openmdao.utils.record_util import check_valid_sqlite3_db, get_source_system, \
+    layout_to_dtype, layout_to_sparsity, decompress_data
 from openmdao.utils.om_warnings import issue_warning, CaseRecorderWarning
+from openmdao.utils.units import unit_conversion, simplify_unit
 
 from openmdao.recorders.sqlite_recorder import format_version, META_KEY_SEP
 
@@ -169,6 +171,9 @@ class SqliteCaseReader(BaseCaseReader):
         Helper object for accessing cases from the problem_cases table.
     _global_iterations : list
         List of iteration cases and the table and row in which they are found.
+    _layouts : dict
+        Dictionary mapping layout id to the structured dtype of binary iteration data, or to
+        the sparsity of derivatives.
     """
 
     def __init__(self, filename, pre_load=False, metadata_filename=None):
@@ -188,6 +193,7 @@ class SqliteCaseReader(BaseCaseReader):
         self._conns = None
         self._auto_ivc_map = {}
         self._global_iterations = None
+        self._layouts = {}
 
         filename = str(filename)
 
@@ -198,6 +204,9 @@ class SqliteCaseReader(BaseCaseReader):
             # get the global iterations table, and save it as an attribute
             self._global_iterations = self._get_global_iterations(cur)
 
+            # get the layouts of any binary iteration data
+            self._layouts = self._get_layouts(cur)
+
             # If separate metadata not specified, check the current db
             # to make sure it's there
             if metadata_filename is None:
@@ -245,19 +254,23 @@ class SqliteCaseReader(BaseCaseReader):
         var_info = self.problem_metadata['variables']
         self._driver_cases = DriverCases(filename, self._format_version, self._global_iterations,
                                          self._prom2abs, self._abs2prom, self._abs2meta,
-                                         self._conns, self._auto_ivc_map, var_info)
+                                         self._conns, self._auto_ivc_map, var_info,
+                                         self._layouts)
         self._system_cases = SystemCases(filename, self._format_version, self._global_iterations,
                                          self._prom2abs, self._abs2prom, self._abs2meta,
-                                         self._conns, self._auto_ivc_map, var_info)
+                                         self._conns, self._auto_ivc_map, var_info,
+                                         self._layouts)
         self._solver_cases = SolverCases(filename, self._format_version, self._global_iterations,
                                          self._prom2abs, self._abs2prom, self._abs2meta,
-                                         self._conns, self._auto_ivc_map, var_info)
+                                         self._conns, self._auto_ivc_map, var_info,
+                                         self._layouts)
         if self._format_version >= 2:
             self._problem_cases = ProblemCases(filename,
                                                self._format_version,
                                                self._global_iterations,
                                                self._prom2abs, self._abs2prom, self._abs2meta,
-                                               self._conns, self._auto_ivc_map, var_info)
+                                               self._conns, self._auto_ivc_map, var_info,
+                                               self._layouts)
 
         # if requested, load all the iteration data into memory
         if pre_load:
@@ -441,6 +454,35 @@ class SqliteCaseReader(BaseCaseReader):
         cur.execute('select * from global_iterations')
         return cur.fetchall()
 
+    def _get_layouts(self, cur):
+        """
+        Get the layouts of binary iteration data.
+
+        Parameters
+        ----------
+        cur : sqlite3.Cursor
+            Database cursor to use for reading the data.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping layout id to the structured dtype of binary iteration data,
+            or to the sparsity of derivatives.
+        """
+        cur.execute("SELECT count(name) FROM sqlite_master WHERE type='table' AND name='layouts'")
+        if cur.fetchone()[0] == 0:
+            return {}
+
+        layouts = {}
+        cur.execute('SELECT id, layout FROM layouts')
+        for layout_id, layout in cur:
+            layout = json_loads(layout)
+            if isinstance(layout, dict):
+                layouts[layout_id] = layout_to_sparsity(layout['derivatives'])
+            else:
+                layouts[layout_id] = layout_to_dtype(layout)
+        return layouts
+
     def _load_cases(self):
         """
         Load all driver, solver, and system cases into memory.
@@ -1037,6 +1079,46 @@ class SqliteCaseReader(BaseCaseReader):
 
         raise RuntimeError('Case not found:', case_id)
 
+    def get_val_history(self, names, source='driver', units=None, chunk_size=1000):
+        """
+        Get the recorded values of the specified variables across all cases from a source.
+
+        Unlike get_cases, no Case objects are created. Rows are read from the database in
+        chunks and only the requested variables are extracted from each row.
+
+        Parameters
+        ----------
+        names : str or iter of str
+            Promoted or absolute names of the variables.
+        source : str
+            The source of the cases: 'driver', 'problem', or a system or solver pathname.
+        units : str or dict or None
+            Units to convert the values to, either for all variables or as a dictionary
+            keyed by variable name.
+        chunk_size : int
+            The number of rows to read from the database at a time.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping each variable name to a 2D array with one flattened row of
+            values per case, in recorded order.
+        """
+        if self._format_version < 3:
+            raise RuntimeError(f"get_val_history is not supported for data format "
+                               f"{self._format_version}.")
+
+        if source == 'driver':
+            return self._driver_cases.get_val_history(names, None, units, chunk_size)
+        elif source == 'problem':
+            return self._problem_cases.get_val_history(names, None, units, chunk_size)
+        elif source in self._system_cases.list_sources():
+            return self._system_cases.get_val_history(names, source, units, chunk_size)
+        elif source in self._solver_cases.list_sources():
+            return self._solver_cases.get_val_history(names, source, units, chunk_size)
+
+        raise RuntimeError('Source not found: %s' % source)
+
 
 class CaseTable(object):
     """
@@ -1068,6 +1150,8 @@ class CaseTable(object):
         display.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    layouts : dict or None
+        Dictionary mapping layout id to the structured dtype of binary iteration data.
 
     Attributes
     ----------
@@ -1102,10 +1186,12 @@ class CaseTable(object):
         connections or a promoted input name for multiple connections. This is for output display.
     _global_iterations : list
         List of iteration cases and the table and row in which they are found.
+    _layouts : dict or None
+        Dictionary mapping layout id to the structured dtype of binary iteration data.
     """
 
     def __init__(self, fname, ver, table, index, giter, prom2abs, abs2prom, abs2meta, conns,
-                 auto_ivc_map, var_info):
+                 auto_ivc_map, var_info, layouts=None):
         """
         Initialize.
         """
@@ -1120,6 +1206,7 @@ class CaseTable(object):
         self._conns = conns
         self._auto_ivc_map = auto_ivc_map
         self._var_info = var_info
+        self._layouts = layouts
 
         # cached keys/cases
         self._sources = None
@@ -1181,6 +1268,25 @@ class CaseTable(object):
             # source is a system or solver
             return [key for key in self._keys if self._get_source(key) == source]
 
+    def _list_counters(self):
+        """
+        Get the counter and case ID of each case in the table.
+
+        Returns
+        -------
+        list of (int, str)
+            The counter and case ID of each case, in recorded order.
+        """
+        with sqlite3.connect(self._filename) as con:
+            cur = con.cursor()
+            cur.execute(f"SELECT counter, {self._index_name} FROM {self._table_name}"
+                        " ORDER BY id ASC")  # nosec trusted input
+            rows = cur.fetchall()
+
+        con.close()
+
+        return rows
+
     def get_cases(self, source=None, recurse=False, flat=False):
         """
         Get list of case names for cases in the table.
@@ -1284,7 +1390,8 @@ class CaseTable(object):
                 source = self._get_source(row[self._index_name])
 
             case = Case(source, row, self._prom2abs, self._abs2prom, self._abs2meta,
-                        self._conns, self._auto_ivc_map, self._var_info, self._format_version)
+                        self._conns, self._auto_ivc_map, self._var_info, self._format_version,
+                        self._layouts)
 
             # cache it if requested
             if cache:
@@ -1336,7 +1443,8 @@ class CaseTable(object):
                 case_id = row[self._index_name]
                 source = self._get_source(case_id)
                 case = Case(source, row, self._prom2abs, self._abs2prom, self._abs2meta,
-                            self._conns, self._auto_ivc_map, self._var_info, self._format_version)
+                            self._conns, self._auto_ivc_map, self._var_info, self._format_version,
+                            self._layouts)
                 if cache:
                     self._cases[case_id] = case
                 yield case
@@ -1435,6 +1543,234 @@ class CaseTable(object):
 
         return None
 
+    def _get_history_keys(self, name):
+        """
+        Get the columns and keys under which the value of a variable may be recorded.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or absolute name of the variable.
+
+        Returns
+        -------
+        list of (str, str)
+            Candidate (column, key) pairs, in order of preference.
+        """
+        prom2abs = self._prom2abs
+        abs2prom = self._abs2prom
+        conns = self._conns
+
+        if name in abs2prom['output'] or name in prom2abs['output']:
+            abs_name = name if name in abs2prom['output'] else prom2abs['output'][name][0]
+            keys = [('outputs', abs_name)]
+            if abs_name in self._auto_ivc_map:
+                # auto_ivc outputs may be recorded under the promoted input name
+                keys.append(('outputs', self._auto_ivc_map[abs_name]))
+            return keys
+
+        if name in prom2abs['input']:
+            abs_name = prom2abs['input'][name][0]
+            return [('outputs', name), ('inputs', abs_name), ('outputs', conns[abs_name])]
+
+        if name in abs2prom['input']:
+            return [('inputs', name), ('outputs', conns[name]),
+                    ('outputs', abs2prom['input'][name])]
+
+        raise KeyError('Variable name "%s" not found.' % name)
+
+    def _get_history_units(self, key):
+        """
+        Get the units of the recorded value of a variable.
+
+        Parameters
+        ----------
+        key : str
+            The key under which the value is recorded.
+
+        Returns
+        -------
+        str or None
+            Unit string.
+        """
+        if key in self._abs2meta:
+            return self._abs2meta[key]['units']
+
+        # auto_ivc output recorded under a promoted input name, use the units of the source
+        abs_in = self._prom2abs['input'][key][0]
+        return self._abs2meta[self._conns[abs_in]]['units']
+
+    def get_val_history(self, names, source=None, units=None, chunk_size=1000):
+        """
+        Get the recorded values of the specified variables across all cases in the table.
+
+        Parameters
+        ----------
+        names : str or iter of str
+            Promoted or absolute names of the variables.
+        source : str or None
+            If not None, only cases that have the specified source are included.
+        units : str or dict or None
+            Units to convert the values to, either for all variables or as a dictionary
+            keyed by variable name.
+        chunk_size : int
+            The number of rows to read from the database at a time.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping each variable name to a 2D array with one flattened row of
+            values per case, in recorded order.
+        """
+        if isinstance(names, str):
+            names = [names]
+
+        candidates = {name: self._get_history_keys(name) for name in names}
+
+        # solver tables use different column names
+        if self._table_name == 'solver_iterations':
+            colmap = {'inputs': 'solver_inputs', 'outputs': 'solver_output'}
+        else:
+            colmap = {'inputs': 'inputs', 'outputs': 'outputs'}
+
+        columns = sorted({colmap[col] for keys in candidates.values() for col, _ in keys})
+
+        # (column, key) actually used for each variable, determined from the first row
+        found = {}
+        chunks = {name: [] for name in names}
+
+        with sqlite3.connect(self._filename) as con:
+            cur = con.cursor()
+            cur.execute(f"SELECT {self._index_name}, {', '.join(columns)} "  # nosec: trusted
+                        f"FROM {self._table_name} ORDER BY id ASC")
+
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if not rows:
+                    break
+
+                vals = {name: [] for name in names}
+
+                for row in rows:
+                    if source is not None and self._get_source(row[0]) != source:
+                        continue
+
+                    data = {}
+                    for col, raw in zip(columns, row[1:]):
+                        if raw is None:
+                            data[col] = {}
+                        elif isinstance(raw, bytes):
+                            raw, _ = decompress_data(raw)
+                            data[col] = raw if isinstance(raw, bytes) else json_loads(raw) or {}
+                        else:
+                            data[col] = json_loads(raw) or {}
+
+                    for name in names:
+                        vals[name].append(self._get_history_val(name, row[0], data,
+                                                                candidates[name], colmap,
+                                                                found))
+
+                for name in names:
+                    if vals[name]:
+                        chunks[name].append(np.vstack(vals[name]))
+
+        con.close()
+
+        history = {}
+        for name in names:
+            if chunks[name]:
+                val = np.vstack(chunks[name])
+            else:
+                val = np.zeros((0, 0))
+
+            unit = units.get(name) if isinstance(units, dict) else units
+            if unit is not None and name in found:
+                val = self._convert_history_units(name, found[name][1], val, unit)
+
+            history[name] = val
+
+        return history
+
+    def _get_history_val(self, name, case_id, data, candidates, colmap, found):
+        """
+        Extract the flattened value of a variable from the decoded data of a row.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or absolute name of the variable.
+        case_id : str
+            The identifier of the case in the row, for error messages.
+        data : dict
+            Dictionary mapping column name to decoded JSON data or binary blob.
+        candidates : list of (str, str)
+            Candidate (column, key) pairs under which the value may be recorded.
+        colmap : dict
+            Dictionary mapping generic column name to column name in this table.
+        found : dict
+            Dictionary mapping variable name to the (column, key) found in previous rows.
+
+        Returns
+        -------
+        ndarray
+            The flattened value.
+        """
+        if name in found:
+            candidates = [found[name]] + candidates
+
+        for col, key in candidates:
+            coldata = data[colmap[col]]
+            if isinstance(coldata, bytes):
+                # read just this field from the blob rather than decoding all of it
+                layout_id = int(np.frombuffer(coldata, dtype=np.int64, count=1)[0])
+                fields = self._layouts[layout_id].fields
+                if key in fields:
+                    dt, offset = fields[key]
+                    found[name] = (col, key)
+                    return np.frombuffer(coldata, dtype=dt.base,
+                                         count=int(np.prod(dt.shape)),
+                                         offset=np.dtype(np.int64).itemsize + offset)
+            elif key in coldata:
+                found[name] = (col, key)
+                return np.asarray(coldata[key], dtype=float).ravel()
+
+        raise KeyError(f'Variable name "{name}" not found in case "{case_id}".')
+
+    def _convert_history_units(self, name, key, val, units):
+        """
+        Convert the recorded values of a variable to the specified units.
+
+        Parameters
+        ----------
+        name : str
+            Promoted or absolute name of the variable.
+        key : str
+            The key under which the value is recorded.
+        val : ndarray
+            The recorded values.
+        units : str
+            The units to convert to.
+
+        Returns
+        -------
+        ndarray
+            The converted values.
+        """
+        base_units = self._get_history_units(key)
+        simp_units = simplify_unit(units)
+
+        if base_units is None:
+            msg = "Can't express variable '{}' with units of 'None' in units of '{}'."
+            raise TypeError(msg.format(name, simp_units))
+
+        try:
+            scale, offset = unit_conversion(base_units, simp_units)
+        except TypeError:
+            msg = "Can't express variable '{}' with units of '{}' in units of '{}'."
+            raise TypeError(msg.format(name, base_units, simp_units))
+
+        return (val + offset) * scale
+
 
 class DriverCases(CaseTable):
     """
@@ -1462,17 +1798,19 @@ class DriverCases(CaseTable):
         display.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    layouts : dict or None
+        Dictionary mapping layout id to the structured dtype of binary iteration data.
     """
 
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
-                 auto_ivc_map, var_info):
+                 auto_ivc_map, var_info, layouts=None):
         """
         Initialize.
         """
         super().__init__(filename, format_version,
                          'driver_iterations', 'iteration_coordinate', giter,
                          prom2abs, abs2prom, abs2meta, conns, auto_ivc_map,
-                         var_info)
+                         var_info, layouts)
         self._var_info = var_info
 
     def cases(self, cache=False):
@@ -1509,7 +1847,8 @@ class DriverCases(CaseTable):
                         row['jacobian'] = derivs_row['derivatives']
 
                 case = Case('driver', row, self._prom2abs, self._abs2prom, self._abs2meta,
-                            self._conns, self._auto_ivc_map, self._var_info, self._format_version)
+                            self._conns, self._auto_ivc_map, self._var_info, self._format_version,
+                            self._layouts)
 
                 if cache:
                     self._cases[case.name] = case
@@ -1569,7 +1908,8 @@ class DriverCases(CaseTable):
         # if found, create Case object (and cache it if requested) else return None
         if row:
             case = Case('driver', row, self._prom2abs, self._abs2prom, self._abs2meta,
-                        self._conns, self._auto_ivc_map, self._var_info, self._format_version)
+                        self._conns, self._auto_ivc_map, self._var_info, self._format_version,
+                        self._layouts)
             if cache:
                 self._cases[case_id] = case
             return case
@@ -1646,17 +1986,19 @@ class SystemCases(CaseTable):
         display.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    layouts : dict or None
+        Dictionary mapping layout id to the structured dtype of binary iteration data.
     """
 
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
-                 auto_ivc_map, var_info):
+                 auto_ivc_map, var_info, layouts=None):
         """
         Initialize.
         """
         super().__init__(filename, format_version,
                          'system_iterations', 'iteration_coordinate', giter,
                          prom2abs, abs2prom, abs2meta, conns, auto_ivc_map,
-                         var_info)
+                         var_info, layouts)
 
 
 class SolverCases(CaseTable):
@@ -1685,17 +2027,19 @@ class SolverCases(CaseTable):
         display.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    layouts : dict or None
+        Dictionary mapping layout id to the structured dtype of binary iteration data.
     """
 
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
-                 auto_ivc_map, var_info):
+                 auto_ivc_map, var_info, layouts=None):
         """
         Initialize.
         """
         super().__init__(filename, format_version,
                          'solver_iterations', 'iteration_coordinate', giter,
                          prom2abs, abs2prom, abs2meta, conns, auto_ivc_map,
-                         var_info)
+                         var_info, layouts)
 
     def _get_source(self, iteration_coordinate):
         """
@@ -1752,17 +2096,19 @@ class ProblemCases(CaseTable):
         display.
     var_info : dict
         Dictionary with information about variables (scaling, indices, execution order).
+    layouts : dict or None
+        Dictionary mapping layout id to the structured dtype of binary iteration data.
     """
 
     def __init__(self, filename, format_version, giter, prom2abs, abs2prom, abs2meta, conns,
-                 auto_ivc_map, var_info):
+                 auto_ivc_map, var_info, layouts=None):
         """
         Initialize.
         """
         super().__init__(filename, format_version,
                          'problem_cases', 'case_name', giter,
                          prom2abs, abs2prom, abs2meta, conns, auto_ivc_map,
-                         var_info)
+                         var_info, layouts)
 
     def list_sources(self):
         """
@@ -7,6 +7,10 @@ from io import BytesIO
 import os.path
 import gc
 import sqlite3
+import queue
+import threading
+import time
+from fnmatch import fnmatchcase
 from itertools import chain
 
 import json
@@ -18,7 +22,7 @@ import zlib
 from openmdao import __version__ as openmdao_version
 from openmdao.recorders.case_recorder import CaseRecorder, PICKLE_VER
 from openmdao.utils.mpi import MPI
-from openmdao.utils.record_util import dict_to_structured_array
+from openmdao.utils.record_util import dict_to_structured_array, compress_data
 from openmdao.utils.options_dictionary import OptionsDictionary
 from openmdao.utils.general_utils import make_serializable, default_noraise
 from openmdao.core.driver import Driver
@@ -31,6 +35,12 @@ from openmdao.utils.om_warnings import issue_warning, CaseRecorderWarning
 """
 SQL case database version history.
 ----------------------------------
+17-- OpenMDAO 3.35.1
+     Driver derivatives may be stored as the nonzero values of the total coloring sparsity.
+16-- OpenMDAO 3.35.1
+     Iteration data may be compressed and/or quantized.
+15-- OpenMDAO 3.35.1
+     Added layouts table so iteration data can be stored as contiguous binary blobs.
 14-- OpenMDAO 3.8.1
      Metadata pickle and JSON blobs are compressed.
      Save metadata separately for parallel runs.
@@ -63,7 +73,7 @@ SQL case database version history.
 1 -- Through OpenMDAO 2.3
      Original implementation.
 """
-format_version = 14
+format_version = 17
 
 # separator, cannot be a legal char for names
 META_KEY_SEP = '!'
@@ -129,6 +139,26 @@ class SqliteRecorder(CaseRecorder):
         The pickle protocol version to use when pickling metadata.
     record_viewer_data : bool, optional
         If True, record data needed for visualization.
+    binary_data : bool, optional
+        If True, store the inputs, outputs and residuals of each case as a single binary blob
+        of float64 values whose layout is recorded once per run, rather than as JSON text.
+    background_writes : bool, optional
+        If True, cases are serialized on the calling thread but inserted into the database by a
+        background writer thread in batched transactions, using WAL journaling.
+    commit_interval : float, optional
+        Maximum time in seconds that the background writer collects cases before committing them.
+    max_queued : int, optional
+        Maximum number of cases waiting for the background writer. Recording blocks when the
+        queue is full.
+    compression : str or None, optional
+        If 'zlib' or 'lzma', compress the inputs, outputs and residuals of each case.
+    compression_level : int or None, optional
+        The zlib level or lzma preset to use for compression, or None for the default.
+    quantize : dict or None, optional
+        Dictionary mapping glob patterns of absolute variable names to a lossy reduction
+        in precision for matching variables. A value of 'float32' rounds values to single
+        precision (and stores them as float32 with binary_data), and an int rounds values to
+        that many decimal places. The first matching pattern is used.
 
     Attributes
     ----------
@@ -157,9 +187,40 @@ class SqliteRecorder(CaseRecorder):
         set of recording requesters for which this recorder has been started.
     _use_outputs_dir : bool
         Flag indicating if the database is being saved in the problem outputs dir.
+    _binary_data : bool
+        If True, store iteration data as binary blobs rather than JSON text.
+    _layouts : dict
+        Mapping of variable layout, as a tuple of (name, shape), to its id in the layouts table.
+    _deriv_layout : tuple or None
+        The id of the layout of the recorded derivatives and their sparsity, if known.
+    _commit_interval : float or None
+        Maximum time in seconds between commits of the background writer, or None if cases
+        are written synchronously.
+    _queue : queue.Queue or None
+        Queue of inserts waiting for the background writer.
+    _writer : threading.Thread or None
+        The background writer thread.
+    _writer_error : Exception or None
+        Exception raised by the background writer, to be re-raised on the calling thread.
+    _compression : str or None
+        The compression to use for iteration data, 'zlib' or 'lzma', or None.
+    _compression_level : int or None
+        The compression level, or None for the default.
+    _quantize : dict
+        Dictionary mapping glob patterns of variable names to their quantization.
+    _quantize_cache : dict
+        Dictionary mapping variable names to their quantization, or None if not quantized.
+    _raw_bytes : int
+        Total size of the serialized iteration data before compression.
+    _stored_bytes : int
+        Total size of the iteration data as stored.
+    _encode_time : float
+        Total time in seconds spent quantizing and compressing iteration data.
     """
 
-    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True):
+    def __init__(self, filepath, append=False, pickle_version=PICKLE_VER, record_viewer_data=True,
+                 binary_data=False, background_writes=False, commit_interval=1.0, max_queued=1000,
+                 compression=None, compression_level=None, quantize=None):
         """
         Initialize the SqliteRecorder.
         """
@@ -182,8 +243,39 @@ class SqliteRecorder(CaseRecorder):
         self._database_initialized = False
         self._started = set()
 
+        self._binary_data = binary_data
+        self._layouts = {}
+        self._deriv_layout = None
+
+        self._commit_interval = commit_interval if background_writes else None
+        self._queue = queue.Queue(maxsize=max_queued) if background_writes else None
+        self._writer = None
+        self._writer_error = None
+
+        if compression not in (None, 'zlib', 'lzma'):
+            raise ValueError("SqliteRecorder: compression must be one of None, 'zlib' or "
+                             f"'lzma', but '{compression}' was given.")
+        self._compression = compression
+        self._compression_level = compression_level
+
+        self._quantize = {} if quantize is None else dict(quantize)
+        for pattern, quant in self._quantize.items():
+            if quant != 'float32' and not isinstance(quant, int):
+                raise ValueError("SqliteRecorder: quantize values must be 'float32' or an int "
+                                 f"number of decimal places, but {quant!r} was given for "
+                                 f"'{pattern}'.")
+        self._quantize_cache = {}
+
+        self._raw_bytes = 0
+        self._stored_bytes = 0
+        self._encode_time = 0.
+
         super().__init__(record_viewer_data)
 
+        # recorders that serialize case data the same way share it
+        self._payload_encoding = ('sqlite', binary_data, compression, compression_level,
+                                  tuple(self._quantize.items()))
+
     def _initialize_database(self, comm):
         """
         Initialize the database.
@@ -249,23 +341,31 @@ class SqliteRecorder(CaseRecorder):
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
                           "success INT, msg TEXT, derivatives BLOB)")
                 c.execute("CREATE INDEX driv_iter_ind on driver_iterations(iteration_coordinate)")
+                c.execute("CREATE INDEX driv_counter_ind on driver_iterations(counter)")
+                c.execute("CREATE INDEX driv_deriv_ind on driver_derivatives(iteration_coordinate)")
 
                 c.execute("CREATE TABLE problem_cases(id INTEGER PRIMARY KEY, "
                           "counter INT, case_name TEXT, timestamp REAL, "
                           "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT, "
                           "jacobian BLOB, abs_err REAL, rel_err REAL)")
                 c.execute("CREATE INDEX prob_name_ind on problem_cases(case_name)")
+                c.execute("CREATE INDEX prob_counter_ind on problem_cases(counter)")
 
                 c.execute("CREATE TABLE system_iterations(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
                           "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT)")
                 c.execute("CREATE INDEX sys_iter_ind on system_iterations(iteration_coordinate)")
+                c.execute("CREATE INDEX sys_counter_ind on system_iterations(counter)")
 
                 c.execute("CREATE TABLE solver_iterations(id INTEGER PRIMARY KEY, "
                           "counter INT, iteration_coordinate TEXT, timestamp REAL, "
                           "success INT, msg TEXT, abs_err REAL, rel_err REAL, "
                           "solver_inputs TEXT, solver_output TEXT, solver_residuals TEXT)")
                 c.execute("CREATE INDEX solv_iter_ind on solver_iterations(iteration_coordinate)")
+                c.execute("CREATE INDEX solv_counter_ind on solver_iterations(counter)")
+
+                # layouts of binary iteration data, referenced by the header of each blob
+                c.execute("CREATE TABLE layouts(id INTEGER PRIMARY KEY, layout TEXT)")
 
                 if self._record_metadata:
                     with self.metadata_connection as m:
@@ -282,6 +382,13 @@ class SqliteRecorder(CaseRecorder):
                         m.execute("CREATE TABLE solver_metadata(id TEXT PRIMARY KEY, "
                                   "solver_options BLOB, solver_class TEXT)")
 
+            if self._queue is not None:
+                # WAL lets the writer thread commit while metadata is written on this thread
+                self.connection.execute("PRAGMA journal_mode=WAL")
+                self._writer = threading.Thread(target=self._write_loop, args=(filepath,),
+                                                daemon=True)
+                self._writer.start()
+
         self._database_initialized = True
         if MPI and comm and comm.size > 1:
             comm.barrier()
@@ -317,6 +424,294 @@ class SqliteRecorder(CaseRecorder):
             var_settings[name] = meta
         return var_settings
 
+    def _get_layout_id(self, layout):
+        """
+        Return the id of the given layout, adding it to the layouts table if necessary.
+
+        Parameters
+        ----------
+        layout : tuple
+            Tuple of (name, shape) for each variable, in the order stored in the blob.
+
+        Returns
+        -------
+        int
+            The id of the layout in the layouts table.
+        """
+        try:
+            return self._layouts[layout]
+        except KeyError:
+            layout_id = self._layouts[layout] = len(self._layouts) + 1
+            self._write("INSERT INTO layouts(id, layout) VALUES(?,?)",
+                        (layout_id, json.dumps(layout)))
+            return layout_id
+
+    def _serialize_case(self, data):
+        """
+        Serialize the outputs, inputs and residuals of a case.
+
+        If the case data is shared with other recorders, the serialized data is shared with
+        those recorders that serialize it the same way.
+
+        Parameters
+        ----------
+        data : dict
+            Dictionary containing the 'output', 'input' and 'residual' values of the case.
+
+        Returns
+        -------
+        tuple
+            The serialized outputs, inputs and residuals.
+        """
+        return tuple(self._serialize_values(data[key], self._payload, key)
+                     for key in ('output', 'input', 'residual'))
+
+    def _serialize_values(self, values, payload=None, key=None):
+        """
+        Convert a dict of variable values into a form that can be stored in an iteration table.
+
+        If binary data was requested and all of the values are float arrays, the values are
+        packed into a single blob preceded by the id of their layout.  Otherwise they are
+        converted to JSON.
+
+        Parameters
+        ----------
+        values : dict or None
+            Dictionary mapping absolute variable names to values.
+        payload : CasePayload or None
+            The case data shared with other recorders, if any.
+        key : str or None
+            The entry of the shared case data that contains the values.
+
+        Returns
+        -------
+        str or sqlite3.Binary
+            The serialized values.
+        """
+        if not values:
+            return json.dumps(values)
+
+        if payload is None:
+            layout, data = self._encode(values)
+        else:
+            layout, data = payload.get_serialized(self._payload_encoding, key,
+                                                  lambda: self._encode(values))
+
+        layout_id = None
+        if layout is not None:
+            # layout ids are specific to each database, so the id is added after sharing
+            layout_id = self._get_layout_id(layout)
+            data = b''.join((np.int64(layout_id).tobytes(), data))
+
+        if not self._compression:
+            self._raw_bytes += len(data)
+            self._stored_bytes += len(data)
+            return data if layout is None else sqlite3.Binary(data)
+
+        start = time.perf_counter()
+
+        raw_size = len(data)
+        if payload is None:
+            data = compress_data(data, self._compression, self._compression_level)
+        else:
+            data = payload.get_serialized(self._payload_encoding, (key, layout_id),
+                                          lambda: compress_data(data, self._compression,
+                                                                self._compression_level))
+
+        self._raw_bytes += raw_size
+        self._stored_bytes += len(data)
+        self._encode_time += time.perf_counter() - start
+
+        return sqlite3.Binary(data)
+
+    def _encode(self, values):
+        """
+        Quantize a dict of variable values and convert it into JSON or binary data.
+
+        Parameters
+        ----------
+        values : dict
+            Dictionary mapping absolute variable names to values.
+
+        Returns
+        -------
+        tuple or None
+            Tuple of (name, shape) for each variable in the binary data, or None for JSON.
+        str or bytes
+            The JSON, or the values packed into binary data.
+        """
+        if self._quantize:
+            start = time.perf_counter()
+            values = self._quantize_values(values)
+            self._encode_time += time.perf_counter() - start
+
+        if self._binary_data:
+            vals = values.values()
+            if all(isinstance(v, np.ndarray) and v.dtype in (np.float64, np.float32)
+                   for v in vals):
+                layout = tuple((n, v.shape) if v.dtype == np.float64 else
+                               (n, v.shape, v.dtype.str) for n, v in values.items())
+                return layout, b''.join(v.tobytes() for v in vals)
+
+        # convert to lists so this can be dumped as JSON, without modifying the original values
+        return None, json.dumps({name: make_serializable(val) for name, val in values.items()})
+
+    def _quantize_values(self, values):
+        """
+        Reduce the precision of the values of variables matching the quantize patterns.
+
+        Parameters
+        ----------
+        values : dict
+            Dictionary mapping absolute variable names to values.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping absolute variable names to possibly quantized values.
+        """
+        quantized = {}
+
+        for name, val in values.items():
+            try:
+                quant = self._quantize_cache[name]
+            except KeyError:
+                quant = None
+                for pattern, q in self._quantize.items():
+                    if fnmatchcase(name, pattern):
+                        quant = q
+                        break
+                self._quantize_cache[name] = quant
+
+            if quant is None or not isinstance(val, np.ndarray) or \
+                    not np.issubdtype(val.dtype, np.floating):
+                quantized[name] = val
+            elif quant != 'float32':
+                quantized[name] = np.round(val, quant)
+            elif self._binary_data:
+                quantized[name] = val.astype(np.float32)
+            else:
+                # the shortest decimal representation of the single precision values, so the
+                # JSON is shorter as well
+                quantized[name] = val.astype(np.float32).astype(str).astype(np.float64)
+
+        return quantized
+
+    def _write(self, sql, params, record_type=None, source=None):
+        """
+        Insert a row into the database, or queue it for the background writer.
+
+        Parameters
+        ----------
+        sql : str
+            The INSERT statement.
+        params : tuple
+            The values to insert.
+        record_type : str or None
+            If not None, also add the row to the global iterations table with this record type.
+        source : str or None
+            The source of the case, used for the global iterations table.
+        """
+        if self._queue is not None:
+            if self._writer_error is not None:
+                err, self._writer_error = self._writer_error, None
+                raise RuntimeError(f"Background writer for '{self._filepath}' failed.") from err
+            self._queue.put((sql, params, record_type, source))
+            return
+
+        with self.connection as c:
+            c = c.cursor()  # need a real cursor for lastrowid
+            self._insert(c, sql, params, record_type, source)
+
+    def _insert(self, cur, sql, params, record_type, source):
+        """
+        Execute an insert and its corresponding global iterations insert, if any.
+
+        Parameters
+        ----------
+        cur : sqlite3.Cursor
+            Cursor used to execute the insert.
+        sql : str
+            The INSERT statement.
+        params : tuple
+            The values to insert.
+        record_type : str or None
+            If not None, also add the row to the global iterations table with this record type.
+        source : str or None
+            The source of the case, used for the global iterations table.
+        """
+        cur.execute(sql, params)
+        if record_type is not None:
+            cur.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
+                        (record_type, cur.lastrowid, source))
+
+    def _write_loop(self, filepath):
+        """
+        Insert queued rows in batched transactions until a None entry is found in the queue.
+
+        Runs in the background writer thread, using its own connection to the database.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to the database file.
+        """
+        con = sqlite3.connect(filepath, timeout=60.)
+        cur = con.cursor()
+        q = self._queue
+        done = False
+
+        while not done:
+            # block until something arrives, then collect until the commit interval expires
+            batch = [q.get()]
+            deadline = time.perf_counter() + self._commit_interval
+            while batch[-1] is not None:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0.:
+                    break
+                try:
+                    batch.append(q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            done = batch[-1] is None
+            if done:
+                batch.pop()
+
+            if batch and self._writer_error is None:
+                try:
+                    with con:
+                        for entry in batch:
+                            self._insert(cur, *entry)
+                except Exception as err:
+                    # keep draining the queue so the recording thread never blocks on it
+                    self._writer_error = err
+
+            for _ in range(len(batch) + done):
+                q.task_done()
+
+        con.close()
+
+    def _flush(self):
+        """
+        Wait until all queued rows have been committed by the background writer.
+        """
+        if self._writer is not None:
+            self._queue.join()
+
+    def _stop_writer(self):
+        """
+        Commit all queued rows and stop the background writer.
+        """
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+
+            if self._writer_error is not None:
+                err, self._writer_error = self._writer_error, None
+                raise RuntimeError(f"Background writer for '{self._filepath}' failed.") from err
+
     def startup(self, recording_requester, comm=None):
         """
         Prepare for a new run and create/update the abs2prom and prom2abs variables.
@@ -371,7 +766,6 @@ class SqliteRecorder(CaseRecorder):
                     objectives[name] = data
 
         if self.connection:
-
             if driver is not None:
                 desvars = driver._designvars
                 responses = driver._responses
@@ -501,33 +895,15 @@ class SqliteRecorder(CaseRecorder):
                                "must be called after adding a recorder.")
 
         if self.connection:
-            outputs = data['output']
-            inputs = data['input']
-            residuals = data['residual']
+            outputs_text, inputs_text, residuals_text = self._serialize_case(data)
 
-            # convert to list so this can be dumped as JSON
-            for in_out_resid in (inputs, outputs, residuals):
-                if in_out_resid is None:
-                    continue
-                for var in in_out_resid:
-                    in_out_resid[var] = make_serializable(in_out_resid[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO driver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs, outputs, residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('driver', c.lastrowid, driver._get_name()))
+            self._write("INSERT INTO driver_iterations(counter, iteration_coordinate, "
+                        "timestamp, success, msg, inputs, outputs, residuals) "
+                        "VALUES(?,?,?,?,?,?,?,?)",
+                        (self._counter, self._iteration_coordinate,
+                         metadata['timestamp'], metadata['success'], metadata['msg'],
+                         inputs_text, outputs_text, residuals_text),
+                        'driver', driver._get_name())
 
     def record_iteration_problem(self, problem, data, metadata):
         """
@@ -549,10 +925,6 @@ class SqliteRecorder(CaseRecorder):
                                "must be called after adding a recorder.")
 
         if self.connection:
-            outputs = data['output']
-            inputs = data['input']
-            residuals = data['residual']
-
             driver = problem.driver
             if problem.recording_options['record_derivatives'] and \
                driver._designvars and driver._responses:
@@ -562,34 +934,20 @@ class SqliteRecorder(CaseRecorder):
             totals_array = dict_to_structured_array(totals)
             totals_blob = array_to_blob(totals_array)
 
-            # convert to list so this can be dumped as JSON
-            for in_out_resid in (inputs, outputs, residuals):
-                if in_out_resid is None:
-                    continue
-                for var in in_out_resid:
-                    in_out_resid[var] = make_serializable(in_out_resid[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
+            outputs_text, inputs_text, residuals_text = self._serialize_case(data)
 
             abs_err = data['abs'] if 'abs' in data else None
             rel_err = data['rel'] if 'rel' in data else None
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO problem_cases(counter, case_name, "
-                          "timestamp, success, msg, inputs, outputs, residuals, jacobian, "
-                          "abs_err, rel_err ) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?,?)",
-                          (self._counter, metadata['name'],
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text, totals_blob,
-                           abs_err, rel_err))
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('problem', c.lastrowid, metadata['name']))
+            self._write("INSERT INTO problem_cases(counter, case_name, "
+                        "timestamp, success, msg, inputs, outputs, residuals, jacobian, "
+                        "abs_err, rel_err ) "
+                        "VALUES(?,?,?,?,?,?,?,?,?,?,?)",
+                        (self._counter, metadata['name'],
+                         metadata['timestamp'], metadata['success'], metadata['msg'],
+                         inputs_text, outputs_text, residuals_text, totals_blob,
+                         abs_err, rel_err),
+                        'problem', metadata['name'])
 
     def record_iteration_system(self, system, data, metadata):
         """
@@ -611,36 +969,20 @@ class SqliteRecorder(CaseRecorder):
                                "must be called after adding a recorder.")
 
         if self.connection:
-            inputs = data['input']
-            outputs = data['output']
-            residuals = data['residual']
+            outputs_text, inputs_text, residuals_text = self._serialize_case(data)
 
-            # convert to list so this can be dumped as JSON
-            for i_o_r in (inputs, outputs, residuals):
-                for var, dat in i_o_r.items():
-                    i_o_r[var] = make_serializable(dat)
+            # get the pathname of the source system
+            source_system = system.pathname
+            if source_system == '':
+                source_system = 'root'
 
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO system_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs , outputs , residuals ) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
-
-                # get the pathname of the source system
-                source_system = system.pathname
-                if source_system == '':
-                    source_system = 'root'
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('system', c.lastrowid, source_system))
+            self._write("INSERT INTO system_iterations(counter, iteration_coordinate, "
+                        "timestamp, success, msg, inputs , outputs , residuals ) "
+                        "VALUES(?,?,?,?,?,?,?,?)",
+                        (self._counter, self._iteration_coordinate,
+                         metadata['timestamp'], metadata['success'], metadata['msg'],
+                         inputs_text, outputs_text, residuals_text),
+                        'system', source_system)
 
     def record_iteration_solver(self, solver, data, metadata):
         """
@@ -664,49 +1006,32 @@ class SqliteRecorder(CaseRecorder):
         if self.connection:
             abs = data['abs']
             rel = data['rel']
-            inputs = data['input']
-            outputs = data['output']
-            residuals = data['residual']
 
-            # convert to list so this can be dumped as JSON
-            for i_o_r in (inputs, outputs, residuals):
-                if i_o_r is None:
-                    continue
-                for var in i_o_r:
-                    i_o_r[var] = make_serializable(i_o_r[var])
+            outputs_text, inputs_text, residuals_text = self._serialize_case(data)
 
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
+            # get the pathname of the source system
+            source_system = solver._system().pathname
+            if source_system == '':
+                source_system = 'root'
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO solver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, abs_err, rel_err, "
-                          "solver_inputs, solver_output, solver_residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           abs, rel, inputs_text, outputs_text, residuals_text))
-
-                # get the pathname of the source system
-                source_system = solver._system().pathname
-                if source_system == '':
-                    source_system = 'root'
-
-                # get solver type from SOLVER class attribute to determine the solver pathname
-                solver_type = solver.SOLVER[0:2]
-                if solver_type == 'NL':
-                    source_solver = source_system + '.nonlinear_solver'
-                elif solver_type == 'LS':
-                    source_solver = source_system + '.nonlinear_solver.linesearch'
-                else:
-                    raise RuntimeError("Solver type '%s' not recognized during recording. "
-                                       "Expecting NL or LS" % solver.SOLVER)
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('solver', c.lastrowid, source_solver))
+            # get solver type from SOLVER class attribute to determine the solver pathname
+            solver_type = solver.SOLVER[0:2]
+            if solver_type == 'NL':
+                source_solver = source_system + '.nonlinear_solver'
+            elif solver_type == 'LS':
+                source_solver = source_system + '.nonlinear_solver.linesearch'
+            else:
+                raise RuntimeError("Solver type '%s' not recognized during recording. "
+                                   "Expecting NL or LS" % solver.SOLVER)
+
+            self._write("INSERT INTO solver_iterations(counter, iteration_coordinate, "
+                        "timestamp, success, msg, abs_err, rel_err, "
+                        "solver_inputs, solver_output, solver_residuals) "
+                        "VALUES(?,?,?,?,?,?,?,?,?,?)",
+                        (self._counter, self._iteration_coordinate,
+                         metadata['timestamp'], metadata['success'], metadata['msg'],
+                         abs, rel, inputs_text, outputs_text, residuals_text),
+                        'solver', source_solver)
 
     def record_viewer_data(self, model_viewer_data, key='Driver'):
         """
@@ -827,30 +1152,81 @@ class SqliteRecorder(CaseRecorder):
             Dictionary containing execution metadata.
         """
         if self.connection:
+            sparsity = self._get_deriv_sparsity(recording_requester, data)
 
-            data_array = dict_to_structured_array(data)
-            data_blob = array_to_blob(data_array)
+            if sparsity is None:
+                data_array = dict_to_structured_array(data)
+                data_blob = array_to_blob(data_array)
+            else:
+                # only the nonzero values, aligned to the sparsity recorded once per run
+                layout_id, sparsity = sparsity
+                nzvals = [data[key][rows, cols] for key, (rows, cols) in sparsity.items()]
+                data_blob = sqlite3.Binary(np.int64(layout_id).tobytes() +
+                                           np.concatenate(nzvals).astype(np.float64).tobytes())
+
+            self._write("INSERT INTO driver_derivatives(counter, iteration_coordinate, "
+                        "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
+                        (self._counter, self._iteration_coordinate,
+                         metadata['timestamp'], metadata['success'], metadata['msg'],
+                         data_blob))
+
+    def _get_deriv_sparsity(self, recording_requester, data):
+        """
+        Get the sparsity of the derivatives, adding it to the layouts table if necessary.
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
+        Parameters
+        ----------
+        recording_requester : object
+            Driver in need of recording.
+        data : dict
+            Dictionary containing derivatives keyed by 'of!wrt' to be recorded.
 
-                c.execute("INSERT INTO driver_derivatives(counter, iteration_coordinate, "
-                          "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           data_blob))
+        Returns
+        -------
+        tuple or None
+            The id of the layout and a dict mapping 'of!wrt' keys to the rows and columns
+            of the nonzero values of each sub-jacobian, or None if the sparsity is not known.
+        """
+        total_jac = getattr(recording_requester, '_total_jac', None)
+        if total_jac is None:
+            return None
+
+        sparsity = total_jac.get_recorded_sparsity()
+        if sparsity is None or sparsity.keys() != data.keys():
+            return None
+
+        if self._deriv_layout is None or self._deriv_layout[1] is not sparsity:
+            layout_id = len(self._layouts) + 1
+            self._layouts[('derivatives', layout_id)] = layout_id
+            layout = {'derivatives': [[key, data[key].shape, rows.tolist(), cols.tolist()]
+                                      for key, (rows, cols) in sparsity.items()]}
+            self._write("INSERT INTO layouts(id, layout) VALUES(?,?)",
+                        (layout_id, json.dumps(layout)))
+            self._deriv_layout = (layout_id, sparsity)
+
+        return self._deriv_layout
 
     def shutdown(self):
         """
         Shut down the recorder.
         """
-        # close database connection
-        if self._record_metadata and self.metadata_connection and \
-                self.metadata_connection != self.connection:
-            self.metadata_connection.close()
-
-        if self.connection:
-            self.connection.close()
+        try:
+            # write out everything still queued for the background writer
+            self._stop_writer()
+
+            if self.connection and (self._compression or self._quantize):
+                ratio = self._raw_bytes / self._stored_bytes if self._stored_bytes else 1.
+                print(f"SqliteRecorder '{self._filepath}': {self._raw_bytes} bytes of case data "
+                      f"stored as {self._stored_bytes} bytes (ratio {ratio:.2f}), "
+                      f"quantization and compression took {self._encode_time:.3f} s.")
+        finally:
+            # close database connection
+            if self._record_metadata and self.metadata_connection and \
+                    self.metadata_connection != self.connection:
+                self.metadata_connection.close()
+
+            if self.connection:
+                self.connection.close()
 
         # sqlite close() does not always write until garbage collection occurs.
         # If collection is not forced like this and a reader is immediately opened on
@@ -863,6 +1239,7 @@ class SqliteRecorder(CaseRecorder):
         Delete all the recordings.
         """
         if self.connection:
+            self._flush()
             self.connection.execute("DELETE FROM global_iterations")
             self.connection.execute("DELETE FROM driver_iterations")
             self.connection.execute("DELETE FROM driver_derivatives")
@@ -872,3 +1249,6 @@ class SqliteRecorder(CaseRecorder):
             self.connection.execute("DELETE FROM driver_metadata")
             self.connection.execute("DELETE FROM system_metadata")
             self.connection.execute("DELETE FROM solver_metadata")
+            self.connection.execute("DELETE FROM layouts")
+            self._layouts = {}
+            self._deriv_layout = None
@@ -0,0 +1,174 @@
+""" Unit tests for the ArrayRecorder and ArrayCaseReader. """
+
+import json
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.test_suite.components.paraboloid import Paraboloid
+from openmdao.test_suite.components.sellar import SellarDerivativesGrouped, SellarProblem
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+@use_tempdirs
+class TestArrayRecorder(unittest.TestCase):
+
+    def test_sellar(self):
+        # compare against the same cases recorded by SqliteRecorder
+        prob = SellarProblem(SellarDerivativesGrouped)
+        prob.setup()
+        prob.driver = om.ScipyOptimizeDriver(tol=1e-9, disp=False)
+        prob.driver.recording_options['includes'] = ['*']
+
+        recorder = om.ArrayRecorder('cases', initial_rows=2)
+        sqlite_recorder = om.SqliteRecorder('cases.sql', record_viewer_data=False)
+        prob.model.mda.nonlinear_solver = om.NonlinearBlockGS()
+        for rec in (recorder, sqlite_recorder):
+            prob.driver.add_recorder(rec)
+            prob.model.add_recorder(rec)
+            prob.model.mda.nonlinear_solver.add_recorder(rec)
+
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.ArrayCaseReader(prob.get_outputs_dir() / 'cases')
+        sqlite_cr = om.CaseReader(prob.get_outputs_dir() / 'cases.sql')
+
+        self.assertEqual(cr.list_sources(), ['driver', 'root', 'root.mda.nonlinear_solver'])
+        self.assertEqual(cr.list_source_vars('driver')['outputs'],
+                         sqlite_cr.list_source_vars('driver', out_stream=None)['outputs'])
+
+        for source, names in [('driver', ['z', 'x', 'obj', 'con1', 'y1']),
+                              ('root', ['z', 'obj', 'y2', 'obj_cmp.y2']),
+                              ('root.mda.nonlinear_solver', ['y1', 'mda.d2.y2'])]:
+            cases = sqlite_cr.get_cases(source, recurse=False)
+            data = cr.get_source_data(source)
+
+            # rows were added beyond the initial allocation, and the file was truncated
+            self.assertEqual(len(data), len(cases))
+            self.assertEqual(list(data['counter']), [case.counter for case in cases])
+            self.assertEqual(list(data['success']), [1] * len(cases))
+
+            history = cr.get_val_history(names, source)
+            sqlite_history = sqlite_cr.get_val_history(names, source)
+            for name in names:
+                assert_near_equal(history[name], sqlite_history[name], 1e-15)
+
+        data = cr.get_source_data('root.mda.nonlinear_solver')
+        assert_near_equal(np.asarray(data['abs_err']),
+                          np.array([case.abs_err for case in
+                                    sqlite_cr.get_cases('root.mda.nonlinear_solver')]))
+
+        # completed files are ordinary .npy files
+        data = np.load(prob.get_outputs_dir() / 'cases' / 'driver.npy')
+        self.assertEqual(len(data), len(sqlite_cr.list_cases('driver', recurse=False,
+                                                            out_stream=None)))
+
+        # values are views of the file
+        history = cr.get_val_history('z')
+        self.assertIsNotNone(history['z'].base)
+        self.assertFalse(history['z'].flags.writeable)
+
+    def test_units(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', om.ExecComp('y = 2.0 * x', x={'units': 'm'},
+                                                     y={'units': 'ft'}), promotes=['*'])
+        prob.model.add_recorder(om.ArrayRecorder('cases'))
+        prob.setup()
+
+        for x in (1., 2., 3.):
+            prob.set_val('x', x, units='m')
+            prob.run_model()
+
+        prob.cleanup()
+
+        cr = om.ArrayCaseReader(prob.get_outputs_dir() / 'cases')
+        history = cr.get_val_history(['x', 'comp.y'], source='root', units={'x': 'cm'})
+        assert_near_equal(history['x'], [[100.], [200.], [300.]], 1e-12)
+        assert_near_equal(history['comp.y'], [[2.], [4.], [6.]], 1e-12)
+
+        with self.assertRaises(TypeError) as cm:
+            cr.get_val_history('y', source='root', units='degK')
+        self.assertEqual(str(cm.exception),
+                         "Can't express variable 'y' with units of 'ft' in units of 'degK'.")
+
+        with self.assertRaises(KeyError) as cm:
+            cr.get_val_history('foo', source='root')
+        self.assertEqual(str(cm.exception), "'Variable name \"foo\" not found.'")
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_val_history('x', source='driver')
+        self.assertEqual(str(cm.exception), "Source not found: driver")
+
+    def test_read_while_recording(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        prob.model.add_design_var('x', lower=-50., upper=50.)
+        prob.model.add_design_var('y', lower=-50., upper=50.)
+        prob.model.add_objective('f_xy')
+
+        xs = np.linspace(0., 10., 11)
+        prob.driver = om.DOEDriver(om.ListGenerator([[('x', x), ('y', 0.)] for x in xs]))
+        prob.driver.add_recorder(om.ArrayRecorder('cases', initial_rows=4))
+        prob.setup()
+        prob.run_driver()
+
+        # not cleaned up yet, so the file still has unused rows at the end
+        dirpath = prob.get_outputs_dir() / 'cases'
+        with open(dirpath / 'driver.json') as f:
+            self.assertFalse(json.load(f)['complete'])
+        self.assertEqual(len(np.load(dirpath / 'driver.npy', mmap_mode='r')), 16)
+
+        cr = om.ArrayCaseReader(dirpath)
+        history = cr.get_val_history(['x', 'f_xy'])
+        assert_near_equal(history['x'].ravel(), xs)
+        assert_near_equal(history['f_xy'].ravel(), (xs - 3.) ** 2 + xs * 0. + 16. - 3.)
+
+        prob.cleanup()
+
+        with open(dirpath / 'driver.json') as f:
+            self.assertTrue(json.load(f)['complete'])
+        self.assertEqual(len(np.load(dirpath / 'driver.npy', mmap_mode='r')), 11)
+
+    def test_non_numeric(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', om.ExecComp('y = 2.0 * x'))
+        comp.add_discrete_output('label', 'abc')
+        prob.model.add_recorder(om.ArrayRecorder('cases'))
+        prob.setup()
+
+        with self.assertRaises(TypeError) as cm:
+            prob.run_model()
+        self.assertEqual(str(cm.exception),
+                         "ArrayRecorder can only record numeric variables, but output "
+                         "'comp.label' from 'root' has value 'abc'.")
+
+    def test_unsupported(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', om.ExecComp('y = 2.0 * x'))
+        prob.add_recorder(om.ArrayRecorder('cases'))
+        prob.setup()
+
+        with self.assertRaises(ValueError) as cm:
+            prob.final_setup()
+        self.assertEqual(str(cm.exception),
+                         "ArrayRecorder can't record Problem cases. Attach it to a Driver, "
+                         "System or Solver instead.")
+
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', om.ExecComp('y = 2.0 * x'))
+        prob.driver.add_recorder(om.ArrayRecorder('cases'))
+        prob.driver.recording_options['record_derivatives'] = True
+        prob.setup()
+
+        with self.assertRaises(ValueError) as cm:
+            prob.final_setup()
+        self.assertEqual(str(cm.exception),
+                         "ArrayRecorder can't record derivatives. Set the 'record_derivatives' "
+                         "recording option of the Driver to False.")
+
+
+if __name__ == '__main__':
+    unittest.main()
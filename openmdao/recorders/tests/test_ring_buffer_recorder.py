@@ -0,0 +1,162 @@
+""" Unit tests for the RingBufferRecorder. """
+
+import unittest
+
+import openmdao.api as om
+from openmdao.test_suite.components.sellar import SellarDerivativesGrouped, SellarProblem
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+def _sellar(maxiter, *recorders):
+    prob = SellarProblem(SellarDerivativesGrouped)
+    prob.setup()
+    solver = prob.model.mda.nonlinear_solver = om.NonlinearBlockGS(maxiter=maxiter, iprint=-1)
+    for rec in recorders:
+        solver.add_recorder(rec)
+        prob.model.add_recorder(rec)
+    return prob
+
+
+@use_tempdirs
+class TestRingBufferRecorder(unittest.TestCase):
+
+    def test_flush_on_failure(self):
+        # compare against the same iterations recorded by SqliteRecorder
+        recorder = om.RingBufferRecorder('ring.sql', capacity=3, record_viewer_data=False)
+        sqlite_recorder = om.SqliteRecorder('cases.sql', record_viewer_data=False)
+        prob = _sellar(5, recorder, sqlite_recorder)
+
+        prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'ring.sql')
+        sqlite_cr = om.CaseReader(prob.get_outputs_dir() / 'cases.sql')
+
+        source = 'root.mda.nonlinear_solver'
+
+        # the iteration of the model ends after the failure, and is written at shutdown
+        self.assertEqual(cr.list_sources(out_stream=None), ['root.mda.nonlinear_solver', 'root'])
+        self.assertEqual(len(cr.list_cases('root', recurse=False, out_stream=None)), 1)
+
+        cases = cr.get_cases(source, recurse=False)
+        sqlite_cases = sqlite_cr.get_cases(source, recurse=False)
+        self.assertTrue(len(sqlite_cases) > 3)
+        self.assertEqual(len(cases), 3)
+
+        for case, sqlite_case in zip(cases, sqlite_cases[-3:]):
+            self.assertEqual(case.name, sqlite_case.name)
+            self.assertEqual(case.counter, sqlite_case.counter)
+            assert_near_equal(case.abs_err, sqlite_case.abs_err, 1e-15)
+            assert_near_equal(case.rel_err, sqlite_case.rel_err, 1e-15)
+            for name in ('y1', 'y2'):
+                assert_near_equal(case[name], sqlite_case[name], 1e-15)
+
+        # the last iteration of the failed solver is marked as a failure
+        self.assertEqual([case.success for case in cases], [1, 1, 0])
+        self.assertEqual(cases[-1].msg, "Solver 'NL: NLBGS' on system 'mda' failed to converge "
+                                        "in 5 iterations.")
+
+    def test_flush_on_demand(self):
+        recorder = om.RingBufferRecorder('ring.sql', capacity=2, flush_on_failure=False,
+                                         record_viewer_data=False)
+        prob = _sellar(3, recorder)
+
+        # a failure doesn't write anything
+        prob.run_model()
+        self.assertEqual(recorder.flush(), 3)
+
+        # nothing left to write
+        self.assertEqual(recorder.flush(), 0)
+
+        prob.model.mda.nonlinear_solver.options['maxiter'] = 100
+        prob.run_model()
+        self.assertEqual(recorder.flush(), 3)
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'ring.sql')
+
+        # only the last 2 iterations of the solver are kept from each run
+        self.assertEqual([case.counter for case in
+                          cr.get_cases('root.mda.nonlinear_solver', recurse=False)], [1, 2, 7, 8])
+        self.assertEqual(len(cr.list_cases('root', recurse=False, out_stream=None)), 2)
+
+        case = cr.get_cases('root', recurse=False)[-1]
+        assert_near_equal(case['y1'], 25.58830237, 1e-6)
+
+    def test_system_recorder(self):
+        # a failure of the solver of a parent flushes the iterations kept for a component
+        recorder = om.RingBufferRecorder('ring.sql', capacity=2, record_viewer_data=False)
+        prob = _sellar(4)
+        prob.model.mda.d1.add_recorder(recorder)
+
+        prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'ring.sql')
+        self.assertEqual(cr.list_sources(out_stream=None), ['root.mda.d1'])
+        self.assertEqual(len(cr.list_cases('root.mda.d1', recurse=False, out_stream=None)), 2)
+
+    def test_analysis_error(self):
+        class FailingComp(om.ExplicitComponent):
+            def setup(self):
+                self.add_input('x', 1.)
+                self.add_output('y', 1.)
+
+            def compute(self, inputs, outputs):
+                if inputs['x'] > 2.:
+                    raise om.AnalysisError('x is too large')
+                outputs['y'] = 2. * inputs['x']
+
+        recorder = om.RingBufferRecorder('ring.sql', capacity=5, record_viewer_data=False)
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', FailingComp(), promotes=['*'])
+        prob.model.add_design_var('x')
+        prob.model.add_objective('y')
+        prob.model.add_recorder(recorder)
+
+        # the DOEDriver catches the AnalysisError and goes on with the next case
+        prob.driver = om.DOEDriver(om.ListGenerator([[('x', x)] for x in (1., 2., 3., 1.5)]))
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'ring.sql')
+        cases = cr.get_cases('root', recurse=False)
+        self.assertEqual([case.success for case in cases], [1, 1, 0, 1])
+        self.assertEqual(cases[2].msg, "'comp' <class FailingComp>: Error calling compute(), "
+                                       "x is too large")
+        assert_near_equal([case['y'] for case in cases[:2]], [[2.], [4.]], 1e-15)
+
+    def test_flush_at_shutdown(self):
+        recorder = om.RingBufferRecorder('ring.sql', capacity=2, flush_on_failure=False,
+                                         record_viewer_data=False)
+        prob = _sellar(3, recorder)
+
+        # the failure isn't written until shutdown
+        prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'ring.sql')
+        cases = cr.get_cases('root.mda.nonlinear_solver', recurse=False)
+        self.assertEqual([case.success for case in cases], [1, 0])
+        self.assertEqual(len(cr.list_cases('root', recurse=False, out_stream=None)), 1)
+
+        # without a failure, the kept iterations are discarded
+        recorder = om.RingBufferRecorder('ring2.sql', record_viewer_data=False)
+        prob = _sellar(100, recorder)
+        prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'ring2.sql')
+        self.assertEqual(cr.list_sources(out_stream=None), [])
+
+    def test_capacity(self):
+        with self.assertRaises(ValueError) as cm:
+            om.RingBufferRecorder('ring.sql', capacity=0)
+        self.assertEqual(str(cm.exception),
+                         "RingBufferRecorder: capacity must be at least 1, but 0 was given.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+""" Unit tests for reading and merging multiple case recording files. """
+
+import os
+import shutil
+import sqlite3
+import argparse
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.recorders.sqlite_reader import SqliteCaseReader
+from openmdao.recorders.sqlite_multi_reader import SqliteMultiCaseReader
+from openmdao.recorders.sqlite_merge import sqlite_merge, _sqlite_merge_setup_parser, \
+    _sqlite_merge_cmd
+from openmdao.test_suite.components.paraboloid import Paraboloid
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.record_util import get_recording_files
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+def run_doe(filename, xs, prefix, record_model=False, record_desvars=True, binary_data=False,
+            compression=None):
+    """
+    Run a DOE of the paraboloid, recording to the given file.
+    """
+    prob = om.Problem(name=prefix)
+    model = prob.model
+    model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+    model.add_design_var('x', lower=-50., upper=50.)
+    model.add_design_var('y', lower=-50., upper=50.)
+    model.add_objective('f_xy')
+
+    recorder = om.SqliteRecorder(os.path.join(os.getcwd(), filename), record_viewer_data=False,
+                                 binary_data=binary_data, compression=compression)
+
+    prob.driver = om.DOEDriver(om.ListGenerator([[('x', x), ('y', 2. * x)] for x in xs]))
+    prob.driver.recording_options['record_desvars'] = record_desvars
+    prob.driver.add_recorder(recorder)
+    if record_model:
+        model.add_recorder(recorder)
+
+    prob.setup()
+    prob.run_driver(case_prefix=prefix)
+    prob.cleanup()
+
+
+@use_tempdirs
+class TestSqliteMerge(unittest.TestCase):
+
+    def setUp(self):
+        run_doe('cases.sql_0', [1., 2., 3.], 'p0')
+        run_doe('cases.sql_1', [4., 5.], 'p1', record_model=True)
+
+        # a file containing only metadata should be skipped when matching a glob pattern
+        shutil.copy('cases.sql_0', 'cases.sql_meta')
+        with sqlite3.connect('cases.sql_meta') as con:
+            for table in ('global_iterations', 'driver_iterations', 'driver_derivatives',
+                          'problem_cases', 'system_iterations', 'solver_iterations'):
+                con.execute(f"DROP TABLE {table}")
+        con.close()
+
+        # ordered by counter, and model cases are counted too in the second file
+        self.expected_driver = ['p0_rank0:DOEDriver_List|0',  # counter 1
+                                'p0_rank0:DOEDriver_List|1',  # counter 2
+                                'p1_rank0:DOEDriver_List|0',  # counter 2
+                                'p0_rank0:DOEDriver_List|2',  # counter 3
+                                'p1_rank0:DOEDriver_List|1']  # counter 4
+
+    def test_get_recording_files(self):
+        self.assertEqual(get_recording_files('cases.sql_*'), ['cases.sql_0', 'cases.sql_1'])
+        self.assertEqual(get_recording_files(['cases.sql_1', 'cases.sql_0']),
+                         ['cases.sql_1', 'cases.sql_0'])
+        self.assertEqual(get_recording_files('cases.sql_0'), ['cases.sql_0'])
+
+        self.assertIsInstance(om.CaseReader('cases.sql_0'), SqliteCaseReader)
+        self.assertIsInstance(om.CaseReader('cases.sql_?'), SqliteMultiCaseReader)
+
+    def test_multi_reader(self):
+        cr = om.CaseReader('cases.sql_*')
+        self.assertIsInstance(cr, SqliteMultiCaseReader)
+
+        self.assertEqual(cr.list_sources(out_stream=None), ['driver', 'root'])
+        self.assertEqual(cr.list_cases('driver', recurse=False, out_stream=None),
+                         self.expected_driver)
+        self.assertEqual(len(cr.list_cases(out_stream=None)), 7)
+        self.assertEqual(cr.list_cases('root', recurse=False, out_stream=None),
+                         ['p1_rank0:DOEDriver_List|0|root._solve_nonlinear|0',
+                          'p1_rank0:DOEDriver_List|1|root._solve_nonlinear|1'])
+
+        xs = [1., 2., 4., 3., 5.]
+        cases = cr.get_cases('driver', recurse=False)
+        self.assertEqual([case.name for case in cases], self.expected_driver)
+        for case, x in zip(cases, xs):
+            assert_near_equal(case.get_val('x'), x)
+            assert_near_equal(case.get_val('y'), 2. * x)
+
+        assert_near_equal(cr.get_case('p1_rank0:DOEDriver_List|1').get_val('x'), 5.)
+        assert_near_equal(cr.get_case(0).get_val('x'), 1.)
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_case('foo')
+        self.assertEqual(cm.exception.args, ('Case not found:', 'foo'))
+
+        history = cr.get_val_history(['x', 'f_xy'])
+        assert_near_equal(history['x'], np.array(xs).reshape((5, 1)))
+        assert_near_equal(history['f_xy'],
+                          np.array([case.get_val('f_xy') for case in cases]).reshape((5, 1)))
+
+        # cases nested under each driver case come from whichever file contains it
+        nested = cr.list_cases('driver', recurse=True, flat=False, out_stream=None)
+        self.assertEqual(list(nested), self.expected_driver)
+        self.assertEqual(list(nested['p1_rank0:DOEDriver_List|0']),
+                         ['p1_rank0:DOEDriver_List|0|root._solve_nonlinear|0'])
+
+    def test_sqlite_merge(self):
+        for binary_data, compression in ((False, None), (True, None), (True, 'zlib')):
+            # different recorded variables, so layouts of binary data differ between files
+            run_doe('cases.sql_0', [1., 2., 3.], 'p0', record_desvars=False,
+                    binary_data=binary_data, compression=compression)
+            run_doe('cases.sql_1', [4., 5.], 'p1', record_model=True, binary_data=binary_data,
+                    compression=compression)
+
+            count = sqlite_merge('cases.sql_*', 'merged.sql')
+            self.assertEqual(count, 7)
+
+            merged = om.CaseReader('merged.sql')
+            multi = om.CaseReader(['cases.sql_0', 'cases.sql_1'])
+
+            case_ids = multi.list_cases(out_stream=None)
+            self.assertEqual(merged.list_cases(out_stream=None), case_ids)
+            self.assertEqual(merged.list_cases('driver', recurse=False, out_stream=None),
+                             self.expected_driver)
+
+            for case_id in case_ids:
+                merged_case = merged.get_case(case_id)
+                multi_case = multi.get_case(case_id)
+                self.assertEqual(merged_case.source, multi_case.source)
+                for name, val in multi_case.outputs.items():
+                    assert_near_equal(merged_case.outputs[name], val)
+
+            assert_near_equal(merged.get_val_history('f_xy')['f_xy'],
+                              multi.get_val_history('f_xy')['f_xy'])
+
+            if binary_data:
+                self.assertEqual(len(merged._layouts), 3)
+
+    def test_sqlite_merge_cmd(self):
+        parser = argparse.ArgumentParser()
+        _sqlite_merge_setup_parser(parser)
+        options = parser.parse_args(['cases.sql_*', '-o', 'merged.sql'])
+        _sqlite_merge_cmd(options, [])
+
+        cr = om.CaseReader('merged.sql')
+        self.assertEqual(cr.list_cases('driver', recurse=False, out_stream=None),
+                         self.expected_driver)
+
+        with self.assertRaises(ValueError) as cm:
+            sqlite_merge(['cases.sql_0', 'merged.sql'], 'merged.sql')
+        self.assertEqual(str(cm.exception),
+                         "The merged file, merged.sql, is also one of the files to merge.")
+
+
+if __name__ == '__main__':
+    unittest.main()
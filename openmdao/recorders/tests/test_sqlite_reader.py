@@ -2,6 +2,7 @@
 
 import sys
 import os
+import sqlite3
 import unittest
 import platform
 
@@ -15,7 +16,7 @@ import openmdao.api as om
 from openmdao import __version__ as openmdao_version
 from openmdao.recorders.sqlite_recorder import format_version
 from openmdao.recorders.sqlite_reader import SqliteCaseReader
-from openmdao.recorders.case import PromAbsDict
+from openmdao.recorders.case import PromAbsDict, DerivativesDict, _NOT_DECODED
 from openmdao.recorders.tests.recorder_test_utils import assert_model_matches_case
 from openmdao.core.tests.test_discrete import ModCompEx, ModCompIm
 from openmdao.core.tests.test_expl_comp import RectangleComp, RectangleCompWithTags
@@ -3184,6 +3185,352 @@ class DummyClass(object):
         objs = case.get_objectives()
         self.assertEqual(set(objs.keys()), {'z'})
 
+    def test_binary_data(self):
+        # cases recorded as binary blobs should read back the same as those recorded as JSON
+        def run(recorder):
+            prob = SellarProblem(SellarDerivativesGrouped)
+            prob.setup()
+            prob.driver = om.ScipyOptimizeDriver(tol=1e-9, disp=False)
+            prob.driver.recording_options['record_inputs'] = True
+            prob.driver.recording_options['record_residuals'] = True
+            prob.driver.add_recorder(recorder)
+            prob.model.add_recorder(recorder)
+            nl = prob.model.mda.nonlinear_solver = om.NonlinearBlockGS()
+            nl.recording_options['record_solver_residuals'] = True
+            nl.add_recorder(recorder)
+            prob.run_driver()
+            prob.cleanup()
+            return om.CaseReader(prob.get_outputs_dir() / recorder._filepath.name)
+
+        cr_json = run(om.SqliteRecorder('json.sql', record_viewer_data=False))
+        cr_bin = run(om.SqliteRecorder('binary.sql', record_viewer_data=False, binary_data=True))
+
+        self.assertEqual(cr_bin._format_version, format_version)
+        # one layout per distinct set of recorded variables, regardless of the number of cases
+        self.assertEqual(len(cr_bin._layouts), 5)
+        self.assertEqual(cr_bin.list_cases(out_stream=None), cr_json.list_cases(out_stream=None))
+
+        for case_id in cr_json.list_cases(out_stream=None):
+            case_json = cr_json.get_case(case_id)
+            case_bin = cr_bin.get_case(case_id)
+            for attr in ('inputs', 'outputs', 'residuals'):
+                vals_json = getattr(case_json, attr)
+                vals_bin = getattr(case_bin, attr)
+                if vals_json is None:
+                    self.assertIsNone(vals_bin)
+                    continue
+                self.assertEqual(sorted(vals_bin.absolute_names()),
+                                 sorted(vals_json.absolute_names()))
+                for name in vals_json.absolute_names():
+                    assert_near_equal(vals_bin[name], vals_json[name], 1e-15)
+
+        last_case = cr_bin.get_case(cr_bin.list_cases('driver', out_stream=None)[-1])
+        assert_near_equal(last_case.get_design_vars(scaled=False)['z'], [1.97763888, 0.], 1e-6)
+        assert_near_equal(last_case['con1'], 0., 1e-6)
+
+        # values can be modified like those read from JSON
+        last_case.outputs['con1'] += 1.
+
+    def test_get_val_history(self):
+        def run(recorder):
+            prob = SellarProblem(SellarDerivativesGrouped)
+            prob.add_recorder(recorder)
+            prob.recording_options['record_inputs'] = True
+            prob.setup()
+            prob.driver = om.ScipyOptimizeDriver(tol=1e-9, disp=False)
+            prob.driver.recording_options['record_inputs'] = True
+            prob.driver.recording_options['includes'] = ['*']
+            prob.driver.add_recorder(recorder)
+            prob.model.add_recorder(recorder)
+            prob.model.mda.nonlinear_solver = om.NonlinearBlockGS()
+            prob.model.mda.nonlinear_solver.add_recorder(recorder)
+            prob.run_driver()
+            prob.record('final')
+            prob.cleanup()
+            return om.CaseReader(prob.get_outputs_dir() / recorder._filepath.name)
+
+        names = ['z', 'x', 'con1', 'mda.d1.y1', 'obj_cmp.y2', 'obj']
+
+        for binary_data in (False, True):
+            cr = run(om.SqliteRecorder('cases.sql', record_viewer_data=False,
+                                       binary_data=binary_data))
+
+            for source, srcnames in [('driver', names), ('problem', names), ('root', names),
+                                     ('root.mda.nonlinear_solver', ['mda.d1.y1', 'y2'])]:
+                cases = cr.get_cases(source, recurse=False)
+                self.assertTrue(len(cases) > 0)
+
+                # read a few rows at a time to exercise chunking
+                history = cr.get_val_history(srcnames, source=source, chunk_size=3)
+
+                self.assertEqual(list(history), srcnames)
+                for name in srcnames:
+                    expected = np.array([np.ravel(case.get_val(name)) for case in cases])
+                    assert_near_equal(history[name], expected, 1e-15)
+
+            history = cr.get_val_history('z')
+            self.assertEqual(list(history), ['z'])
+            self.assertEqual(history['z'].shape[1], 2)
+
+        with self.assertRaises(KeyError) as cm:
+            cr.get_val_history('foo')
+        self.assertEqual(str(cm.exception), "'Variable name \"foo\" not found.'")
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_val_history('z', source='root.foo')
+        self.assertEqual(str(cm.exception), "Source not found: root.foo")
+
+        with self.assertRaises(TypeError) as cm:
+            cr.get_val_history('z', units='m')
+        self.assertEqual(str(cm.exception),
+                         "Can't express variable 'z' with units of 'None' in units of 'm'.")
+
+    def test_get_val_history_units(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', om.ExecComp('y = 2.0 * x', x={'units': 'm'},
+                                                     y={'units': 'ft'}), promotes=['*'])
+        prob.model.add_recorder(om.SqliteRecorder('cases.sql', record_viewer_data=False))
+        prob.setup()
+
+        for x in (1., 2., 3.):
+            prob.set_val('x', x, units='m')
+            prob.run_model()
+
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'cases.sql')
+        history = cr.get_val_history(['x', 'y'], source='root', units={'x': 'cm'})
+
+        assert_near_equal(history['x'], [[100.], [200.], [300.]], 1e-12)
+        assert_near_equal(history['y'], [[2.], [4.], [6.]], 1e-12)
+
+        history = cr.get_val_history('comp.y', source='root', units='inch')
+        assert_near_equal(history['comp.y'], [[24.], [48.], [72.]], 1e-12)
+
+    def test_lazy_case(self):
+        prob = SellarProblem(SellarDerivativesGrouped)
+        prob.setup()
+        prob.driver = om.ScipyOptimizeDriver(tol=1e-9, disp=False)
+        prob.driver.recording_options['record_inputs'] = True
+        prob.driver.recording_options['includes'] = ['*']
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql', record_viewer_data=False,
+                                                   binary_data=True))
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(prob.get_outputs_dir() / 'cases.sql')
+        case = cr.get_case(-1)
+
+        # cases don't have a __dict__, to save memory
+        self.assertFalse(hasattr(case, '__dict__'))
+        with self.assertRaises(AttributeError):
+            case.foo = 1
+
+        # nothing is decoded until accessed
+        self.assertEqual(case._decoded, {})
+        self.assertEqual(sorted(case._payloads), ['inputs', 'outputs', 'residuals'])
+
+        # single outputs don't require the maps of all of the variables
+        z = case['z']
+        assert_near_equal(z, [1.97763888, 0.], 1e-6)
+        obj = case['obj_cmp.obj']
+        self.assertEqual(sorted(case._decoded), ['outputs'])
+        self.assertEqual(sorted(case._payloads), ['inputs', 'residuals'])
+        self.assertIs(case._outputs, _NOT_DECODED)
+        assert_near_equal(obj, case.outputs['obj'], 1e-15)
+
+        # values are shared with the maps once built
+        z += 1.
+        assert_near_equal(case.outputs['z'], [2.97763888, 1.], 1e-6)
+
+        # inputs are decoded when needed
+        self.assertEqual(sorted(case.inputs), ['x', 'y1', 'y2', 'z'])
+        assert_near_equal(case.inputs['obj_cmp.x'], case.get_val('x'), 1e-15)
+        self.assertEqual(sorted(case._payloads), ['residuals'])
+
+        # residuals were not recorded
+        self.assertIsNone(case.residuals)
+        self.assertIsNone(case.derivatives)
+        self.assertEqual(case._payloads, {})
+
+    def test_sparse_derivatives(self):
+        # with total coloring, only the nonzero derivatives are recorded
+        def run(recorder, coloring):
+            prob = om.Problem()
+            prob.model.add_subsystem('comp', om.ExecComp(['y = x**2 + 3.0*x',
+                                                          'f = x[0]**2 + x[9]'],
+                                                         x=np.ones(10), y=np.ones(10)),
+                                     promotes=['*'])
+            prob.model.add_design_var('x', lower=-10., upper=10.)
+            prob.model.add_objective('f')
+            prob.model.add_constraint('y', lower=-1.)
+            prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', disp=False)
+            if coloring:
+                prob.driver.declare_coloring(show_summary=False)
+            prob.driver.recording_options['record_derivatives'] = True
+            prob.driver.add_recorder(recorder)
+            prob.setup()
+            prob.set_val('x', np.linspace(1., 3., 10))
+            prob.run_driver()
+            prob.cleanup()
+            return om.CaseReader(prob.get_outputs_dir() / recorder._filepath.name)
+
+        cr_dense = run(om.SqliteRecorder('dense.sql', record_viewer_data=False), False)
+        cr_sparse = run(om.SqliteRecorder('sparse.sql', record_viewer_data=False), True)
+
+        # the sparsity is recorded once
+        self.assertEqual(len(cr_sparse._layouts), 1)
+        sparsity = cr_sparse._layouts[1]
+        self.assertEqual(list(sparsity), ['f!x', 'y!x'])
+        self.assertEqual(sparsity['f!x'][-2:], (0, 2))
+        self.assertEqual(sparsity['y!x'][-2:], (2, 12))
+
+        cases_dense = cr_dense.get_cases('driver')
+        cases_sparse = cr_sparse.get_cases('driver')
+        self.assertEqual(len(cases_sparse), len(cases_dense))
+
+        for case_dense, case_sparse in zip(cases_dense, cases_sparse):
+            if case_dense.derivatives is None:
+                self.assertIsNone(case_sparse.derivatives)
+                continue
+
+            derivs = case_sparse.derivatives
+            self.assertIsInstance(derivs, DerivativesDict)
+
+            # sub-jacobians are rebuilt on first access
+            self.assertIs(dict.__getitem__(derivs, ('y', 'x')), _NOT_DECODED)
+            assert_near_equal(derivs['y', 'x'], case_dense.derivatives['y', 'x'], 1e-15)
+            self.assertIsNot(dict.__getitem__(derivs, ('y', 'x')), _NOT_DECODED)
+            self.assertIs(derivs['y', 'x'], derivs['y!x'])
+
+            for key, val in case_dense.derivatives.items():
+                assert_near_equal(derivs[key], val, 1e-15)
+            self.assertEqual(sorted(derivs.keys()), sorted(case_dense.derivatives.keys()))
+            for key, val in derivs.items():
+                self.assertIsInstance(val, np.ndarray)
+
+    def test_compression(self):
+        # compressed cases should read back the same as uncompressed ones
+        def run(recorder):
+            prob = SellarProblem(SellarDerivativesGrouped)
+            prob.setup()
+            prob.driver = om.ScipyOptimizeDriver(tol=1e-9, disp=False)
+            prob.driver.recording_options['record_inputs'] = True
+            prob.driver.add_recorder(recorder)
+            nl = prob.model.mda.nonlinear_solver = om.NonlinearBlockGS()
+            nl.add_recorder(recorder)
+            stdout = sys.stdout
+            strout = StringIO()
+            sys.stdout = strout
+            try:
+                prob.run_driver()
+                prob.cleanup()
+            finally:
+                sys.stdout = stdout
+            return om.CaseReader(prob.get_outputs_dir() / recorder._filepath.name), \
+                strout.getvalue()
+
+        cr_json, summary = run(om.SqliteRecorder('json.sql', record_viewer_data=False))
+        self.assertEqual(summary, '')
+
+        for compression in ('zlib', 'lzma'):
+            for binary_data in (False, True):
+                filename = f'{compression}_{binary_data}.sql'
+                cr, summary = run(om.SqliteRecorder(filename, record_viewer_data=False,
+                                                    binary_data=binary_data,
+                                                    compression=compression))
+                self.assertIn(f"{filename}': ", summary)
+                self.assertIn('ratio', summary)
+
+                case_ids = cr_json.list_cases(out_stream=None)
+                self.assertEqual(cr.list_cases(out_stream=None), case_ids)
+                for case_id in case_ids:
+                    case_json = cr_json.get_case(case_id)
+                    case = cr.get_case(case_id)
+                    for name in case_json.outputs.absolute_names():
+                        assert_near_equal(case.outputs[name], case_json.outputs[name], 1e-15)
+                    if case_json.inputs is not None:
+                        for name in case_json.inputs.absolute_names():
+                            assert_near_equal(case.inputs[name], case_json.inputs[name], 1e-15)
+
+                assert_near_equal(cr.get_val_history(['z', 'obj']),
+                                  cr_json.get_val_history(['z', 'obj']), 1e-15)
+
+        with self.assertRaises(ValueError) as cm:
+            om.SqliteRecorder('cases.sql', compression='gzip')
+        self.assertEqual(str(cm.exception),
+                         "SqliteRecorder: compression must be one of None, 'zlib' or 'lzma', "
+                         "but 'gzip' was given.")
+
+    def test_quantize(self):
+        def run(recorder):
+            prob = om.Problem()
+            prob.model.add_subsystem('comp', om.ExecComp(['y = 2.0 * x', 'z = 3.0 * x'],
+                                                         x=np.ones(3), y=np.ones(3),
+                                                         z=np.ones(3)), promotes=['*'])
+            prob.model.add_recorder(recorder)
+            prob.setup()
+
+            for x in (1. / 3., 1. / 7.):
+                prob.set_val('x', x * np.arange(1, 4))
+                prob.run_model()
+
+            prob.cleanup()
+            return om.CaseReader(prob.get_outputs_dir() / recorder._filepath.name)
+
+        xs = np.array([1. / 3., 1. / 7.]).reshape((2, 1)) * np.arange(1, 4)
+
+        for binary_data in (False, True):
+            filename = f'cases_{binary_data}.sql'
+            recorder = om.SqliteRecorder(filename, record_viewer_data=False,
+                                         binary_data=binary_data,
+                                         quantize={'*.y': 'float32', '*.z': 3})
+            cr = run(recorder)
+
+            history = cr.get_val_history(['x', 'y', 'z'], source='root')
+            assert_near_equal(history['x'], xs, 1e-15)
+            assert_near_equal(history['y'], 2. * xs, 1e-7)
+            self.assertTrue(np.all(history['y'].astype(np.float32) ==
+                                   (2. * xs).astype(np.float32)))
+            self.assertTrue(np.all(history['z'] == np.round(3. * xs, 3)))
+
+            case = cr.get_case(-1)
+            assert_near_equal(case.get_val('x'), xs[-1], 1e-15)
+            self.assertTrue(np.all(case.get_val('y').astype(np.float32) ==
+                                   (2. * xs[-1]).astype(np.float32)))
+            self.assertTrue(np.all(case.get_val('z') == np.round(3. * xs[-1], 3)))
+
+            if binary_data:
+                self.assertEqual(case.outputs['y'].dtype, np.float32)
+
+        with self.assertRaises(ValueError) as cm:
+            om.SqliteRecorder('cases.sql', quantize={'*': 'float16'})
+        self.assertEqual(str(cm.exception),
+                         "SqliteRecorder: quantize values must be 'float32' or an int number "
+                         "of decimal places, but 'float16' was given for '*'.")
+
+    def test_quantize_json_size(self):
+        # single precision values are written with their shortest representation
+        sizes = []
+        for quantize in (None, {'*': 'float32'}):
+            prob = om.Problem()
+            prob.model.add_subsystem('comp', om.ExecComp('y = 2.0 * x', x=np.ones(1000),
+                                                         y=np.ones(1000)), promotes=['*'])
+            recorder = om.SqliteRecorder('cases.sql', record_viewer_data=False,
+                                         quantize=quantize)
+            prob.model.add_recorder(recorder)
+            prob.setup()
+            prob.set_val('x', np.arange(1000) * 0.1)
+            prob.run_model()
+            prob.cleanup()
+
+            with sqlite3.connect(prob.get_outputs_dir() / 'cases.sql') as con:
+                outputs, = con.execute("SELECT outputs FROM system_iterations").fetchone()
+            con.close()
+            sizes.append(len(outputs))
+
+        self.assertLess(sizes[1], sizes[0])
+
     def test_pickle_vulnerability(self):
         # test handling of vulnerability https://github.com/advisories/GHSA-g4r7-86gm-pgqc
         class Payload:
@@ -3243,6 +3590,64 @@ class DummyClass(object):
                 files = os.listdir(os.getcwd())
                 self.assertTrue('pwned.txt' not in files, "Payload was allowed to execute")
 
+    def test_shared_serialization(self):
+        # recorders that serialize the same way share the serialized case data
+        recorders = [
+            om.SqliteRecorder('json.sql', record_viewer_data=False),
+            om.SqliteRecorder('bin1.sql', record_viewer_data=False, binary_data=True,
+                              compression='zlib'),
+            om.SqliteRecorder('bin2.sql', record_viewer_data=False, binary_data=True,
+                              compression='zlib'),
+        ]
+
+        # a recorder that opts out of sharing is still given the case data
+        opt_out = om.SqliteRecorder('opt_out.sql', record_viewer_data=False, binary_data=True,
+                                    compression='zlib')
+        opt_out._payload_encoding = None
+        recorders.append(opt_out)
+
+        prob = SellarProblem(SellarDerivativesGrouped)
+        # recording a subsystem as well makes the layout ids differ between the binary recorders
+        prob.setup()
+        prob.model.mda.add_recorder(recorders[2])
+        driver = prob.driver = om.ScipyOptimizeDriver(tol=1e-9, disp=False)
+        driver.recording_options['record_inputs'] = True
+        driver.recording_options['includes'] = ['*']
+        for recorder in recorders:
+            driver.add_recorder(recorder)
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertTrue(driver._rec_mgr._shared > 0)
+        self.assertNotEqual(recorders[1]._layouts, recorders[2]._layouts)
+
+        stream = StringIO()
+        times = driver._rec_mgr.report_times(out_stream=stream)
+        self.assertEqual(set(times), set(recorders))
+        ncases = len(om.CaseReader(prob.get_outputs_dir() / 'json.sql').list_cases(
+            'driver', out_stream=None))
+        for recorder in recorders:
+            self.assertEqual(times[recorder][0], ncases)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), len(recorders) + 1)
+        self.assertTrue(lines[-1].startswith("Serialized data reused"))
+
+        readers = [om.CaseReader(prob.get_outputs_dir() / recorder._filepath)
+                   for recorder in recorders]
+        cases = [cr.get_cases('driver', recurse=False) for cr in readers]
+        for other in cases[1:]:
+            self.assertEqual(len(other), len(cases[0]))
+            for case, other_case in zip(cases[0], other):
+                for vals, other_vals in ((case.outputs, other_case.outputs),
+                                         (case.inputs, other_case.inputs)):
+                    self.assertEqual(sorted(vals.absolute_names()),
+                                     sorted(other_vals.absolute_names()))
+                    for name in vals.absolute_names():
+                        assert_near_equal(other_vals[name], vals[name], 1e-15)
+
+        # the case data itself was not converted for JSON
+        self.assertIsInstance(cases[0][-1].outputs['z'], np.ndarray)
+
 
 @use_tempdirs
 class TestFeatureSqliteReader(unittest.TestCase):
@@ -2904,6 +2904,65 @@ class TestSqliteRecorder(unittest.TestCase):
         self.assertTrue(all([case.startswith('foo_') for case in driver_cases]),
                         msg='One or more cases do not start with the expected prefix.')
 
+    def test_background_writes(self):
+        def run(recorder):
+            prob = SellarProblem(SellarDerivativesGrouped)
+            prob.driver = om.ScipyOptimizeDriver(tol=1e-9, disp=False)
+            prob.driver.recording_options['record_derivatives'] = True
+            prob.driver.add_recorder(recorder)
+            prob.model.add_recorder(recorder)
+            prob.setup()
+            prob.run_driver()
+            prob.cleanup()
+            return prob.get_outputs_dir() / recorder._filepath.name
+
+        sync_file = run(om.SqliteRecorder('sync.sql', record_viewer_data=False))
+
+        # a long commit interval, so everything is written by the final flush in shutdown
+        recorder = om.SqliteRecorder('async.sql', record_viewer_data=False,
+                                     background_writes=True, commit_interval=100.)
+        async_file = run(recorder)
+        self.assertIsNone(recorder._writer)
+
+        with sqlite3.connect(async_file) as con:
+            self.assertEqual(con.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+        con.close()
+
+        cr_sync = om.CaseReader(sync_file)
+        cr_async = om.CaseReader(async_file)
+
+        case_ids = cr_sync.list_cases(out_stream=None)
+        self.assertEqual(cr_async.list_cases(out_stream=None), case_ids)
+
+        for case_id in case_ids:
+            case_sync = cr_sync.get_case(case_id)
+            case_async = cr_async.get_case(case_id)
+            self.assertEqual(case_async.counter, case_sync.counter)
+            for name, val in case_sync.outputs.items():
+                assert_near_equal(case_async.outputs[name], val, 1e-15)
+            if case_sync.derivatives is not None:
+                for key, val in case_sync.derivatives.items():
+                    assert_near_equal(case_async.derivatives[key], val, 1e-15)
+
+    def test_background_writes_error(self):
+        prob = ParaboloidProblem()
+        recorder = om.SqliteRecorder('async.sql', record_viewer_data=False,
+                                     background_writes=True, commit_interval=0.)
+        prob.driver.add_recorder(recorder)
+        prob.setup()
+        prob.final_setup()
+
+        # drop a table out from under the writer thread
+        recorder.connection.execute("DROP TABLE driver_iterations")
+        prob.run_driver()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.cleanup()
+
+        self.assertEqual(str(cm.exception),
+                         f"Background writer for '{recorder._filepath}' failed.")
+        self.assertIsInstance(cm.exception.__cause__, sqlite3.OperationalError)
+
 @use_tempdirs
 class TestFeatureSqliteRecorder(unittest.TestCase):
 
@@ -3012,7 +3071,8 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['type'], 'doe')
         self.assertEqual(metadata['options'], {'debug_print': [], 'generator': 'UniformGenerator',
                                                'invalid_desvar_behavior': 'warn',
-                                               'run_parallel': False, 'procs_per_model': 1})
+                                               'run_parallel': False, 'procs_per_model': 1,
+                                               'totals_cache_size': 0})
 
         # Optimization
         driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-3)
@@ -3032,7 +3092,8 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['options'], {"debug_print": [], "optimizer": "SLSQP",
                                                "tol": 1e-03, "maxiter": 200, "disp": True,
                                                "invalid_desvar_behavior": "warn",
-                                                'singular_jac_behavior': 'warn', 'singular_jac_tol': 1e-16})
+                                                'singular_jac_behavior': 'warn', 'singular_jac_tol': 1e-16,
+                                               'hessp': False, 'totals_cache_size': 0})
         self.assertEqual(metadata['opt_settings'], {"maxiter": 1000})
 
     def test_feature_solver_options(self):
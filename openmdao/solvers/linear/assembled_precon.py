@@ -0,0 +1,175 @@
+"""Define algebraic preconditioners built from the matrix of an AssembledJacobian."""
+
+import numpy as np
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import spilu, splu
+
+
+class ILUPreconditioner(object):
+    """
+    Incomplete LU preconditioner with threshold dropping (ILUT).
+
+    Parameters
+    ----------
+    matrix : csc_matrix or ndarray
+        Matrix to be approximately factored.
+    drop_tol : float
+        Drop tolerance for the entries of the incomplete factors.
+    fill_factor : float
+        Upper bound on the ratio of nonzeros in the incomplete factors to those in the matrix.
+
+    Attributes
+    ----------
+    _ilu : SuperLU
+        Incomplete LU factorization of the matrix.
+    """
+
+    def __init__(self, matrix, drop_tol=1e-4, fill_factor=10.):
+        """
+        Compute the incomplete factorization.
+        """
+        self._ilu = spilu(csc_matrix(matrix), drop_tol=drop_tol, fill_factor=fill_factor)
+
+    def solve(self, rhs, trans='N'):
+        """
+        Apply the preconditioner.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Vector to be preconditioned.
+        trans : str
+            'N' to apply the preconditioner, or 'T' to apply its transpose.
+
+        Returns
+        -------
+        ndarray
+            The preconditioned vector.
+        """
+        return self._ilu.solve(rhs, trans)
+
+
+class BlockJacobiPreconditioner(object):
+    """
+    Block Jacobi preconditioner with an LU factorization of each diagonal block.
+
+    Parameters
+    ----------
+    matrix : csc_matrix or ndarray
+        Matrix to be preconditioned.
+    blocks : list of ndarray
+        Row (and column) indices of each block.
+
+    Attributes
+    ----------
+    _blocks : list of ndarray
+        Row (and column) indices of each block.
+    _lus : list of SuperLU
+        LU factorization of each block.
+    _dtype : dtype
+        Data type of the matrix.
+    """
+
+    def __init__(self, matrix, blocks):
+        """
+        Factor the blocks.
+        """
+        matrix = csc_matrix(matrix)
+        self._blocks = blocks
+        self._dtype = matrix.dtype
+        self._lus = [splu(matrix[idxs][:, idxs].tocsc()) for idxs in blocks]
+
+    def solve(self, rhs, trans='N'):
+        """
+        Apply the preconditioner.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Vector to be preconditioned.
+        trans : str
+            'N' to apply the preconditioner, or 'T' to apply its transpose.
+
+        Returns
+        -------
+        ndarray
+            The preconditioned vector.
+        """
+        out = np.zeros(rhs.shape, dtype=np.result_type(rhs, self._dtype))
+        for idxs, lu in zip(self._blocks, self._lus):
+            out[idxs] += lu.solve(rhs[idxs], trans)
+        return out
+
+
+class AdditiveSchwarzPreconditioner(BlockJacobiPreconditioner):
+    """
+    Restricted additive Schwarz preconditioner with overlapping blocks.
+
+    Each block is grown by the rows that are within a given number of nonzeros of it in the
+    symmetrized sparsity pattern of the matrix. Each block is solved including its overlap, but
+    only contributes the entries of its original rows to the result.
+
+    Parameters
+    ----------
+    matrix : csc_matrix or ndarray
+        Matrix to be preconditioned.
+    blocks : list of ndarray
+        Row (and column) indices of each block before overlapping.
+    overlap : int
+        Number of levels of overlap between neighboring blocks.
+
+    Attributes
+    ----------
+    _owned : list of ndarray
+        Boolean mask of the original rows of each block within its grown rows.
+    """
+
+    def __init__(self, matrix, blocks, overlap=1):
+        """
+        Grow and factor the blocks.
+        """
+        matrix = csc_matrix(matrix)
+        pattern = csc_matrix((np.ones(matrix.nnz), matrix.indices, matrix.indptr),
+                             shape=matrix.shape)
+        pattern = (pattern + pattern.T).tocsr()
+
+        grown = []
+        self._owned = []
+        for idxs in blocks:
+            mask = np.zeros(matrix.shape[0], dtype=bool)
+            mask[idxs] = True
+            owned = mask.copy()
+            for _ in range(overlap):
+                mask |= pattern @ mask > 0
+            grown_idxs = np.nonzero(mask)[0]
+            grown.append(grown_idxs)
+            self._owned.append(owned[grown_idxs])
+
+        super().__init__(matrix, grown)
+
+    def solve(self, rhs, trans='N'):
+        """
+        Apply the preconditioner.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Vector to be preconditioned.
+        trans : str
+            'N' to apply the preconditioner, or 'T' to apply its transpose.
+
+        Returns
+        -------
+        ndarray
+            The preconditioned vector.
+        """
+        out = np.zeros(rhs.shape, dtype=np.result_type(rhs, self._dtype))
+        for idxs, owned, lu in zip(self._blocks, self._owned, self._lus):
+            if trans == 'N':
+                out[idxs[owned]] += lu.solve(rhs[idxs], trans)[owned]
+            else:
+                # the transpose restricts the right-hand side instead of the solution
+                sub_rhs = rhs[idxs]
+                sub_rhs[~owned] = 0.
+                out[idxs] += lu.solve(sub_rhs, trans)
+        return out
@@ -1,11 +1,13 @@
 """LinearSolver that uses linalg.solve or LU factor/solve."""
 
+import os
 import warnings
 
 import numpy as np
 import scipy.linalg
 import scipy.sparse.linalg
-from scipy.sparse import csc_matrix
+from scipy.sparse import csc_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components, maximum_bipartite_matching
 
 from openmdao.solvers.solver import LinearSolver
 from openmdao.matrices.dense_matrix import DenseMatrix
@@ -171,6 +173,171 @@ def format_nan_error(system, matrix):
     return msg.format(system.msginfo, ', '.join(varnames))
 
 
+def _block_triangular_order(rows, cols, shape):
+    """
+    Compute a block lower triangular ordering of a sparse matrix from its sparsity pattern.
+
+    Rows are matched to columns to get a zero-free diagonal, and the diagonal blocks are the
+    strongly connected components of the resulting graph, sorted so that each block only depends
+    on the blocks before it. Consecutive 1x1 blocks are merged into lower triangular segments.
+
+    Parameters
+    ----------
+    rows : ndarray
+        Row indices of the nonzero entries.
+    cols : ndarray
+        Column indices of the nonzero entries.
+    shape : tuple
+        Shape of the matrix.
+
+    Returns
+    -------
+    tuple or None
+        Row permutation, column permutation, segment boundaries and a flag for each segment
+        that is True if it is lower triangular. None is returned if the matrix is structurally
+        singular or has a single diagonal block.
+    """
+    pattern = csr_matrix((np.ones(rows.size), (rows, cols)), shape=shape)
+
+    # for each row, the column that gets moved to the diagonal
+    match = maximum_bipartite_matching(pattern, perm_type='column')
+    if np.any(match < 0):
+        return None
+
+    # entry (i, j) means that row i depends on the variable matched to row j
+    graph = pattern[:, match].tocoo()
+    ncomps, labels = connected_components(graph, directed=True, connection='strong')
+    if ncomps == 1:
+        return None
+
+    mask = labels[graph.row] != labels[graph.col]
+    deps = csr_matrix((np.ones(np.count_nonzero(mask)),
+                       (labels[graph.row[mask]], labels[graph.col[mask]])),
+                      shape=(ncomps, ncomps))
+    deps.sum_duplicates()
+    dependents = deps.T.tocsr()
+
+    # topological sort of the components, dependencies first
+    ndeps = np.diff(deps.indptr)
+    ready = list(np.nonzero(ndeps == 0)[0])
+    order = []
+    while ready:
+        comp = ready.pop()
+        order.append(comp)
+        deps_of = dependents.indices[dependents.indptr[comp]:dependents.indptr[comp + 1]]
+        ndeps[deps_of] -= 1
+        ready.extend(deps_of[ndeps[deps_of] == 0])
+
+    rank = np.empty(ncomps, dtype=int)
+    rank[order] = np.arange(ncomps)
+    row_perm = np.argsort(rank[labels], kind='stable')
+    col_perm = match[row_perm]
+
+    bounds = [0]
+    tri = []
+    for size in np.bincount(labels)[order]:
+        if size == 1 and tri and tri[-1]:
+            bounds[-1] += 1
+        else:
+            bounds.append(bounds[-1] + size)
+            tri.append(size == 1)
+
+    return row_perm, col_perm, bounds, tri
+
+
+class _BlockTriangularLU(object):
+    """
+    LU factorization of a sparse matrix in block lower triangular form.
+
+    Only the diagonal blocks are factored, and solves are done by block substitution. The
+    interface matches that of the object returned by scipy.sparse.linalg.splu.
+
+    Parameters
+    ----------
+    matrix : csc_matrix
+        Matrix to be factored.
+    order : tuple
+        Block triangular ordering as returned by _block_triangular_order.
+
+    Attributes
+    ----------
+    _row_perm : ndarray
+        Row permutation of the block triangular form.
+    _col_perm : ndarray
+        Column permutation of the block triangular form.
+    _segments : list of tuple
+        Start, end, factorization, coupling to the previous rows and transposed coupling to
+        the following columns for each segment on the diagonal.
+    _dtype : dtype
+        Data type of the factored matrix.
+    """
+
+    def __init__(self, matrix, order):
+        """
+        Factor the diagonal blocks.
+        """
+        self._row_perm, self._col_perm, bounds, tri = order
+
+        mtx = matrix[self._row_perm][:, self._col_perm].tocsr()
+        mtx_t = mtx.T.tocsr()
+        n = mtx.shape[0]
+        self._dtype = mtx.dtype
+
+        self._segments = segments = []
+        for start, end, is_tri in zip(bounds[:-1], bounds[1:], tri):
+            diag = mtx[start:end, start:end].tocsc()
+            if is_tri:
+                # no pivoting or reordering is needed, so there is no fill-in
+                lu = scipy.sparse.linalg.splu(diag, permc_spec='NATURAL', diag_pivot_thresh=0.)
+            else:
+                lu = scipy.sparse.linalg.splu(diag)
+
+            # full row blocks are cheaper to extract, and the entries of the solution that
+            # aren't known yet are still zero during the substitution.
+            lower = mtx[start:end] if start > 0 else None
+            upper = mtx_t[start:end] if end < n else None
+            segments.append((start, end, lu, lower, upper))
+
+    def solve(self, rhs, trans='N'):
+        """
+        Solve the factored system.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Right-hand side, either 1D or 2D with one right-hand side per column.
+        trans : str
+            'N' to solve the system, or 'T' to solve the transposed system.
+
+        Returns
+        -------
+        ndarray
+            Solution with the same shape as rhs.
+        """
+        if trans == 'N':
+            rhs = rhs[self._row_perm]
+            sol = np.zeros(rhs.shape, dtype=np.result_type(rhs, self._dtype))
+            for start, end, lu, lower, _ in self._segments:
+                b = rhs[start:end]
+                if lower is not None:
+                    b = b - lower @ sol
+                sol[start:end] = lu.solve(np.ascontiguousarray(b))
+            out_perm = self._col_perm
+        else:
+            rhs = rhs[self._col_perm]
+            sol = np.zeros(rhs.shape, dtype=np.result_type(rhs, self._dtype))
+            for start, end, lu, _, upper in reversed(self._segments):
+                b = rhs[start:end]
+                if upper is not None:
+                    b = b - upper @ sol
+                sol[start:end] = lu.solve(np.ascontiguousarray(b), 'T')
+            out_perm = self._row_perm
+
+        result = np.empty_like(sol)
+        result[out_perm] = sol
+        return result
+
+
 class DirectSolver(LinearSolver):
     """
     LinearSolver that uses linalg.solve or LU factor/solve.
@@ -184,6 +351,13 @@ class DirectSolver(LinearSolver):
     ----------
     _lin_rhs_checker : LinearRHSChecker or None
         Object for checking the right-hand side of the linear solve.
+    _bt_order : tuple, False or None
+        Block triangular ordering of the assembled jacobian, False if it has no useful block
+        triangular form, or None if it hasn't been computed yet.
+    _mixed_precision : bool
+        True if the current factorization is in single precision.
+    _mtx : csc_matrix, ndarray or None
+        Full precision matrix used for iterative refinement in mixed precision mode.
     """
 
     SOLVER = 'LN: Direct'
@@ -194,6 +368,9 @@ class DirectSolver(LinearSolver):
         """
         super().__init__(**kwargs)
         self._lin_rhs_checker = None
+        self._bt_order = None
+        self._mixed_precision = False
+        self._mtx = None
 
     def _declare_options(self):
         """
@@ -211,6 +388,27 @@ class DirectSolver(LinearSolver):
                              "allow finer control over it. Allowed options are: "
                              f"{LinearRHSChecker.options}")
 
+        self.options.declare('block_triangular', types=bool, default=False,
+                             desc="If True, permute a sparse assembled jacobian to block lower "
+                             "triangular form and only factor its diagonal blocks. The ordering "
+                             "is computed once from the sparsity pattern of the jacobian. Only "
+                             "applies when assemble_jac is True and the jacobian is sparse.")
+
+        self.options.declare('mixed_precision', types=bool, default=False,
+                             desc="If True, factor the matrix in single precision and refine the "
+                             "solutions iteratively using residuals computed in double precision. "
+                             "The matrix is factored again in double precision if the single "
+                             "precision factorization fails or the refinement doesn't converge. "
+                             "Not used under complex step.")
+
+        self.options.declare('refine_rtol', types=float, default=1e-12, lower=0.0,
+                             desc="Relative tolerance of the residual of the refined solutions in "
+                             "mixed precision mode.")
+
+        self.options.declare('refine_maxiter', types=int, default=10, lower=0,
+                             desc="Maximum number of refinement iterations in mixed precision "
+                             "mode.")
+
         # this solver does not iterate
         self.options.undeclare("maxiter")
         self.options.undeclare("err_on_non_converge")
@@ -238,6 +436,7 @@ class DirectSolver(LinearSolver):
         self._disallow_distrib_solve()
         self._lin_rhs_checker = LinearRHSChecker.create(self._system(),
                                                         self.options['rhs_checking'])
+        self._bt_order = None
 
     def _linearize_children(self):
         """
@@ -319,6 +518,8 @@ class DirectSolver(LinearSolver):
         """
         system = self._system()
         nproc = system.comm.size
+        self._mixed_precision = (self.options['mixed_precision'] and
+                                 not system.under_complex_step)
 
         if self._assembled_jac is not None:
             matrix = self._assembled_jac._int_mtx._matrix
@@ -327,58 +528,99 @@ class DirectSolver(LinearSolver):
                 # this happens if we're not rank 0 when using owned_sizes
                 self._lu = self._lup = None
 
-            # Perform dense or sparse lu factorization.
-            elif isinstance(matrix, csc_matrix):
-                try:
-                    self._lu = scipy.sparse.linalg.splu(matrix)
-                except RuntimeError:
-                    raise RuntimeError(format_singular_error(system, matrix))
-
-            elif isinstance(matrix, np.ndarray):  # dense
-                # During LU decomposition, detect singularities and warn user.
-                with warnings.catch_warnings():
-                    if self.options['err_on_singular']:
-                        warnings.simplefilter('error', RuntimeWarning)
-                    try:
-                        self._lup = scipy.linalg.lu_factor(matrix)
-                    except RuntimeWarning:
-                        raise RuntimeError(format_singular_error(system, matrix))
-
-                    # NaN in matrix.
-                    except ValueError:
-                        raise RuntimeError(format_nan_error(system, matrix))
-
             # Note: calling scipy.sparse.linalg.splu on a COO actually transposes
             # the matrix during conversion to csc prior to LU decomp, so we can't use COO.
-            else:
+            elif not isinstance(matrix, (csc_matrix, np.ndarray)):
                 raise RuntimeError("Direct solver not implemented for matrix type %s"
                                    " in %s." % (type(self._assembled_jac._int_mtx),
                                                 system.msginfo))
+            else:
+                self._factor(matrix)
         else:
             if nproc > 1:
                 raise RuntimeError("DirectSolvers without an assembled jacobian are not supported "
                                    "when running under MPI if comm.size > 1.")
 
-            mtx = self._build_mtx()
+            self._factor(self._build_mtx())
+
+        if self._lin_rhs_checker is not None:
+            self._lin_rhs_checker.clear()
+
+    def _factor(self, matrix):
+        """
+        Perform dense or sparse lu factorization of the given matrix.
+
+        In mixed precision mode, the factorization is done in single precision and the matrix
+        is kept for the iterative refinement of the solutions. If the single precision matrix
+        can't be factored, it is factored again in full precision.
+
+        Parameters
+        ----------
+        matrix : csc_matrix or ndarray
+            Matrix to be factored.
+        """
+        if self._mixed_precision:
+            self._mtx = matrix
+            try:
+                self._lu_factor(matrix.astype(np.float32), True)
+                return
+            except (RuntimeError, RuntimeWarning, ValueError):
+                # the matrix may be singular or overflow once it's cast to single precision
+                self._print_refinement('Single precision factorization failed. '
+                                       'Factoring again in full precision.')
+                self._mixed_precision = False
+
+        self._mtx = None
+        system = self._system()
+
+        try:
+            self._lu_factor(matrix, self.options['err_on_singular'])
+        except (RuntimeError, RuntimeWarning):
+            raise RuntimeError(format_singular_error(system, matrix))
+        # NaN in matrix.
+        except ValueError:
+            raise RuntimeError(format_nan_error(system, matrix))
+
+    def _lu_factor(self, matrix, err_on_singular):
+        """
+        Perform dense or sparse lu factorization of the given matrix without formatting errors.
+
+        Parameters
+        ----------
+        matrix : csc_matrix or ndarray
+            Matrix to be factored.
+        err_on_singular : bool
+            If True, raise a RuntimeWarning if a dense matrix is singular.
+        """
+        if isinstance(matrix, csc_matrix):
+            if self.options['block_triangular'] and self._get_bt_order():
+                self._lu = _BlockTriangularLU(matrix, self._bt_order)
+            else:
+                self._lu = scipy.sparse.linalg.splu(matrix)
 
+        else:  # dense
             # During LU decomposition, detect singularities and warn user.
             with warnings.catch_warnings():
-
-                if self.options['err_on_singular']:
+                if err_on_singular:
                     warnings.simplefilter('error', RuntimeWarning)
+                self._lup = scipy.linalg.lu_factor(matrix)
 
-                try:
-                    self._lup = scipy.linalg.lu_factor(mtx)
-
-                except RuntimeWarning:
-                    raise RuntimeError(format_singular_error(system, mtx))
+    def _get_bt_order(self):
+        """
+        Return the block triangular ordering of the assembled jacobian, computing it if needed.
 
-                # NaN in matrix.
-                except ValueError:
-                    raise RuntimeError(format_nan_error(system, mtx))
+        Returns
+        -------
+        tuple or False
+            Block triangular ordering, or False if the jacobian has no useful block triangular
+            form.
+        """
+        if self._bt_order is None:
+            coo = self._assembled_jac._int_mtx._coo
+            order = _block_triangular_order(coo.row, coo.col, coo.shape)
+            self._bt_order = False if order is None else order
 
-        if self._lin_rhs_checker is not None:
-            self._lin_rhs_checker.clear()
+        return self._bt_order
 
     def _inverse(self):
         """
@@ -457,6 +699,100 @@ class DirectSolver(LinearSolver):
 
         return inv_jac
 
+    def _lu_solve(self, mode, rhs):
+        """
+        Solve the linear system with the current factorization.
+
+        Parameters
+        ----------
+        mode : str
+            'fwd' or 'rev'.
+        rhs : ndarray
+            Right-hand side, either 1D or 2D with one right-hand side per column.
+
+        Returns
+        -------
+        ndarray
+            Solution with the same shape as rhs.
+        """
+        if self._assembled_jac is not None and \
+                not isinstance(self._assembled_jac._int_mtx, DenseMatrix):
+            return self._lu.solve(rhs, 'N' if mode == 'fwd' else 'T')
+
+        return scipy.linalg.lu_solve(self._lup, rhs, trans=0 if mode == 'fwd' else 1)
+
+    def _solve_factored(self, mode, rhs):
+        """
+        Solve the factored linear system for one or more right-hand sides.
+
+        The right-hand sides must be expressed in the same space as the factorization, i.e.,
+        unscaled if the jacobian is assembled and scaled otherwise.
+
+        Parameters
+        ----------
+        mode : str
+            'fwd' or 'rev'.
+        rhs : ndarray
+            Right-hand side, either 1D or 2D with one right-hand side per column.
+
+        Returns
+        -------
+        ndarray
+            Solution with the same shape as rhs.
+        """
+        if not self._mixed_precision:
+            return self._lu_solve(mode, rhs)
+
+        mtx = self._mtx if mode == 'fwd' else self._mtx.T
+        rtol = self.options['refine_rtol']
+        maxiter = self.options['refine_maxiter']
+
+        sol = self._lu_solve(mode, rhs.astype(np.float32)).astype(rhs.dtype)
+        rhs_norm = np.linalg.norm(rhs, axis=0)
+        prev_norm = np.inf
+
+        # iterative refinement with the residual computed in full precision
+        self._iter_count = 0
+        while True:
+            resid = rhs - mtx @ sol
+            norm = np.linalg.norm(resid, axis=0)
+            rel_norm = np.max(np.divide(norm, rhs_norm, out=np.zeros_like(norm),
+                                        where=rhs_norm != 0.))
+            norm = np.max(norm)
+            self._mpi_print(self._iter_count, norm, rel_norm)
+
+            if rel_norm <= rtol or norm == 0.:
+                self._print_refinement('Converged in {} refinement iterations')
+                return sol
+
+            if self._iter_count >= maxiter or not norm < prev_norm:
+                break
+
+            sol += self._lu_solve(mode, resid.astype(np.float32))
+            prev_norm = norm
+            self._iter_count += 1
+
+        self._print_refinement('Refinement failed to converge in {} iterations. '
+                               'Factoring again in full precision.')
+
+        self._mixed_precision = False
+        self._factor(self._mtx)
+
+        return self._lu_solve(mode, rhs)
+
+    def _print_refinement(self, msg):
+        """
+        Print a message about the mixed precision refinement if iprint > 0.
+
+        Parameters
+        ----------
+        msg : str
+            Message, formatted with the number of refinement iterations.
+        """
+        if (self.options['iprint'] > 0 and
+                (self._system().comm.rank == 0 or os.environ.get('USE_PROC_FILES'))):
+            print(f"{self._solver_info.prefix}{self.SOLVER} {msg.format(self._iter_count)}")
+
     def solve(self, mode, rel_systems=None):
         """
         Run the solver.
@@ -477,13 +813,9 @@ class DirectSolver(LinearSolver):
         if mode == 'fwd':
             x_vec = d_outputs.asarray()
             b_vec = d_residuals.asarray()
-            trans_lu = 0
-            trans_splu = 'N'
         else:  # rev
             x_vec = d_residuals.asarray()
             b_vec = d_outputs.asarray()
-            trans_lu = 1
-            trans_splu = 'T'
 
             if self._lin_rhs_checker is not None:
                 sol_array, is_zero = self._lin_rhs_checker.get_solution(b_vec, system)
@@ -496,19 +828,12 @@ class DirectSolver(LinearSolver):
 
         # AssembledJacobians are unscaled.
         if self._assembled_jac is not None:
-            full_b = b_vec
-
             with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
-                if isinstance(self._assembled_jac._int_mtx, DenseMatrix):
-                    sol_array = scipy.linalg.lu_solve(self._lup, full_b, trans=trans_lu)
-                else:
-                    sol_array = self._lu.solve(full_b, trans_splu)
-
-                x_vec[:] = sol_array
+                x_vec[:] = sol_array = self._solve_factored(mode, b_vec)
 
         # matrix-vector-product generated jacobians are scaled.
         else:
-            x_vec[:] = sol_array = scipy.linalg.lu_solve(self._lup, b_vec, trans=trans_lu)
+            x_vec[:] = sol_array = self._solve_factored(mode, b_vec)
 
         if not system.under_complex_step and self._lin_rhs_checker is not None and mode == 'rev':
             self._lin_rhs_checker.add_solution(b_vec, sol_array, copy=True)
@@ -0,0 +1,266 @@
+"""Define the GCRO-DR Krylov method, which recycles a subspace between linear solves."""
+
+import numpy as np
+from scipy.linalg import eig, lstsq, qr, solve_triangular
+
+# relative size below which a vector is considered to be linearly dependent on the others
+_DROP_TOL = 1e-10
+
+
+def gcrodr(A, b, x0=None, rtol=1e-10, atol=0., m=20, k=10, maxiter=1000, M=None,
+           recycled=None, callback=None):
+    """
+    Solve A x = b with GCRO-DR, the GMRES variant with deflated restarting and recycling.
+
+    At the end of every restart cycle, the harmonic Ritz vectors of the k harmonic Ritz values
+    of smallest magnitude are kept, and the next cycle minimizes the residual over them in
+    addition to its own Krylov subspace. These vectors approximate the eigenvectors that slow
+    down the convergence the most, so they are not found again after every restart. The kept
+    subspace is returned, and can be passed to the solve of another right-hand side with the same
+    matrix and preconditioner.
+
+    Parameters
+    ----------
+    A : LinearOperator
+        The matrix of the linear system.
+    b : ndarray
+        The right-hand side of the linear system.
+    x0 : ndarray or None
+        The initial guess. Zero if None.
+    rtol : float
+        Relative tolerance on the residual norm, with respect to the norm of b.
+    atol : float
+        Absolute tolerance on the residual norm.
+    m : int
+        Maximum dimension of the search space of each cycle, including the recycled vectors.
+    k : int
+        Number of harmonic Ritz vectors kept between cycles.
+    maxiter : int
+        Maximum number of iterations (matrix-vector products).
+    M : LinearOperator or None
+        Right preconditioner.
+    recycled : tuple of ndarray or None
+        The (C, U) subspace returned by a previous solve, where C = A M U has orthonormal columns.
+    callback : function or None
+        Function called with the residual norm after each iteration.
+
+    Returns
+    -------
+    ndarray
+        The solution.
+    int
+        0 if the solve converged, otherwise the number of iterations.
+    tuple of ndarray or None
+        The (C, U) subspace kept at the end of the solve, or None if there is none.
+    """
+    if M is None:
+        matvec = A.matvec
+    else:
+        def matvec(vec):
+            return A.matvec(M.matvec(vec))
+
+    if x0 is None or not np.any(x0):
+        r = np.array(b)
+    else:
+        r = b - A.matvec(x0)
+
+    # update of the solution, before it is preconditioned
+    z = np.zeros_like(r)
+    tol = max(atol, rtol * np.linalg.norm(b))
+
+    if recycled is None:
+        C = U = None
+    else:
+        C, U = recycled
+        y = C.conj().T @ r
+        z += U @ y
+        r -= C @ y
+
+    beta = np.linalg.norm(r)
+    iters = 0
+    while beta > tol and iters < maxiter:
+        ncols = 0 if C is None else C.shape[1]
+        steps = min(max(m - ncols, 1), maxiter - iters)
+        W, G, Vhat, y, beta = _cycle(matvec, r, beta, C, U, steps, tol, callback)
+        iters += G.shape[1] - ncols
+
+        z += Vhat @ y
+        r -= W @ (G @ y)
+
+        C, U = _deflate(W, G, Vhat, k)
+
+    x = z if M is None else M.matvec(z)
+    if x0 is not None:
+        x = x + x0
+
+    return x, 0 if beta <= tol else iters, None if C is None else (C, U)
+
+
+def _cycle(matvec, r, beta, C, U, steps, tol, callback):
+    """
+    Run one cycle of Arnoldi iterations, orthogonal to C, and minimize the residual.
+
+    Parameters
+    ----------
+    matvec : function
+        The (preconditioned) matrix-vector product.
+    r : ndarray
+        The residual at the start of the cycle, orthogonal to C.
+    beta : float
+        The norm of r.
+    C : ndarray or None
+        Orthonormal basis of the image of the recycled subspace.
+    U : ndarray or None
+        The recycled subspace, where C = A U.
+    steps : int
+        Maximum number of iterations.
+    tol : float
+        Absolute tolerance on the residual norm.
+    callback : function or None
+        Function called with the residual norm after each iteration.
+
+    Returns
+    -------
+    ndarray
+        W, the orthonormal basis of the image of the search space.
+    ndarray
+        G, the matrix of the search space in W, such that A Vhat = W G.
+    ndarray
+        Vhat, the basis of the search space.
+    ndarray
+        Coefficients of the residual minimizing solution update in Vhat.
+    float
+        Norm of the residual at the end of the cycle.
+    """
+    n = r.size
+    ncols = 0 if C is None else C.shape[1]
+
+    V = np.zeros((n, steps + 1), dtype=r.dtype)
+    G = np.zeros((ncols + steps + 1, ncols + steps), dtype=r.dtype)
+    rhs = np.zeros(ncols + steps + 1, dtype=r.dtype)
+    rhs[ncols] = beta
+    V[:, 0] = r / beta
+
+    if C is not None:
+        # scale U so that the system is not ill-conditioned by the norms of its columns
+        scale = 1. / np.linalg.norm(U, axis=0)
+        G[:ncols, :ncols] = np.diag(scale)
+        U = U * scale
+
+    for j in range(steps):
+        w = matvec(V[:, j])
+
+        # classical Gram-Schmidt, done twice for stability
+        for _ in range(2):
+            if C is not None:
+                h = C.conj().T @ w
+                w -= C @ h
+                G[:ncols, ncols + j] += h
+            h = V[:, :j + 1].conj().T @ w
+            w -= V[:, :j + 1] @ h
+            G[ncols:ncols + j + 1, ncols + j] += h
+
+        norm = np.linalg.norm(w)
+        G[ncols + j + 1, ncols + j] = norm
+
+        nrows = ncols + j + 2
+        y = lstsq(G[:nrows, :nrows - 1], rhs[:nrows])[0]
+        beta = np.linalg.norm(rhs[:nrows] - G[:nrows, :nrows - 1] @ y)
+        if callback is not None:
+            callback(beta)
+
+        # the Krylov subspace is invariant, so the residual can't be reduced any further
+        if norm <= _DROP_TOL * np.abs(G[:nrows, ncols + j]).max():
+            break
+
+        V[:, j + 1] = w / norm
+        if beta <= tol:
+            break
+
+    W = V[:, :nrows - ncols] if C is None else np.hstack((C, V[:, :nrows - ncols]))
+    Vhat = V[:, :nrows - ncols - 1]
+    if C is not None:
+        Vhat = np.hstack((U, Vhat))
+
+    return W, G[:nrows, :nrows - 1], Vhat, y, beta
+
+
+def _deflate(W, G, Vhat, k):
+    """
+    Compute the subspace of the harmonic Ritz vectors of the k smallest harmonic Ritz values.
+
+    Parameters
+    ----------
+    W : ndarray
+        The orthonormal basis of the image of the search space.
+    G : ndarray
+        The matrix of the search space in W.
+    Vhat : ndarray
+        The basis of the search space.
+    k : int
+        Number of harmonic Ritz vectors.
+
+    Returns
+    -------
+    ndarray or None
+        C, the orthonormal basis of the image of the subspace.
+    ndarray or None
+        U, the subspace, such that C = A U.
+    """
+    # harmonic Ritz values and vectors solve G^H G p = theta G^H W^H Vhat p
+    GH = G.conj().T
+    theta, P = eig(GH @ G, GH @ (W.conj().T @ Vhat))
+    order = np.argsort(np.abs(np.where(np.isfinite(theta), theta, np.inf)))
+    P = P[:, order[:k]]
+
+    # a real basis spans the complex conjugate pairs of vectors
+    if not np.iscomplexobj(G):
+        P = np.hstack((P.real, P.imag))
+
+    P = _orthonormal_basis(P)
+    Q, R, piv = qr(G @ P, mode='economic', pivoting=True)
+    rank = _rank(R)
+    if rank == 0:
+        return None, None
+    P = P[:, piv[:rank]]
+
+    U = solve_triangular(R[:rank, :rank], (Vhat @ P).T, trans='T').T
+    return W @ Q[:, :rank], U
+
+
+def _orthonormal_basis(P):
+    """
+    Return an orthonormal basis of the span of the columns of P.
+
+    Parameters
+    ----------
+    P : ndarray
+        The matrix.
+
+    Returns
+    -------
+    ndarray
+        Orthonormal basis of the span of the columns of P.
+    """
+    Q, R, _ = qr(P, mode='economic', pivoting=True)
+    return Q[:, :_rank(R)]
+
+
+def _rank(R):
+    """
+    Return the numerical rank of the triangular factor of a pivoted QR factorization.
+
+    Parameters
+    ----------
+    R : ndarray
+        The triangular factor.
+
+    Returns
+    -------
+    int
+        The numerical rank.
+    """
+    diag = np.abs(np.diag(R))
+    if diag.size == 0 or diag[0] == 0.:
+        return 0
+    return np.count_nonzero(diag > _DROP_TOL * diag[0])
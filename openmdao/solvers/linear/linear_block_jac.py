@@ -1,4 +1,6 @@
 """Define the LinearBlockJac class."""
+from functools import partial
+
 from openmdao.solvers.solver import BlockLinearSolver
 
 
@@ -14,6 +16,31 @@ class LinearBlockJac(BlockLinearSolver):
 
     SOLVER = 'LN: LNBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc="Number of threads used to solve the subsystems concurrently. "
+                             "This only speeds up subsystems that spend most of their time in "
+                             "code that releases the GIL, such as numpy and scipy routines.")
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+        self._setup_threads()
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
@@ -40,9 +67,7 @@ class LinearBlockJac(BlockLinearSolver):
             system._dresiduals *= -1.0
             system._dresiduals += self._rhs_vec
 
-            for i, subsys in enumerate(subs):
-                scope_out, scope_in = scopelist[i]
-                subsys._solve_linear(mode, scope_out, scope_in)
+            self._solve_subsystems(subs, scopelist)
 
         else:  # rev
             for i, subsys in enumerate(subs):
@@ -60,6 +85,24 @@ class LinearBlockJac(BlockLinearSolver):
             system._doutputs *= -1.0
             system._doutputs += self._rhs_vec
 
-            for i, subsys in enumerate(subs):
-                scope_out, scope_in = scopelist[i]
+            self._solve_subsystems(subs, scopelist)
+
+    def _solve_subsystems(self, subs, scopelist):
+        """
+        Solve the given subsystems, concurrently if num_threads > 1.
+
+        Parameters
+        ----------
+        subs : list of <System>
+            Relevant subsystems.
+        scopelist : list of tuple
+            Matvec scope of outputs and inputs of each subsystem.
+        """
+        mode = self._mode
+
+        if self.options['num_threads'] > 1 and len(subs) > 1:
+            self._run_threaded([partial(subsys._solve_linear, mode, scope_out, scope_in)
+                                for subsys, (scope_out, scope_in) in zip(subs, scopelist)])
+        else:
+            for subsys, (scope_out, scope_in) in zip(subs, scopelist):
                 subsys._solve_linear(mode, scope_out, scope_in)
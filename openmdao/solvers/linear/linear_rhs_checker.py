@@ -11,6 +11,7 @@ import numpy as np
 
 from math import isclose
 from openmdao.utils.array_utils import allclose, allzero
+from openmdao.utils.mpi import MPI
 from openmdao.utils.om_warnings import issue_warning, SolverWarning
 from openmdao.visualization.tables.table_builder import generate_table
 
@@ -23,13 +24,14 @@ def _print_stats():
     Print out cache statistics at the end of the run.
     """
     if _cache_stats:
-        headers = ['System', 'Eq Hits', 'Neg Hits', 'Parallel Hits', 'Zero Hits', 'Misses',
-                   'Resets']
+        headers = ['System', 'Eq Hits', 'Neg Hits', 'Parallel Hits', 'Projection Hits',
+                   'Zero Hits', 'Misses', 'Resets']
         for prob_name, dct in _cache_stats.items():
             rows = []
             for syspath, stats in dct.items():
                 rows.append([syspath, stats['eqhits'], stats['neghits'], stats['parhits'],
-                             stats['zerohits'], stats['misses'], stats['resets']])
+                             stats['projhits'], stats['zerohits'], stats['misses'],
+                             stats['resets']])
 
             print(f"\nCache Statistics for Problem '{prob_name}':")
             generate_table(rows, tablefmt='simple_grid', headers=headers).display()
@@ -55,6 +57,14 @@ class LinearRHSChecker(object):
         If True, collect cache statistics. Defaults to False.
     verbose : bool
         If True, print out whenever a cache hit occurs. Defaults to False.
+    projection : bool
+        If True, keep an orthonormal basis of the recent RHS vectors and their solutions, and
+        build the solution of an RHS vector in their span without a solve. Defaults to False.
+    projection_rtol : float
+        Relative tolerance on the residual of the projection of an RHS vector on the basis,
+        below which the projected solution is returned. Defaults to 1e-10.
+    max_projection_bytes : int
+        Maximum memory used by the basis and its solutions. Defaults to 64 MB.
 
     Attributes
     ----------
@@ -75,13 +85,31 @@ class LinearRHSChecker(object):
         If True, print out whenever a cache hit occurs.
     _solver_msginfo : str
         The message info for the solver that owns this LinearRHSChecker.
+    _comm : MPI.Comm or FakeComm
+        The communicator of the system that owns the solver.
+    _projection : bool
+        If True, project the RHS vectors on the basis of the recent RHS vectors.
+    _projection_rtol : float
+        Relative tolerance on the residual of the projection.
+    _max_projection_bytes : int
+        Maximum memory used by the basis and its solutions.
+    _basis : ndarray or None
+        Orthonormal basis of the recent RHS vectors, one per column.
+    _basis_sols : ndarray or None
+        Solutions of the columns of _basis.
+    _basis_order : deque
+        Indices of the filled columns of _basis, from oldest to newest.
+    _guess : ndarray or None
+        Projected solution of the last RHS vector that didn't match the cache, to be used as
+        the initial guess of an iterative solve.
     """
 
     options = ('check_zero', 'rtol', 'atol', 'max_cache_entries', 'collect_stats',
-               'auto', 'verbose')
+               'auto', 'verbose', 'projection', 'projection_rtol', 'max_projection_bytes')
 
     def __init__(self, system, max_cache_entries=3, check_zero=False, rtol=3e-16, atol=3e-16,
-                 collect_stats=False, verbose=False):
+                 collect_stats=False, verbose=False, projection=False, projection_rtol=1e-10,
+                 max_projection_bytes=2**26):
         """
         Initialize the LinearRHSChecker.
         """
@@ -95,7 +123,8 @@ class LinearRHSChecker(object):
         # print out cache stats at the end of the run
         if collect_stats:
             self._stats = {
-                'eqhits': 0, 'neghits': 0, 'parhits': 0, 'zerohits': 0, 'misses': 0, 'resets': 0
+                'eqhits': 0, 'neghits': 0, 'parhits': 0, 'projhits': 0, 'zerohits': 0,
+                'misses': 0, 'resets': 0
             }
             prob_name = system._problem_meta['name']
             if not _cache_stats:
@@ -107,6 +136,14 @@ class LinearRHSChecker(object):
             self._stats = None
         self._verbose = verbose
         self._solver_msginfo = system.linear_solver.msginfo
+        self._comm = system.comm
+        self._projection = projection
+        self._projection_rtol = projection_rtol
+        self._max_projection_bytes = max_projection_bytes
+        self._basis = None
+        self._basis_sols = None
+        self._basis_order = deque()
+        self._guess = None
 
     @staticmethod
     def check_options(system, options):
@@ -173,11 +210,13 @@ class LinearRHSChecker(object):
         if redundant_adj:
             return LinearRHSChecker(system, **opts)
         else:
-            if opts.get('max_cache_entries', 3) > 0:
+            if opts.get('max_cache_entries', 3) > 0 and not opts.get('projection', False):
                 issue_warning(f"{system.linear_solver.msginfo}: 'rhs_checking' is active "
                               "but no redundant adjoint dependencies were found, so caching"
                               " has been disabled.", category=SolverWarning)
-            if opts.get('check_zero', False):
+            # projection doesn't need redundant adjoint solves, because RHS vectors of different
+            # responses can still be linear combinations of each other
+            if opts.get('check_zero', False) or opts.get('projection', False):
                 opts['max_cache_entries'] = 0
                 return LinearRHSChecker(system, **opts)
 
@@ -186,6 +225,121 @@ class LinearRHSChecker(object):
         Clear the cache.
         """
         self._caches.clear()
+        self._basis = None
+        self._basis_sols = None
+        self._basis_order.clear()
+        self._guess = None
+
+    def _dot(self, mat, vec):
+        """
+        Return the product of the transpose of mat and vec, over all procs.
+
+        Parameters
+        ----------
+        mat : ndarray
+            The matrix, or vector.
+        vec : ndarray
+            The vector.
+
+        Returns
+        -------
+        ndarray or float
+            The product.
+        """
+        prod = mat.T @ vec
+        if self._comm.size > 1:
+            prod = self._comm.allreduce(prod)
+        return prod
+
+    def _add_to_basis(self, rhs, solution):
+        """
+        Orthonormalize the RHS vector against the basis and add it, with its solution.
+
+        The oldest column of the basis is dropped if the basis is full.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            The RHS vector.
+        solution : ndarray
+            The solution vector.
+        """
+        if self._basis is None:
+            size = rhs.size
+            nbytes = rhs.nbytes
+            if self._comm.size > 1:
+                size = self._comm.allreduce(size)
+                nbytes = self._comm.allreduce(nbytes, op=MPI.MAX)
+            ncols = min(size, max(1, self._max_projection_bytes // max(1, 2 * nbytes)))
+            self._basis = np.zeros((rhs.size, ncols))
+            self._basis_sols = np.zeros((rhs.size, ncols))
+
+        rhs_norm = np.sqrt(self._dot(rhs, rhs))
+        if rhs_norm == 0.0:
+            return
+
+        # classical Gram-Schmidt, done twice for stability
+        rhs = rhs.copy()
+        solution = solution.copy()
+        for _ in range(2):
+            coefs = self._dot(self._basis, rhs)
+            rhs -= self._basis @ coefs
+            solution -= self._basis_sols @ coefs
+
+        norm = np.sqrt(self._dot(rhs, rhs))
+
+        # the RHS vector is already in the span of the basis
+        if norm <= self._projection_rtol * rhs_norm:
+            return
+
+        # the new column is orthogonal to all the others, so the oldest one can just be replaced
+        if len(self._basis_order) == self._basis.shape[1]:
+            col = self._basis_order.popleft()
+        else:
+            col = len(self._basis_order)
+
+        self._basis[:, col] = rhs / norm
+        self._basis_sols[:, col] = solution / norm
+        self._basis_order.append(col)
+
+    def _project(self, rhs_arr):
+        """
+        Project the RHS vector on the basis, and return the matching combination of solutions.
+
+        Parameters
+        ----------
+        rhs_arr : ndarray
+            The RHS vector.
+
+        Returns
+        -------
+        ndarray or None
+            The projected solution, or None if the basis is empty.
+        bool
+            True if the residual of the projection is below the tolerance.
+        """
+        if not self._basis_order:
+            return None, False
+
+        coefs = self._dot(self._basis, rhs_arr)
+        resid = rhs_arr - self._basis @ coefs
+        resid_norm = np.sqrt(self._dot(resid, resid))
+        rhs_norm = np.sqrt(self._dot(rhs_arr, rhs_arr))
+
+        return self._basis_sols @ coefs, resid_norm <= self._projection_rtol * rhs_norm
+
+    def get_initial_guess(self):
+        """
+        Return the projected solution of the last RHS vector that didn't match the cache.
+
+        Returns
+        -------
+        ndarray or None
+            The projected solution, or None if projection is not active or the basis was empty.
+        """
+        guess = self._guess
+        self._guess = None
+        return guess
 
     def add_solution(self, rhs, solution, copy):
         """
@@ -200,6 +354,9 @@ class LinearRHSChecker(object):
         copy : bool
             If True, make a copy of the RHS and solution vectors before storing them.
         """
+        if self._projection:
+            self._add_to_basis(rhs, solution)
+
         if self._caches.maxlen > 0:
             if copy:
                 rhs = rhs.copy()
@@ -210,7 +367,9 @@ class LinearRHSChecker(object):
         """
         Return a cached solution if the RHS vector matches a cached vector.
 
-        Also indicates if the RHS vector is zero.
+        Also indicates if the RHS vector is zero. If projection is active, the solution of an
+        RHS vector in the span of the basis is built from the solutions of the basis. Otherwise,
+        the projected solution is kept for get_initial_guess.
 
         Parameters
         ----------
@@ -227,6 +386,8 @@ class LinearRHSChecker(object):
         bool
             True if the rhs array is zero.
         """
+        self._guess = None
+
         if system.under_complex_step:
             return None, False
 
@@ -246,7 +407,7 @@ class LinearRHSChecker(object):
                         print(f"{self._solver_msginfo}: Skipping linear solve. RHS is zero.")
                 return None, True
 
-        if self._caches.maxlen == 0:
+        if self._caches.maxlen == 0 and not self._projection:
             return None, False
 
         # if there is no intersection between the current seed vars and the responses that cause
@@ -255,19 +416,14 @@ class LinearRHSChecker(object):
         try:
             redundant = system._relevance.get_redundant_adjoint_systems()[system.pathname]
         except KeyError:
-            return None, False
+            return self._get_projected_solution(rhs_arr, system)
 
         if seed_vars is None or not redundant.intersection(seed_vars):
-            return None, False
+            return self._get_projected_solution(rhs_arr, system)
 
         sol_array = None
 
-        if self._ncompute_totals != system._problem_meta['ncompute_totals']:
-            # reset the cache if we've run compute_totals since the last time we used the cache
-            self.clear()
-            self._ncompute_totals = system._problem_meta['ncompute_totals']
-            if self._stats is not None:
-                self._stats['resets'] += 1
+        self._reset_if_stale(system)
 
         for i in range(len(self._caches) - 1, -1, -1):
             rhs_cache, sol_cache = self._caches[i]
@@ -316,7 +472,67 @@ class LinearRHSChecker(object):
             if system.comm.allreduce(matched_cache) != system.comm.size:
                 matched_cache = 0
 
+        if not matched_cache and self._projection:
+            return self._get_projected_solution(rhs_arr, system)
+
         if not matched_cache and self._stats is not None:
             self._stats['misses'] += 1
 
         return sol_array if matched_cache else None, False
+
+    def _reset_if_stale(self, system):
+        """
+        Clear the cache if compute_totals has run since the last time it was used.
+
+        Parameters
+        ----------
+        system : System
+            The system that owns the solver that owns this LinearRHSChecker.
+        """
+        if self._ncompute_totals != system._problem_meta['ncompute_totals']:
+            self.clear()
+            self._ncompute_totals = system._problem_meta['ncompute_totals']
+            if self._stats is not None:
+                self._stats['resets'] += 1
+
+    def _get_projected_solution(self, rhs_arr, system):
+        """
+        Return the projected solution if the RHS vector is in the span of the basis.
+
+        Otherwise, the projected solution is kept for get_initial_guess.
+
+        Parameters
+        ----------
+        rhs_arr : ndarray
+            The RHS vector.
+        system : System
+            The system that owns the solver that owns this LinearRHSChecker.
+
+        Returns
+        -------
+        ndarray or None
+            The projected solution if the residual of the projection is below the tolerance,
+            otherwise None.
+        bool
+            Always False, because the zero check is done by get_solution.
+        """
+        if not self._projection:
+            return None, False
+
+        self._reset_if_stale(system)
+
+        # the projection is done over the whole distributed array, so all procs agree
+        sol_array, matched = self._project(rhs_arr)
+        if matched:
+            if self._stats is not None:
+                self._stats['projhits'] += 1
+            if self._verbose:
+                print(f"{self._solver_msginfo}: Skipping linear solve. RHS is a linear "
+                      "combination of previous RHS vectors.")
+            return sol_array, False
+
+        self._guess = sol_array
+        if self._stats is not None:
+            self._stats['misses'] += 1
+
+        return None, False
@@ -391,6 +391,11 @@ class PETScKrylov(LinearSolver):
                     x_vec.set_val(sol_array)
                     return
 
+                # start from the solution projected on the previous RHS vectors, if any
+                guess = self._lin_rhs_checker.get_initial_guess()
+                if guess is not None:
+                    x_vec.set_val(guess)
+
         rhs_array = b_vec.asarray(copy=True)
         sol_array = x_vec.asarray(copy=True)
 
@@ -4,6 +4,9 @@ from packaging.version import Version
 import numpy as np
 import scipy
 from scipy.sparse.linalg import LinearOperator, gmres
+from openmdao.solvers.linear.assembled_precon import ILUPreconditioner, \
+    BlockJacobiPreconditioner, AdditiveSchwarzPreconditioner
+from openmdao.solvers.linear.gcrodr import gcrodr
 from openmdao.solvers.linear.linear_rhs_checker import LinearRHSChecker
 
 from openmdao.solvers.solver import LinearSolver
@@ -14,8 +17,11 @@ _SOLVER_TYPES = {
     # 'cg': cg,
     # 'cgs': cgs,
     'gmres': gmres,
+    'gcrodr': gcrodr,
 }
 
+_PRECON_TYPES = (None, 'ilu', 'block_jacobi', 'schwarz')
+
 
 class ScipyKrylov(LinearSolver):
     """
@@ -32,6 +38,13 @@ class ScipyKrylov(LinearSolver):
         Preconditioner for linear solve. Default is None for no preconditioner.
     _lin_rhs_checker : LinearRHSChecker or None
         Object for checking the right-hand side of the linear solve.
+    _assembled_precon : object or None
+        Algebraic preconditioner built from the assembled jacobian, if any.
+    _precon_blocks : list of ndarray or None
+        Indices of the outputs of each subsystem, used by the block preconditioners.
+    _recycled : dict
+        Subspace recycled by the 'gcrodr' solver for each direction, kept between the linear
+        solves of one linearization.
     """
 
     SOLVER = 'LN: SCIPY'
@@ -44,6 +57,9 @@ class ScipyKrylov(LinearSolver):
 
         self.precon = None
         self._lin_rhs_checker = None
+        self._assembled_precon = None
+        self._precon_blocks = None
+        self._recycled = {}
 
     def _assembled_jac_solver_iter(self):
         """
@@ -67,7 +83,19 @@ class ScipyKrylov(LinearSolver):
         self.options.declare('restart', default=20, types=int,
                              desc='Number of iterations between restarts. Larger values increase '
                                   'iteration cost, but may be necessary for convergence. This '
-                                  'option applies only to gmres.')
+                                  'option applies to gmres and gcrodr, where it includes the '
+                                  'recycled vectors.')
+
+        self.options.declare('recycle', default=True, types=bool,
+                             desc="If True, the harmonic Ritz vectors kept by 'gcrodr' between its "
+                             "restarts are also kept between the linear solves of one "
+                             "linearization, so that each solve starts from the subspace found by "
+                             "the previous ones. The subspace is discarded when the system is "
+                             "linearized again.")
+
+        self.options.declare('recycle_size', default=10, types=int, lower=1,
+                             desc="Number of harmonic Ritz vectors kept by 'gcrodr'. It should be "
+                             "less than restart.")
 
         self.options.declare('rhs_checking', types=(bool, dict),
                              default=False,
@@ -76,6 +104,25 @@ class ScipyKrylov(LinearSolver):
                              "allow finer control over it. Allowed options are: "
                              f"{LinearRHSChecker.options}")
 
+        self.options.declare('precon', default=None, values=_PRECON_TYPES, allow_none=True,
+                             desc="Algebraic preconditioner built from the assembled jacobian. "
+                             "'ilu' is an incomplete LU factorization with threshold dropping, "
+                             "'block_jacobi' uses an LU factorization of the diagonal block of "
+                             "each subsystem and 'schwarz' is an additive Schwarz method with "
+                             "overlapping subsystem blocks. Requires assemble_jac=True, and can't "
+                             "be combined with a preconditioner solver.")
+
+        self.options.declare('ilu_drop_tol', default=1e-4, types=float, lower=0.0,
+                             desc="Drop tolerance of the 'ilu' preconditioner.")
+
+        self.options.declare('ilu_fill_factor', default=10.0, types=float, lower=1.0,
+                             desc="Maximum ratio of nonzeros in the factors of the 'ilu' "
+                             "preconditioner to nonzeros in the jacobian.")
+
+        self.options.declare('schwarz_overlap', default=1, types=int, lower=0,
+                             desc="Number of levels of overlap between the blocks of the "
+                             "'schwarz' preconditioner.")
+
         # changing the default maxiter from the base class
         self.options['maxiter'] = 1000
         self.options['atol'] = 1.0e-12
@@ -98,6 +145,20 @@ class ScipyKrylov(LinearSolver):
         if self.precon is not None:
             self.precon._setup_solvers(self._system(), self._depth + 1)
 
+        self._assembled_precon = None
+        self._precon_blocks = None
+        self._recycled = {}
+        if self.options['precon'] is not None:
+            if self.precon is not None:
+                raise RuntimeError(f"{self.msginfo}: The 'precon' option can't be used when a "
+                                   "preconditioner solver is also assigned.")
+            if not self.options['assemble_jac']:
+                raise RuntimeError(f"{self.msginfo}: The '{self.options['precon']}' "
+                                   "preconditioner requires assemble_jac=True.")
+            if system.comm.size > 1:
+                raise RuntimeError(f"{self.msginfo}: The '{self.options['precon']}' "
+                                   "preconditioner is not supported under MPI if comm.size > 1.")
+
         self._lin_rhs_checker = LinearRHSChecker.create(self._system(),
                                                         self.options['rhs_checking'])
 
@@ -137,9 +198,50 @@ class ScipyKrylov(LinearSolver):
         if self.precon is not None:
             self.precon._linearize()
 
+        precon = self.options['precon']
+        if precon is not None:
+            matrix = self._assembled_jac._int_mtx._matrix
+            try:
+                if precon == 'ilu':
+                    self._assembled_precon = ILUPreconditioner(
+                        matrix, self.options['ilu_drop_tol'], self.options['ilu_fill_factor'])
+                elif precon == 'block_jacobi':
+                    self._assembled_precon = BlockJacobiPreconditioner(matrix,
+                                                                       self._get_precon_blocks())
+                else:
+                    self._assembled_precon = AdditiveSchwarzPreconditioner(
+                        matrix, self._get_precon_blocks(), self.options['schwarz_overlap'])
+            except RuntimeError as err:
+                raise RuntimeError(f"{self.msginfo}: Failed to build the '{precon}' "
+                                   f"preconditioner: {err}")
+
+        self._recycled = {}
+
         if self._lin_rhs_checker is not None:
             self._lin_rhs_checker.clear()
 
+    def _get_precon_blocks(self):
+        """
+        Return the indices of the outputs of each subsystem in the assembled jacobian.
+
+        Returns
+        -------
+        list of ndarray
+            Indices of the outputs of each subsystem.
+        """
+        if self._precon_blocks is None:
+            system = self._system()
+            plen = len(system.pathname) + 1 if system.pathname else 0
+
+            ranges = {}
+            for name, slc in system._outputs.get_slice_dict().items():
+                ranges.setdefault(name[plen:].split('.', 1)[0], []).append(
+                    np.arange(slc.start, slc.stop))
+
+            self._precon_blocks = [np.concatenate(r) for r in ranges.values()]
+
+        return self._precon_blocks
+
     def _mat_vec(self, in_arr):
         """
         Compute matrix-vector product.
@@ -182,7 +284,17 @@ class ScipyKrylov(LinearSolver):
         res : ndarray
             the current residual vector.
         """
-        norm = np.linalg.norm(res)
+        self._monitor_norm(np.linalg.norm(res))
+
+    def _monitor_norm(self, norm):
+        """
+        Print the residual norm and iteration number (callback from solvers passing the norm).
+
+        Parameters
+        ----------
+        norm : float
+            The norm of the current residual vector.
+        """
         if self._iter_count == 0:
             if norm != 0.0:
                 self._norm0 = norm
@@ -230,6 +342,11 @@ class ScipyKrylov(LinearSolver):
                     x_vec.set_val(sol_array)
                     return
 
+                # start from the solution projected on the previous RHS vectors, if any
+                guess = self._lin_rhs_checker.get_initial_guess()
+                if guess is not None:
+                    x_vec.set_val(guess)
+
         x_vec_combined = x_vec.asarray()
         size = x_vec_combined.size
         linop = LinearOperator((size, size), dtype=float, matvec=self._mat_vec)
@@ -237,11 +354,24 @@ class ScipyKrylov(LinearSolver):
         # Support a preconditioner
         if self.precon:
             M = LinearOperator((size, size), matvec=self._apply_precon, dtype=float)
+        elif self._assembled_precon is not None:
+            M = LinearOperator((size, size), matvec=self._apply_assembled_precon, dtype=float)
         else:
             M = None
 
         self._iter_count = 0
-        if solver is gmres:
+        if solver is gcrodr:
+            recycle = self.options['recycle'] and not system.under_complex_step
+
+            # the initial guess is copied, because the matrix-vector products overwrite it
+            x, info, recycled = solver(linop, b_vec.asarray(True), x0=x_vec_combined.copy(),
+                                       rtol=rtol, atol=atol, m=self.options['restart'],
+                                       k=self.options['recycle_size'], maxiter=maxiter, M=M,
+                                       recycled=self._recycled.get(mode) if recycle else None,
+                                       callback=self._monitor_norm)
+            if recycle and recycled is not None:
+                self._recycled[mode] = recycled
+        elif solver is gmres:
             if Version(Version(scipy.__version__).base_version) < Version("1.12"):
                 x, info = solver(linop, b_vec.asarray(True), M=M, restart=restart,
                                  x0=x_vec_combined, maxiter=maxiter, tol=atol, atol='legacy',
@@ -307,6 +437,41 @@ class ScipyKrylov(LinearSolver):
         # return resulting value of x vector
         return x_vec.asarray(copy=True)
 
+    def _apply_assembled_precon(self, in_vec):
+        """
+        Apply the algebraic preconditioner built from the assembled jacobian.
+
+        Parameters
+        ----------
+        in_vec : ndarray
+            Incoming vector.
+
+        Returns
+        -------
+        ndarray
+            The preconditioned Vector.
+        """
+        system = self._system()
+        d_outputs = system._doutputs
+        d_residuals = system._dresiduals
+
+        if self._mode == 'fwd':
+            x_vec = d_outputs
+            b_vec = d_residuals
+            trans = 'N'
+        else:  # rev
+            x_vec = d_residuals
+            b_vec = d_outputs
+            trans = 'T'
+
+        b_vec.set_val(in_vec)
+
+        # AssembledJacobians are unscaled.
+        with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+            x_vec.set_val(self._assembled_precon.solve(b_vec.asarray(), trans))
+
+        return x_vec.asarray(copy=True)
+
     def use_relevance(self):
         """
         Return True if relevance should be active.
@@ -1,16 +1,20 @@
 """Test the DirectSolver linear solver class."""
 
+import sys
 import unittest
+from io import StringIO
 
 import numpy as np
 
 import openmdao.api as om
 
+from openmdao.solvers.linear.direct import _BlockTriangularLU
 from openmdao.solvers.linear.tests.linear_test_base import LinearSolverTests
 from openmdao.test_suite.components.double_sellar import DoubleSellar
 from openmdao.test_suite.components.expl_comp_simple import TestExplCompSimpleJacVec
 from openmdao.test_suite.components.sellar import SellarDerivatives
 from openmdao.test_suite.groups.implicit_group import TestImplicitGroup
+from openmdao.test_suite.groups.parallel_groups import ConvergeDivergeFlat, FanInGrouped
 from openmdao.utils.array_utils import evenly_distrib_idxs
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.general_utils import printoptions
@@ -933,6 +937,320 @@ class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
             prob.run_model()
 
 
+def _block_triangular_chain(size=5):
+    # a feed-forward chain with a coupled pair of implicit states in the middle
+    prob = om.Problem()
+    model = prob.model
+    model.add_subsystem('c1', om.ExecComp('y = 2.0 * x**2', x=np.ones(size), y=np.ones(size),
+                                          has_diag_partials=True))
+    model.add_subsystem('c2', om.ExecComp('y = 3.0 * x', x=np.ones(size), y=np.ones(size),
+                                          has_diag_partials=True))
+    bal = model.add_subsystem('bal', om.BalanceComp())
+    bal.add_balance('a', lhs_name='lhs_a', rhs_name='rhs_a', val=np.ones(size))
+    bal.add_balance('b', lhs_name='lhs_b', rhs_name='rhs_b', val=np.ones(size))
+    model.add_subsystem('ca', om.ExecComp('y = 3.0 * a + b', a=np.ones(size), b=np.ones(size),
+                                          y=np.ones(size), has_diag_partials=True))
+    model.add_subsystem('cb', om.ExecComp('y = a - 2.0 * b', a=np.ones(size), b=np.ones(size),
+                                          y=np.ones(size), has_diag_partials=True))
+    model.add_subsystem('c3', om.ExecComp('y = sum(a * x)', a=np.ones(size), x=np.ones(size)))
+
+    model.connect('c1.y', ['c2.x', 'c3.x'])
+    model.connect('c2.y', ['bal.rhs_a', 'bal.rhs_b'])
+    model.connect('bal.a', ['ca.a', 'cb.a', 'c3.a'])
+    model.connect('bal.b', ['ca.b', 'cb.b'])
+    model.connect('ca.y', 'bal.lhs_a')
+    model.connect('cb.y', 'bal.lhs_b')
+
+    model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, atol=1e-12, rtol=1e-12)
+    model.linear_solver = om.DirectSolver()
+    prob.set_solver_print(level=0)
+
+    return prob
+
+
+class TestDirectSolverBlockTriangular(unittest.TestCase):
+
+    def _compare_totals(self, model_func, of, wrt, **setup_kwargs):
+        for mode in ('fwd', 'rev'):
+            results = []
+            for block_triangular in (False, True):
+                prob = model_func()
+                prob.model.linear_solver.options['block_triangular'] = block_triangular
+                prob.setup(mode=mode, **setup_kwargs)
+                prob.run_model()
+                results.append(prob.compute_totals(of=of, wrt=wrt, return_format='array'))
+
+            assert_near_equal(results[1], results[0], 1e-12)
+
+        return prob
+
+    def test_chain(self):
+        prob = self._compare_totals(_block_triangular_chain, ['c3.y', 'bal.a'], ['c1.x'])
+
+        lu = prob.model.linear_solver._lu
+        self.assertIsInstance(lu, _BlockTriangularLU)
+
+        # the balance residuals set ca.y and cb.y, so only each pair of a and b entries is
+        # coupled and needs a factorization.
+        row_perm, col_perm, bounds, tri = prob.model.linear_solver._bt_order
+        sizes = np.diff(bounds)
+        self.assertEqual([n for n, is_tri in zip(sizes, tri) if not is_tri], [2] * 5)
+        self.assertEqual(np.sum(sizes), prob.model._outputs.asarray().size)
+
+        # the balance is converged with the block triangular factorization
+        assert_near_equal(prob.get_val('ca.y'), prob.get_val('c2.y'), 1e-10)
+        assert_near_equal(prob.get_val('cb.y'), prob.get_val('c2.y'), 1e-10)
+
+    def test_feed_forward(self):
+        def model_func():
+            prob = om.Problem(ConvergeDivergeFlat())
+            prob.model.linear_solver = om.DirectSolver()
+            prob.set_solver_print(level=0)
+            return prob
+
+        prob = self._compare_totals(model_func, ['c7.y1'], ['iv.x'])
+        self.assertEqual(prob.model.linear_solver._bt_order[3], [True])
+
+        J = prob.compute_totals(of=['c7.y1'], wrt=['iv.x'], return_format='flat_dict')
+        assert_near_equal(J['c7.y1', 'iv.x'], [[-40.75]], 1e-6)
+
+    def test_irreducible(self):
+        def model_func():
+            prob = om.Problem(SellarDerivatives())
+            prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+            prob.model.linear_solver = om.DirectSolver()
+            prob.set_solver_print(level=0)
+            return prob
+
+        prob = self._compare_totals(model_func, ['obj', 'con1', 'con2'], ['x', 'z'])
+
+        # indep vars are ordered ahead of the coupled block, so there is more than one block
+        self.assertIsInstance(prob.model.linear_solver._lu, _BlockTriangularLU)
+
+    def test_subgroup(self):
+        def model_func():
+            prob = om.Problem(FanInGrouped())
+            prob.model.sub.linear_solver = om.DirectSolver()
+            prob.model.linear_solver = om.DirectSolver()
+            prob.set_solver_print(level=0)
+            return prob
+
+        self._compare_totals(model_func, ['c3.y'], ['x1', 'x2'])
+
+    def test_dense_jac(self):
+        prob = _block_triangular_chain()
+        prob.model.linear_solver.options['block_triangular'] = True
+        prob.model.options['assembled_jac_type'] = 'dense'
+        prob.setup()
+        prob.run_model()
+
+        # the option only applies to sparse jacobians
+        self.assertIsNone(prob.model.linear_solver._bt_order)
+        assert_near_equal(prob.get_val('ca.y'), prob.get_val('c2.y'), 1e-10)
+
+    def test_raise_error_on_singular(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p', om.IndepVarComp('x', 1.0))
+        model.add_subsystem('c1', om.ExecComp('y = 2.0 * x'))
+        model.add_subsystem('sing', SingularComp())
+        model.connect('p.x', 'c1.x')
+        model.connect('c1.y', 'sing.x')
+
+        model.linear_solver = om.DirectSolver(block_triangular=True)
+
+        prob.setup()
+        prob.run_model()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_totals(of=['sing.y'], wrt=['p.x'])
+
+        expected_msg = "Singular entry found in <model> <class Group> for row associated with " \
+                       "state/residual 'sing.y' index 0."
+        self.assertEqual(expected_msg, str(cm.exception))
+
+
+class LinearSystemComp(om.ImplicitComponent):
+    """Solve A x = b for a given dense matrix A."""
+
+    def initialize(self):
+        self.options.declare('A')
+
+    def setup(self):
+        A = self.options['A']
+        size = A.shape[0]
+        self.add_input('b', np.ones(size))
+        self.add_output('x', np.ones(size))
+
+        rows, cols = np.nonzero(np.ones(A.shape))
+        self.declare_partials('x', 'x', rows=rows, cols=cols, val=A.ravel())
+        self.declare_partials('x', 'b', rows=np.arange(size), cols=np.arange(size), val=-1.)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['x'] = self.options['A'].dot(outputs['x']) - inputs['b']
+
+
+def _conditioned_matrix(size, cond):
+    rng = np.random.default_rng(11)
+    U, _ = np.linalg.qr(rng.random((size, size)))
+    V, _ = np.linalg.qr(rng.random((size, size)))
+    return U.dot(np.diag(np.logspace(0., np.log10(cond), size))).dot(V.T)
+
+
+class TestDirectSolverMixedPrecision(unittest.TestCase):
+
+    def _compare_totals(self, model_func, of, wrt, assemble_jac=True, jac_type='csc',
+                        **options):
+        for mode in ('fwd', 'rev'):
+            results = []
+            for mixed_precision in (False, True):
+                prob = model_func()
+                prob.model.options['assembled_jac_type'] = jac_type
+                prob.model.linear_solver = om.DirectSolver(assemble_jac=assemble_jac,
+                                                           mixed_precision=mixed_precision,
+                                                           **options)
+                prob.set_solver_print(level=0)
+                prob.setup(mode=mode)
+                prob.run_model()
+                results.append(prob.compute_totals(of=of, wrt=wrt, return_format='array'))
+
+            with self.subTest(mode=mode):
+                assert_near_equal(results[1], results[0], 1e-10)
+
+        return prob
+
+    def _sellar(self):
+        prob = om.Problem(SellarDerivatives())
+        prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        return prob
+
+    def _linear_system(self, cond=100.):
+        prob = om.Problem()
+        prob.model.add_subsystem('ls', LinearSystemComp(A=_conditioned_matrix(20, cond)),
+                                 promotes=['*'])
+        prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        return prob
+
+    def test_sellar(self):
+        for assemble_jac, jac_type in ((True, 'csc'), (True, 'dense'), (False, 'csc')):
+            with self.subTest(assemble_jac=assemble_jac, jac_type=jac_type):
+                prob = self._compare_totals(self._sellar, ['obj', 'con1', 'con2'], ['x', 'z'],
+                                            assemble_jac=assemble_jac, jac_type=jac_type)
+
+                solver = prob.model.linear_solver
+                self.assertTrue(solver._mixed_precision)
+                self.assertGreater(solver._iter_count, 0)
+
+    def test_block_triangular(self):
+        prob = self._compare_totals(_block_triangular_chain, ['c3.y', 'bal.a'], ['c1.x'],
+                                    block_triangular=True)
+
+        self.assertIsInstance(prob.model.linear_solver._lu, _BlockTriangularLU)
+        self.assertTrue(prob.model.linear_solver._mixed_precision)
+
+    def test_linear_system(self):
+        for jac_type in ('csc', 'dense'):
+            with self.subTest(jac_type=jac_type):
+                prob = self._compare_totals(self._linear_system, ['x'], ['b'], jac_type=jac_type)
+
+                A = prob.model.ls.options['A']
+                J = prob.compute_totals(of=['x'], wrt=['b'], return_format='array')
+                assert_near_equal(J, np.linalg.inv(A), 1e-10)
+                self.assertTrue(prob.model.linear_solver._mixed_precision)
+
+    def test_fallback(self):
+        # single precision can't resolve a condition number of 1e9, so the refinement diverges
+        # and the matrix is factored again in double precision.
+        for jac_type in ('csc', 'dense'):
+            with self.subTest(jac_type=jac_type):
+                prob = self._compare_totals(lambda: self._linear_system(1e9), ['x'], ['b'],
+                                            jac_type=jac_type)
+
+                self.assertFalse(prob.model.linear_solver._mixed_precision)
+                self.assertIsNone(prob.model.linear_solver._mtx)
+
+    def test_singular_in_single_precision(self):
+        # the matrix is only singular once it's cast to single precision, so it's factored
+        # again in double precision
+        A = np.array([[1., 1.], [1., 1. + 1e-9]])
+
+        def model_func():
+            prob = om.Problem()
+            prob.model.add_subsystem('ls', LinearSystemComp(A=A), promotes=['*'])
+            prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+            return prob
+
+        for assemble_jac, jac_type in ((True, 'csc'), (True, 'dense'), (False, 'csc')):
+            with self.subTest(assemble_jac=assemble_jac, jac_type=jac_type):
+                prob = self._compare_totals(model_func, ['x'], ['b'],
+                                            assemble_jac=assemble_jac, jac_type=jac_type)
+
+                J = prob.compute_totals(of=['x'], wrt=['b'], return_format='array')
+                assert_near_equal(J, np.linalg.inv(A), 1e-6)
+                self.assertFalse(prob.model.linear_solver._mixed_precision)
+                self.assertIsNone(prob.model.linear_solver._mtx)
+
+    def test_no_refinement(self):
+        prob = self._linear_system()
+        prob.model.linear_solver = om.DirectSolver(mixed_precision=True, refine_maxiter=0)
+        prob.set_solver_print(level=0)
+        prob.setup()
+        prob.run_model()
+
+        J = prob.compute_totals(of=['x'], wrt=['b'], return_format='array')
+        assert_near_equal(J, np.linalg.inv(prob.model.ls.options['A']), 1e-10)
+        self.assertFalse(prob.model.linear_solver._mixed_precision)
+
+    def test_iprint(self):
+        prob = self._linear_system(1e9)
+        prob.model.linear_solver = om.DirectSolver(mixed_precision=True)
+        prob.set_solver_print(level=0)
+        prob.setup()
+        prob.run_model()
+
+        prob.model.linear_solver.options['iprint'] = 2
+        prob.model.linear_solver._linearize()
+
+        stdout = sys.stdout
+        strout = StringIO()
+        sys.stdout = strout
+        try:
+            prob.compute_totals(of=['x'], wrt=['b'])
+        finally:
+            sys.stdout = stdout
+
+        lines = strout.getvalue().strip().split('\n')
+        self.assertTrue(lines[0].startswith('LN: Direct 0 ; '), lines[0])
+        self.assertRegex(lines[-1], r'^LN: Direct Refinement failed to converge in \d+ '
+                         r'iterations\. Factoring again in full precision\.$')
+        self.assertFalse(prob.model.linear_solver._mixed_precision)
+
+        prob.model.linear_solver.options['iprint'] = 1
+        prob.model.linear_solver.options['mixed_precision'] = False
+        prob.model.linear_solver._linearize()
+
+        sys.stdout = strout = StringIO()
+        try:
+            prob.compute_totals(of=['x'], wrt=['b'])
+        finally:
+            sys.stdout = stdout
+
+        self.assertEqual(strout.getvalue(), '')
+
+    def test_complex_step(self):
+        prob = self._sellar()
+        prob.model.linear_solver = om.DirectSolver(mixed_precision=True)
+        prob.set_solver_print(level=0)
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+
+        data = prob.check_totals(of=['obj', 'con1', 'con2'], wrt=['x', 'z'], method='cs',
+                                 out_stream=None)
+        for key, val in data.items():
+            assert_near_equal(val['rel error'][0], 0., 1e-10)
+
+
 @unittest.skipUnless(MPI and PETScVector, "only run with MPI and PETSc.")
 class TestDirectSolverRemoteErrors(unittest.TestCase):
 
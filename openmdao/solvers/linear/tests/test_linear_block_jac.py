@@ -1,12 +1,15 @@
 """Test the LinearBlockJac class."""
 
+import threading
 import unittest
+from unittest import mock
 
 import numpy as np
 
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_near_equal
-from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, SellarDis2withDerivatives
+from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, SellarDis2withDerivatives, \
+     SellarDerivativesGrouped
 from openmdao.test_suite.components.expl_comp_simple import TestExplCompSimpleDense
 from openmdao.solvers.linear.tests.linear_test_base import LinearSolverTests
 
@@ -31,6 +34,41 @@ class TestLinearBlockJacSolver(LinearSolverTests.LinearSolverTestCase):
             self.assertEqual(str(context.exception),
                              "Linear solver 'LN: LNBJ' doesn't support assembled jacobians.")
 
+    def test_threaded(self):
+        of = [f'sellar{i}.{name}' for i in range(3) for name in ('obj', 'con1', 'con2')]
+        wrt = [f'sellar{i}.{name}' for i in range(3) for name in ('x', 'z')]
+
+        for mode in ('fwd', 'rev'):
+            results = []
+            for num_threads in (1, 3):
+                prob = om.Problem()
+                model = prob.model
+                for i in range(3):
+                    model.add_subsystem(f'sellar{i}', SellarDerivativesGrouped(
+                        nonlinear_solver=om.NewtonSolver(solve_subsystems=False),
+                        linear_solver=om.DirectSolver()))
+                model.linear_solver = om.LinearBlockJac(num_threads=num_threads)
+                prob.set_solver_print(level=0)
+                prob.setup(mode=mode)
+                prob.run_model()
+
+                threads = set()
+                direct_solve = om.DirectSolver.solve
+
+                def solve(solver, solve_mode, rel_systems=None):
+                    threads.add(threading.current_thread().name)
+                    return direct_solve(solver, solve_mode, rel_systems)
+
+                with mock.patch.object(om.DirectSolver, 'solve', autospec=True,
+                                       side_effect=solve):
+                    results.append(prob.compute_totals(of, wrt, return_format='array'))
+
+                # the subsystems are only solved on the pool threads if num_threads > 1
+                self.assertEqual(threading.main_thread().name in threads, num_threads == 1)
+
+            with self.subTest(mode=mode):
+                assert_near_equal(results[1], results[0], 1e-15)
+
 
 class TestBJacSolverFeature(unittest.TestCase):
 
@@ -1,6 +1,9 @@
 """Test the ScipyKrylov linear solver class."""
 
+import sys
 import unittest
+from io import StringIO
+from unittest import mock
 
 import numpy as np
 import scipy
@@ -8,19 +11,30 @@ import scipy
 from packaging.version import Version
 
 import openmdao.api as om
+from openmdao.solvers.linear.assembled_precon import ILUPreconditioner, \
+    BlockJacobiPreconditioner, AdditiveSchwarzPreconditioner
+from openmdao.solvers.linear.gcrodr import gcrodr
+from openmdao.solvers.linear.linear_rhs_checker import LinearRHSChecker
 from openmdao.solvers.linear.tests.linear_test_base import LinearSolverTests
+from openmdao.test_suite.components.double_sellar import DoubleSellar
 from openmdao.test_suite.components.expl_comp_simple import TestExplCompSimpleDense
 from openmdao.test_suite.components.misc_components import Comp4LinearCacheTest
+from openmdao.test_suite.components.poisson1d import Poisson1DComp
 from openmdao.test_suite.components.quad_implicit import QuadraticComp
 from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, SellarDis2withDerivatives
 from openmdao.test_suite.groups.implicit_group import TestImplicitGroup
 from openmdao.utils.assert_utils import assert_near_equal, assert_check_totals
 
+try:
+    from parameterized import parameterized
+except ImportError:
+    from openmdao.utils.assert_utils import SkipParameterized as parameterized
+
 
 # use this to fake out the TestImplicitGroup so it'll use the solver we want.
-def krylov_factory(solver):
+def krylov_factory(solver, **options):
     def f(junk=None):
-        return om.ScipyKrylov(solver=solver)
+        return om.ScipyKrylov(solver=solver, **options)
     return f
 
 
@@ -201,6 +215,12 @@ class TestScipyKrylov(LinearSolverTests.LinearSolverTestCase):
                         f"the first solve, which ran for {icount1} iterations.")
 
 
+class TestScipyKrylovGCRODR(TestScipyKrylov):
+
+    linear_solver_name = 'gcrodr'
+    linear_solver_class = krylov_factory('gcrodr')
+
+
 class TestScipyKrylovFeature(unittest.TestCase):
 
     def test_feature_simple(self):
@@ -400,5 +420,362 @@ class TestCaching(unittest.TestCase):
 
         assert_check_totals(prob.check_totals(out_stream=None))
 
+    def _projection_prob(self, linear_solver):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.ones(3)))
+        G = model.add_subsystem('G', om.Group())
+        G.add_subsystem('comp', om.ExecComp('y = A.dot(x)', A={'val': np.array([[2., 1., 0.],
+                                                                                  [1., 3., 1.],
+                                                                                  [0., 1., 4.]])},
+                                            x=np.ones(3), y=np.ones(3)))
+        G.linear_solver = linear_solver
+
+        # the seed of r3 is the sum of the seeds of r1 and r2, and the seed of r4 is a scaled
+        # copy of the seed of r2
+        model.add_subsystem('r1', om.ExecComp('y = x[0] + x[1]', x=np.ones(3)))
+        model.add_subsystem('r2', om.ExecComp('y = x[1] + x[2]', x=np.ones(3)))
+        model.add_subsystem('r3', om.ExecComp('y = x[0] + 2.*x[1] + x[2]', x=np.ones(3)))
+        model.add_subsystem('r4', om.ExecComp('y = 3.*x[1] + 3.*x[2]', x=np.ones(3)))
+
+        model.connect('ivc.x', 'G.comp.x')
+        model.connect('G.comp.y', ['r1.x', 'r2.x', 'r3.x', 'r4.x'])
+
+        model.add_design_var('ivc.x')
+        for name in ('r1', 'r2', 'r3', 'r4'):
+            model.add_constraint(f'{name}.y', upper=10.0)
+
+        prob.setup(mode='rev')
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        return prob
+
+    def test_projection(self):
+        opts = {'collect_stats': True, 'max_cache_entries': 0, 'projection': True}
+        for linear_solver in (om.ScipyKrylov(rhs_checking=opts), om.DirectSolver(rhs_checking=opts)):
+            prob = self._projection_prob(linear_solver)
+
+            with mock.patch.object(LinearRHSChecker, 'add_solution', autospec=True,
+                                   side_effect=LinearRHSChecker.add_solution) as add_solution:
+                J = prob.compute_totals(return_format='array')
+
+            # only the first two RHS vectors are solved
+            checker = prob.model.G.linear_solver._lin_rhs_checker
+            self.assertEqual(add_solution.call_count, 2)
+            self.assertEqual(checker._stats['projhits'], 2)
+
+            A = np.array([[2., 1., 0.], [1., 3., 1.], [0., 1., 4.]])
+            expected = np.array([[1., 1., 0.], [0., 1., 1.], [1., 2., 1.], [0., 3., 3.]]) @ A
+            assert_near_equal(J, expected, 1e-12)
+
+            # the basis is cleared by the next compute_totals
+            prob.compute_totals()
+            self.assertEqual(checker._stats['resets'], 2)
+            self.assertEqual(checker._stats['projhits'], 4)
+
+    def test_projection_basis(self):
+        prob = self._projection_prob(om.ScipyKrylov())
+        checker = LinearRHSChecker(prob.model.G, projection=True, max_projection_bytes=200)
+
+        rng = np.random.default_rng(0)
+        A = rng.random((3, 3)) + 3. * np.eye(3)
+        rhs = rng.random((3, 3))
+
+        # the memory bound allows 4 columns, but no more than 3 are independent
+        for b in rhs.T:
+            checker.add_solution(b, np.linalg.solve(A, b), copy=True)
+        self.assertEqual(checker._basis.shape, (3, 3))
+        assert_near_equal(checker._basis.T @ checker._basis, np.eye(3), 1e-12)
+        assert_near_equal(A @ checker._basis_sols, checker._basis, 1e-12)
+
+        # a dependent RHS vector doesn't change the basis
+        order = list(checker._basis_order)
+        checker.add_solution(rhs @ [1., 2., 3.], np.linalg.solve(A, rhs @ [1., 2., 3.]), copy=True)
+        self.assertEqual(list(checker._basis_order), order)
+
+        b = rng.random(3)
+        sol, matched = checker._project(b)
+        self.assertTrue(matched)
+        assert_near_equal(sol, np.linalg.solve(A, b), 1e-12)
+
+    def test_projection_initial_guess(self):
+        prob = self._projection_prob(om.ScipyKrylov())
+        checker = LinearRHSChecker(prob.model.G, projection=True)
+
+        b1 = np.array([1., 0., 0.])
+        checker.add_solution(b1, 2. * b1, copy=True)
+
+        # an RHS vector outside the span of the basis starts from its projected solution
+        sol, is_zero = checker.get_solution(np.array([3., 1., 0.]), prob.model.G)
+        self.assertIsNone(sol)
+        self.assertFalse(is_zero)
+        assert_near_equal(checker.get_initial_guess(), 6. * b1, 1e-15)
+        self.assertIsNone(checker.get_initial_guess())
+
+class TestAssembledPrecon(unittest.TestCase):
+
+    def _double_sellar(self, linear_solver, mode):
+        prob = om.Problem(DoubleSellar(scaling=True))
+        prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        prob.model.linear_solver = linear_solver
+        prob.set_solver_print(level=0)
+        prob.setup(mode=mode)
+        prob.run_model()
+        return prob
+
+    @parameterized.expand([(precon, mode) for precon in ('ilu', 'block_jacobi', 'schwarz')
+                           for mode in ('fwd', 'rev')])
+    def test_double_sellar(self, precon, mode):
+        of = ['g1.y1', 'g2.y2']
+        wrt = ['g1.z', 'g2.z']
+
+        prob = self._double_sellar(om.DirectSolver(), mode)
+        expected = prob.compute_totals(of, wrt, return_format='array')
+
+        prob = self._double_sellar(om.ScipyKrylov(), mode)
+        prob.compute_totals(of, wrt)
+        unpreconditioned_iters = prob.model.linear_solver._iter_count
+
+        prob = self._double_sellar(om.ScipyKrylov(assemble_jac=True, precon=precon), mode)
+        assert_near_equal(prob.get_val('g1.y1'), 0.64, 1e-4)
+        assert_near_equal(prob.compute_totals(of, wrt, return_format='array'), expected, 1e-9)
+        self.assertLess(prob.model.linear_solver._iter_count, unpreconditioned_iters)
+
+    def test_errors(self):
+        prob = om.Problem(DoubleSellar())
+        prob.model.linear_solver = om.ScipyKrylov(precon='ilu')
+
+        prob.setup()
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+        self.assertEqual(str(cm.exception),
+                         "ScipyKrylov in <model> <class DoubleSellar>: The 'ilu' preconditioner "
+                         "requires assemble_jac=True.")
+
+        prob = om.Problem(DoubleSellar())
+        prob.model.linear_solver = om.ScipyKrylov(assemble_jac=True, precon='ilu')
+        prob.model.linear_solver.precon = om.LinearBlockGS()
+
+        prob.setup()
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+        self.assertEqual(str(cm.exception),
+                         "ScipyKrylov in <model> <class DoubleSellar>: The 'precon' option can't "
+                         "be used when a preconditioner solver is also assigned.")
+
+
+class TestKrylovRecycling(unittest.TestCase):
+
+    def _poisson(self, mode, **options):
+        prob = om.Problem()
+        prob.model.add_subsystem('poisson', Poisson1DComp(num_nodes=30), promotes=['*'])
+        prob.model.linear_solver = om.ScipyKrylov(atol=1e-14, rtol=1e-12, **options)
+        prob.set_solver_print(level=0)
+        prob.setup(mode=mode)
+        prob.run_model()
+        return prob
+
+    def _compute_totals(self, prob):
+        with mock.patch.object(om.ScipyKrylov, '_mat_vec', autospec=True,
+                               side_effect=om.ScipyKrylov._mat_vec) as mat_vec:
+            J = prob.compute_totals(['u'], ['f'], return_format='array')
+        return J, mat_vec.call_count
+
+    @parameterized.expand(['fwd', 'rev'])
+    def test_poisson(self, mode):
+        prob = self._poisson(mode, solver='gcrodr', recycle=False)
+        poisson = prob.model.poisson
+        expected = poisson.h2 * np.linalg.inv(poisson.K.toarray())
+        J, iters = self._compute_totals(prob)
+        assert_near_equal(J, expected, 1e-8)
+        self.assertEqual(prob.model.linear_solver._recycled, {})
+
+        prob = self._poisson(mode, solver='gcrodr')
+        J, recycled_iters = self._compute_totals(prob)
+        assert_near_equal(J, expected, 1e-8)
+
+        # each solve starts from the subspace found by the previous ones
+        self.assertLess(recycled_iters, iters)
+
+        # the subspace is kept for the current direction only, and has at most
+        # recycle_size vectors, or one more to keep a pair of complex conjugate vectors
+        solver = prob.model.linear_solver
+        self.assertEqual(list(solver._recycled), [mode])
+        C, U = solver._recycled[mode]
+        self.assertLessEqual(U.shape[1], solver.options['recycle_size'] + 1)
+
+        # and is discarded when the system is linearized again
+        prob.model.run_linearize()
+        self.assertEqual(solver._recycled, {})
+        J, iters = self._compute_totals(prob)
+        assert_near_equal(J, expected, 1e-8)
+        self.assertEqual(iters, recycled_iters)
+
+    def test_double_sellar(self):
+        of = ['g1.y1', 'g2.y2']
+        wrt = ['g1.z', 'g2.z']
+
+        for mode in ('fwd', 'rev'):
+            expected = None
+            for linear_solver in (om.DirectSolver(), om.ScipyKrylov(solver='gcrodr'),
+                                  om.ScipyKrylov(solver='gcrodr', assemble_jac=True,
+                                                 precon='ilu')):
+                prob = om.Problem(DoubleSellar(scaling=True))
+                prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+                prob.model.linear_solver = linear_solver
+                prob.set_solver_print(level=0)
+                prob.setup(mode=mode)
+                prob.run_model()
+
+                assert_near_equal(prob.get_val('g1.y1'), 0.64, 1e-4)
+                J = prob.compute_totals(of, wrt, return_format='array')
+                if expected is None:
+                    expected = J
+                else:
+                    assert_near_equal(J, expected, 1e-9)
+
+    def test_iprint(self):
+        prob = self._poisson('rev', solver='gcrodr')
+        prob.model.linear_solver.options['iprint'] = 2
+
+        stdout = sys.stdout
+        strout = StringIO()
+        sys.stdout = strout
+        try:
+            prob.compute_totals(['u'], ['f'])
+        finally:
+            sys.stdout = stdout
+
+        lines = strout.getvalue().strip().split('\n')
+        self.assertTrue(lines[0].startswith('LN: SCIPY 0 ; '), lines[0])
+        self.assertTrue(all(line.startswith('LN: SCIPY ') for line in lines))
+        self.assertEqual(float(lines[-1].split()[-1]) < 1e-10, True)
+
+
+class TestAssembledPreconClasses(unittest.TestCase):
+
+    def setUp(self):
+        # a tridiagonal matrix split into three blocks
+        n = 9
+        rng = np.random.default_rng(0)
+        self.matrix = scipy.sparse.diags([rng.random(n - 1), 4. + rng.random(n),
+                                          rng.random(n - 1)], [-1, 0, 1], format='csc')
+        self.blocks = [np.arange(0, 3), np.arange(3, 6), np.arange(6, 9)]
+        self.rhs = rng.random(n)
+
+    def test_ilu(self):
+        # no dropping gives an exact factorization
+        precon = ILUPreconditioner(self.matrix, drop_tol=0.)
+        for trans, mtx in (('N', self.matrix), ('T', self.matrix.T)):
+            assert_near_equal(mtx @ precon.solve(self.rhs, trans), self.rhs, 1e-12)
+
+    def test_block_jacobi(self):
+        precon = BlockJacobiPreconditioner(self.matrix, self.blocks)
+        dense = self.matrix.toarray()
+
+        for trans in ('N', 'T'):
+            expected = np.zeros(self.rhs.size)
+            for idxs in self.blocks:
+                block = dense[np.ix_(idxs, idxs)]
+                if trans == 'T':
+                    block = block.T
+                expected[idxs] = np.linalg.solve(block, self.rhs[idxs])
+            assert_near_equal(precon.solve(self.rhs, trans), expected, 1e-12)
+
+    def test_schwarz(self):
+        # without overlap it is the same as block jacobi
+        precon = AdditiveSchwarzPreconditioner(self.matrix, self.blocks, overlap=0)
+        block_jacobi = BlockJacobiPreconditioner(self.matrix, self.blocks)
+        for trans in ('N', 'T'):
+            assert_near_equal(precon.solve(self.rhs, trans),
+                              block_jacobi.solve(self.rhs, trans), 1e-12)
+
+        # the first block grows to cover the whole matrix with enough overlap, which makes the
+        # part of the solution it contributes exact.
+        precon = AdditiveSchwarzPreconditioner(self.matrix, self.blocks, overlap=6)
+        self.assertEqual(precon._blocks[0].size, 9)
+        exact = scipy.sparse.linalg.spsolve(self.matrix, self.rhs)
+        assert_near_equal(precon.solve(self.rhs)[:3], exact[:3], 1e-12)
+
+        # the transpose is consistent with the preconditioner
+        precon = AdditiveSchwarzPreconditioner(self.matrix, self.blocks, overlap=1)
+        M = np.column_stack([precon.solve(col) for col in np.eye(9)])
+        MT = np.column_stack([precon.solve(col, 'T') for col in np.eye(9)])
+        assert_near_equal(MT, M.T, 1e-12)
+
+
+class TestGCRODR(unittest.TestCase):
+
+    def setUp(self):
+        # a nonsymmetric, indefinite matrix with a few eigenvalues close to zero
+        n = 60
+        rng = np.random.default_rng(0)
+        Q = np.linalg.qr(rng.random((n, n)))[0]
+        eigs = np.concatenate((np.linspace(1e-3, 1e-2, 4), -np.linspace(1., 2., 10),
+                               np.linspace(1., 5., n - 14)))
+        self.matrix = Q @ np.diag(eigs) @ Q.T + 0.1 * np.triu(rng.random((n, n)), 1)
+        self.linop = scipy.sparse.linalg.aslinearoperator(self.matrix)
+        self.rng = rng
+
+    def test_solve(self):
+        b = self.rng.random(60)
+        x0 = self.rng.random(60)
+        x, info, (C, U) = gcrodr(self.linop, b, x0, rtol=1e-10, m=20, k=5, maxiter=1000)
+
+        self.assertEqual(info, 0)
+        assert_near_equal(self.matrix @ x, b, 1e-9)
+
+        # the recycled subspace satisfies C = A U, with orthonormal C
+        assert_near_equal(self.matrix @ U, C, 1e-9)
+        assert_near_equal(C.T @ C, np.eye(C.shape[1]), 1e-12)
+
+    def test_recycle(self):
+        rhs = self.rng.random((60, 5))
+        counts = []
+        for recycle in (False, True):
+            matvec = mock.Mock(side_effect=self.matrix.dot)
+            linop = scipy.sparse.linalg.LinearOperator(self.matrix.shape, matvec=matvec)
+            recycled = None
+            for b in rhs.T:
+                x, info, subspace = gcrodr(linop, b, rtol=1e-10, m=20, k=5, maxiter=1000,
+                                           recycled=recycled)
+                self.assertEqual(info, 0)
+                assert_near_equal(self.matrix @ x, b, 1e-9)
+                if recycle:
+                    recycled = subspace
+            counts.append(matvec.call_count)
+
+        self.assertLess(counts[1], counts[0])
+
+    def test_precon(self):
+        b = self.rng.random(60)
+        M = scipy.sparse.linalg.aslinearoperator(np.linalg.inv(self.matrix))
+        callback = mock.Mock()
+        x, info, _ = gcrodr(self.linop, b, rtol=1e-10, m=20, k=5, maxiter=1000, M=M,
+                            callback=callback)
+
+        # the exact inverse converges in one iteration
+        self.assertEqual(info, 0)
+        self.assertEqual(callback.call_count, 1)
+        assert_near_equal(self.matrix @ x, b, 1e-9)
+
+    def test_complex(self):
+        b = self.rng.random(60) + 1j * self.rng.random(60)
+        x, info, _ = gcrodr(self.linop, b, rtol=1e-10, m=20, k=5, maxiter=1000)
+
+        self.assertEqual(info, 0)
+        assert_near_equal(self.matrix @ x, b, 1e-9)
+
+    def test_maxiter(self):
+        callback = mock.Mock()
+        x, info, _ = gcrodr(self.linop, self.rng.random(60), rtol=1e-10, m=20, k=5, maxiter=25,
+                            callback=callback)
+
+        self.assertEqual(info, 25)
+        self.assertEqual(callback.call_count, 25)
+
+
 if __name__ == "__main__":
     unittest.main()
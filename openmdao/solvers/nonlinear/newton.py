@@ -23,6 +23,12 @@ class NewtonSolver(NonlinearSolver):
         is the parent system's linear solver.
     _linesearch : NonlinearSolver
         Line search algorithm. Default is None for no line search.
+    _jac_age : int or None
+        Number of iterations since the last linearization, or None if there is no
+        linearization available for reuse.
+    _lin_norm : float or None
+        Residual norm at the start of the previous iteration, used to monitor the convergence
+        rate while the linearization is being reused.
     """
 
     SOLVER = 'NL: Newton'
@@ -35,6 +41,8 @@ class NewtonSolver(NonlinearSolver):
 
         self.linear_solver = None
         self._linesearch = BoundsEnforceLS()
+        self._jac_age = None
+        self._lin_norm = None
 
     def _declare_options(self):
         """
@@ -53,6 +61,19 @@ class NewtonSolver(NonlinearSolver):
                              desc='When the option is true, a solver will reraise any '
                              'AnalysisError that arises during subsolve; when false, it will '
                              'continue solving.')
+        self.options.declare('max_jac_reuse', types=int, default=0, lower=0,
+                             desc='Maximum number of consecutive iterations that reuse the '
+                             'previous linearization and factorization instead of linearizing '
+                             'again (modified Newton). When 0, the system is linearized at every '
+                             'iteration.')
+        self.options.declare('jac_reuse_rate', types=float, default=0.5, lower=0.0,
+                             desc='While reusing a linearization, linearize again if the ratio of '
+                             'the residual norm to that of the previous iteration is larger than '
+                             'this value.')
+        self.options.declare('jac_reuse_across_solves', types=bool, default=False,
+                             desc='When True, the linearization from the end of one solve may be '
+                             'reused at the start of the next one, e.g., across successive '
+                             'driver iterations. Only applies when max_jac_reuse > 0.')
 
         self.supports['linesearch'] = True
         self.supports['gradients'] = True
@@ -85,6 +106,9 @@ class NewtonSolver(NonlinearSolver):
         if self.linesearch is not None:
             self.linesearch._setup_solvers(system, self._depth + 1)
 
+        self._jac_age = None
+        self._lin_norm = None
+
     def _assembled_jac_solver_iter(self):
         """
         Return a generator of linear solvers using assembled jacs.
@@ -156,6 +180,32 @@ class NewtonSolver(NonlinearSolver):
         if self.linesearch is not None:
             self.linesearch._linearize()
 
+    def _reuse_linearization(self):
+        """
+        Return True if the current iteration can reuse the previous linearization.
+
+        Returns
+        -------
+        bool
+            True if the system doesn't need to be linearized again.
+        """
+        max_reuse = self.options['max_jac_reuse']
+        if max_reuse == 0:
+            return False
+
+        norm = self._iter_get_norm()
+        prev_norm, self._lin_norm = self._lin_norm, norm
+
+        if self._jac_age is None or self._jac_age >= max_reuse or \
+                self._system().under_complex_step:
+            return False
+
+        # linearize again when the convergence rate stalls
+        if prev_norm is not None and norm > self.options['jac_reuse_rate'] * prev_norm:
+            return False
+
+        return True
+
     def _iter_initialize(self):
         """
         Perform any necessary pre-processing operations.
@@ -170,6 +220,10 @@ class NewtonSolver(NonlinearSolver):
         system = self._system()
         solve_subsystems = self.options['solve_subsystems'] and not system.under_complex_step
 
+        self._lin_norm = None
+        if not self.options['jac_reuse_across_solves'] or system.under_complex_step:
+            self._jac_age = None
+
         if self.options['debug_print']:
             self._err_cache['inputs'] = system._inputs._copy_views()
             self._err_cache['outputs'] = system._outputs._copy_views()
@@ -218,12 +272,16 @@ class NewtonSolver(NonlinearSolver):
             system._dresiduals *= -1.0
             my_asm_jac = self.linear_solver._assembled_jac
 
-            system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
-            if (my_asm_jac is not None and
-                    system.linear_solver._assembled_jac is not my_asm_jac):
-                my_asm_jac._update(system)
+            if self._reuse_linearization():
+                self._jac_age += 1
+            else:
+                system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
+                if (my_asm_jac is not None and
+                        system.linear_solver._assembled_jac is not my_asm_jac):
+                    my_asm_jac._update(system)
 
-            self._linearize()
+                self._linearize()
+                self._jac_age = 0
 
             self.linear_solver.solve('fwd')
 
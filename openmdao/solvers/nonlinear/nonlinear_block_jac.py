@@ -16,6 +16,31 @@ class NonlinearBlockJac(NonlinearSolver):
 
     SOLVER = 'NL: NLBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc="Number of threads used to solve the subsystems concurrently. "
+                             "This only speeds up subsystems that spend most of their time in "
+                             "code that releases the GIL, such as numpy and scipy routines.")
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+        self._setup_threads()
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
@@ -29,17 +54,28 @@ class NonlinearBlockJac(NonlinearSolver):
             # If this is a parallel group, check for analysis errors and reraise.
             if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
                 with multi_proc_fail_check(system.comm):
-                    for subsys in system._relevance.filter(system._subsystems_myproc):
-                        subsys._solve_nonlinear()
+                    self._solve_subsystems()
             else:
-                for subsys in system._relevance.filter(system._subsystems_myproc):
-                    subsys._solve_nonlinear()
+                self._solve_subsystems()
 
             rec.abs = 0.0
             rec.rel = 0.0
 
         self._solver_info.pop()
 
+    def _solve_subsystems(self):
+        """
+        Solve the relevant subsystems, concurrently if num_threads > 1.
+        """
+        system = self._system()
+        subs = list(system._relevance.filter(system._subsystems_myproc))
+
+        if self.options['num_threads'] > 1 and len(subs) > 1:
+            self._run_threaded([subsys._solve_nonlinear for subsys in subs])
+        else:
+            for subsys in subs:
+                subsys._solve_nonlinear()
+
     def _run_apply(self):
         """
         Run the apply_nonlinear method on the system.
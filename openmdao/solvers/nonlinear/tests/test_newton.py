@@ -1,6 +1,7 @@
 """Test the Newton nonlinear solver. """
 
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -9,6 +10,7 @@ from openmdao.test_suite.components.double_sellar import DoubleSellar, DoubleSel
 from openmdao.test_suite.components.sellar import SellarDerivativesGrouped, \
      SellarNoDerivatives, SellarDerivatives, SellarStateConnection, StateConnection, \
      SellarDis1withDerivatives, SellarDis2withDerivatives
+from openmdao.solvers.linear.direct import DirectSolver
 from openmdao.utils.assert_utils import assert_near_equal
 
 try:
@@ -825,6 +827,63 @@ class TestNewton(unittest.TestCase):
         msg = "NewtonSolver in <model> <class Group>: solve_subsystems must be set by the user."
         self.assertEqual(str(context.exception), msg)
 
+    def _run_jac_reuse(self, prob):
+        with mock.patch.object(DirectSolver, '_linearize', autospec=True,
+                               side_effect=DirectSolver._linearize) as m:
+            prob.run_model()
+        return m.call_count
+
+    def _jac_reuse_prob(self, **options):
+        newton = om.NewtonSolver(solve_subsystems=False, maxiter=50, **options)
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=newton,
+                                                  linear_solver=om.DirectSolver()))
+        prob.setup()
+        prob.set_solver_print(level=0)
+        return prob
+
+    def test_jac_reuse(self):
+        prob = self._jac_reuse_prob()
+        self.assertEqual(self._run_jac_reuse(prob), 3)
+        self.assertEqual(prob.model.nonlinear_solver._iter_count, 3)
+
+        # the factorization is only reused while the residual drops quickly enough
+        prob = self._jac_reuse_prob(max_jac_reuse=5)
+        self.assertEqual(self._run_jac_reuse(prob), 2)
+        self.assertEqual(prob.model.nonlinear_solver._iter_count, 7)
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        # a single linearization is enough with a lax rate
+        prob = self._jac_reuse_prob(max_jac_reuse=50, jac_reuse_rate=0.9)
+        self.assertEqual(self._run_jac_reuse(prob), 1)
+        self.assertEqual(prob.model.nonlinear_solver._iter_count, 10)
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+    def test_jac_reuse_stall(self):
+        # the system is linearized again once the convergence rate drops
+        prob = self._jac_reuse_prob(max_jac_reuse=5, jac_reuse_rate=1e-3)
+        self.assertEqual(self._run_jac_reuse(prob), 2)
+        self.assertEqual(prob.model.nonlinear_solver._iter_count, 4)
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+    def test_jac_reuse_across_solves(self):
+        for across, expected in [(False, 1), (True, 0)]:
+            prob = self._jac_reuse_prob(max_jac_reuse=50, jac_reuse_rate=0.9,
+                                        jac_reuse_across_solves=across)
+            self.assertEqual(self._run_jac_reuse(prob), 1)
+
+            prob.set_val('x', 1.1)
+            self.assertEqual(self._run_jac_reuse(prob), expected)
+            self.assertGreater(prob.model.nonlinear_solver._iter_count, 1)
+
+            prob.model.run_apply_nonlinear()
+            self.assertLess(prob.model._residuals.get_norm(), 1e-9)
+
 
 class TestNewtonFeatures(unittest.TestCase):
 
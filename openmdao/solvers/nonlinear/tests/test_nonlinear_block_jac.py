@@ -1,14 +1,19 @@
 """Test the Nonlinear Block Jacobi solver. """
 
+import copy
+import pickle
+import threading
 import unittest
 
 import numpy as np
 
 import openmdao.api as om
 from openmdao.test_suite.components.ae_tests import AEComp, AEDriver
-from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, SellarDis2withDerivatives
+from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, SellarDis2withDerivatives, \
+     SellarDerivativesGrouped
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
 
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -137,6 +142,137 @@ class TestNLBlockJacobi(unittest.TestCase):
         assert_near_equal(prob['y2'], 12.05848819, .00001)
 
 
+class ThreadNameComp(om.ExplicitComponent):
+    """Record the names of the threads that compute this component."""
+
+    def initialize(self):
+        self.options.declare('fail', types=bool, default=False)
+        self.threads = set()
+
+    def setup(self):
+        self.add_input('x', np.ones(3))
+        self.add_output('y', np.ones(3))
+        self.declare_partials('y', 'x', rows=np.arange(3), cols=np.arange(3), val=2.)
+
+    def compute(self, inputs, outputs):
+        thread = threading.current_thread()
+        self.threads.add(thread.name)
+        if self.options['fail'] and thread is not threading.main_thread():
+            raise om.AnalysisError(f"{self.msginfo}: failed.")
+        outputs['y'] = 2. * inputs['x']
+
+
+def _threaded_sellars(num_threads, nsellars=3, fail=False):
+    prob = om.Problem()
+    model = prob.model
+
+    for i in range(nsellars):
+        model.add_subsystem(f'sellar{i}', SellarDerivativesGrouped(
+            nonlinear_solver=om.NewtonSolver(solve_subsystems=False),
+            linear_solver=om.DirectSolver()))
+    model.add_subsystem('comp', ThreadNameComp(fail=fail))
+    model.connect('sellar0.y1', 'comp.x', src_indices=[0, 0, 0])
+
+    model.nonlinear_solver = om.NonlinearBlockJac(num_threads=num_threads, maxiter=20)
+    model.linear_solver = om.LinearBlockJac(num_threads=num_threads, maxiter=20)
+    prob.set_solver_print(level=0)
+    return prob
+
+
+@use_tempdirs
+class TestNLBlockJacobiThreaded(unittest.TestCase):
+
+    def test_threaded(self):
+        results = []
+        for num_threads in (1, 3):
+            prob = _threaded_sellars(num_threads)
+            prob.setup()
+            for i in range(3):
+                prob.set_val(f'sellar{i}.x', i + 1.)
+            prob.run_model()
+
+            results.append([prob.get_val(f'sellar{i}.y1') for i in range(3)])
+            results[-1].append(prob.get_val('comp.y'))
+
+        for expected, actual in zip(*results):
+            assert_near_equal(actual, expected, 1e-15)
+        assert_near_equal(prob.get_val('sellar0.y1'), 25.58830237, 1e-6)
+
+        self.assertTrue(prob.model.comp.threads - {threading.main_thread().name})
+        self.assertIsNotNone(prob.model.nonlinear_solver._thread_pool)
+
+        # the per thread bookkeeping of the calling thread is left as it was
+        meta = prob.model._problem_meta
+        self.assertEqual(meta['solver_info'].prefix, '')
+        self.assertEqual(meta['solver_info'].stack, [])
+        self.assertEqual(meta['recording_iter'].stack, [])
+
+    def test_copy(self):
+        # the thread local bookkeeping and the thread pool aren't copied
+        for num_threads in (1, 3):
+            with self.subTest(num_threads=num_threads):
+                prob = _threaded_sellars(num_threads)
+                prob.setup()
+                prob.final_setup()
+                if num_threads > 1:
+                    prob.model.nonlinear_solver._get_thread_pool()
+
+                model = copy.deepcopy(prob.model)
+                self.assertIsNone(model.nonlinear_solver._thread_pool)
+                self.assertEqual(model._problem_meta['solver_info'].stack, [])
+                self.assertEqual(model._problem_meta['recording_iter'].stack, [])
+
+                relevance = pickle.loads(pickle.dumps(prob.model._relevance))
+                self.assertEqual(relevance._active, prob.model._relevance._active)
+
+    def test_worker_relevance(self):
+        prob = _threaded_sellars(3)
+        prob.setup()
+        prob.run_model()
+
+        relevance = prob.model._relevance
+        active = relevance._active
+        seen = []
+
+        def worker():
+            relevance._set_worker_active(active)
+            relevance._active = not active
+            seen.append(relevance._active)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        # a worker thread doesn't change the value used by threads that haven't set their own
+        self.assertEqual(seen, [not active])
+        self.assertEqual(relevance._active, active)
+        self.assertEqual(relevance._default_active, active)
+
+    def test_analysis_error(self):
+        prob = _threaded_sellars(3, fail=True)
+        prob.setup()
+
+        with self.assertRaises(om.AnalysisError) as cm:
+            prob.run_model()
+
+        self.assertEqual(str(cm.exception), "'comp' <class ThreadNameComp>: failed.")
+
+        # the other subsystems were still solved
+        assert_near_equal(prob.get_val('sellar1.y1'), 25.58830237, 1e-6)
+
+    def test_recorder_error(self):
+        prob = _threaded_sellars(3)
+        prob.model.sellar1.add_recorder(om.SqliteRecorder('cases.sql'))
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_model()
+
+        self.assertEqual(str(cm.exception),
+                         "NonlinearBlockJac in <model> <class Group>: Option 'num_threads' must "
+                         "be 1 when case recorders are attached to 'sellar1' or its solvers.")
+
+
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class TestNonlinearBlockJacobiMPI(unittest.TestCase):
 
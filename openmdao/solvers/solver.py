@@ -3,7 +3,9 @@
 import os
 import pprint
 import sys
+import threading
 import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
 
 import numpy as np
 
@@ -23,20 +25,102 @@ class SolverInfo(object):
     """
     Communal object for storing some formatting for solver iprint.
 
+    The prefix and stack are local to each thread, so subsystems that are solved concurrently
+    each keep their own.
+
     Attributes
     ----------
     prefix : str
         Prefix to prepend during this iprint.
     stack : list
         List of strings; strings are popped and appended as needed.
+    _local : threading.local
+        Prefix and stack of each thread that has used them.
     """
 
     def __init__(self):
         """
         Initialize.
         """
-        self.prefix = ""
-        self.stack = []
+        self._local = threading.local()
+
+    def __getstate__(self):
+        """
+        Return the state of this object for pickling.
+
+        Thread local values can't be pickled, so only those of the calling thread are kept.
+
+        Returns
+        -------
+        dict
+            The prefix and stack of the calling thread.
+        """
+        return {'prefix': self.prefix, 'stack': list(self.stack)}
+
+    def __setstate__(self, state):
+        """
+        Restore the state of this object after unpickling.
+
+        Parameters
+        ----------
+        state : dict
+            The prefix and stack of the thread that pickled this object.
+        """
+        self._local = threading.local()
+        self.prefix = state['prefix']
+        self.stack = state['stack']
+
+    @property
+    def prefix(self):
+        """
+        Return the iprint prefix of the calling thread.
+
+        Returns
+        -------
+        str
+            Prefix to prepend during this iprint.
+        """
+        return getattr(self._local, 'prefix', "")
+
+    @prefix.setter
+    def prefix(self, prefix):
+        """
+        Set the iprint prefix of the calling thread.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix to prepend during this iprint.
+        """
+        self._local.prefix = prefix
+
+    @property
+    def stack(self):
+        """
+        Return the iprint stack of the calling thread.
+
+        Returns
+        -------
+        list
+            List of strings; strings are popped and appended as needed.
+        """
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = stack = []
+            return stack
+
+    @stack.setter
+    def stack(self, stack):
+        """
+        Set the iprint stack of the calling thread.
+
+        Parameters
+        ----------
+        stack : list
+            List of strings; strings are popped and appended as needed.
+        """
+        self._local.stack = stack
 
     def clear(self):
         """
@@ -97,7 +181,8 @@ class SolverInfo(object):
         cache : tuple(str, list)
             Cache of current stack.
         """
-        self.prefix, self.stack = cache
+        self.prefix, stack = cache
+        self.stack = list(stack)
 
 
 class Solver(object, metaclass=SolverMetaclass):
@@ -140,6 +225,8 @@ class Solver(object, metaclass=SolverMetaclass):
         Normalization factor
     _problem_meta : dict
         Problem level metadata.
+    _thread_pool : ThreadPoolExecutor or None
+        Pool of threads used to run subsystems concurrently, if any.
     """
 
     # Object to store some formatting for iprint that is shared across all solvers.
@@ -154,6 +241,7 @@ class Solver(object, metaclass=SolverMetaclass):
         self._mode = 'fwd'
         self._iter_count = 0
         self._problem_meta = None
+        self._thread_pool = None
 
         # Solver options
         self.options = OptionsDictionary(parent_name=self.msginfo)
@@ -227,6 +315,20 @@ class Solver(object, metaclass=SolverMetaclass):
             return type(self).__name__
         return f"{type(self).__name__} in {self._system().msginfo}"
 
+    def __getstate__(self):
+        """
+        Return the state of this solver for pickling, without its thread pool.
+
+        Returns
+        -------
+        dict
+            The state of this solver.
+        """
+        state = self.__dict__.copy()
+        # the pool is created again when it's needed
+        state['_thread_pool'] = None
+        return state
+
     def _inf_nan_failure(self):
         msg = (f"Solver '{self.SOLVER}' on system '{self._system().pathname}': "
                f"residuals contain 'inf' or 'NaN' after {self._iter_count} iterations.")
@@ -266,10 +368,47 @@ class Solver(object, metaclass=SolverMetaclass):
         if iprint > -1 and print_flag:
             print(self._solver_info.prefix + self.SOLVER + msg)
 
+        # let recorders that keep recent iterations in memory write them out
+        for recorder in self._get_failure_recorders():
+            recorder.record_failure(self, msg)
+
         # Raise AnalysisError if requested.
         if self.options['err_on_non_converge']:
             raise AnalysisError(msg)
 
+    def _get_failure_recorders(self):
+        """
+        Return the recorders to notify of a failure of this solver.
+
+        These are the recorders of the system that owns this solver, of its subsystems and of
+        its parents, and of all of their solvers.
+
+        Returns
+        -------
+        list of CaseRecorder
+            The recorders, without duplicates.
+        """
+        system = self._system()
+        model = system._problem_meta['model_ref']()
+
+        systems = list(system.system_iter(include_self=True, recurse=True))
+        parts = system.pathname.split('.') if system.pathname else []
+        for i in range(len(parts)):
+            systems.append(model._get_subsystem('.'.join(parts[:i])) if i else model)
+
+        requesters = [self]
+        for s in systems:
+            requesters.append(s)
+            requesters.extend(solver for solver in (s.nonlinear_solver, s.linear_solver)
+                              if solver is not None and solver is not self)
+
+        recorders = {}
+        for requester in requesters:
+            for recorder in requester._rec_mgr._recorders:
+                recorders[id(recorder)] = recorder
+
+        return list(recorders.values())
+
     @property
     def _recording_iter(self):
         if self._problem_meta is None:
@@ -376,6 +515,78 @@ class Solver(object, metaclass=SolverMetaclass):
             'residual': myresiduals
         }
 
+    def _setup_threads(self):
+        """
+        Check that the subsystems can be run concurrently and discard any existing thread pool.
+        """
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+            self._thread_pool = None
+
+        if self.options['num_threads'] > 1 and self._system().comm.size > 1:
+            raise RuntimeError(f"{self.msginfo}: Option 'num_threads' must be 1 when running "
+                               "under MPI with comm.size > 1.")
+
+    def _get_thread_pool(self):
+        """
+        Return the pool of threads used to run the subsystems concurrently, creating it if needed.
+
+        Returns
+        -------
+        ThreadPoolExecutor
+            The thread pool.
+        """
+        if self._thread_pool is None:
+            # recorders write to their files from the thread that records the case
+            for subsys in self._system().system_iter(recurse=True):
+                solvers = [subsys._nonlinear_solver, subsys._linear_solver]
+                solvers += [getattr(solver, name, None) for solver in solvers
+                            for name in ('linesearch', 'precon')]
+                if subsys._rec_mgr._recorders or \
+                        any(solver is not None and solver._rec_mgr._recorders
+                            for solver in solvers):
+                    raise RuntimeError(f"{self.msginfo}: Option 'num_threads' must be 1 when "
+                                       f"case recorders are attached to '{subsys.pathname}' "
+                                       "or its solvers.")
+
+            self._thread_pool = ThreadPoolExecutor(self.options['num_threads'])
+
+        return self._thread_pool
+
+    def _run_threaded(self, funcs):
+        """
+        Call the given functions concurrently on the thread pool of this solver.
+
+        The iprint prefix, the recording iteration stack and the state of relevance are local
+        to each thread, so each call starts from the state of the calling thread. All calls
+        complete before any exception raised by one of them is re-raised.
+
+        Parameters
+        ----------
+        funcs : list of callable
+            Functions to call, without arguments.
+        """
+        solver_info = self._solver_info
+        rec_iter = self._recording_iter
+        relevance = self._system()._relevance
+
+        info_cache = solver_info.save_cache()
+        rec_cache = rec_iter.save_cache()
+        active = relevance._active
+
+        def run(func):
+            solver_info.restore_cache(info_cache)
+            rec_iter.restore_cache(rec_cache)
+            relevance._set_worker_active(active)
+            func()
+
+        pool = self._get_thread_pool()
+        futures = [pool.submit(run, func) for func in funcs]
+        wait(futures)
+
+        for future in futures:
+            future.result()
+
     def _set_solver_print(self, level=2, type_='all'):
         """
         Control printing for solvers and subsolvers in the model.
@@ -0,0 +1,37 @@
+import numpy as np
+from scipy.sparse import diags
+from scipy.sparse.linalg import spsolve
+
+import openmdao.api as om
+
+
+class Poisson1DComp(om.ImplicitComponent):
+    """
+    Finite difference discretization of -u'' = f on the unit interval with u(0) = u(1) = 0.
+
+    R(f, u) = K u - h**2 f, where K is the tridiagonal second difference matrix and h is the node
+    spacing. The condition number of K grows with the square of the number of nodes, which makes
+    it slow to converge for unpreconditioned Krylov solvers.
+    """
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int, default=50,
+                             desc='Number of interior nodes.')
+
+    def setup(self):
+        n = self.options['num_nodes']
+        self.h2 = (1. / (n + 1)) ** 2
+        self.K = diags([-1., 2., -1.], [-1, 0, 1], shape=(n, n), format='csc')
+
+        self.add_input('f', val=np.ones(n))
+        self.add_output('u', val=np.zeros(n))
+
+        K = self.K.tocoo()
+        self.declare_partials('u', 'u', rows=K.row, cols=K.col, val=K.data)
+        self.declare_partials('u', 'f', rows=np.arange(n), cols=np.arange(n), val=-self.h2)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['u'] = self.K.dot(outputs['u']) - self.h2 * inputs['f']
+
+    def solve_nonlinear(self, inputs, outputs):
+        outputs['u'] = spsolve(self.K, self.h2 * inputs['f'])
@@ -2,7 +2,9 @@
 Routines to compute coloring for use with simultaneous derivatives.
 """
 import datetime
+import hashlib
 import io
+import multiprocessing
 import os
 import time
 import pathlib
@@ -11,7 +13,7 @@ import sys
 import tempfile
 import traceback
 import webbrowser
-from itertools import combinations, groupby
+from itertools import groupby
 from contextlib import contextmanager
 from pprint import pprint
 from packaging.version import Version
@@ -151,6 +153,10 @@ class ColoringMeta(object):
         If True, use driver scaling when computing sparsity.
     msginfo : str
         Prefix for warning/error messages.
+    cache : bool
+        If True, cache a dynamically computed total coloring keyed by the model structure.
+    num_procs : int
+        Number of forked processes used to compute the total sparsity.
 
     Attributes
     ----------
@@ -178,6 +184,10 @@ class ColoringMeta(object):
         If True, use driver scaling when computing sparsity.
     msginfo : str
         Prefix for warning/error messages.
+    cache : bool
+        If True, cache a dynamically computed total coloring keyed by the model structure.
+    num_procs : int
+        Number of forked processes used to compute the total sparsity.
     _coloring : Coloring or None
         The coloring object.
     _failed : bool
@@ -191,7 +201,7 @@ class ColoringMeta(object):
 
     def __init__(self, num_full_jacs=3, tol=1e-25, orders=None, min_improve_pct=5.,
                  show_summary=True, show_sparsity=False, dynamic=False, static=None,
-                 perturb_size=1e-9, use_scaling=False, msginfo=''):
+                 perturb_size=1e-9, use_scaling=False, msginfo='', cache=False, num_procs=1):
         """
         Initialize data structures.
         """
@@ -206,6 +216,8 @@ class ColoringMeta(object):
         self.perturb_size = perturb_size
         self.use_scaling = use_scaling
         self.msginfo = msginfo
+        self.cache = cache
+        self.num_procs = num_procs
         self._coloring = None
         self._failed = False
         self._approx = False
@@ -1974,6 +1986,75 @@ class Coloring(object):
             return abs_name
 
 
+class _BlockArgmin(object):
+    """
+    Track the index of the minimum of an array that only changes in a few places at a time.
+
+    The array is split into blocks of about sqrt(size) entries and the minimum of each block is
+    kept, so finding the minimum and updating after a change only touch the blocks involved
+    rather than the whole array.  Ties go to the lowest index, as with ndarray.argmin.
+
+    Parameters
+    ----------
+    values : ndarray
+        Initial values of the array.
+
+    Attributes
+    ----------
+    values : ndarray
+        The tracked values.  Call update after changing them.
+    _blocks : ndarray
+        The tracked values reshaped into padded blocks.
+    _blockmins : ndarray
+        The minimum of each block.
+    _touched : ndarray
+        Boolean work array marking the blocks changed by an update.
+    """
+
+    def __init__(self, values):
+        """
+        Initialize the tracker.
+        """
+        size = values.size
+        blocksize = max(int(np.sqrt(size)), 1)
+        nblocks = -(-size // blocksize)
+
+        data = np.full(nblocks * blocksize, np.iinfo(values.dtype).max, dtype=values.dtype)
+        data[:size] = values
+
+        self.values = data[:size]
+        self._blocks = data.reshape((nblocks, blocksize))
+        self._blockmins = self._blocks.min(axis=1)
+        self._touched = np.zeros(nblocks, dtype=bool)
+
+    def update(self, idxs):
+        """
+        Update the block minimums after the values at the given indices have changed.
+
+        Parameters
+        ----------
+        idxs : ndarray or int
+            Indices of the changed values.
+        """
+        touched = self._touched
+        touched[np.asarray(idxs) // self._blocks.shape[1]] = True
+        blocks = np.flatnonzero(touched)
+        touched[blocks] = False
+        self._blockmins[blocks] = self._blocks[blocks].min(axis=1)
+
+    def argmin(self):
+        """
+        Return the index of the smallest value, the lowest index in case of a tie.
+
+        Returns
+        -------
+        int
+            Index of the smallest value.
+        """
+        block = self._blockmins.argmin()
+        return block * self._blocks.shape[1] + self._blocks[block].argmin()
+
+
 def _order_by_ID(col_adj_matrix):
     """
     Return columns in order of incidence degree (ID).
@@ -1993,24 +2074,57 @@ def _order_by_ID(col_adj_matrix):
     int
         Column index.
     ndarray
-        Boolean array that's True where the column matches nzcols.
+        Nonzero rows of the column in the adjacency matrix.
     """
     ncols = col_adj_matrix.shape[1]
-    colored_degrees = np.zeros(ncols, dtype=INT_DTYPE)
-    colored_degrees[col_adj_matrix.indices] = 1  # make sure zero cols aren't considered
+    indptr = col_adj_matrix.indptr
+    indices = col_adj_matrix.indices
 
-    for i in range(np.nonzero(colored_degrees)[0].size):
-        col = colored_degrees.argmax()
-        colnzrows = col_adj_matrix.getcol(col).indices
-        colored_degrees[colnzrows] += 1
-        colored_degrees[col] = -ncols  # ensure that this col will never have max degree again
+    colored_degrees = np.zeros(ncols, dtype=INT_DTYPE)
+    colored_degrees[indices] = 1  # make sure zero cols aren't considered
+
+    # the column with the max degree is the one with the min negated degree
+    tracker = _BlockArgmin(-colored_degrees)
+    neg_degrees = tracker.values
+
+    for i in range(np.count_nonzero(colored_degrees)):
+        col = tracker.argmin()
+        colnzrows = indices[indptr[col]:indptr[col + 1]]
+        neg_degrees[colnzrows] -= 1
+        neg_degrees[col] = ncols  # ensure that this col will never have max degree again
+        tracker.update(colnzrows)
+        tracker.update(col)
         yield col, colnzrows
 
 
+def _bool_csr(nzrows, nzcols, shape):
+    """
+    Return a boolean csr sparsity matrix.
+
+    Parameters
+    ----------
+    nzrows : ndarray
+        Nonzero rows of the matrix.
+    nzcols : ndarray
+        Nonzero columns of the matrix.
+    shape : tuple
+        Shape of the matrix.
+
+    Returns
+    -------
+    csr_matrix
+        Boolean sparsity matrix.
+    """
+    return csr_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=shape)
+
+
 def _2col_adj_rows_cols(J):
     """
     Convert nonzero rows/cols of sparsity matrix to those of a column adjacency matrix.
 
+    Two columns are adjacent if they share a nonzero row, so the adjacency matrix has the
+    sparsity of J.T @ J.
+
     Parameters
     ----------
     J : coo_matrix
@@ -2021,31 +2135,8 @@ def _2col_adj_rows_cols(J):
     csc_matrix
         Sparse column adjacency matrix.
     """
-    nrows, ncols = J.shape
-    nzrows, nzcols = J.row, J.col
-
-    adjrows = []
-    adjcols = []
-
-    csr = csr_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
-
-    # mark col_matrix entries as True when nonzero row entries make them dependent
-    for row in np.unique(nzrows):
-        row_nzcols = csr.getrow(row).indices
-
-        if row_nzcols.size > 0:
-            for c in row_nzcols:
-                adjrows.append(row_nzcols)
-                adjcols.append(np.full(row_nzcols.size, c))
-
-    if adjrows:
-        adjrows = np.hstack(adjrows)
-        adjcols = np.hstack(adjcols)
-    else:
-        adjrows = np.zeros(0, dtype=INT_DTYPE)
-        adjcols = np.zeros(0, dtype=INT_DTYPE)
-
-    return csc_matrix((np.ones(adjrows.size, dtype=bool), (adjrows, adjcols)), shape=(ncols, ncols))
+    csr = _bool_csr(J.row, J.col, J.shape)
+    return (csr.T @ csr).tocsc()
 
 
 def _Jc2col_matrix_direct(Jrows, Jcols, shape):
@@ -2068,49 +2159,24 @@ def _Jc2col_matrix_direct(Jrows, Jcols, shape):
 
     Returns
     -------
-    tuple
-        (nzrows, nzcols, shape) of column adjacency matrix.
+    csc_matrix
+        Sparse column adjacency matrix.
     """
     nrows, ncols = shape
 
-    allnzr = []
-    allnzc = []
+    csr = _bool_csr(Jrows, Jcols, shape)
 
-    Jrow = np.zeros(ncols, dtype=bool)
-    csr = csr_matrix((np.ones(Jrows.size, dtype=bool), (Jrows, Jcols)), shape=shape)
+    # columns sharing a nonzero row are adjacent
+    adj = (csr.T @ csr).tocoo()
+    offdiag = adj.row != adj.col
 
-    # mark col_matrix[col1, col2] as True when Jpart[row, col1] is True OR Jpart[row, col2] is True
-    for row in np.unique(Jrows):
-        nzr = []
-        nzc = []
-        row_nzcols = csr.getrow(row).indices
+    # if there's only 1 nonzero column in a row, include it
+    single = np.diff(csr.indptr) == 1
+    diag = np.unique(csr.indices[csr.indptr[:-1][single]])
 
-        if row_nzcols.size == 1:
-            # if there's only 1 nonzero column in a row, include it
-            nzr.append(row_nzcols[0])
-            nzc.append(row_nzcols[0])
-        else:
-            Jrow[:] = False
-            Jrow[row_nzcols] = True
-            for col1, col2 in combinations(row_nzcols, 2):
-                if Jrow[col1] or Jrow[col2]:
-                    nzr.append(col1)
-                    nzc.append(col2)
-        if nzr:
-            allnzr.append(nzr)
-            allnzc.append(nzc)
-
-    csr = Jrow = None  # free up memory
-
-    if allnzr:
-        # matrix is symmetric, so duplicate
-        rows = np.hstack(allnzr + allnzc)
-        cols = np.hstack(allnzc + allnzr)
-    else:
-        rows = np.zeros(0, dtype=INT_DTYPE)
-        cols = np.zeros(0, dtype=INT_DTYPE)
-
-    allnzr = allnzc = None
+    rows = np.concatenate((adj.row[offdiag], diag))
+    cols = np.concatenate((adj.col[offdiag], diag))
+    adj = csr = None  # free up memory
 
     return csc_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(ncols, ncols))
 
@@ -2152,16 +2218,23 @@ def _get_full_disjoint_col_matrix_cols(col_adj_matrix):
     # -1 indicates that a column has not been colored
     colors = np.full(ncols, -1, dtype=INT_DTYPE)
 
+    # colors used by the neighbors of the current column.  The extra entry is always False so
+    # that a new color is chosen when all existing colors are taken.
+    taken = np.zeros(ncols + 1, dtype=bool)
+
     for icol, colnzrows in _order_by_ID(col_adj_matrix):
+        ncolors = len(color_groups)
         neighbor_colors = colors[colnzrows]
-        for color, grp in enumerate(color_groups):
-            if color not in neighbor_colors:
-                grp.append(icol)
-                colors[icol] = color
-                break
+        neighbor_colors = neighbor_colors[neighbor_colors >= 0]
+        taken[neighbor_colors] = True
+        color = taken[:ncolors + 1].argmin()
+        taken[neighbor_colors] = False
+
+        if color < ncolors:
+            color_groups[color].append(icol)
         else:
-            colors[icol] = len(color_groups)
             color_groups.append([icol])
+        colors[icol] = color
 
     return color_groups
 
@@ -2188,8 +2261,6 @@ def _color_partition(Jprows, Jpcols, shape):
     list
         List of nonzero rows for each column.
     """
-    _, ncols = shape
-
     col_adj_matrix = _Jc2col_matrix_direct(Jprows, Jpcols, shape)
     col_groups = _get_full_disjoint_col_matrix_cols(col_adj_matrix)
 
@@ -2199,9 +2270,8 @@ def _color_partition(Jprows, Jpcols, shape):
         col_groups[i] = sorted(group)
 
     csc = csc_matrix((np.ones(Jprows.size), (Jprows, Jpcols)), shape=shape)
-    col2row = [None] * ncols
-    for col in np.unique(Jpcols):
-        col2row[col] = csc.getcol(col).indices
+    col2row = [rows if rows.size else None
+               for rows in np.split(csc.indices, csc.indptr[1:-1])]
 
     return [col_groups, col2row]
 
@@ -2229,20 +2299,22 @@ def MNCO_bidir(J):
 
     coloring = Coloring(sparsity=J)
 
-    M_col_nonzeros = np.zeros(ncols, dtype=INT_DTYPE)
-    M_row_nonzeros = np.zeros(nrows, dtype=INT_DTYPE)
-
-    sparse = csc_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
-
-    for c in range(ncols):
-        M_col_nonzeros[c] = sparse.getcol(c).indices.size
-    sparse = sparse.tocsr()
-    for r in range(nrows):
-        M_row_nonzeros[r] = sparse.getrow(r).indices.size
+    # positions of the nonzeros of each row and each column, in their original order
+    row_order = np.argsort(nzrows, kind='stable')
+    row_ptr = np.zeros(nrows + 1, dtype=INT_DTYPE)
+    np.cumsum(np.bincount(nzrows, minlength=nrows), out=row_ptr[1:])
+    col_order = np.argsort(nzcols, kind='stable')
+    col_ptr = np.zeros(ncols + 1, dtype=INT_DTYPE)
+    np.cumsum(np.bincount(nzcols, minlength=ncols), out=col_ptr[1:])
 
-    sparse = None
+    # nonzeros that haven't been assigned to Jf or Jr yet
+    remaining = np.ones(nzrows.size, dtype=bool)
+    nremaining = nzrows.size
 
-    M_rows, M_cols = nzrows, nzcols
+    row_tracker = _BlockArgmin(np.diff(row_ptr))
+    col_tracker = _BlockArgmin(np.diff(col_ptr))
+    M_row_nonzeros = row_tracker.values
+    M_col_nonzeros = col_tracker.values
 
     Jf_rows = [None] * nrows
     Jr_cols = [None] * ncols
@@ -2255,8 +2327,8 @@ def MNCO_bidir(J):
     # We build Jf from bottom up (by row) and Jr from right to left (by column).
 
     # get index of row with fewest nonzeros and col with fewest nonzeros
-    r = M_row_nonzeros.argmin()
-    c = M_col_nonzeros.argmin()
+    r = row_tracker.argmin()
+    c = col_tracker.argmin()
 
     # get number of nonzeros in the selected row and column
     nnz_r = M_row_nonzeros[r]
@@ -2265,7 +2337,7 @@ def MNCO_bidir(J):
     Jf_nz_max = 0   # max row nonzeros in Jf
     Jr_nz_max = 0   # max col nonzeros in Jr
 
-    while M_rows.size > 0:
+    while nremaining > 0:
         # what the algorithm is doing is basically minimizing the total of the max number of nonzero
         # columns in Jf + the max number of nonzero rows in Jr, so it's basically minimizing
         # the upper bound of the number of colors that will be needed.
@@ -2274,38 +2346,47 @@ def MNCO_bidir(J):
         # different sides of the inequality in order to prevent bad colorings when we have
         # matrices that have many more rows than columns or many more columns than rows.
         if ncols + Jr_nz_max + max(Jf_nz_max, nnz_r) < (nrows + Jf_nz_max + max(Jr_nz_max, nnz_c)):
-            Jf_rows[r] = M_cols[M_rows == r]
+            # remove row r
+            nzs = row_order[row_ptr[r]:row_ptr[r + 1]]
+            nzs = nzs[remaining[nzs]]
+            remaining[nzs] = False
+            nremaining -= nzs.size
+
+            Jf_rows[r] = nzcols[nzs]
             Jf_nz_max = max(nnz_r, Jf_nz_max)
 
             M_row_nonzeros[r] = ncols + 1  # make sure we don't pick this one again
             M_col_nonzeros[Jf_rows[r]] -= 1
+            row_tracker.update(r)
+            col_tracker.update(Jf_rows[r])
 
-            # remove row r
-            keep = M_rows != r
-            r = M_row_nonzeros.argmin()
-            c = M_col_nonzeros.argmin()
+            r = row_tracker.argmin()
+            c = col_tracker.argmin()
             nnz_r = M_row_nonzeros[r]
 
             row_i += 1
         else:
-            Jr_cols[c] = M_rows[M_cols == c]
+            # remove column c
+            nzs = col_order[col_ptr[c]:col_ptr[c + 1]]
+            nzs = nzs[remaining[nzs]]
+            remaining[nzs] = False
+            nremaining -= nzs.size
+
+            Jr_cols[c] = nzrows[nzs]
             Jr_nz_max = max(nnz_c, Jr_nz_max)
 
             M_col_nonzeros[c] = nrows + 1  # make sure we don't pick this one again
             M_row_nonzeros[Jr_cols[c]] -= 1
+            col_tracker.update(c)
+            row_tracker.update(Jr_cols[c])
 
-            # remove column c
-            keep = M_cols != c
-            r = M_row_nonzeros.argmin()
-            c = M_col_nonzeros.argmin()
+            r = row_tracker.argmin()
+            c = col_tracker.argmin()
             nnz_c = M_col_nonzeros[c]
 
             col_i += 1
 
-        M_rows = M_rows[keep]
-        M_cols = M_cols[keep]
-
-    M_row_nonzeros = M_col_nonzeros = None
+    row_tracker = col_tracker = M_row_nonzeros = M_col_nonzeros = remaining = None
 
     nnz_Jf = nnz_Jr = 0
 
@@ -2348,6 +2429,31 @@ def MNCO_bidir(J):
     return coloring
 
 
+def _col2rows(nzrows, nzcols, ncols):
+    """
+    Return the sorted list of nonzero rows of each column.
+
+    Parameters
+    ----------
+    nzrows : ndarray
+        Nonzero rows of the matrix being colored.
+    nzcols : ndarray
+        Nonzero columns of the matrix being colored.
+    ncols : int
+        Number of columns in the matrix being colored.
+
+    Returns
+    -------
+    list
+        List of nonzero rows for each column, or None for columns with no nonzeros.
+    """
+    order = np.lexsort((nzrows, nzcols))
+    counts = np.bincount(nzcols, minlength=ncols)
+    splits = np.split(nzrows[order], np.cumsum(counts[:-1]))
+
+    return [rows.tolist() if rows.size else None for rows in splits]
+
+
 def _tol_sweep(arr, tol=_DEF_COMP_SPARSITY_ARGS['tol'], orders=_DEF_COMP_SPARSITY_ARGS['orders']):
     """
     Find best tolerance 'around' tol to choose nonzero values of arr.
@@ -2433,20 +2539,139 @@ def _compute_total_coloring_context(problem):
     problem : Problem
         The problem where coloring will be done.
     """
+    # a report run by a hook during the passes may compute the coloring again, so restore the
+    # previous state rather than clearing it
+    save = (problem._metadata['coloring_randgen'], problem._computing_coloring)
     problem._metadata['coloring_randgen'] = np.random.default_rng(41)  # set seed for consistency
     problem._computing_coloring = True
 
     try:
         yield
     finally:
-        problem._metadata['coloring_randgen'] = None
-        problem._computing_coloring = False
+        problem._metadata['coloring_randgen'], problem._computing_coloring = save
+
+
+# the arguments of _sum_abs_totals, shared with the forked processes that compute sparsity
+_sparsity_args = None
+
+
+def _sum_abs_totals(prob, driver, of, wrt, num_full_jacs, use_driver):
+    """
+    Return the sum of the absolute values of several total jacobians.
+
+    Parameters
+    ----------
+    prob : Problem
+        The Problem being analyzed.
+    driver : Driver, None, or False
+        The driver that will be used to compute the total jacobian.
+    of : iter of str
+        Names of response variables.
+    wrt : iter of str
+        Names of design variables.
+    num_full_jacs : int
+        Number of times to repeat total jacobian computation.
+    use_driver : bool
+        If True, compute the totals using the driver, so that driver scaling is applied.
+
+    Returns
+    -------
+    ndarray
+        The sum of the absolute values of the total jacobians.
+    """
+    fullJ = None
+    for i in range(num_full_jacs):
+        if use_driver:
+            Jabs = driver._compute_totals(of=of, wrt=wrt, return_format='array')
+        else:
+            Jabs = prob.compute_totals(of=of, wrt=wrt, return_format='array',
+                                       coloring_info=False)
+        if fullJ is None:
+            fullJ = np.abs(Jabs)
+        else:
+            fullJ += np.abs(Jabs)
+
+    return fullJ
+
+
+def _sum_abs_totals_worker(worker):
+    """
+    Compute the share of the total jacobian solves assigned to a forked process.
+
+    Parameters
+    ----------
+    worker : int
+        The index of the process.
+
+    Returns
+    -------
+    tuple
+        The rows, columns and values of the nonzero entries of the summed jacobians, and
+        their shape.
+    """
+    prob, driver, of, wrt, num_full_jacs, use_driver, num_procs = _sparsity_args
+
+    prob._metadata['coloring_seed_split'] = (num_procs, worker)
+    if driver:
+        # this process can't safely write to the parent's recorders
+        driver.recording_options['record_derivatives'] = False
+
+    fullJ = _sum_abs_totals(prob, driver, of, wrt, num_full_jacs, use_driver)
+    rows, cols = np.nonzero(fullJ)
+
+    return rows, cols, fullJ[rows, cols], fullJ.shape
+
+
+def _sum_abs_totals_forked(prob, driver, of, wrt, num_full_jacs, use_driver, num_procs):
+    """
+    Return the sum of the absolute values of several total jacobians, using forked processes.
+
+    Each forked process inherits the set up problem, including the state of the random number
+    generator used for the partial jacobians, and does every num_procs-th linear solve.  The
+    entries computed by each process are disjoint, so their sum is the full result.
+
+    Parameters
+    ----------
+    prob : Problem
+        The Problem being analyzed.
+    driver : Driver, None, or False
+        The driver that will be used to compute the total jacobian.
+    of : iter of str
+        Names of response variables.
+    wrt : iter of str
+        Names of design variables.
+    num_full_jacs : int
+        Number of times to repeat total jacobian computation.
+    use_driver : bool
+        If True, compute the totals using the driver, so that driver scaling is applied.
+    num_procs : int
+        Number of processes.
+
+    Returns
+    -------
+    ndarray
+        The sum of the absolute values of the total jacobians.
+    """
+    global _sparsity_args
+
+    _sparsity_args = (prob, driver, of, wrt, num_full_jacs, use_driver, num_procs)
+    try:
+        with multiprocessing.get_context('fork').Pool(num_procs) as pool:
+            results = pool.map(_sum_abs_totals_worker, range(num_procs))
+    finally:
+        _sparsity_args = None
+
+    fullJ = np.zeros(results[0][3])
+    for rows, cols, vals, _ in results:
+        fullJ[rows, cols] += vals
+
+    return fullJ
 
 
 def _get_total_jac_sparsity(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_jacs'],
                             tol=_DEF_COMP_SPARSITY_ARGS['tol'],
                             orders=_DEF_COMP_SPARSITY_ARGS['orders'], setup=False, run_model=False,
-                            of=None, wrt=None, driver=None):
+                            of=None, wrt=None, driver=None, num_procs=1):
     """
     Return a boolean version of the total jacobian.
 
@@ -2481,6 +2706,9 @@ def _get_total_jac_sparsity(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_ful
         The driver that will be used to compute the total jacobian.  If None, the driver
         from the problem will be used.  If False, compute_totals will be called directly
         on the problem.
+    num_procs : int
+        Number of forked processes that share the linear solves.  Only used when running
+        without MPI on a platform that supports forking processes.
 
     Returns
     -------
@@ -2511,21 +2739,25 @@ def _get_total_jac_sparsity(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_ful
 
     use_driver = driver and driver._coloring_info.use_scaling
 
+    if num_procs > 1:
+        if prob.comm.size > 1:
+            issue_warning("Total sparsity is computed collectively by all MPI processes, so "
+                          f"num_procs={num_procs} is ignored.", prefix=prob.msginfo,
+                          category=DerivativesWarning)
+            num_procs = 1
+        elif 'fork' not in multiprocessing.get_all_start_methods():
+            issue_warning("Forking processes is not supported on this platform, so "
+                          f"num_procs={num_procs} is ignored.", prefix=prob.msginfo,
+                          category=DerivativesWarning)
+            num_procs = 1
+
     with _compute_total_coloring_context(prob):
         start_time = time.perf_counter()
-        fullJ = None
-        for i in range(num_full_jacs):
-            if use_driver:
-                Jabs = driver._compute_totals(of=of, wrt=wrt, return_format='array')
-            else:
-                Jabs = prob.compute_totals(of=of, wrt=wrt, return_format='array',
-                                           coloring_info=False)
-            if fullJ is None:
-                fullJ = np.abs(Jabs)
-            else:
-                fullJ += np.abs(Jabs)
-
-        Jabs = None
+        if num_procs > 1:
+            fullJ = _sum_abs_totals_forked(prob, driver, of, wrt, num_full_jacs, use_driver,
+                                           num_procs)
+        else:
+            fullJ = _sum_abs_totals(prob, driver, of, wrt, num_full_jacs, use_driver)
         elapsed = time.perf_counter() - start_time
 
     fullJ *= (1.0 / np.max(fullJ))
@@ -2533,6 +2765,7 @@ def _get_total_jac_sparsity(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_ful
     spmeta = _tol_sweep(fullJ, tol, orders)
     spmeta['num_full_jacs'] = num_full_jacs
     spmeta['sparsity_time'] = elapsed
+    spmeta['sparsity_procs'] = num_procs
     spmeta['type'] = 'total'
 
     print(f"Full total jacobian for problem '{prob._metadata['pathname']}' was computed "
@@ -2608,17 +2841,7 @@ def _compute_coloring(J, mode):
     nzrows, nzcols = J.row, J.col
     col_groups = _get_full_disjoint_cols(J)
 
-    col2rows = [None] * ncols  # will contain list of nonzero rows for each column
-
-    for r, c in zip(nzrows, nzcols):
-        if col2rows[c] is None:
-            col2rows[c] = [r]
-        else:
-            col2rows[c].append(r)
-
-    for c, rows in enumerate(col2rows):
-        if rows is not None:
-            col2rows[c] = sorted(rows)
+    col2rows = _col2rows(nzrows, nzcols, ncols)
 
     if rev:
         coloring._rev = (col_groups, col2rows)
@@ -2637,7 +2860,7 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
                            tol=_DEF_COMP_SPARSITY_ARGS['tol'],
                            orders=_DEF_COMP_SPARSITY_ARGS['orders'],
                            setup=False, run_model=False, fname=None,
-                           driver=None):
+                           driver=None, num_procs=1):
     """
     Compute simultaneous derivative colorings for the total jacobian of the given problem.
 
@@ -2666,6 +2889,8 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
     driver : <Driver>, None, or False
         The driver associated with the coloring.  If None, use problem.driver.  If False, no
         driver will be used.
+    num_procs : int
+        Number of forked processes used to compute the total sparsity.
 
     Returns
     -------
@@ -2707,7 +2932,7 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
         J, sparsity_info = _get_total_jac_sparsity(problem, num_full_jacs=num_full_jacs, tol=tol,
                                                    orders=orders, setup=setup,
                                                    run_model=run_model, of=ofs, wrt=wrts,
-                                                   driver=driver)
+                                                   driver=driver, num_procs=num_procs)
         coloring = _compute_coloring(J, mode)
         if coloring is not None:
             coloring._row_vars = list(ofs)
@@ -2752,6 +2977,180 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
     return coloring
 
 
+def _is_rank0(model):
+    """
+    Return True if this is the rank that writes coloring files.
+
+    Parameters
+    ----------
+    model : Group
+        The top level model.
+
+    Returns
+    -------
+    bool
+        True if coloring files are written by this rank.
+    """
+    comm = model._full_comm if model._full_comm is not None else model.comm
+    return comm.rank == 0
+
+
+def _total_coloring_structure_hash(driver, ofs, wrts):
+    """
+    Return a hash of everything that determines the total sparsity computed for a driver.
+
+    This covers the sizes of all variables, the connections, the declared partial sparsity
+    of all components, the design variables and responses, and the sparsity options.
+
+    Parameters
+    ----------
+    driver : Driver
+        The driver whose total coloring is being computed.
+    ofs : dict
+        Metadata of the response variables.
+    wrts : dict
+        Metadata of the design variables.
+
+    Returns
+    -------
+    str
+        Hex digest of the hash.
+    """
+    from openmdao import __version__
+    from openmdao.core.component import Component
+
+    problem = driver._problem()
+    model = problem.model
+    info = driver._coloring_info
+    use_scaling = info.use_scaling
+
+    def update(h, *args):
+        for arg in args:
+            if isinstance(arg, np.ndarray):
+                h.update(repr((arg.dtype.str, arg.shape)).encode())
+                h.update(np.ascontiguousarray(arg).tobytes())
+            else:
+                h.update(repr(arg).encode())
+
+    h = hashlib.sha256()
+    update(h, __version__, problem._orig_mode, info.num_full_jacs, info.tol, info.orders,
+           use_scaling)
+
+    for io in ('input', 'output'):
+        for name, meta in model._var_allprocs_abs2meta[io].items():
+            update(h, io, name, meta['global_shape'], meta['distributed'])
+
+    update(h, sorted(model._conn_global_abs_in2out.items()))
+
+    comp_h = hashlib.sha256()
+    for comp in model.system_iter(recurse=True, typ=Component):
+        update(comp_h, comp.pathname, type(comp).__qualname__, comp.matrix_free)
+        for key, meta in comp._subjacs_info.items():
+            update(comp_h, key, meta['shape'], meta.get('dependent'), meta.get('rows'),
+                   meta.get('cols'))
+            sparsity = meta.get('sparsity')
+            if sparsity is not None:
+                update(comp_h, np.asarray(sparsity[0]), np.asarray(sparsity[1]), sparsity[2])
+
+    # components are only known on the ranks where they are local
+    if model.comm.size > 1:
+        update(h, model.comm.allgather(comp_h.hexdigest()))
+    else:
+        update(h, comp_h.hexdigest())
+
+    for kind, metas in (('of', ofs), ('wrt', wrts)):
+        for name, meta in metas.items():
+            update(h, kind, name, meta['source'], meta['global_size'], meta.get('linear'),
+                   meta['parallel_deriv_color'])
+            indices = meta['indices']
+            update(h, None if indices is None else np.asarray(indices.flat()))
+            if use_scaling:
+                update(h, meta['total_scaler'], meta['total_adder'])
+
+    return h.hexdigest()
+
+
+def _get_total_coloring_cache_fname(driver, of=None, wrt=None):
+    """
+    Return the name of the cache file for the total coloring of a driver and its key.
+
+    Parameters
+    ----------
+    driver : Driver
+        The driver whose total coloring is being computed.
+    of : iter of str or None
+        Names of the 'response' variables.
+    wrt : iter of str or None
+        Names of the 'design' variables.
+
+    Returns
+    -------
+    pathlib.Path
+        The name of the cache file.
+    str
+        Hash of the structure of the model, design variables and responses.
+    """
+    problem = driver._problem()
+    ofs, wrts, _ = problem.model._get_totals_metadata(driver, of, wrt)
+    struct_hash = _total_coloring_structure_hash(driver, ofs, wrts)
+    return problem.get_coloring_dir(mode='input') / f'total_coloring_{struct_hash[:32]}.pkl', \
+        struct_hash
+
+
+def _load_cached_total_coloring(driver, fname, struct_hash, check_config=True):
+    """
+    Load a cached total coloring, removing the cache file if it doesn't match the driver.
+
+    Parameters
+    ----------
+    driver : Driver
+        The driver whose total coloring is being computed.
+    fname : pathlib.Path
+        The name of the cache file.
+    struct_hash : str
+        Hash of the structure of the model, design variables and responses.
+    check_config : bool
+        If True, also check the design variables and responses of the coloring against
+        those of the driver.
+
+    Returns
+    -------
+    Coloring or None
+        The cached coloring, or None if there is no valid cached coloring.
+    """
+    model = driver._problem().model
+    coloring = None
+
+    if _is_rank0(model) and fname.is_file():
+        try:
+            coloring = Coloring.load(fname)
+            if coloring._meta.get('structure_hash') != struct_hash:
+                raise InvalidColoringError("structure hash doesn't match.")
+            if check_config:
+                coloring._check_config_total(driver, model)
+        except Exception as err:
+            # unreadable or out of date, so invalidate the entry
+            issue_warning(f"Removing invalid cached total coloring '{fname}': {err}",
+                          prefix=driver.msginfo, category=DerivativesWarning)
+            coloring = None
+            try:
+                fname.unlink()
+            except OSError:
+                pass
+        else:
+            print(f"loading total coloring from cache file {fname}")
+
+    # make sure all ranks use the coloring found by the rank that reads coloring files
+    comm = model._full_comm if model._full_comm is not None else model.comm
+    if comm.size > 1:
+        coloring = comm.bcast(coloring, root=0)
+
+    if coloring is not None:
+        coloring._meta['source'] = str(fname)
+
+    return coloring
+
+
 def dynamic_total_coloring(driver, run_model=True, fname=None, of=None, wrt=None):
     """
     Compute simultaneous deriv coloring during runtime.
@@ -2789,9 +3188,27 @@ def dynamic_total_coloring(driver, run_model=True, fname=None, of=None, wrt=None
     tol = driver._coloring_info.get('tol', _DEF_COMP_SPARSITY_ARGS['tol'])
     orders = driver._coloring_info.get('orders', _DEF_COMP_SPARSITY_ARGS['orders'])
 
-    coloring = compute_total_coloring(problem, of=of, wrt=wrt, num_full_jacs=num_full_jacs, tol=tol,
-                                      orders=orders, setup=False, run_model=run_model, fname=fname,
-                                      driver=driver)
+    coloring = cache_fname = None
+    if driver._coloring_info.cache and not problem.model._approx_schemes:
+        cache_fname, struct_hash = _get_total_coloring_cache_fname(driver, of, wrt)
+        coloring = _load_cached_total_coloring(driver, cache_fname, struct_hash,
+                                               check_config=of is None and wrt is None)
+
+    if coloring is None:
+        coloring = compute_total_coloring(problem, of=of, wrt=wrt, num_full_jacs=num_full_jacs,
+                                          tol=tol, orders=orders, setup=False,
+                                          run_model=run_model, fname=fname, driver=driver,
+                                          num_procs=driver._coloring_info.num_procs)
+
+        if coloring is not None and cache_fname is not None:
+            coloring._meta['structure_hash'] = struct_hash
+            if _is_rank0(problem.model):
+                coloring.save(cache_fname)
+    else:
+        if run_model and not problem._computing_coloring:
+            problem.run_model(reset_iter_counts=False)
+        if fname is not None and _is_rank0(problem.model):
+            coloring.save(fname)
 
     driver._coloring_info.coloring = coloring
 
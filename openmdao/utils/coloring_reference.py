@@ -0,0 +1,421 @@
+"""
+Reference implementations of the graph coloring kernels found in openmdao.utils.coloring.
+
+These are straightforward loop based versions of the vectorized kernels used by coloring.py.
+They are much slower on large jacobians, but are kept in order to verify that the vectorized
+kernels compute the same colorings.
+"""
+from itertools import combinations
+
+import numpy as np
+from scipy.sparse import csc_matrix, csr_matrix
+
+from openmdao.core.constants import INT_DTYPE
+from openmdao.utils.coloring import Coloring
+
+
+def _order_by_ID(col_adj_matrix):
+    """
+    Return columns in order of incidence degree (ID).
+
+    ID is the number of already colored neighbors (neighbors are dependent columns).
+
+    The parameters given are assumed to correspond to a those of a column dependency matrix,
+    i.e., (i, j) nonzero entries in the matrix indicate that column i is dependent on column j.
+
+    Parameters
+    ----------
+    col_adj_matrix : csc matrix
+        CSC column adjacency matrix.
+
+    Yields
+    ------
+    int
+        Column index.
+    ndarray
+        Boolean array that's True where the column matches nzcols.
+    """
+    ncols = col_adj_matrix.shape[1]
+    colored_degrees = np.zeros(ncols, dtype=INT_DTYPE)
+    colored_degrees[col_adj_matrix.indices] = 1  # make sure zero cols aren't considered
+
+    for i in range(np.nonzero(colored_degrees)[0].size):
+        col = colored_degrees.argmax()
+        colnzrows = col_adj_matrix.getcol(col).indices
+        colored_degrees[colnzrows] += 1
+        colored_degrees[col] = -ncols  # ensure that this col will never have max degree again
+        yield col, colnzrows
+
+
+def _2col_adj_rows_cols(J):
+    """
+    Convert nonzero rows/cols of sparsity matrix to those of a column adjacency matrix.
+
+    Parameters
+    ----------
+    J : coo_matrix
+        Sparse matrix to be colored.
+
+    Returns
+    -------
+    csc_matrix
+        Sparse column adjacency matrix.
+    """
+    nrows, ncols = J.shape
+    nzrows, nzcols = J.row, J.col
+
+    adjrows = []
+    adjcols = []
+
+    csr = csr_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
+
+    # mark col_matrix entries as True when nonzero row entries make them dependent
+    for row in np.unique(nzrows):
+        row_nzcols = csr.getrow(row).indices
+
+        if row_nzcols.size > 0:
+            for c in row_nzcols:
+                adjrows.append(row_nzcols)
+                adjcols.append(np.full(row_nzcols.size, c))
+
+    if adjrows:
+        adjrows = np.hstack(adjrows)
+        adjcols = np.hstack(adjcols)
+    else:
+        adjrows = np.zeros(0, dtype=INT_DTYPE)
+        adjcols = np.zeros(0, dtype=INT_DTYPE)
+
+    return csc_matrix((np.ones(adjrows.size, dtype=bool), (adjrows, adjcols)), shape=(ncols, ncols))
+
+
+def _Jc2col_matrix_direct(Jrows, Jcols, shape):
+    """
+    Convert a partitioned jacobian sparsity matrix to a column adjacency matrix.
+
+    This creates the column adjacency matrix used for direct jacobian determination
+    as described in Coleman, T.F., Verma, A. (1998) The efficient Computation of Sparse Jacobian
+    Matrices Using Automatic Differentiation. SIAM Journal on Scientific Computing, 19(4),
+    1210-1233.
+
+    Parameters
+    ----------
+    Jrows : ndarray
+        Nonzero rows of a partition of the matrix being colored.
+    Jcols : ndarray
+        Nonzero columns of a partition of the matrix being colored.
+    shape : tuple
+        Shape of the partition of the matrix being colored.
+
+    Returns
+    -------
+    tuple
+        (nzrows, nzcols, shape) of column adjacency matrix.
+    """
+    nrows, ncols = shape
+
+    allnzr = []
+    allnzc = []
+
+    Jrow = np.zeros(ncols, dtype=bool)
+    csr = csr_matrix((np.ones(Jrows.size, dtype=bool), (Jrows, Jcols)), shape=shape)
+
+    # mark col_matrix[col1, col2] as True when Jpart[row, col1] is True OR Jpart[row, col2] is True
+    for row in np.unique(Jrows):
+        nzr = []
+        nzc = []
+        row_nzcols = csr.getrow(row).indices
+
+        if row_nzcols.size == 1:
+            # if there's only 1 nonzero column in a row, include it
+            nzr.append(row_nzcols[0])
+            nzc.append(row_nzcols[0])
+        else:
+            Jrow[:] = False
+            Jrow[row_nzcols] = True
+            for col1, col2 in combinations(row_nzcols, 2):
+                if Jrow[col1] or Jrow[col2]:
+                    nzr.append(col1)
+                    nzc.append(col2)
+        if nzr:
+            allnzr.append(nzr)
+            allnzc.append(nzc)
+
+    csr = Jrow = None  # free up memory
+
+    if allnzr:
+        # matrix is symmetric, so duplicate
+        rows = np.hstack(allnzr + allnzc)
+        cols = np.hstack(allnzc + allnzr)
+    else:
+        rows = np.zeros(0, dtype=INT_DTYPE)
+        cols = np.zeros(0, dtype=INT_DTYPE)
+
+    allnzr = allnzc = None
+
+    return csc_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(ncols, ncols))
+
+
+def _get_full_disjoint_cols(J):
+    """
+    Find sets of disjoint columns in J and their corresponding rows using a col adjacency matrix.
+
+    Parameters
+    ----------
+    J : coo_matrix
+        Sparse matrix to be colored.
+
+    Returns
+    -------
+    list
+        List of lists of disjoint columns
+    """
+    return _get_full_disjoint_col_matrix_cols(_2col_adj_rows_cols(J))
+
+
+def _get_full_disjoint_col_matrix_cols(col_adj_matrix):
+    """
+    Find sets of disjoint columns in a column intersection matrix.
+
+    Parameters
+    ----------
+    col_adj_matrix : csc_matrix
+        Sparse column adjacency matrix.
+
+    Returns
+    -------
+    list
+        List of lists of disjoint columns.
+    """
+    color_groups = []
+    _, ncols = col_adj_matrix.shape
+
+    # -1 indicates that a column has not been colored
+    colors = np.full(ncols, -1, dtype=INT_DTYPE)
+
+    for icol, colnzrows in _order_by_ID(col_adj_matrix):
+        neighbor_colors = colors[colnzrows]
+        for color, grp in enumerate(color_groups):
+            if color not in neighbor_colors:
+                grp.append(icol)
+                colors[icol] = color
+                break
+        else:
+            colors[icol] = len(color_groups)
+            color_groups.append([icol])
+
+    return color_groups
+
+
+def _color_partition(Jprows, Jpcols, shape):
+    """
+    Compute a single directional fwd coloring using partition Jpart.
+
+    This routine is used to compute a fwd coloring on Jc and a rev coloring on Jr.T.
+
+    Parameters
+    ----------
+    Jprows : ndarray
+        Nonzero rows of a partition of the matrix being colored.
+    Jpcols : ndarray
+        Nonzero columns of a partition of the matrix being colored.
+    shape : tuple
+        Shape of a partition of the matrix being colored.
+
+    Returns
+    -------
+    list
+        List of color groups.  First group is uncolored.
+    list
+        List of nonzero rows for each column.
+    """
+    _, ncols = shape
+
+    col_adj_matrix = _Jc2col_matrix_direct(Jprows, Jpcols, shape)
+    col_groups = _get_full_disjoint_col_matrix_cols(col_adj_matrix)
+
+    col_adj_matrix = None
+
+    for i, group in enumerate(col_groups):
+        col_groups[i] = sorted(group)
+
+    csc = csc_matrix((np.ones(Jprows.size), (Jprows, Jpcols)), shape=shape)
+    col2row = [None] * ncols
+    for col in np.unique(Jpcols):
+        col2row[col] = csc.getcol(col).indices
+
+    return [col_groups, col2row]
+
+
+def MNCO_bidir(J):
+    """
+    Compute bidirectional coloring using Minimum Nonzero Count Order (MNCO).
+
+    Based on the algorithm found in Coleman, T.F., Verma, A. (1998) The efficient Computation
+    of Sparse Jacobian Matrices Using Automatic Differentiation. SIAM Journal on Scientific
+    Computing, 19(4), 1210-1233.
+
+    Parameters
+    ----------
+    J : coo_matrix
+        Jacobian sparsity matrix (boolean).
+
+    Returns
+    -------
+    Coloring
+        See docstring for Coloring class.
+    """
+    nzrows, nzcols = J.row, J.col
+    nrows, ncols = J.shape
+
+    coloring = Coloring(sparsity=J)
+
+    M_col_nonzeros = np.zeros(ncols, dtype=INT_DTYPE)
+    M_row_nonzeros = np.zeros(nrows, dtype=INT_DTYPE)
+
+    sparse = csc_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
+
+    for c in range(ncols):
+        M_col_nonzeros[c] = sparse.getcol(c).indices.size
+    sparse = sparse.tocsr()
+    for r in range(nrows):
+        M_row_nonzeros[r] = sparse.getrow(r).indices.size
+
+    sparse = None
+
+    M_rows, M_cols = nzrows, nzcols
+
+    Jf_rows = [None] * nrows
+    Jr_cols = [None] * ncols
+
+    row_i = col_i = 0
+
+    # partition J into Jf and Jr
+    # Jf is colored by column and those columns will be solved in fwd mode
+    # Jr is colored by row and those rows will be solved in reverse mode
+    # We build Jf from bottom up (by row) and Jr from right to left (by column).
+
+    # get index of row with fewest nonzeros and col with fewest nonzeros
+    r = M_row_nonzeros.argmin()
+    c = M_col_nonzeros.argmin()
+
+    # get number of nonzeros in the selected row and column
+    nnz_r = M_row_nonzeros[r]
+    nnz_c = M_col_nonzeros[c]
+
+    Jf_nz_max = 0   # max row nonzeros in Jf
+    Jr_nz_max = 0   # max col nonzeros in Jr
+
+    while M_rows.size > 0:
+        # what the algorithm is doing is basically minimizing the total of the max number of nonzero
+        # columns in Jf + the max number of nonzero rows in Jr, so it's basically minimizing
+        # the upper bound of the number of colors that will be needed.
+
+        # we differ from the algorithm in the paper here slightly because we add ncols and nrows to
+        # different sides of the inequality in order to prevent bad colorings when we have
+        # matrices that have many more rows than columns or many more columns than rows.
+        if ncols + Jr_nz_max + max(Jf_nz_max, nnz_r) < (nrows + Jf_nz_max + max(Jr_nz_max, nnz_c)):
+            Jf_rows[r] = M_cols[M_rows == r]
+            Jf_nz_max = max(nnz_r, Jf_nz_max)
+
+            M_row_nonzeros[r] = ncols + 1  # make sure we don't pick this one again
+            M_col_nonzeros[Jf_rows[r]] -= 1
+
+            # remove row r
+            keep = M_rows != r
+            r = M_row_nonzeros.argmin()
+            c = M_col_nonzeros.argmin()
+            nnz_r = M_row_nonzeros[r]
+
+            row_i += 1
+        else:
+            Jr_cols[c] = M_rows[M_cols == c]
+            Jr_nz_max = max(nnz_c, Jr_nz_max)
+
+            M_col_nonzeros[c] = nrows + 1  # make sure we don't pick this one again
+            M_row_nonzeros[Jr_cols[c]] -= 1
+
+            # remove column c
+            keep = M_cols != c
+            r = M_row_nonzeros.argmin()
+            c = M_col_nonzeros.argmin()
+            nnz_c = M_col_nonzeros[c]
+
+            col_i += 1
+
+        M_rows = M_rows[keep]
+        M_cols = M_cols[keep]
+
+    M_row_nonzeros = M_col_nonzeros = None
+
+    nnz_Jf = nnz_Jr = 0
+
+    if row_i > 0:
+        Jfr = []
+        Jfc = []
+        # build Jf and do fwd coloring on it
+        for i, cols in enumerate(Jf_rows):
+            if cols is not None:
+                Jfc.append(cols)
+                Jfr.append(np.full(cols.size, i, dtype=INT_DTYPE))
+                nnz_Jf += len(cols)
+
+        Jf_rows = None
+        Jfr = np.hstack(Jfr)
+        Jfc = np.hstack(Jfc)
+        coloring._fwd = _color_partition(Jfr, Jfc, J.shape)
+        Jfr = Jfc = None
+
+    if col_i > 0:
+        Jrr = []
+        Jrc = []
+        # build Jr and do rev coloring
+        for i, rows in enumerate(Jr_cols):
+            if rows is not None:
+                Jrr.append(rows)
+                Jrc.append(np.full(rows.size, i, dtype=INT_DTYPE))
+                nnz_Jr += len(rows)
+
+        Jr_cols = None
+        Jrr = np.hstack(Jrr)
+        Jrc = np.hstack(Jrc)
+        coloring._rev = _color_partition(Jrc, Jrr, J.T.shape)
+
+    if nzrows.size != nnz_Jf + nnz_Jr:
+        raise RuntimeError("Nonzero mismatch for J vs. Jf and Jr")
+
+    coloring._meta['bidirectional'] = True
+
+    return coloring
+
+
+def _col2rows(nzrows, nzcols, ncols):
+    """
+    Return the sorted list of nonzero rows of each column.
+
+    Parameters
+    ----------
+    nzrows : ndarray
+        Nonzero rows of the matrix being colored.
+    nzcols : ndarray
+        Nonzero columns of the matrix being colored.
+    ncols : int
+        Number of columns in the matrix being colored.
+
+    Returns
+    -------
+    list
+        List of nonzero rows for each column, or None for columns with no nonzeros.
+    """
+    col2rows = [None] * ncols  # will contain list of nonzero rows for each column
+
+    for r, c in zip(nzrows, nzcols):
+        if col2rows[c] is None:
+            col2rows[c] = [r]
+        else:
+            col2rows[c].append(r)
+
+    for c, rows in enumerate(col2rows):
+        if rows is not None:
+            col2rows[c] = sorted(rows)
+
+    return col2rows
@@ -48,6 +48,7 @@ from openmdao.devtools.iprofile import _iprof_totals_exec, _iprof_totals_setup_p
 from openmdao.devtools.iprof_mem import _mem_prof_exec, _mem_prof_setup_parser, \
     _mempost_exec, _mempost_setup_parser
 from openmdao.error_checking.check_config import _check_config_cmd, _check_config_setup_parser
+from openmdao.recorders.sqlite_merge import _sqlite_merge_setup_parser, _sqlite_merge_cmd
 from openmdao.utils.mpi import MPI
 from openmdao.utils.file_utils import clean_outputs
 from openmdao.utils.find_cite import print_citations
@@ -601,6 +602,9 @@ _command_map = {
     'scaffold': (_scaffold_setup_parser, _scaffold_exec,
                  'Generate a simple scaffold for a component.'),
     'scaling': (_scaling_setup_parser, _scaling_cmd, 'View driver scaling report.'),
+    'sqlite_merge': (_sqlite_merge_setup_parser, _sqlite_merge_cmd,
+                     'Merge case recording files, such as those recorded on multiple '
+                     'processors, into a single file.'),
     'summary': (_config_summary_setup_parser, _config_summary_cmd,
                 'Print a short top-level summary of the problem.'),
     'timing': (_timing_setup_parser, _timing_cmd, 'Collect timing information for all systems.'),
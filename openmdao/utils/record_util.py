@@ -2,9 +2,13 @@
 Utility functions related to recording or execution metadata.
 """
 from fnmatch import fnmatchcase
+import glob
 import os
 import re
 import json
+import lzma
+import sqlite3
+import zlib
 import numpy as np
 
 
@@ -135,6 +139,86 @@ def check_valid_sqlite3_db(filename):
         raise IOError('File does not contain a valid sqlite database ({0})'.format(filename))
 
 
+def get_recording_files(filenames):
+    """
+    Resolve a filename, glob pattern or list of them into a list of case recording files.
+
+    Files that only contain metadata, such as the separate metadata file written when
+    recording on multiple processors, are not included.
+
+    Parameters
+    ----------
+    filenames : str or pathlib.Path or list
+        Filename(s) or glob pattern(s) of the recording files.
+
+    Returns
+    -------
+    list of str
+        The case recording files, with any numeric suffixes in natural order.
+    """
+    if isinstance(filenames, (str, os.PathLike)):
+        filenames = [filenames]
+
+    files = []
+    for filename in filenames:
+        filename = str(filename)
+        if not os.path.exists(filename) and glob.has_magic(filename):
+            matches = glob.glob(filename)
+            if matches:
+                files.extend(sorted(matches, key=_natural_sort_key))
+                continue
+        files.append(filename)
+
+    return [f for f in files if _has_cases(f)]
+
+
+def _natural_sort_key(filename):
+    """
+    Return a sort key that orders embedded numbers by value (e.g. 'x_2' before 'x_10').
+
+    Parameters
+    ----------
+    filename : str
+        The filename.
+
+    Returns
+    -------
+    list
+        The sort key.
+    """
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', filename)]
+
+
+def _has_cases(filename):
+    """
+    Return False if the given file is a valid database that only contains recorded metadata.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to be tested.
+
+    Returns
+    -------
+    bool
+        False if the file contains no case tables.
+    """
+    try:
+        check_valid_sqlite3_db(filename)
+    except IOError:
+        # let the reader report the problem
+        return True
+
+    with sqlite3.connect(filename) as con:
+        cur = con.execute("SELECT count(name) FROM sqlite_master "
+                          "WHERE type='table' AND name='global_iterations'")
+        count = cur.fetchone()[0]
+
+    con.close()
+
+    return count > 0
+
+
 def check_path(path, includes, excludes, include_all_path=False):
     """
     Calculate whether `path` should be recorded.
@@ -190,17 +274,17 @@ def has_match(pattern, names):
     return False
 
 
-def deserialize(json_data, abs2meta, prom2abs, conns):
+def deserialize(json_data, abs2meta, prom2abs, conns, layouts=None):
     """
-    Deserialize recorded data from a JSON formatted string.
+    Deserialize recorded data from a JSON formatted string or a binary blob.
 
     If all data values are arrays then a numpy structured array will be returned,
     otherwise a dictionary mapping variable names to values will be returned.
 
     Parameters
     ----------
-    json_data : str
-        JSON encoded data.
+    json_data : str or bytes
+        JSON encoded data, or a binary blob of float64 values preceded by its layout id.
     abs2meta : dict
         Dictionary mapping absolute variable names to variable metadata.
     prom2abs : dict
@@ -208,12 +292,19 @@ def deserialize(json_data, abs2meta, prom2abs, conns):
         that are recorded with their promoted input name.
     conns : dict
         Dictionary of all model connections.
+    layouts : dict or None
+        Dictionary mapping layout id to the structured dtype of binary data.
 
     Returns
     -------
     array or dict
         Variable names and values parsed from the JSON string.
     """
+    if isinstance(json_data, bytes):
+        json_data, _ = decompress_data(json_data)
+        if isinstance(json_data, bytes):
+            return deserialize_binary(json_data, layouts)
+
     values = json.loads(json_data)
     if values is None:
         return None
@@ -239,6 +330,188 @@ def deserialize(json_data, abs2meta, prom2abs, conns):
         return values
 
 
+def deserialize_binary(blob, layouts):
+    """
+    Deserialize recorded data from a binary blob.
+
+    The blob starts with the int64 id of its layout, followed by the float64 values of
+    all variables in that layout.  The blob is copied into a writable buffer, and the
+    values are returned as views into that copy.
+
+    Parameters
+    ----------
+    blob : bytes
+        The binary data.
+    layouts : dict
+        Dictionary mapping layout id to the structured dtype of binary data.
+
+    Returns
+    -------
+    array
+        Numpy structured array of shape (1,) containing the recorded values.
+    """
+    layout_id = int(np.frombuffer(blob, dtype=np.int64, count=1)[0])
+    dtype = layouts[layout_id]
+    # bytearray gives a writable buffer, so values behave like those read from JSON
+    return np.frombuffer(bytearray(blob), dtype=dtype, count=1,
+                         offset=np.dtype(np.int64).itemsize)
+
+
+def layout_to_dtype(layout):
+    """
+    Convert a recorded layout of binary data into a numpy structured dtype.
+
+    Parameters
+    ----------
+    layout : list
+        List of [name, shape] for each variable in the order stored in the blob, or
+        [name, shape, dtype] for variables that are not stored as float64.
+
+    Returns
+    -------
+    dtype
+        Structured dtype with one field per variable.
+    """
+    return np.dtype([(str(entry[0]), entry[2] if len(entry) > 2 else np.float64,
+                      tuple(entry[1])) for entry in layout])
+
+
+def layout_to_sparsity(layout):
+    """
+    Convert the layout of sparsely recorded derivatives into the sparsity of each sub-jacobian.
+
+    Parameters
+    ----------
+    layout : list
+        List of ['of!wrt' key, shape, rows, cols] for each sub-jacobian, in the order its
+        nonzero values are stored in the blob.
+
+    Returns
+    -------
+    dict
+        Dictionary mapping 'of!wrt' key to the (rows, cols, shape, start, stop) of each
+        sub-jacobian, where start and stop locate its nonzero values in the blob.
+    """
+    sparsity = {}
+    start = 0
+    for key, shape, rows, cols in layout:
+        stop = start + len(rows)
+        sparsity[key] = (np.array(rows, dtype=int), np.array(cols, dtype=int), tuple(shape),
+                         start, stop)
+        start = stop
+    return sparsity
+
+
+def is_sparse_derivatives(blob):
+    """
+    Return True if recorded derivatives were stored sparsely rather than as a numpy array.
+
+    Parameters
+    ----------
+    blob : bytes
+        The recorded derivatives.
+
+    Returns
+    -------
+    bool
+        True if the blob contains a layout id followed by the nonzero derivative values.
+    """
+    # dense derivatives are saved in the .npy format
+    return isinstance(blob, bytes) and not blob.startswith(b'\x93NUMPY')
+
+
+def deserialize_sparse_derivatives(blob, layouts):
+    """
+    Deserialize sparsely recorded derivatives.
+
+    Parameters
+    ----------
+    blob : bytes
+        The int64 id of the layout followed by the float64 nonzero derivative values.
+    layouts : dict
+        Dictionary mapping layout id to its structured dtype or derivative sparsity.
+
+    Returns
+    -------
+    ndarray
+        The nonzero values of all sub-jacobians.
+    dict
+        Dictionary mapping 'of!wrt' key to the (rows, cols, shape, start, stop) of each
+        sub-jacobian.
+    """
+    layout_id = int(np.frombuffer(blob, dtype=np.int64, count=1)[0])
+    nzvals = np.frombuffer(blob, dtype=np.float64, offset=np.dtype(np.int64).itemsize)
+    return nzvals, layouts[layout_id]
+
+
+# codes identifying the compression used for iteration data
+_COMPRESSORS = {
+    'zlib': (1, lambda data, level: zlib.compress(data, -1 if level is None else level),
+             zlib.decompress),
+    'lzma': (2, lambda data, level: lzma.compress(data, preset=level), lzma.decompress),
+}
+_DECOMPRESSORS = {code: (name, decompress) for name, (code, _, decompress) in _COMPRESSORS.items()}
+
+
+def compress_data(data, compression, level=None):
+    """
+    Compress serialized iteration data.
+
+    The compressed data is preceded by a negative int64 code identifying the compression
+    and whether the data is JSON or binary, which distinguishes it from a binary blob whose
+    header is a (positive) layout id.
+
+    Parameters
+    ----------
+    data : str or bytes
+        JSON encoded data, or a binary blob of values preceded by its layout id.
+    compression : str
+        The compression to use, 'zlib' or 'lzma'.
+    level : int or None
+        The compression level, or None for the default level.
+
+    Returns
+    -------
+    bytes
+        The compressed data.
+    """
+    code, compress, _ = _COMPRESSORS[compression]
+    if isinstance(data, str):
+        data = data.encode()
+        code = -2 * code
+    else:
+        code = -2 * code - 1
+    return np.int64(code).tobytes() + compress(data, level)
+
+
+def decompress_data(data):
+    """
+    Decompress iteration data compressed by compress_data.
+
+    Parameters
+    ----------
+    data : bytes
+        Compressed data, or an uncompressed binary blob which is returned unchanged.
+
+    Returns
+    -------
+    str or bytes
+        JSON encoded data, or a binary blob of values preceded by its layout id.
+    str or None
+        The compression that was used, or None if the data was not compressed.
+    """
+    code = int(np.frombuffer(data, dtype=np.int64, count=1)[0])
+    if code >= 0:
+        return data, None
+
+    name, decompress = _DECOMPRESSORS[-code // 2]
+    data = decompress(data[np.dtype(np.int64).itemsize:])
+
+    if code % 2 == 0:
+        return data.decode(), name
+    return data, name
+
+
 def dict_to_structured_array(values):
     """
     Convert a dict of variable names and values into a numpy structured array.
@@ -2,6 +2,7 @@
 Class definitions for Relevance and related classes.
 """
 
+import threading
 from contextlib import contextmanager
 from collections import defaultdict
 
@@ -92,7 +93,12 @@ class Relevance(object):
         Maps direction to all seed variable names.
     _active : bool or None
         If True, relevance is active.  If False, relevance is inactive.  If None, relevance is
-        uninitialized.
+        uninitialized.  Each thread that sets it keeps its own value.
+    _thread_active : threading.local
+        Value of _active in each thread that has set it.
+    _default_active : bool or None
+        Value of _active most recently set by any thread other than the worker threads of a
+        solver, used by threads that haven't set their own.
     _seed_var_map : dict
         Nested dict of the form {fwdseed(s): {revseed(s): var_array, ...}}.
         Keys that contain multiple seeds are sorted tuples of seed names.
@@ -132,6 +138,8 @@ class Relevance(object):
         """
         assert model.pathname == '', "Relevance can only be initialized on the top level Group."
 
+        self._thread_active = threading.local()
+        self._default_active = None
         self._active = None  # allow relevance to be turned on later
         self._rel_array_cache = rel_array_cache
         self._graph = model._dataflow_graph
@@ -166,6 +174,58 @@ class Relevance(object):
         if not (fwd_meta and rev_meta):
             self._active = False
 
+    @property
+    def _active(self):
+        return getattr(self._thread_active, 'value', self._default_active)
+
+    @_active.setter
+    def _active(self, active):
+        # subsystems run concurrently may toggle relevance independently of each other
+        self._thread_active.value = active
+        if not getattr(self._thread_active, 'worker', False):
+            self._default_active = active
+
+    def _set_worker_active(self, active):
+        """
+        Set _active in a worker thread of a solver without changing the default of other threads.
+
+        Parameters
+        ----------
+        active : bool or None
+            The value of _active in the calling thread.
+        """
+        self._thread_active.worker = True
+        self._thread_active.value = active
+
+    def __getstate__(self):
+        """
+        Return the state of this object for pickling.
+
+        Thread local values can't be pickled, so only the value of _active in the calling thread
+        is kept, as the default of all threads.
+
+        Returns
+        -------
+        dict
+            The state of this object.
+        """
+        state = self.__dict__.copy()
+        del state['_thread_active']
+        state['_default_active'] = self._active
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore the state of this object after unpickling.
+
+        Parameters
+        ----------
+        state : dict
+            The state of this object.
+        """
+        self.__dict__.update(state)
+        self._thread_active = threading.local()
+
     def __repr__(self):
         """
         Return a string representation of the Relevance.
@@ -396,13 +396,13 @@ def view_driver_scaling(driver, outfile=_default_scaling_filename, show_browser=
             data['oflabels'] = driver._get_ordered_nl_responses()
             data['wrtlabels'] = list(n for n in dv_vals if n in nldvs)
 
-            # this call updates driver._total_jac
+            # this call updates driver._total_jac, which a hit in the totals cache wouldn't do
             driver._compute_totals(of=data['oflabels'], wrt=data['wrtlabels'],
-                                   return_format=driver._total_jac_format)
-            totals = driver._total_jac.J  # .J is always an array even if return format != 'array'
+                                   return_format=driver._total_jac_format, use_cache=False)
+            totals = driver._total_jac.get_J_array()
             driver._total_jac = None
         else:
-            totals = driver._total_jac.J  # .J is always an array even if return format != 'array'
+            totals = driver._total_jac.get_J_array()
             data['oflabels'] = list(driver._total_jac.output_meta['fwd'])
             data['wrtlabels'] = list(driver._total_jac.input_meta['fwd'])
 
@@ -434,11 +434,11 @@ def view_driver_scaling(driver, outfile=_default_scaling_filename, show_browser=
                 try:
                     lintotals = driver._compute_totals(of=lindata['oflabels'],
                                                        wrt=lindata['wrtlabels'],
-                                                       return_format='array')
+                                                       return_format='array', use_cache=False)
                 finally:
                     driver._total_jac = save
             else:
-                lintotals = driver._total_jac_linear.J
+                lintotals = driver._total_jac_linear.get_J_array()
 
             _compute_jac_view_info(lintotals, lindata, lin_dv_vals, lin_response_vals, None)
 